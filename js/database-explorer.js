@@ -150,7 +150,7 @@ const DatabaseExplorer = (() => {
             path: 'data/backend/v_rfu_team_games.json',
             grain: 'One row per team per RFU match',
             description: 'Derived RFU team-game view with home/away perspective, opposition, scoreline, lineup coverage, and previous match linkage.',
-            sourceNote: 'Defined in backend.py as a derived RFU view over games_rfu.'
+            sourceNote: 'Defined in backend.py as a materialised RFU table over games_rfu, refreshed per season.'
         },
         {
             key: 'v_rfu_squad_size',
@@ -158,7 +158,7 @@ const DatabaseExplorer = (() => {
             path: 'data/backend/v_rfu_squad_size.json',
             grain: 'One row per season-team-unit',
             description: 'Derived RFU squad-size view counting players used by team, season, and unit, including total squad size.',
-            sourceNote: 'Defined in backend.py as a derived RFU view over player_appearances_rfu.'
+            sourceNote: 'Defined in backend.py as a materialised RFU table over player_appearances_rfu, refreshed per season.'
         },
         {
             key: 'v_rfu_match_retention',
@@ -166,7 +166,7 @@ const DatabaseExplorer = (() => {
             path: 'data/backend/v_rfu_match_retention.json',
             grain: 'One row per team-match-unit',
             description: 'Derived RFU continuity view measuring how many starters were retained from the previous match for total, forwards, and backs.',
-            sourceNote: 'Defined in backend.py as a derived RFU view over player_appearances_rfu and previous-match lineage.'
+            sourceNote: 'Defined in backend.py as a materialised RFU table over player_appearances_rfu and previous-match lineage, refreshed per season.'
         },
         {
             key: 'v_rfu_average_retention',
@@ -174,7 +174,7 @@ const DatabaseExplorer = (() => {
             path: 'data/backend/v_rfu_average_retention.json',
             grain: 'One row per season-team-unit',
             description: 'Derived RFU summary view averaging match-to-match retention where previous lineup data exists.',
-            sourceNote: 'Defined in backend.py as a derived RFU summary view over v_rfu_match_retention.'
+            sourceNote: 'Defined in backend.py as a materialised RFU summary table over v_rfu_match_retention, refreshed per season.'
         },
         {
             key: 'v_rfu_lineup_coverage',
@@ -151,13 +151,14 @@
     }
 
     async function fetchJson(path) {
+        const hashedPath = await resolveAssetPath(path);
         const separator = path.includes('?') ? '&' : '?';
-        const requestPath = `${path}${separator}v=${encodeURIComponent(String(Date.now()))}`;
-        const response = await fetch(requestPath, { cache: 'no-store' });
+        const requestPath = hashedPath || `${path}${separator}v=${encodeURIComponent(String(Date.now()))}`;
+        const response = await fetch(requestPath, hashedPath ? {} : { cache: 'no-store' });
         if (!response.ok) {
             throw new Error(`Failed to fetch ${path} (${response.status})`);
         }
-        return response.json();
+        return resolveChartSpecDatasets(await response.json());
     }
 
     function cloneJson(value) {
@@ -10,6 +10,12 @@ const TEAM_SHEET_MODES = ['bold', 'compact', 'pitch'];
 let teamSheetDisplayMode = 'bold';
 let clubLogosManifest = {}; // Will be populated by loadLogosManifest()
 let matchInfoAnalysisRailInitialised = false;
+// Per-match shards (data/backend/matches, written by export_tables). When the
+// index is missing the page falls back to loading the full tables.
+const MATCH_SHARD_INDEX_PATH = 'data/backend/matches/index.json';
+let matchShardMode = false;
+let matchShardRequests = new Map();
+let loadedMatchShardGameIds = new Set();
 
 const MATCH_INFO_FILTERS_OFFCANVAS_ID = 'matchInfoFiltersOffcanvas';
 
@@ -1568,6 +1574,34 @@ function toggleMatchInfoDetailRail(hasSelection, options = {}) {
     window.dispatchEvent(new Event('resize'));
 }
 
+function registerMatchShard(shard) {
+    const gameId = String(shard?.game_id || '').trim();
+    const row = allMatches.find(match => String(match?.game_id || '').trim() === gameId);
+    // Index rows only carry list fields; the shard's game row has the rest.
+    if (row && shard?.game) Object.assign(row, shard.game);
+    loadedMatchShardGameIds.add(gameId);
+    registerAppearanceRows(shard?.appearances);
+    registerProfiles(shard?.profiles);
+    registerSetPieceRows(shard?.set_piece);
+    registerLineoutRows(shard?.lineouts);
+    return shard;
+}
+
+function loadMatchShard(row) {
+    const slug = String(row?.slug || '').trim();
+    if (!matchShardRequests.has(slug)) {
+        const request = fetchStaticAsset(`data/backend/matches/${slug}.json`)
+            .then(response => {
+                if (!response.ok) throw new Error(`Failed to fetch match shard ${slug} (${response.status})`);
+                return response.json();
+            })
+            .then(registerMatchShard);
+        request.catch(() => matchShardRequests.delete(slug));
+        matchShardRequests.set(slug, request);
+    }
+    return matchShardRequests.get(slug);
+}
+
 function renderMatchInfo(gameId) {
     const body = document.getElementById('matchDataInfoBody');
     const headerAction = document.getElementById('matchDataInfoHeaderAction');
@@ -1582,6 +1616,21 @@ function renderMatchInfo(gameId) {
         return;
     }
 
+    if (matchShardMode && !loadedMatchShardGameIds.has(String(selected.game_id || '').trim())) {
+        body.innerHTML = '<p class="text-muted" style="margin: 0;">Loading match information...</p>';
+        loadMatchShard(selected)
+            .then(() => {
+                const matchSelect = document.getElementById('matchSelect');
+                const currentGameId = String(matchSelect ? matchSelect.value : gameId).trim();
+                if (currentGameId === String(selected.game_id || '').trim()) renderMatchInfo(currentGameId);
+            })
+            .catch(error => {
+                console.error(error);
+                body.innerHTML = '<p class="text-muted" style="margin: 0;">Unable to load match information.</p>';
+            });
+        return;
+    }
+
     if (headerAction) headerAction.innerHTML = pitcheroLinkButtonHtml(selected);
 
     updateUrlGame(String(selected.game_id || ''));
@@ -1843,44 +1892,130 @@ function bindControls(initialGameId) {
     isInitialisingControls = false;
 }
 
+function registerAppearanceRows(rows) {
+    (Array.isArray(rows) ? rows : []).forEach(row => {
+        const gameId = String(row?.game_id || '').trim();
+        if (!gameId) return;
+        if (!appearancesByGameId.has(gameId)) appearancesByGameId.set(gameId, []);
+        appearancesByGameId.get(gameId).push(row);
+    });
+}
+
+function registerProfiles(profiles) {
+    (Array.isArray(profiles) ? profiles : []).forEach(profile => {
+        const key = canonicalizeName(profile?.name);
+        if (!key) return;
+        const existing = profilesByName.get(key);
+        profilesByName.set(key, choosePreferredProfile(existing, profile));
+    });
+}
+
+function registerSetPieceRows(rows) {
+    (Array.isArray(rows) ? rows : []).forEach(row => {
+        const gameId = String(row?.game_id || '').trim();
+        if (!gameId) return;
+        const team = String(row?.team || '').trim();
+        const lineoutsWon = numberIfFinite(row?.lineouts_won);
+        const lineoutsTotal = numberIfFinite(row?.lineouts_total);
+        const scrumsWon = numberIfFinite(row?.scrums_won);
+        const scrumsTotal = numberIfFinite(row?.scrums_total);
+
+        const normalized = {
+            lineouts_won: lineoutsWon,
+            lineouts_total: lineoutsTotal,
+            lineouts_lost: lineoutsWon !== null && lineoutsTotal !== null ? Math.max(0, lineoutsTotal - lineoutsWon) : null,
+            lineouts_success_rate: normalizeSuccessRate(lineoutsWon, lineoutsTotal, row?.lineouts_success_rate),
+            scrums_won: scrumsWon,
+            scrums_total: scrumsTotal,
+            scrums_lost: scrumsWon !== null && scrumsTotal !== null ? Math.max(0, scrumsTotal - scrumsWon) : null,
+            scrums_success_rate: normalizeSuccessRate(scrumsWon, scrumsTotal, row?.scrums_success_rate),
+            entries_22m: optionalNumberIfFinite(row?.entries_22m),
+            tries: optionalNumberIfFinite(row?.tries),
+            tries_per_entry: optionalNumberIfFinite(row?.tries_per_entry),
+            points_per_entry: optionalNumberIfFinite(row?.points_per_entry),
+        };
+
+        const existing = setPieceByGameId.get(gameId) || { egrfc: null, opposition: null };
+        if (team === 'EGRFC') existing.egrfc = normalized;
+        if (team === 'Opposition') existing.opposition = normalized;
+        setPieceByGameId.set(gameId, existing);
+    });
+}
+
+function registerLineoutRows(rows) {
+    (Array.isArray(rows) ? rows : []).forEach(row => {
+        const gameId = String(row?.game_id || '').trim();
+        if (!gameId) return;
+        if (!lineoutsByGameId.has(gameId)) lineoutsByGameId.set(gameId, []);
+        lineoutsByGameId.get(gameId).push(row);
+    });
+}
+
+async function loadMatchIndex() {
+    try {
+        const response = await fetchStaticAsset(MATCH_SHARD_INDEX_PATH);
+        if (!response.ok) return null;
+        const index = await response.json();
+        const seasons = Array.isArray(index?.seasons) ? index.seasons : [];
+        return seasons.flatMap(season => (Array.isArray(season?.games) ? season.games : []));
+    } catch (error) {
+        console.warn('Match index unavailable; loading full tables.', error);
+        return null;
+    }
+}
+
+async function loadFullMatchTables() {
+    const [gamesResponse, appearancesResponse, profilesResponse] = await Promise.all([
+        fetchBackendTable('games'),
+        fetchBackendTable('player_appearances'),
+        fetchBackendTable('player_profiles_canonical'),
+    ]);
+    if (!gamesResponse.ok) throw new Error(`Failed to load games (${gamesResponse.status})`);
+
+    let setPiece = [];
+    let lineouts = [];
+    try {
+        const setPieceResponse = await fetchStaticAsset('data/backend/set_piece.json');
+        if (setPieceResponse.ok) {
+            setPiece = await setPieceResponse.json();
+        }
+    } catch (error) {
+        console.warn('Could not load set-piece data; Video Analysis section will be hidden.', error);
+    }
+
+    try {
+        const lineoutResponse = await fetchStaticAsset('data/backend/lineouts.json');
+        if (lineoutResponse.ok) {
+            lineouts = await lineoutResponse.json();
+        }
+    } catch (error) {
+        console.warn('Could not load lineout detail data; lineout table will be hidden.', error);
+    }
+
+    const games = await gamesResponse.json();
+    registerAppearanceRows(appearancesResponse.ok ? await appearancesResponse.json() : []);
+    registerProfiles(profilesResponse.ok ? await profilesResponse.json() : []);
+    registerSetPieceRows(setPiece);
+    registerLineoutRows(lineouts);
+    return games;
+}
+
 async function loadPage() {
     const errorEl = document.getElementById('matchDataError');
     try {
-        const [gamesResponse, appearancesResponse, profilesResponse] = await Promise.all([
-            fetch('data/backend/games.json'),
-            fetch('data/backend/player_appearances.json'),
-            fetch('data/backend/player_profiles_canonical.json'),
-        ]);
-        if (!gamesResponse.ok) throw new Error(`Failed to load games (${gamesResponse.status})`);
-
         // Optional assets should never block the page from loading.
         loadLogosManifest().catch(error => {
             console.warn('Could not load logos manifest', error);
         });
 
-        let setPiece = [];
-        let lineouts = [];
-        try {
-            const setPieceResponse = await fetch('data/backend/set_piece.json');
-            if (setPieceResponse.ok) {
-                setPiece = await setPieceResponse.json();
-            }
-        } catch (error) {
-            console.warn('Could not load set-piece data; Video Analysis section will be hidden.', error);
-        }
-
-        try {
-            const lineoutResponse = await fetch('data/backend/lineouts.json');
-            if (lineoutResponse.ok) {
-                lineouts = await lineoutResponse.json();
-            }
-        } catch (error) {
-            console.warn('Could not load lineout detail data; lineout table will be hidden.', error);
-        }
+        appearancesByGameId = new Map();
+        profilesByName = new Map();
+        setPieceByGameId = new Map();
+        lineoutsByGameId = new Map();
 
-        const games = await gamesResponse.json();
-        const appearances = appearancesResponse.ok ? await appearancesResponse.json() : [];
-        const profiles = profilesResponse.ok ? await profilesResponse.json() : [];
+        const indexedGames = await loadMatchIndex();
+        matchShardMode = Array.isArray(indexedGames);
+        const games = matchShardMode ? indexedGames : await loadFullMatchTables();
 
         allMatches = Array.isArray(games) ? games.filter(row => row && row.game_id) : [];
         allMatches.sort((a, b) => String(b?.date || '').localeCompare(String(a?.date || '')));
@@ -1888,61 +2023,6 @@ async function loadPage() {
         renderMatchInfoHeroQuickLinks();
         bindMatchInfoHeroQuickLinks();
 
-        appearancesByGameId = new Map();
-        (Array.isArray(appearances) ? appearances : []).forEach(row => {
-            const gameId = String(row?.game_id || '').trim();
-            if (!gameId) return;
-            if (!appearancesByGameId.has(gameId)) appearancesByGameId.set(gameId, []);
-            appearancesByGameId.get(gameId).push(row);
-        });
-
-        profilesByName = new Map();
-        (Array.isArray(profiles) ? profiles : []).forEach(profile => {
-            const key = canonicalizeName(profile?.name);
-            if (!key) return;
-            const existing = profilesByName.get(key);
-            profilesByName.set(key, choosePreferredProfile(existing, profile));
-        });
-
-        setPieceByGameId = new Map();
-        (Array.isArray(setPiece) ? setPiece : []).forEach(row => {
-            const gameId = String(row?.game_id || '').trim();
-            if (!gameId) return;
-            const team = String(row?.team || '').trim();
-            const lineoutsWon = numberIfFinite(row?.lineouts_won);
-            const lineoutsTotal = numberIfFinite(row?.lineouts_total);
-            const scrumsWon = numberIfFinite(row?.scrums_won);
-            const scrumsTotal = numberIfFinite(row?.scrums_total);
-
-            const normalized = {
-                lineouts_won: lineoutsWon,
-                lineouts_total: lineoutsTotal,
-                lineouts_lost: lineoutsWon !== null && lineoutsTotal !== null ? Math.max(0, lineoutsTotal - lineoutsWon) : null,
-                lineouts_success_rate: normalizeSuccessRate(lineoutsWon, lineoutsTotal, row?.lineouts_success_rate),
-                scrums_won: scrumsWon,
-                scrums_total: scrumsTotal,
-                scrums_lost: scrumsWon !== null && scrumsTotal !== null ? Math.max(0, scrumsTotal - scrumsWon) : null,
-                scrums_success_rate: normalizeSuccessRate(scrumsWon, scrumsTotal, row?.scrums_success_rate),
-                entries_22m: optionalNumberIfFinite(row?.entries_22m),
-                tries: optionalNumberIfFinite(row?.tries),
-                tries_per_entry: optionalNumberIfFinite(row?.tries_per_entry),
-                points_per_entry: optionalNumberIfFinite(row?.points_per_entry),
-            };
-
-            const existing = setPieceByGameId.get(gameId) || { egrfc: null, opposition: null };
-            if (team === 'EGRFC') existing.egrfc = normalized;
-            if (team === 'Opposition') existing.opposition = normalized;
-            setPieceByGameId.set(gameId, existing);
-        });
-
-        lineoutsByGameId = new Map();
-        (Array.isArray(lineouts) ? lineouts : []).forEach(row => {
-            const gameId = String(row?.game_id || '').trim();
-            if (!gameId) return;
-            if (!lineoutsByGameId.has(gameId)) lineoutsByGameId.set(gameId, []);
-            lineoutsByGameId.get(gameId).push(row);
-        });
-
         populateBaseFilters();
 
         const url = new URL(window.location.href);
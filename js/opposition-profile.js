@@ -1182,7 +1182,7 @@
             console.warn('Could not load logos manifest', _error);
         }
 
-        const gamesResponse = await fetch('data/backend/games.json');
+        const gamesResponse = await fetchBackendTable('games');
         if (!gamesResponse.ok) {
             throw new Error(`Failed to load games data (${gamesResponse.status})`);
         }
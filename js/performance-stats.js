@@ -235,8 +235,8 @@
 
         try {
             const [setPieceResponse, redZoneResponse] = await Promise.all([
-                fetch('data/backend/set_piece.json', { cache: 'no-store' }),
-                fetch('data/backend/v_red_zone.json', { cache: 'no-store' }),
+                fetchStaticAsset('data/backend/set_piece.json', { cache: 'no-store' }),
+                fetchStaticAsset('data/backend/v_red_zone.json', { cache: 'no-store' }),
             ]);
 
             if (!setPieceResponse.ok || !redZoneResponse.ok) {
@@ -304,7 +304,7 @@
 
     async function fetchSeasons() {
         try {
-            const response = await fetch('data/backend/games.json', { cache: 'no-store' });
+            const response = await fetchBackendTable('games', { cache: 'no-store' });
             if (!response.ok) throw new Error(`HTTP ${response.status}`);
             const rows = await response.json();
             return Array.from(new Set((Array.isArray(rows) ? rows : [])
@@ -636,9 +636,9 @@ async function loadPlayerProfilesPage() {
 
     try {
         const [profilesRes, gamesRes, appearancesRes] = await Promise.all([
-            fetch('data/backend/player_profiles_canonical.json'),
-            fetch('data/backend/games.json'),
-            fetch('data/backend/player_appearances.json')
+            fetchBackendTable('player_profiles_canonical'),
+            fetchBackendTable('games'),
+            fetchBackendTable('player_appearances')
         ]);
 
         if (!profilesRes.ok || !gamesRes.ok || !appearancesRes.ok) {
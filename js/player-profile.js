@@ -5,6 +5,24 @@ let fullAppearancesByGame = new Map();
 let fullProfilesByName = new Map();
 let fullSponsorHistoryByPlayer = new Map();
 let fullCurrentSeason = "";
+// Per-player shards (data/backend/players, written by export_tables). When the
+// index is missing the page falls back to loading the full tables.
+const PLAYER_SHARD_INDEX_PATH = "data/backend/players/index.json";
+let fullPlayerIndex = null;
+let fullPlayerShardRequests = new Map();
+// Specs the profile filters down to the selected player. With the shard index
+// they are loaded without their shared datasets, and each player's rows come
+// from data/charts/players/<slug>.json (split_player_chart_rows in
+// python/chart_datasets.py).
+const FULL_PROFILE_CHART_SPEC_PATHS = [
+  "data/charts/player_full_profile_appearances_per_season_squad.json",
+  "data/charts/player_full_profile_appearances_per_season_result.json",
+  "data/charts/player_full_profile_appearances_per_season_position.json",
+  "data/charts/player_full_profile_position_donut.json",
+  "data/charts/player_full_profile_career_timeline.json",
+];
+let fullProfileChartTemplates = [];
+let fullPlayerChartSpecRequests = new Map();
 let fullProfileAppearancesBySeasonSpecs = {
   Squad: null,
   Result: null,
@@ -325,7 +343,102 @@ function squadTagMarkup(squadValue) {
 }
 
 function renderPlayerProfileCaptains() {
-  renderCaptainCards('captainCards', fullGamesById, fullAppearancesByGame, fullProfilesByName);
+  if (!fullPlayerIndex) {
+    renderCaptainCards('captainCards', fullGamesById, fullAppearancesByGame, fullProfilesByName);
+    return;
+  }
+  const host = document.getElementById('captainCards');
+  if (!host) return;
+  const captains = fullPlayerIndex.captains || {};
+  host.innerHTML = [
+    generateCaptainCardMarkup(captains['1st'] || null, '1st'),
+    generateCaptainCardMarkup(captains['2nd'] || null, '2nd'),
+  ].join('');
+}
+
+function registerPlayerShard(shard) {
+  const name = String(shard?.name || "").trim();
+  const appearances = Array.isArray(shard?.appearances) ? shard.appearances : [];
+  appearances.forEach((row) => {
+    const gameId = String(row?.game?.game_id || "").trim();
+    if (gameId) fullGamesById.set(gameId, row.game);
+  });
+  fullAppearancesByPlayer.set(name, appearances);
+  if (shard?.profile) fullProfilesByName.set(name, shard.profile);
+  // The point_scorers "Total" rows for this player, as scoringTotalsForPlayer
+  // would read them from data/charts/point_scorers.json.
+  (Array.isArray(shard?.scoring) ? shard.scoring : []).forEach((row) => {
+    fullProfileScoringRows.push(row);
+  });
+  return shard;
+}
+
+async function playerChartSpec(path, template, playerRows) {
+  const spec = JSON.parse(JSON.stringify(template));
+  const external = spec.usermeta?.externalDatasets;
+  const entry = playerRows?.specs?.[path.split("/").pop()];
+  if (
+    external &&
+    entry &&
+    JSON.stringify(entry.externalDatasets) === JSON.stringify(external)
+  ) {
+    spec.datasets = { ...(spec.datasets || {}), ...entry.datasets };
+    delete spec.usermeta.externalDatasets;
+    if (Object.keys(spec.usermeta).length === 0) delete spec.usermeta;
+  } else {
+    // The per-player rows are missing or were cut from an older spec.
+    await resolveChartSpecDatasets(spec);
+  }
+  return attachChartSpecMetadata(spec, { sourcePath: path });
+}
+
+function loadPlayerChartSpecs(entry) {
+  const slug = String(entry?.slug || "").trim();
+  if (!fullPlayerChartSpecRequests.has(slug)) {
+    const request = fetchStaticAsset(`data/charts/players/${slug}.json`)
+      .then((response) => (response.ok ? response.json() : null))
+      .catch(() => null)
+      .then((playerRows) =>
+        Promise.all(
+          FULL_PROFILE_CHART_SPEC_PATHS.map((path, index) => {
+            const template = fullProfileChartTemplates[index];
+            if (!template) return null;
+            return playerChartSpec(path, template, playerRows).catch((error) => {
+              console.warn(`Unable to load ${path} for ${slug}`, error);
+              return null;
+            });
+          }),
+        ),
+      );
+    fullPlayerChartSpecRequests.set(slug, request);
+  }
+  return fullPlayerChartSpecRequests.get(slug);
+}
+
+function setFullProfileChartSpecs(specs) {
+  fullProfileAppearancesBySeasonSpecs = {
+    Squad: specs[0] || null,
+    Result: specs[1] || null,
+    Position: specs[2] || null,
+  };
+  fullProfilePositionDonutSpec = specs[3] || null;
+  fullProfileCareerTimelineSpec = specs[4] || null;
+}
+
+function loadPlayerShard(entry) {
+  const slug = String(entry?.slug || "").trim();
+  if (!fullPlayerShardRequests.has(slug)) {
+    const request = fetchStaticAsset(`data/backend/players/${slug}.json`)
+      .then((response) => {
+        if (!response.ok)
+          throw new Error(`Failed to fetch player shard ${slug} (${response.status})`);
+        return response.json();
+      })
+      .then(registerPlayerShard);
+    request.catch(() => fullPlayerShardRequests.delete(slug));
+    fullPlayerShardRequests.set(slug, request);
+  }
+  return fullPlayerShardRequests.get(slug);
 }
 
 function canonicalizeName(value) {
@@ -1456,12 +1569,12 @@ function updateUrlPlayer(name) {
   window.history.replaceState({}, "", url.toString());
 }
 
-function renderSelectedPlayer() {
+async function renderSelectedPlayer() {
   const select = document.getElementById("fullProfilePlayerSelect");
   if (!select) return;
 
   const selectedName = String(select.value || "").trim();
-  const player = fullProfiles.find(
+  let player = fullProfiles.find(
     (row) => String(row?.name || "").trim() === selectedName,
   );
   const root = document.getElementById("fullProfileRoot");
@@ -1476,6 +1589,26 @@ function renderSelectedPlayer() {
   }
 
   updateUrlPlayer(selectedName);
+  if (fullPlayerIndex) {
+    // Index rows only carry name/slug/appearances; the shard has the profile.
+    try {
+      const [shard, chartSpecs] = await Promise.all([
+        loadPlayerShard(player),
+        loadPlayerChartSpecs(player),
+      ]);
+      if (String(select.value || "").trim() !== selectedName) return;
+      setFullProfileChartSpecs(chartSpecs);
+      player = shard.profile;
+    } catch (error) {
+      console.error(error);
+      player = null;
+    }
+    if (!player) {
+      root.innerHTML =
+        '<div class="alert alert-light">Unable to load this player profile.</div>';
+      return;
+    }
+  }
   renderProfile(player);
 }
 
@@ -1528,113 +1661,25 @@ async function loadPage() {
   const root = document.getElementById("fullProfileRoot");
 
   try {
-    const [profilesRes, gamesRes, appearancesRes, sponsorsRes] =
-      await Promise.all([
-        fetch("data/backend/player_profiles_canonical.json"),
-        fetch("data/backend/games.json"),
-        fetch("data/backend/player_appearances.json"),
-        fetch("data/sponsors.json"),
-      ]);
-
-    if (!profilesRes.ok || !gamesRes.ok || !appearancesRes.ok) {
-      throw new Error("Failed to load one or more profile datasets");
-    }
-
-    const [profiles, games, appearances, sponsorsBySeason] = await Promise.all([
-      profilesRes.json(),
-      gamesRes.json(),
-      appearancesRes.json(),
-      sponsorsRes.ok ? sponsorsRes.json() : Promise.resolve({}),
+    const [indexRes, sponsorsRes] = await Promise.all([
+      fetchStaticAsset(PLAYER_SHARD_INDEX_PATH).catch(() => null),
+      fetch("data/sponsors.json"),
     ]);
-
-    fullProfiles = Array.isArray(profiles) ? profiles : [];
-
-    fullGamesById = new Map();
-    (Array.isArray(games) ? games : []).forEach((game) => {
-      const key = String(game?.game_id || "").trim();
-      if (key) fullGamesById.set(key, game);
-    });
-
-    fullAppearancesByPlayer = new Map();
-    fullAppearancesByGame = new Map();
-    (Array.isArray(appearances) ? appearances : []).forEach((row) => {
-      const key = String(row?.player || "").trim();
-      if (!key) return;
-      if (!fullAppearancesByPlayer.has(key))
-        fullAppearancesByPlayer.set(key, []);
-      fullAppearancesByPlayer.get(key).push(row);
-
-      const gameId = String(row?.game_id || "").trim();
-      if (!gameId) return;
-      if (!fullAppearancesByGame.has(gameId))
-        fullAppearancesByGame.set(gameId, []);
-      fullAppearancesByGame.get(gameId).push(row);
-    });
-
-    fullProfilesByName = new Map(
-      fullProfiles.map((profile) => [
-        String(profile?.name || "").trim(),
-        profile,
-      ]),
-    );
-
+    const sponsorsBySeason = sponsorsRes.ok ? await sponsorsRes.json() : {};
     fullSponsorHistoryByPlayer = buildSponsorHistoryMap(sponsorsBySeason);
-    fullCurrentSeason = deriveCurrentSeason(games);
-
-    const chartSpecEntries = await Promise.allSettled([
-      loadChartSpec(
-        "data/charts/player_full_profile_appearances_per_season_squad.json",
-      ),
-      loadChartSpec(
-        "data/charts/player_full_profile_appearances_per_season_result.json",
-      ),
-      loadChartSpec(
-        "data/charts/player_full_profile_appearances_per_season_position.json",
-      ),
-      loadChartSpec("data/charts/player_full_profile_position_donut.json"),
-      loadChartSpec("data/charts/player_full_profile_career_timeline.json"),
-      loadChartSpec("data/charts/point_scorers.json"),
-    ]);
-    fullProfileAppearancesBySeasonSpecs = {
-      Squad:
-        chartSpecEntries[0].status === "fulfilled"
-          ? chartSpecEntries[0].value
-          : null,
-      Result:
-        chartSpecEntries[1].status === "fulfilled"
-          ? chartSpecEntries[1].value
-          : null,
-      Position:
-        chartSpecEntries[2].status === "fulfilled"
-          ? chartSpecEntries[2].value
-          : null,
-    };
-    fullProfilePositionDonutSpec =
-      chartSpecEntries[3].status === "fulfilled"
-        ? chartSpecEntries[3].value
-        : null;
-    fullProfileCareerTimelineSpec =
-      chartSpecEntries[4].status === "fulfilled"
-        ? chartSpecEntries[4].value
-        : null;
-    fullProfileScoringRows =
-      chartSpecEntries[5].status === "fulfilled"
-        ? extractChartDatasetRows(chartSpecEntries[5].value)
+
+    if (indexRes?.ok) {
+      fullPlayerIndex = await indexRes.json();
+      fullProfiles = Array.isArray(fullPlayerIndex?.players)
+        ? fullPlayerIndex.players
         : [];
-    if (
-      !fullProfileAppearancesBySeasonSpecs.Squad ||
-      !fullProfileAppearancesBySeasonSpecs.Result ||
-      !fullProfileAppearancesBySeasonSpecs.Position
-    ) {
-      console.warn(
-        "Unable to load one or more full profile appearances chart specs:",
-        chartSpecEntries,
-      );
-    }
-    if (!fullProfileScoringRows.length) {
-      console.warn("Unable to load player scoring rows for full profile summaries.");
+      fullCurrentSeason = String(fullPlayerIndex?.currentSeason || "");
+    } else {
+      await loadFullProfileTables();
     }
 
+    await loadFullProfileChartSpecs();
+
     if (loadingState) loadingState.classList.add("d-none");
     if (errorState) errorState.classList.add("d-none");
     if (root) root.classList.remove("d-none");
@@ -1653,4 +1698,89 @@ async function loadPage() {
   }
 }
 
+async function loadFullProfileTables() {
+  const [profilesRes, gamesRes, appearancesRes] = await Promise.all([
+    fetchBackendTable("player_profiles_canonical"),
+    fetchBackendTable("games"),
+    fetchBackendTable("player_appearances"),
+  ]);
+
+  if (!profilesRes.ok || !gamesRes.ok || !appearancesRes.ok) {
+    throw new Error("Failed to load one or more profile datasets");
+  }
+
+  const [profiles, games, appearances] = await Promise.all([
+    profilesRes.json(),
+    gamesRes.json(),
+    appearancesRes.json(),
+  ]);
+
+  fullProfiles = Array.isArray(profiles) ? profiles : [];
+
+  fullGamesById = new Map();
+  (Array.isArray(games) ? games : []).forEach((game) => {
+    const key = String(game?.game_id || "").trim();
+    if (key) fullGamesById.set(key, game);
+  });
+
+  fullAppearancesByPlayer = new Map();
+  fullAppearancesByGame = new Map();
+  (Array.isArray(appearances) ? appearances : []).forEach((row) => {
+    const key = String(row?.player || "").trim();
+    if (!key) return;
+    if (!fullAppearancesByPlayer.has(key))
+      fullAppearancesByPlayer.set(key, []);
+    fullAppearancesByPlayer.get(key).push(row);
+
+    const gameId = String(row?.game_id || "").trim();
+    if (!gameId) return;
+    if (!fullAppearancesByGame.has(gameId))
+      fullAppearancesByGame.set(gameId, []);
+    fullAppearancesByGame.get(gameId).push(row);
+  });
+
+  fullProfilesByName = new Map(
+    fullProfiles.map((profile) => [
+      String(profile?.name || "").trim(),
+      profile,
+    ]),
+  );
+
+  fullCurrentSeason = deriveCurrentSeason(games);
+}
+
+async function loadFullProfileChartSpecs() {
+  // Shards carry each player's scoring rows and chart rows, so with the index
+  // only the spec templates are loaded here.
+  const loadSpec = fullPlayerIndex ? fetchChartSpecJson : loadChartSpec;
+  const chartSpecEntries = await Promise.allSettled([
+    ...FULL_PROFILE_CHART_SPEC_PATHS.map((path) => loadSpec(path)),
+    fullPlayerIndex
+      ? Promise.resolve(null)
+      : loadChartSpec("data/charts/point_scorers.json"),
+  ]);
+  const specs = chartSpecEntries
+    .slice(0, FULL_PROFILE_CHART_SPEC_PATHS.length)
+    .map((entry) => (entry.status === "fulfilled" ? entry.value : null));
+  if (fullPlayerIndex) {
+    fullProfileChartTemplates = specs;
+  } else {
+    setFullProfileChartSpecs(specs);
+    const scoringEntry = chartSpecEntries[FULL_PROFILE_CHART_SPEC_PATHS.length];
+    fullProfileScoringRows =
+      scoringEntry.status === "fulfilled"
+        ? extractChartDatasetRows(scoringEntry.value)
+        : [];
+    if (!fullProfileScoringRows.length) {
+      console.warn("Unable to load player scoring rows for full profile summaries.");
+    }
+  }
+  if (!specs[0] || !specs[1] || !specs[2]) {
+    console.warn(
+      "Unable to load one or more full profile appearances chart specs:",
+      chartSpecEntries,
+    );
+  }
+}
+
 document.addEventListener("DOMContentLoaded", loadPage);
@@ -28,7 +28,10 @@ let availableSeasons = [
   "2016/17",
 ];
 const chartSpecCache = new Map();
+const chartDatasetTextCache = new Map();
 const chartSpecRequestVersion = String(Date.now());
+const ASSET_MANIFEST_PATH = "data/manifest.json";
+let assetManifestRequest = null;
 let responsiveChartResizeBound = false;
 const SET_PIECE_LAYOUT_ENTRY = Object.freeze({
   narrowMax: 760,
@@ -1019,16 +1022,133 @@ function pinVegaActionsInElement(rootElement) {
   [50, 150, 400, 900].forEach((delay) => window.setTimeout(run, delay));
 }
 
-async function loadChartSpec(path) {
-  if (chartSpecCache.has(path)) return chartSpecCache.get(path);
+// data/manifest.json (python/static_artifacts.py) maps each data/backend and
+// data/charts path to an immutable content-hashed copy with .gz/.br siblings.
+// Only the manifest is revalidated; hashed copies use the normal HTTP cache.
+function loadAssetManifest() {
+  if (!assetManifestRequest) {
+    const requestPath = `${ASSET_MANIFEST_PATH}?v=${encodeURIComponent(chartSpecRequestVersion)}`;
+    assetManifestRequest = fetch(requestPath, { cache: "no-store" })
+      .then((response) => (response.ok ? response.json() : null))
+      .then((manifest) => manifest?.files || {})
+      .catch(() => ({}));
+  }
+  return assetManifestRequest;
+}
+
+async function resolveAssetPath(path) {
+  const files = await loadAssetManifest();
+  return files[String(path).replace(/^\.\//, "")]?.path || null;
+}
+
+// fetch() for a published artifact: the hashed copy when the manifest lists
+// one, otherwise the stable path with the caller's options.
+async function fetchStaticAsset(path, init) {
+  const hashedPath = await resolveAssetPath(path);
+  if (hashedPath) {
+    const { cache, ...rest } = init || {};
+    const response = await fetch(hashedPath, rest);
+    if (response.ok) return response;
+  }
+  return fetch(path, init);
+}
+
+// Backend tables are exported twice: data/backend/<name>.json (row records) and
+// <name>.columns.json (column arrays, repeated strings dictionary-encoded; see
+// _columnar_payload in python/backend.py). Both decode to the same rows.
+function decodeColumnarTable(payload) {
+  if (Array.isArray(payload)) return payload;
+  const columns = Array.isArray(payload?.columns) ? payload.columns : [];
+  const length = Number(payload?.length) || 0;
+  const names = columns.map((column) => column.name);
+  const values = columns.map((column) =>
+    Array.isArray(column.dict)
+      ? column.codes.map((code) => column.dict[code])
+      : column.values,
+  );
+  const rows = new Array(length);
+  for (let rowIndex = 0; rowIndex < length; rowIndex += 1) {
+    const row = {};
+    for (let columnIndex = 0; columnIndex < names.length; columnIndex += 1) {
+      row[names[columnIndex]] = values[columnIndex][rowIndex];
+    }
+    rows[rowIndex] = row;
+  }
+  return rows;
+}
+
+// Drop-in for fetch("data/backend/<name>.json"): prefers the columnar export and
+// falls back to the records file. The result's json() resolves to row objects.
+async function fetchBackendTable(name, init) {
+  try {
+    const response = await fetchStaticAsset(`data/backend/${name}.columns.json`, init);
+    if (response.ok) {
+      return {
+        ok: true,
+        status: response.status,
+        json: async () => decodeColumnarTable(await response.json()),
+      };
+    }
+  } catch (error) {
+    console.warn(`Columnar export for ${name} unavailable, using records`, error);
+  }
+  return fetchStaticAsset(`data/backend/${name}.json`, init);
+}
+
+function loadChartDatasetText(path) {
+  // Dataset files are content-addressed, so the normal HTTP cache is safe and a
+  // dataset shared by several specs is only downloaded once per page.
+  if (!chartDatasetTextCache.has(path)) {
+    const request = fetch(path).then((response) => {
+      if (!response.ok)
+        throw new Error(`Failed to fetch ${path} (${response.status})`);
+      return response.text();
+    });
+    request.catch(() => chartDatasetTextCache.delete(path));
+    chartDatasetTextCache.set(path, request);
+  }
+  return chartDatasetTextCache.get(path);
+}
+
+// Specs written by python/chart_datasets.py list their shared datasets under
+// usermeta.externalDatasets; put the rows back under spec.datasets so the
+// filtering helpers and vega-embed see the usual inline shape.
+async function resolveChartSpecDatasets(spec) {
+  const external = spec?.usermeta?.externalDatasets;
+  if (!external || typeof external !== "object") return spec;
+  const entries = Object.entries(external);
+  const texts = await Promise.all(
+    entries.map(([, path]) => loadChartDatasetText(path)),
+  );
+  spec.datasets = spec.datasets || {};
+  entries.forEach(([name], index) => {
+    // Parse per spec so views never share (and mutate) the same row objects.
+    spec.datasets[name] = JSON.parse(texts[index]);
+  });
+  delete spec.usermeta.externalDatasets;
+  if (Object.keys(spec.usermeta).length === 0) delete spec.usermeta;
+  return spec;
+}
+
+// The spec as saved, with any usermeta.externalDatasets still unresolved.
+async function fetchChartSpecJson(path) {
+  const hashedPath = await resolveAssetPath(path);
   const separator = path.includes("?") ? "&" : "?";
-  const requestPath = `${path}${separator}v=${encodeURIComponent(chartSpecRequestVersion)}`;
-  const response = await fetch(requestPath, { cache: "no-store" });
+  const requestPath =
+    hashedPath ||
+    `${path}${separator}v=${encodeURIComponent(chartSpecRequestVersion)}`;
+  const response = await fetch(requestPath, hashedPath ? {} : { cache: "no-store" });
   if (!response.ok)
     throw new Error(`Failed to fetch ${path} (${response.status})`);
-  const spec = attachChartSpecMetadata(await response.json(), {
-    sourcePath: path,
-  });
+  return response.json();
+}
+
+async function loadChartSpec(path) {
+  if (chartSpecCache.has(path)) return chartSpecCache.get(path);
+  const spec = attachChartSpecMetadata(
+    await resolveChartSpecDatasets(await fetchChartSpecJson(path)),
+    { sourcePath: path },
+  );
   chartSpecCache.set(path, spec);
   return spec;
 }
@@ -20,8 +20,8 @@ async function loadSquadStatsCanonicalData() {
     if (squadStatsWithThresholdsEnrichedData && squadContinuityEnrichedData && squadPositionCompositionTemplateSpec) return;
 
     const [statsResponse, continuityResponse] = await Promise.all([
-        fetch('data/backend/squad_stats_with_thresholds_enriched.json'),
-        fetch('data/backend/squad_continuity_enriched.json')
+        fetchStaticAsset('data/backend/squad_stats_with_thresholds_enriched.json'),
+        fetchStaticAsset('data/backend/squad_continuity_enriched.json')
     ]);
 
     if (!statsResponse.ok) throw new Error(`Failed to fetch squad stats export (${statsResponse.status})`);
@@ -32,40 +32,40 @@ async function loadSquadStatsCanonicalData() {
 
     if (!squadSizeTrendTemplateSpec) {
         try {
-            const res = await fetch('data/charts/squad_size_trend.json');
-            if (res.ok) squadSizeTrendTemplateSpec = await res.json();
+            const res = await fetchStaticAsset('data/charts/squad_size_trend.json');
+            if (res.ok) squadSizeTrendTemplateSpec = await resolveChartSpecDatasets(await res.json());
         } catch (e) { console.warn('Unable to load squad size trend template spec:', e); }
     }
 
     if (!squadContinuityTrendTemplateSpec) {
         try {
-            const res = await fetch('data/charts/squad_continuity_average.json');
-            if (res.ok) squadContinuityTrendTemplateSpec = await res.json();
+            const res = await fetchStaticAsset('data/charts/squad_continuity_average.json');
+            if (res.ok) squadContinuityTrendTemplateSpec = await resolveChartSpecDatasets(await res.json());
         } catch (e) { console.warn('Unable to load squad continuity trend template spec:', e); }
     }
 
     if (!squadOverlapTemplateSpec) {
         try {
-            const res = await fetch('data/charts/squad_overlap.json');
-            if (res.ok) squadOverlapTemplateSpec = await res.json();
+            const res = await fetchStaticAsset('data/charts/squad_overlap.json');
+            if (res.ok) squadOverlapTemplateSpec = await resolveChartSpecDatasets(await res.json());
         } catch (e) { console.warn('Unable to load squad overlap template spec:', e); }
     }
 
     if (!squadPositionCompositionTemplateSpec) {
         try {
-            const res = await fetch('data/charts/squad_position_composition.json');
-            if (res.ok) squadPositionCompositionTemplateSpec = await res.json();
+            const res = await fetchStaticAsset('data/charts/squad_position_composition.json');
+            if (res.ok) squadPositionCompositionTemplateSpec = await resolveChartSpecDatasets(await res.json());
         } catch (e) { console.warn('Unable to load squad position composition template spec:', e); }
     }
 
     if (!squadResultsGameSpec || !squadResultsAggregateSpec) {
         try {
             const [gameRes, aggRes] = await Promise.all([
-                fetch('data/charts/team_stats_results_game.json'),
-                fetch('data/charts/team_stats_results_season_aggregate.json'),
+                fetchStaticAsset('data/charts/team_stats_results_game.json'),
+                fetchStaticAsset('data/charts/team_stats_results_season_aggregate.json'),
             ]);
-            if (gameRes.ok) squadResultsGameSpec = await gameRes.json();
-            if (aggRes.ok) squadResultsAggregateSpec = await aggRes.json();
+            if (gameRes.ok) squadResultsGameSpec = await resolveChartSpecDatasets(await gameRes.json());
+            if (aggRes.ok) squadResultsAggregateSpec = await resolveChartSpecDatasets(await aggRes.json());
         } catch (e) { console.warn('Unable to load squad results specs:', e); }
     }
 }
@@ -1091,7 +1091,7 @@ function _ltApplyColourEncoding(spec, colourEncoding) {
 async function _ltLoadResultsIndex() {
     if (_ltResultsIndexData) return _ltResultsIndexData;
     try {
-        const response = await fetch('data/charts/league_results_index.json');
+        const response = await fetchStaticAsset('data/charts/league_results_index.json');
         if (!response.ok) {
             console.warn(`Unable to load league results index (${response.status}).`);
             _ltResultsIndexData = {};
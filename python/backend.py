@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
+import shutil
+import unicodedata
 from datetime import date, datetime
 from dataclasses import dataclass
 from pathlib import Path
@@ -14,6 +17,7 @@ from typing import Any
 import duckdb
 import pandas as pd
 
+from python.canonical_names import map_unique, memoize_name
 from python.data import (
     HISTORIC_PITCHERO_SEASON_IDS,
     PITCHERO_OPPOSITION_CANONICAL_NAMES,
@@ -27,6 +31,8 @@ from python.league_data import (
     build_rfu_player_appearances_dataframe,
     load_consolidated_matches,
 )
+from python.static_artifacts import is_published_artifact, publish_static_artifacts, refresh_static_artifacts
+from python.tracing import span, traced
 
 
 PITCHERO_TO_GOOGLE_CANONICAL_NAMES = {
@@ -130,12 +136,279 @@ def _normalise_dates_for_json(df: pd.DataFrame) -> pd.DataFrame:
     return normalized
 
 
+COLUMNAR_EXPORT_FORMAT = "egrfc-columns/1"
+
+
+def _columnar_payload(records: list[dict[str, Any]], columns: list[str]) -> dict[str, Any]:
+    """Column-oriented form of ``records`` (decoded by ``decodeColumnarTable`` in js/shared.js).
+
+    String columns with many repeats (squad, season, player, position ...) are
+    dictionary-encoded as ``dict`` + integer ``codes``; other columns keep their
+    values as a plain array. Decoding yields exactly ``records``.
+    """
+    encoded = []
+    for column in columns:
+        values = [record.get(column) for record in records]
+        distinct: dict[str | None, int] = {}
+        is_text = bool(values) and all(value is None or isinstance(value, str) for value in values)
+        if is_text:
+            for value in values:
+                distinct.setdefault(value, len(distinct))
+        if is_text and len(distinct) * 2 <= len(values):
+            encoded.append({"name": column, "dict": list(distinct), "codes": [distinct[value] for value in values]})
+        else:
+            encoded.append({"name": column, "values": values})
+    return {"format": COLUMNAR_EXPORT_FORMAT, "length": len(records), "columns": encoded}
+
+
+PLAYER_SHARD_FORMAT = "egrfc-player/1"
+PLAYER_SHARD_DIRNAME = "players"
+# Exports a player shard is built from; exporting any of them rewrites the shards.
+PLAYER_SHARD_SOURCES = ("games", "player_appearances", "player_profiles_canonical", "players", "season_scorers")
+# Game fields the player page reads from each appearance's ``game``.
+_PLAYER_SHARD_GAME_COLUMNS = (
+    "game_id",
+    "date",
+    "season",
+    "squad",
+    "competition",
+    "game_type",
+    "opposition",
+    "home_away",
+    "score_for",
+    "score_against",
+    "result",
+)
+
+
+# (component, season_scorers column, points each), stacked in this order by
+# points_scorers_chart in python/charts.py.
+_POINT_SCORER_COMPONENTS = (
+    ("Tries", "tries", 5),
+    ("Conversions", "conversions", 2),
+    ("Penalties", "penalties", 3),
+    ("Drop Goals", "drop_goals", 3),
+)
+
+
+MATCH_SHARD_FORMAT = "egrfc-match/1"
+MATCH_SHARD_DIRNAME = "matches"
+MATCH_SHARD_SOURCES = ("games", "player_appearances", "player_profiles_canonical", "set_piece", "lineouts")
+# Game fields match-info.js needs to filter, list and link fixtures before a shard loads.
+_MATCH_INDEX_COLUMNS = _PLAYER_SHARD_GAME_COLUMNS + ("captain",)
+# Profile fields the team sheet and scorer labels read.
+_MATCH_SHARD_PROFILE_COLUMNS = ("name", "short_name", "photo_url", "totalAppearances")
+_GAME_SCORER_COLUMNS = ("tries_scorers", "conversions_scorers", "penalties_scorers", "drop_goals_scorers")
+
+
+def _export_slug(value: str, default: str) -> str:
+    ascii_value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", ascii_value.lower()).strip("-") or default
+
+
+def _unique_slug(value: str, default: str, used: set[str]) -> str:
+    slug = base_slug = _export_slug(value, default)
+    suffix = 2
+    while slug in used:
+        slug, suffix = f"{base_slug}-{suffix}", suffix + 1
+    used.add(slug)
+    return slug
+
+
+def _season_start_year(season: Any) -> int:
+    match = re.match(r"^(\d{4})/", str(season or ""))
+    return int(match.group(1)) if match else -1
+
+
+def _profile_name_key(name: Any) -> str:
+    """Same as canonicalizeName in js/player-profile.js."""
+    return re.sub(r"\s+", " ", str(name or "").strip().lower())
+
+
+def _point_scorer_total_rows(season_scorers: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """The ``score_type == "Total"`` rows of the point_scorers chart dataset.
+
+    points_scorers_chart writes one such row per non-zero scoring component of
+    each season_scorers row, and scoringTotalsForPlayer in js/player-profile.js
+    sums them, so shards carry the same rows to keep the profile totals unchanged.
+    """
+    rows = []
+    for record in season_scorers:
+        base = {
+            "squad": record["squad"],
+            "season": record["season"],
+            "player": record["player"],
+            "game_type": record["game_type"] if record["game_type"] is not None else "Unknown",
+            "tries": record["tries"] or 0,
+            "conversions": record["conversions"] or 0,
+            "penalties": record["penalties"] or 0,
+            "drop_goals": record["drop_goals"] or 0,
+            "total_points": record["points"] or 0,
+        }
+        for order, (component, column, points) in enumerate(_POINT_SCORER_COMPONENTS, start=1):
+            value = base[column] * points
+            if value > 0:
+                rows.append(
+                    {**base, "score_type": "Total", "component": component, "value": value, "component_order": order}
+                )
+    return rows
+
+
+def _player_shards(records: dict[str, list[dict[str, Any]]]) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Split exported ``records`` (keyed by PLAYER_SHARD_SOURCES) into per-player shards.
+
+    Returns the index (player list, current season and squad captains, which the
+    player page needs before any shard loads) and the shards keyed by slug.
+    """
+    profiles = {row["name"]: row for row in records["player_profiles_canonical"]}
+    games = {row["game_id"]: row for row in records["games"]}
+    appearances_by_player: dict[str, list[dict[str, Any]]] = {}
+    appearances_by_game: dict[str, list[dict[str, Any]]] = {}
+    for row in records["player_appearances"]:
+        appearances_by_player.setdefault(row["player"], []).append(row)
+        appearances_by_game.setdefault(row["game_id"], []).append(row)
+    scoring_by_player: dict[str, list[dict[str, Any]]] = {}
+    for row in _point_scorer_total_rows(records["season_scorers"]):
+        scoring_by_player.setdefault(_profile_name_key(row["player"]), []).append(row)
+
+    index_rows = []
+    shards = {}
+    slugs: set[str] = set()
+    for player in sorted(records["players"], key=lambda row: row["name"]):
+        name = player["name"]
+        slug = _unique_slug(name, "player", slugs)
+
+        profile = profiles.get(name)
+        appearances = [
+            {**row, "game": {column: games[row["game_id"]].get(column) for column in _PLAYER_SHARD_GAME_COLUMNS}}
+            for row in appearances_by_player.get(name, [])
+            if row["game_id"] in games
+        ]
+        appearances.sort(key=lambda row: str(row["game"]["date"] or ""))
+        shards[slug] = {
+            "format": PLAYER_SHARD_FORMAT,
+            "slug": slug,
+            "name": name,
+            "profile": profile,
+            "player": player,
+            "appearances": appearances,
+            "scoring": scoring_by_player.get(_profile_name_key(name), []),
+        }
+        index_rows.append({
+            "name": name,
+            "slug": slug,
+            "totalAppearances": profile["totalAppearances"] if profile else player["total_appearances"],
+        })
+
+    # Same rule as findCurrentCaptainProfile in js/shared.js: the most recent
+    # game with a captain who has a profile.
+    captains = {}
+    for squad in ("1st", "2nd"):
+        captains[squad] = None
+        squad_games = sorted(
+            (game for game in records["games"] if game["squad"] == squad),
+            key=lambda game: str(game["date"] or ""),
+            reverse=True,
+        )
+        for game in squad_games:
+            captain_row = next(
+                (
+                    row for row in appearances_by_game.get(game["game_id"], [])
+                    if row["squad"] == squad and row.get("is_captain") is True
+                ),
+                None,
+            )
+            captain = str((captain_row or {}).get("player") or game.get("captain") or "").strip()
+            if captain in profiles:
+                captains[squad] = profiles[captain]
+                break
+
+    seasons = [game["season"] for game in records["games"] if game.get("season")]
+    index = {
+        "format": PLAYER_SHARD_FORMAT,
+        "currentSeason": max(seasons, key=_season_start_year) if seasons else "",
+        "captains": captains,
+        "players": index_rows,
+    }
+    return index, shards
+
+
+def _canonical_name_key(value: Any) -> str:
+    # Same normalisation as canonicalizeName in js/match-info.js.
+    return re.sub(r"\s+", " ", str(value or "").strip().lower())
+
+
+def _match_shards(records: dict[str, list[dict[str, Any]]]) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Split exported ``records`` (keyed by MATCH_SHARD_SOURCES) into per-game shards.
+
+    Each shard holds the full game row (scorers included), the lineup, the
+    profiles of everyone named in it, and the set-piece and lineout rows. The
+    index groups a few fields of every game by season, newest first, for the
+    match list and filters.
+    """
+    def by_game(rows: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            grouped.setdefault(row["game_id"], []).append(row)
+        return grouped
+
+    appearances = by_game(records["player_appearances"])
+    set_piece = by_game(records["set_piece"])
+    lineouts = by_game(records["lineouts"])
+    profiles: dict[str, dict[str, Any]] = {}
+    for profile in records["player_profiles_canonical"]:
+        profiles.setdefault(_canonical_name_key(profile["name"]), profile)
+
+    games = sorted(records["games"], key=lambda game: (str(game["date"] or ""), game["game_id"]), reverse=True)
+    shards = {}
+    seasons: dict[str, list[dict[str, Any]]] = {}
+    slugs: set[str] = set()
+    for game in games:
+        slug = _unique_slug(game["game_id"], "match", slugs)
+        lineup = appearances.get(game["game_id"], [])
+        named = {row["player"] for row in lineup}
+        named.update(game.get(column) for column in ("captain", "vice_captain_1", "vice_captain_2", "motm"))
+        for column in _GAME_SCORER_COLUMNS:
+            if isinstance(game.get(column), dict):
+                named.update(game[column])
+        named_keys = sorted({_canonical_name_key(name) for name in named if name} & profiles.keys())
+        shards[slug] = {
+            "format": MATCH_SHARD_FORMAT,
+            "slug": slug,
+            "game_id": game["game_id"],
+            "game": game,
+            "appearances": lineup,
+            "profiles": [
+                {column: profiles[key].get(column) for column in _MATCH_SHARD_PROFILE_COLUMNS} for key in named_keys
+            ],
+            "set_piece": set_piece.get(game["game_id"], []),
+            "lineouts": lineouts.get(game["game_id"], []),
+        }
+        seasons.setdefault(game.get("season") or "", []).append(
+            {"slug": slug, **{column: game.get(column) for column in _MATCH_INDEX_COLUMNS}}
+        )
+
+    index = {
+        "format": MATCH_SHARD_FORMAT,
+        "seasons": [
+            {"season": season, "games": seasons[season]}
+            for season in sorted(seasons, key=_season_start_year, reverse=True)
+        ],
+    }
+    return index, shards
+
+
 def _yes_no_to_bool(series: pd.Series) -> pd.Series:
     return series.fillna("").astype(str).str.strip().str.upper().isin(["Y", "YES", "TRUE", "X", "1"])
 
 
+_NON_ALPHANUMERIC_RE = re.compile(r"[^a-z0-9]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@memoize_name
 def _normalise_key(name: str) -> str:
-    return re.sub(r"[^a-z0-9]", "", name.lower())
+    return _NON_ALPHANUMERIC_RE.sub("", name.lower())
 
 
 _OPPOSITION_TEAM_SUFFIX_RE = re.compile(
@@ -160,6 +433,7 @@ _ROMAN_TO_TEAM_NUMBER = {
 }
 
 
+@memoize_name
 def _split_opposition_club_team(name: Any) -> tuple[str, int | None]:
     """Split opposition display name into (club_name, team_number).
 
@@ -175,12 +449,12 @@ def _split_opposition_club_team(name: Any) -> tuple[str, int | None]:
     if not canonical:
         return "", None
 
-    collapsed = re.sub(r"\s+", " ", canonical)
+    collapsed = _WHITESPACE_RE.sub(" ", canonical)
     match = _OPPOSITION_TEAM_SUFFIX_RE.match(collapsed)
     if not match:
         return collapsed, None
 
-    club = re.sub(r"\s+", " ", (match.group("club") or "").strip(" -"))
+    club = _WHITESPACE_RE.sub(" ", (match.group("club") or "").strip(" -"))
     if not club:
         return collapsed, None
 
@@ -202,6 +476,35 @@ def _canonical_game_id(match_date: Any, squad: Any, opposition: Any) -> str:
     return f"{match_date}_{squad}_{club}".replace(" ", "_").replace("/", "")
 
 
+def _canonical_game_ids(frame: pd.DataFrame) -> pd.Series:
+    """Vectorised ``_canonical_game_id`` over date/squad/opposition columns."""
+    clubs = map_unique(frame["opposition"], _opposition_club_name)
+    ids = [
+        f"{match_date}_{squad}_{club}".replace(" ", "_").replace("/", "")
+        for match_date, squad, club in zip(frame["date"], frame["squad"], clubs)
+    ]
+    return pd.Series(ids, index=frame.index)
+
+
+def _non_empty_jsonish(frame: pd.DataFrame) -> pd.DataFrame:
+    """Element-wise ``not _is_empty_jsonish`` for a frame of JSON-ish text columns."""
+    text = frame.fillna("{}").astype(str)
+    return text.apply(lambda column: ~column.str.strip().isin(["", "{}", "null", "None"]))
+
+
+def _score_pair_keys(pf: pd.Series, pa: pd.Series) -> pd.Series:
+    """Order-independent "low:high" score key, or "" when either score is missing."""
+    both = pf.notna() & pa.notna()
+    keys = pd.Series("", index=pf.index, dtype=object)
+    if both.any():
+        pf_int = pf[both].astype("int64")
+        pa_int = pa[both].astype("int64")
+        low = pf_int.where(pf_int <= pa_int, pa_int)
+        high = pf_int.where(pf_int >= pa_int, pa_int)
+        keys.loc[both] = low.astype(str) + ":" + high.astype(str)
+    return keys
+
+
 def _season_sort_key(season: Any) -> tuple[int, str]:
     season_text = str(season or "").strip()
     match = re.match(r"^(\d{4})-(\d{4})$", season_text)
@@ -210,12 +513,14 @@ def _season_sort_key(season: Any) -> tuple[int, str]:
     return (-1, season_text)
 
 
+@memoize_name
 def _canonical_player_name(name: Any) -> Any:
     if pd.isna(name):
         return name
     return PITCHERO_TO_GOOGLE_CANONICAL_NAMES.get(str(name).strip(), str(name).strip())
 
 
+@memoize_name
 def _canonical_player_name_for_season(name: Any, season: Any) -> Any:
     """Resolve scorer aliases that are ambiguous across eras.
 
@@ -302,6 +607,148 @@ def _normalise_scorer_payload_names(
     return json.dumps(normalized)
 
 
+# Column types of the historic Pitchero team-sheet store, in cache order.
+HISTORIC_PITCHERO_GAME_COLUMNS: dict[str, str] = {
+    "game_id": "VARCHAR",
+    "date": "DATE",
+    "season": "VARCHAR",
+    "squad": "VARCHAR",
+    "competition": "VARCHAR",
+    "game_type": "VARCHAR",
+    "opposition": "VARCHAR",
+    "home_away": "VARCHAR",
+    "pf": "INTEGER",
+    "pa": "INTEGER",
+    "result": "VARCHAR",
+    "margin": "INTEGER",
+    "captain": "VARCHAR",
+    "motm": "VARCHAR",
+    "vc1": "VARCHAR",
+    "vc2": "VARCHAR",
+    "tries_scorers": "VARCHAR",
+    "conversions_scorers": "VARCHAR",
+    "penalties_scorers": "VARCHAR",
+    "drop_goals_scorers": "VARCHAR",
+    "pitchero_match_url": "VARCHAR",
+}
+HISTORIC_PITCHERO_APPEARANCE_COLUMNS: dict[str, str] = {
+    "appearance_id": "VARCHAR",
+    "game_id": "VARCHAR",
+    "player": "VARCHAR",
+    "shirt_number": "INTEGER",
+    "position": "VARCHAR",
+    "position_group": "VARCHAR",
+    "unit": "VARCHAR",
+    "is_starter": "BOOLEAN",
+    "is_captain": "BOOLEAN",
+    "is_vc": "BOOLEAN",
+    "player_join": "VARCHAR",
+}
+_HISTORIC_STORE_TABLES = (
+    ("games", HISTORIC_PITCHERO_GAME_COLUMNS),
+    ("appearances", HISTORIC_PITCHERO_APPEARANCE_COLUMNS),
+)
+
+
+def historic_pitchero_store_dir(cache_file: Path) -> Path:
+    """Directory of the Parquet store that replaces the JSON cache at ``cache_file``."""
+    return cache_file.with_suffix("")
+
+
+def _historic_season_partition(season: Any) -> str:
+    return f"season={str(season).strip().replace('/', '-')}"
+
+
+def write_historic_pitchero_store(store_dir: Path, games_df: pd.DataFrame, apps_df: pd.DataFrame) -> None:
+    """Replace the store with one typed Parquet file per season for games and appearances.
+
+    Appearances are partitioned by their game's season; appearances of games
+    that are not in ``games_df`` are dropped. The new store is written next to
+    the old one and swapped in, so readers never see a half-written season.
+    """
+    games = games_df.reindex(columns=list(HISTORIC_PITCHERO_GAME_COLUMNS))
+    appearances = apps_df.reindex(columns=list(HISTORIC_PITCHERO_APPEARANCE_COLUMNS))
+    game_seasons = dict(zip(games["game_id"].astype(str), games["season"].astype(str).str.strip()))
+    frames = {
+        "games": games.assign(_partition=games["season"].astype(str).str.strip(), _row=range(len(games))),
+        "appearances": appearances.assign(
+            _partition=appearances["game_id"].astype(str).map(game_seasons),
+            _row=range(len(appearances)),
+        ),
+    }
+
+    new_dir = store_dir.with_name(f".{store_dir.name}.new")
+    old_dir = store_dir.with_name(f".{store_dir.name}.old")
+    for leftover in (new_dir, old_dir):
+        shutil.rmtree(leftover, ignore_errors=True)
+    new_dir.mkdir(parents=True)
+
+    with duckdb.connect() as con:
+        for table, columns in _HISTORIC_STORE_TABLES:
+            con.register(f"{table}_frame", frames[table])
+        for season in sorted(frames["games"]["_partition"].dropna().unique()):
+            season_dir = new_dir / _historic_season_partition(season)
+            season_dir.mkdir()
+            season_literal = str(season).replace("'", "''")
+            for table, columns in _HISTORIC_STORE_TABLES:
+                select = ", ".join(f'CAST("{name}" AS {sql_type}) AS "{name}"' for name, sql_type in columns.items())
+                target = (season_dir / f"{table}.parquet").as_posix().replace("'", "''")
+                # _row keeps the cache order across partitions, so readers get rows back as they were written.
+                con.execute(
+                    f"COPY (SELECT {select}, CAST(_row AS BIGINT) AS _row FROM {table}_frame "
+                    f"WHERE _partition = '{season_literal}' ORDER BY _row) "
+                    f"TO '{target}' (FORMAT parquet, COMPRESSION zstd)"
+                )
+
+    if store_dir.exists():
+        os.replace(store_dir, old_dir)
+    os.replace(new_dir, store_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def read_historic_pitchero_store(
+    store_dir: Path,
+    seasons: Any = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Read the store's games and appearances, only opening the partitions of ``seasons``.
+
+    Dates come back as ISO strings, as they are in the JSON cache.
+    """
+    partitions = sorted(path for path in store_dir.glob("season=*") if path.is_dir())
+    if seasons is not None:
+        wanted = {_historic_season_partition(season) for season in seasons}
+        partitions = [path for path in partitions if path.name in wanted]
+
+    frames = []
+    with duckdb.connect() as con:
+        for table, columns in _HISTORIC_STORE_TABLES:
+            files = [(path / f"{table}.parquet").as_posix() for path in partitions if (path / f"{table}.parquet").exists()]
+            if not files:
+                frames.append(pd.DataFrame(columns=list(columns)))
+                continue
+            select = ", ".join(
+                f'CAST("{name}" AS VARCHAR) AS "{name}"' if sql_type == "DATE" else f'"{name}"'
+                for name, sql_type in columns.items()
+            )
+            # The partition directory names use "-" in seasons; keep the stored column.
+            frames.append(
+                con.execute(
+                    f"SELECT {select} FROM read_parquet(?, hive_partitioning = false) ORDER BY _row", [files]
+                ).df()
+            )
+    return frames[0], frames[1]
+
+
+def read_historic_pitchero_cache(cache_file: Path, seasons: Any = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Historic games and appearances from the Parquet store, or from the JSON cache if there is no store yet."""
+    store_dir = historic_pitchero_store_dir(cache_file)
+    if store_dir.is_dir():
+        return read_historic_pitchero_store(store_dir, seasons=seasons)
+    with cache_file.open("r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    return pd.DataFrame(payload.get("games", [])), pd.DataFrame(payload.get("appearances", []))
+
+
 def _apply_pitchero_supplemental_enrichment(db_path: Path, project_root: Path) -> dict[str, int]:
     """Apply URL/scorer supplements from reconciliation artifacts, if available."""
     report = {
@@ -450,15 +897,14 @@ def _apply_pitchero_supplemental_enrichment(db_path: Path, project_root: Path) -
         # 4) Backfill from historic Pitchero cache by game_id.
         # This path avoids network calls and preserves scorer/captain data
         # extracted previously from Pitchero events pages.
-        historic_cache_file = project_root / "data" / "pitchero_historic_team_sheets_cache.json"
-        if historic_cache_file.exists():
+        historic_cache_file = project_root / BackendConfig.historic_pitchero_cache_path
+        if historic_cache_file.exists() or historic_pitchero_store_dir(historic_cache_file).is_dir():
             try:
-                with historic_cache_file.open("r", encoding="utf-8") as handle:
-                    cache_payload = json.load(handle)
+                cache_games_df, _ = read_historic_pitchero_cache(historic_cache_file)
+                cache_games = cache_games_df.astype(object).where(cache_games_df.notna(), None).to_dict(orient="records")
             except Exception:
-                cache_payload = {}
+                cache_games = []
 
-            cache_games = cache_payload.get("games", []) if isinstance(cache_payload, dict) else []
             if isinstance(cache_games, list) and cache_games:
                 scorer_cols = ["tries_scorers", "conversions_scorers", "penalties_scorers", "drop_goals_scorers"]
                 cache_lookup: dict[str, dict[str, Any]] = {}
@@ -611,6 +1057,251 @@ def _apply_pitchero_supplemental_enrichment(db_path: Path, project_root: Path) -
     return report
 
 
+# Source files whose code shapes the backend schema and derived tables. A change
+# to any of them invalidates every stored fingerprint and forces a full rebuild.
+_BUILDER_SOURCE_FILES = ("backend.py", "data.py", "league_data.py")
+
+_GAMES_BUILD_INPUTS = ("sheets:games", "sheets:appearances", "sheets:scorers_2526", "pitchero:historic")
+
+# Upstream inputs and tables for every persisted table, in build order. An entry
+# containing ":" is an extracted input; anything else is an upstream table.
+BUILD_TABLE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "ref_pitchero_player_name_overrides": (),
+    "ref_pitchero_opposition_overrides": (),
+    "ref_pitchero_match_url_overrides": (),
+    "games": _GAMES_BUILD_INPUTS,
+    "player_appearances": _GAMES_BUILD_INPUTS + ("games",),
+    "lineouts": ("sheets:lineouts", "games"),
+    "set_piece": _GAMES_BUILD_INPUTS + ("sheets:set_piece", "games"),
+    "season_scorers": ("sheets:scorers_2526", "pitchero:stats", "player_appearances", "games"),
+    "players": ("files:headshots", "files:sponsors", "player_appearances", "games", "lineouts", "season_scorers"),
+    "squad_stats_enriched": ("player_appearances", "games"),
+    "squad_position_profiles_enriched": ("player_appearances", "games"),
+    "squad_continuity_enriched": ("config:continuity_window", "player_appearances", "games"),
+    "squad_stats_with_thresholds_enriched": ("player_appearances", "games"),
+    "player_profiles_canonical": ("players", "player_appearances", "games", "season_scorers"),
+    "season_summary_enriched": ("games", "player_appearances", "season_scorers", "set_piece"),
+    "games_rfu": ("rfu:matches",),
+    "player_appearances_rfu": ("rfu:matches",),
+}
+
+# Tables rebuilt from the enriched games after supplemental enrichment.
+POST_ENRICHMENT_TABLES = ("season_scorers", "players", "player_profiles_canonical", "season_summary_enriched")
+
+# Tables read by each exported view (and materialised RFU summary), used to
+# limit incremental re-exports.
+VIEW_TABLE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "v_season_results": ("games",),
+    "v_rfu_team_games": ("games_rfu",),
+    "v_rfu_squad_size": ("player_appearances_rfu",),
+    "v_rfu_match_retention": ("player_appearances_rfu",),
+    "v_rfu_average_retention": ("player_appearances_rfu",),
+    "v_rfu_lineup_coverage": ("games_rfu",),
+    "v_red_zone": ("set_piece", "games"),
+}
+
+# RFU league summaries that are materialised as tables rather than views, in
+# refresh order. Each SELECT covers only the seasons listed in the temp table
+# _rfu_refresh_seasons, so a build rewrites just the seasons whose RFU rows
+# changed. Every summary is season-local: previous matches are looked up
+# within a season.
+RFU_SUMMARY_SOURCES = ("games_rfu", "player_appearances_rfu")
+RFU_SUMMARY_TABLES: dict[str, str] = {
+    "v_rfu_team_games": """
+        WITH team_games AS (
+            SELECT
+                match_id,
+                season,
+                league,
+                tracked_squad AS squad,
+                date,
+                home_team AS team,
+                away_team AS opposition,
+                'H' AS home_away,
+                home_score AS score_for,
+                away_score AS score_against,
+                home_walkover AS team_walkover,
+                away_walkover AS opposition_walkover,
+                lineup_available_home AS lineup_available
+            FROM games_rfu
+            WHERE season IN (SELECT season FROM _rfu_refresh_seasons)
+
+            UNION ALL
+
+            SELECT
+                match_id,
+                season,
+                league,
+                tracked_squad AS squad,
+                date,
+                away_team AS team,
+                home_team AS opposition,
+                'A' AS home_away,
+                away_score AS score_for,
+                home_score AS score_against,
+                away_walkover AS team_walkover,
+                home_walkover AS opposition_walkover,
+                lineup_available_away AS lineup_available
+            FROM games_rfu
+            WHERE season IN (SELECT season FROM _rfu_refresh_seasons)
+        )
+        SELECT
+            *,
+            LAG(match_id) OVER (PARTITION BY season, team ORDER BY date, match_id) AS previous_match_id
+        FROM team_games
+    """,
+    "v_rfu_squad_size": """
+        WITH player_units AS (
+            SELECT
+                season,
+                league,
+                tracked_squad AS squad,
+                team,
+                player,
+                CASE
+                    WHEN MAX(CASE WHEN unit = 'Forwards' THEN 1 ELSE 0 END) = 1 THEN 'Forwards'
+                    WHEN MAX(CASE WHEN unit = 'Backs' THEN 1 ELSE 0 END) = 1 THEN 'Backs'
+                    ELSE 'Bench'
+                END AS unit
+            FROM player_appearances_rfu
+            WHERE season IN (SELECT season FROM _rfu_refresh_seasons)
+            GROUP BY season, league, tracked_squad, team, player
+        )
+        SELECT season, league, squad, team, unit, COUNT(*) AS players
+        FROM player_units
+        WHERE unit IN ('Forwards', 'Backs')
+        GROUP BY season, league, squad, team, unit
+
+        UNION ALL
+
+        SELECT season, league, squad, team, 'Total' AS unit, COUNT(*) AS players
+        FROM player_units
+        GROUP BY season, league, squad, team
+    """,
+    "v_rfu_match_retention": """
+        WITH starters AS (
+            SELECT
+                match_id,
+                previous_match_id,
+                season,
+                league,
+                tracked_squad AS squad,
+                date,
+                team,
+                opposition,
+                player,
+                unit
+            FROM player_appearances_rfu
+            WHERE is_starter = TRUE
+              AND season IN (SELECT season FROM _rfu_refresh_seasons)
+        ),
+        starter_units AS (
+            SELECT match_id, previous_match_id, season, league, squad, date, team, opposition, player, 'Total' AS unit
+            FROM starters
+
+            UNION ALL
+
+            SELECT match_id, previous_match_id, season, league, squad, date, team, opposition, player, unit
+            FROM starters
+            WHERE unit IN ('Forwards', 'Backs')
+        ),
+        lineup_flags AS (
+            SELECT match_id, team, COUNT(*) > 0 AS lineup_available
+            FROM starters
+            GROUP BY match_id, team
+        )
+        SELECT
+            curr.season,
+            curr.league,
+            curr.squad,
+            curr.team,
+            curr.opposition,
+            curr.date,
+            curr.match_id,
+            curr.previous_match_id,
+            curr.unit,
+            COALESCE(MAX(CASE WHEN prev_lineup.lineup_available THEN 1 ELSE 0 END), 0) AS previous_lineup_available,
+            COUNT(DISTINCT CASE WHEN prev.player IS NOT NULL THEN curr.player END) AS retained
+        FROM starter_units curr
+        LEFT JOIN lineup_flags prev_lineup
+            ON prev_lineup.match_id = curr.previous_match_id
+            AND prev_lineup.team = curr.team
+        LEFT JOIN starter_units prev
+            ON prev.match_id = curr.previous_match_id
+            AND prev.team = curr.team
+            AND prev.unit = curr.unit
+            AND prev.player = curr.player
+        GROUP BY
+            curr.season,
+            curr.league,
+            curr.squad,
+            curr.team,
+            curr.opposition,
+            curr.date,
+            curr.match_id,
+            curr.previous_match_id,
+            curr.unit
+    """,
+    "v_rfu_average_retention": """
+        SELECT
+            season,
+            league,
+            squad,
+            team,
+            unit,
+            AVG(retained) AS average_retention,
+            COUNT(*) AS game_pairs
+        FROM v_rfu_match_retention
+        WHERE previous_match_id IS NOT NULL
+          AND previous_lineup_available = 1
+          AND season IN (SELECT season FROM _rfu_refresh_seasons)
+        GROUP BY season, league, squad, team, unit
+    """,
+}
+
+# Export row order for tables whose stored order depends on which seasons were
+# refreshed last.
+EXPORT_ORDER_BY: dict[str, str] = {
+    "v_rfu_team_games": "season, team, date, match_id, home_away",
+    "v_rfu_squad_size": "season, league, squad, team, unit",
+    "v_rfu_match_retention": "season, team, date, match_id, unit",
+    "v_rfu_average_retention": "season, league, squad, team, unit",
+}
+
+_RFU_SUMMARY_FINGERPRINT_PREFIX = "rfu_summary:"
+
+
+def _fingerprint_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _frame_fingerprint(*frames: pd.DataFrame | None) -> str:
+    """Content hash of one or more DataFrames (column names and JSON-rendered values)."""
+    parts = []
+    for df in frames:
+        if df is None:
+            parts.append("<none>")
+            continue
+        payload = df.to_json(orient="split", index=False, date_format="iso", default_handler=str)
+        parts.append(f"{list(df.columns)}|{payload}")
+    return _fingerprint_text("\n".join(parts))
+
+
+def _file_fingerprint(path: Path) -> str:
+    if not path.exists():
+        return _fingerprint_text(f"<missing:{path.name}>")
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _builder_source_fingerprint() -> str:
+    source_dir = Path(__file__).resolve().parent
+    return _fingerprint_text("|".join(_file_fingerprint(source_dir / name) for name in _BUILDER_SOURCE_FILES))
+
+
 @dataclass
 class BackendConfig:
     db_path: str = "data/egrfc_backend.duckdb"
@@ -619,29 +1310,86 @@ class BackendConfig:
     historic_pitchero_cache_path: str = "data/pitchero_historic_team_sheets_cache.json"
     credentials_path: str = "client_secret.json"
     rfu_matches_path: str = "data/matches.json"
+    sheets_snapshot_path: str = "data/sheets_snapshot_cache.json"
+    # Also write the historic Pitchero cache as JSON next to its Parquet store.
+    export_historic_pitchero_json: bool = False
+    # Number of preceding games squad continuity compares each starting XV against.
+    continuity_window: int = 1
+
+
+def _staging_db_path(db_file: Path) -> Path:
+    return db_file.with_name(f".{db_file.name}.staging")
+
+
+def _wal_path(db_file: Path) -> Path:
+    return db_file.with_name(f"{db_file.name}.wal")
 
 
 class BackendDatabase:
-    def __init__(self, config: BackendConfig | None = None):
+    def __init__(self, config: BackendConfig | None = None, read_only: bool = False, staged: bool = False):
+        """Open the backend database.
+
+        With ``staged=True`` writes go to a private copy of ``config.db_path``
+        that ``publish()`` atomically swaps into place, so a build never waits
+        on (or disturbs) readers of the published file. Closing a staged
+        database without publishing discards the copy.
+        """
         self.config = config or BackendConfig()
         self.project_root = Path(__file__).resolve().parent.parent
-        self.db_file = self.project_root / self.config.db_path
+        self.published_db_file = self.project_root / self.config.db_path
+        self.staged = staged
+        self.db_file = _staging_db_path(self.published_db_file) if staged else self.published_db_file
         self.export_root = self.project_root / self.config.export_dir
         self.pitchero_cache_file = self.project_root / self.config.pitchero_cache_path
         self.historic_pitchero_cache_file = self.project_root / self.config.historic_pitchero_cache_path
         self.rfu_matches_file = self.project_root / self.config.rfu_matches_path
+        self.sheets_snapshot_file = self.project_root / self.config.sheets_snapshot_path
+        if staged:
+            if read_only:
+                raise ValueError("A staged backend database cannot be read-only.")
+            self._discard_staging()
+            # Start from the published file so incremental builds keep their
+            # fingerprints. Its WAL is left behind: a checkpointed file is a
+            # consistent snapshot, and anything newer is rebuilt.
+            if self.published_db_file.exists():
+                shutil.copyfile(self.published_db_file, self.db_file)
         try:
-            self.con = duckdb.connect(str(self.db_file))
+            self.con = duckdb.connect(str(self.db_file), read_only=read_only)
         except duckdb.IOException as exc:
             if "Could not set lock on file" in str(exc):
                 raise RuntimeError(
                     "Backend DB is locked by another process. Close notebooks/scripts using "
-                    f"{self.db_file.as_posix()} or run with an alternate path using --db-path."
+                    f"{self.db_file.as_posix()}, open it read-only, or query it through "
+                    "python/query_service.py."
                 ) from exc
             raise
 
     def close(self) -> None:
         self.con.close()
+        if self.staged:
+            self._discard_staging()
+
+    def publish(self) -> Path:
+        """Swap a staged build into ``config.db_path`` and close the connection.
+
+        Readers already connected keep the snapshot they opened; new
+        connections see the new build.
+        """
+        if not self.staged:
+            raise RuntimeError("publish() requires a database opened with staged=True.")
+        self.con.execute("CHECKPOINT")
+        self.con.close()
+        # A WAL beside the published file belongs to the build being replaced.
+        _wal_path(self.published_db_file).unlink(missing_ok=True)
+        os.replace(self.db_file, self.published_db_file)
+        self.staged = False
+        self.db_file = self.published_db_file
+        return self.published_db_file
+
+    def _discard_staging(self) -> None:
+        staging = _staging_db_path(self.published_db_file)
+        staging.unlink(missing_ok=True)
+        _wal_path(staging).unlink(missing_ok=True)
 
     def reset_schema(self) -> None:
         self.con.execute("DROP VIEW IF EXISTS v_player_profiles")
@@ -656,10 +1404,8 @@ class BackendDatabase:
         self.con.execute("DROP VIEW IF EXISTS v_set_piece_summary")
         self.con.execute("DROP VIEW IF EXISTS v_season_results")
         self.con.execute("DROP VIEW IF EXISTS v_rfu_lineup_coverage")
-        self.con.execute("DROP VIEW IF EXISTS v_rfu_average_retention")
-        self.con.execute("DROP VIEW IF EXISTS v_rfu_match_retention")
-        self.con.execute("DROP VIEW IF EXISTS v_rfu_squad_size")
-        self.con.execute("DROP VIEW IF EXISTS v_rfu_team_games")
+        for name in reversed(RFU_SUMMARY_TABLES):
+            self._drop_relation(name)
         self.con.execute("DROP TABLE IF EXISTS squad_continuity_enriched")
         self.con.execute("DROP TABLE IF EXISTS squad_position_profiles_enriched")
         self.con.execute("DROP TABLE IF EXISTS squad_stats_enriched")
@@ -686,6 +1432,18 @@ class BackendDatabase:
         self.con.execute("DROP TABLE IF EXISTS player_appearances")
         self.con.execute("DROP TABLE IF EXISTS games_rfu")
         self.con.execute("DROP TABLE IF EXISTS games")
+        self.con.execute("DROP TABLE IF EXISTS build_fingerprints")
+
+        self.con.execute(
+            """
+            CREATE TABLE build_fingerprints (
+                name TEXT PRIMARY KEY,
+                input_key TEXT,
+                output_key TEXT,
+                updated_at TIMESTAMP
+            )
+            """
+        )
 
         self.con.execute(
             """
@@ -808,6 +1566,75 @@ class BackendDatabase:
             """
         )
 
+        self.con.execute(
+            """
+            CREATE TABLE v_rfu_team_games (
+                match_id TEXT NOT NULL,
+                season TEXT NOT NULL,
+                league TEXT,
+                squad TEXT,
+                date DATE NOT NULL,
+                team TEXT NOT NULL,
+                opposition TEXT,
+                home_away TEXT,
+                score_for INTEGER,
+                score_against INTEGER,
+                team_walkover BOOLEAN,
+                opposition_walkover BOOLEAN,
+                lineup_available BOOLEAN,
+                previous_match_id TEXT
+            )
+            """
+        )
+
+        self.con.execute(
+            """
+            CREATE TABLE v_rfu_squad_size (
+                season TEXT NOT NULL,
+                league TEXT,
+                squad TEXT,
+                team TEXT NOT NULL,
+                unit TEXT,
+                players BIGINT
+            )
+            """
+        )
+
+        self.con.execute(
+            """
+            CREATE TABLE v_rfu_match_retention (
+                season TEXT NOT NULL,
+                league TEXT,
+                squad TEXT,
+                team TEXT NOT NULL,
+                opposition TEXT,
+                date DATE,
+                match_id TEXT NOT NULL,
+                previous_match_id TEXT,
+                unit TEXT,
+                previous_lineup_available INTEGER,
+                retained BIGINT
+            )
+            """
+        )
+
+        self.con.execute(
+            """
+            CREATE TABLE v_rfu_average_retention (
+                season TEXT NOT NULL,
+                league TEXT,
+                squad TEXT,
+                team TEXT NOT NULL,
+                unit TEXT,
+                average_retention DOUBLE,
+                game_pairs BIGINT
+            )
+            """
+        )
+
+        for name in RFU_SUMMARY_TABLES:
+            self.con.execute(f"CREATE INDEX {name}_season_league_team ON {name} (season, league, team)")
+
         self.con.execute(
             """
             CREATE TABLE lineouts (
@@ -1020,9 +1847,44 @@ class BackendDatabase:
         )
 
 
-    def build(self, refresh_pitchero: bool = False, export: bool = True, strict_duplicate_audit: bool = False) -> None:
-        self.reset_schema()
-        extractor = DataExtractor(credentials_path=self.config.credentials_path)
+    @traced
+    def build(
+        self,
+        refresh_pitchero: bool = False,
+        export: bool = True,
+        strict_duplicate_audit: bool = False,
+        incremental: bool = False,
+        extractor: DataExtractor | None = None,
+        offline: bool = False,
+    ) -> set[str]:
+        """Build the canonical tables and return the names of tables whose rows changed.
+
+        With ``incremental=True`` every extracted input and persisted table is
+        fingerprinted against the previous build (see ``BUILD_TABLE_DEPENDENCIES``).
+        Tables whose upstream fingerprints are unchanged are left as they are, and a
+        recomputed table that hashes to its stored content is not rewritten, so its
+        dependants are skipped as well.
+
+        Worksheet values are cached in ``sheets_snapshot_path`` and only re-downloaded
+        when the spreadsheet's modifiedTime changes; ``offline=True`` builds from that
+        snapshot and the local caches without any network access.
+        """
+        if offline and refresh_pitchero:
+            raise ValueError("refresh_pitchero needs network access and cannot be combined with offline")
+        schema_key = _builder_source_fingerprint()
+        previous = self._load_build_fingerprints() if incremental else {}
+        full_rebuild = previous.get("schema", (None, None))[0] != schema_key
+        if full_rebuild:
+            if incremental:
+                print("Incremental build: no fingerprints for the current schema, running a full rebuild.")
+            previous = {}
+            self.reset_schema()
+
+        extractor = extractor or DataExtractor(
+            credentials_path=self.config.credentials_path,
+            offline=offline,
+            snapshot_cache_path=self.sheets_snapshot_file,
+        )
 
         games_google_raw = extractor.extract_games_data()
         games_google_raw["_source"] = "google"
@@ -1039,7 +1901,22 @@ class BackendDatabase:
         set_piece_raw = extractor.extract_set_piece_stats()
         pitchero_stats_source = self._load_pitchero(extractor, refresh_pitchero)
         scorers_2526_raw = self._extract_2526_scorers(extractor)
-        rfu_matches_raw = load_consolidated_matches(self.rfu_matches_file.as_posix())
+
+        headshots_dir = self.project_root / "img" / "headshots"
+        headshot_names = sorted(path.name for path in headshots_dir.glob("*.*")) if headshots_dir.exists() else []
+        input_keys = {
+            "sheets:games": _frame_fingerprint(games_google_raw),
+            "sheets:appearances": _frame_fingerprint(appearances_google_raw),
+            "sheets:lineouts": _frame_fingerprint(lineouts_raw),
+            "sheets:set_piece": _frame_fingerprint(set_piece_raw),
+            "sheets:scorers_2526": _frame_fingerprint(scorers_2526_raw),
+            "pitchero:historic": _frame_fingerprint(historic_games_raw, historic_appearances_raw),
+            "pitchero:stats": _frame_fingerprint(pitchero_stats_source),
+            "rfu:matches": _file_fingerprint(self.rfu_matches_file),
+            "files:sponsors": _file_fingerprint(self.project_root / "data" / "sponsors.json"),
+            "files:headshots": _fingerprint_text("|".join(headshot_names)),
+            "config:continuity_window": _fingerprint_text(str(self.config.continuity_window)),
+        }
 
         pitchero_games_raw = self._build_pitchero_games_raw(historic_games_raw)
         pitchero_games_clean = self._build_pitchero_games_clean(pitchero_games_raw)
@@ -1047,9 +1924,6 @@ class BackendDatabase:
         pitchero_appearances_clean = self._build_pitchero_player_appearances_clean(pitchero_appearances_raw)
         pitchero_stats_raw = self._build_pitchero_stats_raw(pitchero_stats_source)
         pitchero_stats_clean = self._build_pitchero_stats_clean(pitchero_stats_raw)
-        ref_player_names = self._build_ref_pitchero_player_name_overrides()
-        ref_opposition_names = self._build_ref_pitchero_opposition_overrides()
-        ref_match_urls = self._build_ref_pitchero_match_url_overrides()
 
         games_raw = pd.concat([games_google_raw, pitchero_games_clean.assign(_source="pitchero")], ignore_index=True)
         appearances_raw = pd.concat(
@@ -1061,84 +1935,322 @@ class BackendDatabase:
         if "pitchero_match_url" not in games_raw.columns:
             games_raw["pitchero_match_url"] = None
 
-        games = self._build_games(games_raw, appearances_raw)
-        games = self._attach_match_scorers(games, scorers_2526_raw)
-        appearances = self._build_player_appearances(appearances_raw, games)
-        lineouts = self._build_lineouts(lineouts_raw, games)
-        set_piece = self._build_set_piece(set_piece_raw, games)
-        season_scorers = self._build_season_scorers(scorers_2526_raw, pitchero_stats_clean, appearances, games)
-        appearances = self._annotate_appearance_numbers(appearances)
-        players = self._build_players(appearances, games, lineouts, season_scorers)
-        player_profiles_base = self._build_player_profiles_base(players, appearances, games, season_scorers)
-        squad_stats_enriched = self._build_squad_stats(appearances, games)
-        squad_position_profiles_enriched = self._build_squad_position_profiles(appearances, games)
-        squad_continuity_enriched = self._build_squad_continuity(appearances, games)
-        squad_stats_with_thresholds_enriched = self._build_squad_stats_with_thresholds(appearances, games)
-        player_profiles_canonical = self._build_player_profiles_canonical(player_profiles_base)
-        season_summary_enriched = self._build_season_summary(games, appearances, season_scorers, set_piece)
-        games_rfu = build_rfu_games_dataframe(
-            matches=rfu_matches_raw,
-            consolidated_file=self.rfu_matches_file.as_posix(),
-        )
-        appearances_rfu = build_rfu_player_appearances_dataframe(
-            matches=rfu_matches_raw,
-            consolidated_file=self.rfu_matches_file.as_posix(),
-            games_df=games_rfu,
+        # Tables built in this run are kept in memory; anything else is read back
+        # from DuckDB on demand when a stale dependant needs it.
+        frames: dict[str, pd.DataFrame] = {}
+        loaded: dict[str, Any] = {}
+
+        def table(name: str) -> pd.DataFrame:
+            if name not in frames:
+                frames[name] = self._read_table(name)
+            return frames[name]
+
+        def build_games() -> pd.DataFrame:
+            games = self._build_games(games_raw, appearances_raw)
+            loaded["game_id_aliases"] = True
+            return self._attach_match_scorers(games, scorers_2526_raw)
+
+        def ensure_game_id_aliases() -> None:
+            # The alias map used to remap appearance/set-piece game_ids is a
+            # by-product of _build_games, so recompute it when games was skipped.
+            if not loaded.get("game_id_aliases"):
+                self._build_games(games_raw, appearances_raw)
+                loaded["game_id_aliases"] = True
+
+        def build_player_appearances() -> pd.DataFrame:
+            ensure_game_id_aliases()
+            appearances = self._build_player_appearances(appearances_raw, table("games"))
+            return self._annotate_appearance_numbers(appearances)
+
+        def build_set_piece() -> pd.DataFrame:
+            ensure_game_id_aliases()
+            return self._build_set_piece(set_piece_raw, table("games"))
+
+        def build_player_profiles_canonical() -> pd.DataFrame:
+            player_profiles_base = self._build_player_profiles_base(
+                table("players"), table("player_appearances"), table("games"), table("season_scorers")
+            )
+            return self._build_player_profiles_canonical(player_profiles_base)
+
+        def rfu_matches_raw() -> list[dict[str, Any]]:
+            if "rfu_matches" not in loaded:
+                loaded["rfu_matches"] = load_consolidated_matches(self.rfu_matches_file.as_posix())
+            return loaded["rfu_matches"]
+
+        builders = {
+            "ref_pitchero_player_name_overrides": self._build_ref_pitchero_player_name_overrides,
+            "ref_pitchero_opposition_overrides": self._build_ref_pitchero_opposition_overrides,
+            "ref_pitchero_match_url_overrides": self._build_ref_pitchero_match_url_overrides,
+            "games": build_games,
+            "player_appearances": build_player_appearances,
+            "lineouts": lambda: self._build_lineouts(lineouts_raw, table("games")),
+            "set_piece": build_set_piece,
+            "season_scorers": lambda: self._build_season_scorers(
+                scorers_2526_raw, pitchero_stats_clean, table("player_appearances"), table("games")
+            ),
+            "players": lambda: self._build_players(
+                table("player_appearances"), table("games"), table("lineouts"), table("season_scorers")
+            ),
+            "squad_stats_enriched": self._build_squad_stats_sql,
+            "squad_position_profiles_enriched": self._build_squad_position_profiles_sql,
+            "squad_continuity_enriched": self._build_squad_continuity,
+            "squad_stats_with_thresholds_enriched": self._build_squad_stats_with_thresholds_sql,
+            "player_profiles_canonical": build_player_profiles_canonical,
+            "season_summary_enriched": lambda: self._build_season_summary(
+                table("games"), table("player_appearances"), table("season_scorers"), table("set_piece")
+            ),
+            "games_rfu": lambda: build_rfu_games_dataframe(
+                matches=rfu_matches_raw(),
+                consolidated_file=self.rfu_matches_file.as_posix(),
+            ),
+            "player_appearances_rfu": lambda: build_rfu_player_appearances_dataframe(
+                matches=rfu_matches_raw(),
+                consolidated_file=self.rfu_matches_file.as_posix(),
+                games_df=table("games_rfu"),
+            ),
+        }
+
+        fingerprints: dict[str, tuple[str | None, str | None]] = {"schema": (schema_key, None)}
+        fingerprints.update({name: (None, key) for name, key in input_keys.items()})
+        output_keys: dict[str, str | None] = {}
+        changed_tables: set[str] = set()
+        for name, dependencies in BUILD_TABLE_DEPENDENCIES.items():
+            input_key = _fingerprint_text(
+                "|".join(
+                    f"{dependency}={input_keys[dependency] if dependency in input_keys else output_keys[dependency]}"
+                    for dependency in dependencies
+                )
+            )
+            prior_input_key, prior_output_key = previous.get(name, (None, None))
+            if prior_input_key == input_key:
+                output_keys[name] = prior_output_key
+                fingerprints[name] = (input_key, prior_output_key)
+                continue
+
+            built = builders[name]()
+            if isinstance(built, str):
+                # SQL builders run entirely inside DuckDB against the persisted
+                # upstream tables; the result never round-trips through pandas.
+                staging = f"_build_{name}"
+                with span("sql_table", table=name):
+                    self.con.execute(f"CREATE OR REPLACE TEMP TABLE {staging} AS {built}")
+                output_key = self._table_fingerprint(staging)
+            else:
+                output_key = _frame_fingerprint(built)
+            output_keys[name] = output_key
+            fingerprints[name] = (input_key, output_key)
+            if output_key != prior_output_key:
+                if not full_rebuild:
+                    self.con.execute(f"DELETE FROM {name}")
+                if isinstance(built, str):
+                    self.con.execute(f"INSERT INTO {name} SELECT * FROM {staging}")
+                else:
+                    frames[name] = built
+                    self._insert(name, built)
+                changed_tables.add(name)
+            # Otherwise the content matches the stored table: keep the stored rows
+            # (including any post-build enrichment) and let dependants read them back.
+            if isinstance(built, str):
+                self.con.execute(f"DROP TABLE {staging}")
+
+        rfu_summary_keys = {
+            name[len(_RFU_SUMMARY_FINGERPRINT_PREFIX):]: input_key
+            for name, (input_key, _) in previous.items()
+            if name.startswith(_RFU_SUMMARY_FINGERPRINT_PREFIX)
+        }
+        if full_rebuild or changed_tables.intersection(RFU_SUMMARY_SOURCES):
+            rfu_summary_keys = self.refresh_rfu_summaries(rfu_summary_keys)
+        fingerprints.update(
+            {f"{_RFU_SUMMARY_FINGERPRINT_PREFIX}{season}": (key, None) for season, key in rfu_summary_keys.items()}
         )
 
-        self._insert("ref_pitchero_player_name_overrides", ref_player_names)
-        self._insert("ref_pitchero_opposition_overrides", ref_opposition_names)
-        self._insert("ref_pitchero_match_url_overrides", ref_match_urls)
-        self._insert("games", games)
-        self._insert("player_appearances", appearances)
-        self._insert("games_rfu", games_rfu)
-        self._insert("player_appearances_rfu", appearances_rfu)
-        self._insert("lineouts", lineouts)
-        self._insert("set_piece", set_piece)
-        self._insert("season_scorers", season_scorers)
-        self._insert("players", players)
-        self._insert("squad_stats_enriched", squad_stats_enriched)
-        self._insert("squad_position_profiles_enriched", squad_position_profiles_enriched)
-        self._insert("squad_continuity_enriched", squad_continuity_enriched)
-        self._insert("squad_stats_with_thresholds_enriched", squad_stats_with_thresholds_enriched)
-        self._insert("player_profiles_canonical", player_profiles_canonical)
-        self._insert("season_summary_enriched", season_summary_enriched)
-        self.create_views()
+        self._store_build_fingerprints(fingerprints)
+        if full_rebuild:
+            self.create_views()
+        elif incremental:
+            summary = ", ".join(sorted(changed_tables)) if changed_tables else "none"
+            print(f"Incremental build: {len(changed_tables)} table(s) changed ({summary}).")
 
         if export:
-            self.export_tables()
+            if full_rebuild:
+                self.export_tables()
+            elif changed_tables:
+                self.export_tables(names=self._export_names_for(changed_tables))
     
         # Store for post-enrichment scorer rebuild.
         self._last_build_scorers_2526_raw = scorers_2526_raw
+        self._last_build_pitchero_stats_clean = pitchero_stats_clean
+        self.last_build_changed_tables = changed_tables
+        return changed_tables
+
+    def _read_table(self, table_name: str) -> pd.DataFrame:
+        """Read a persisted table with DATE columns as ``datetime.date`` like the builders emit."""
+        df = self.con.execute(f"SELECT * FROM {table_name}").df()
+        for column in df.columns:
+            if pd.api.types.is_datetime64_any_dtype(df[column]):
+                df[column] = df[column].dt.date
+        if table_name == "player_appearances":
+            # Stored as ``number``; the builders emit and consume ``shirt_number``.
+            df = df.rename(columns={"number": "shirt_number"})
+        return df
+
+    def _table_fingerprint(self, table_name: str) -> str:
+        """Order-independent content hash of a DuckDB table, computed in-engine."""
+        row_count, row_hash = self.con.execute(f"SELECT COUNT(*), SUM(hash(t)) FROM {table_name} t").fetchone()
+        return _fingerprint_text(f"{row_count}:{row_hash}")
 
+    def _load_build_fingerprints(self) -> dict[str, tuple[str | None, str | None]]:
+        try:
+            rows = self.con.execute("SELECT name, input_key, output_key FROM build_fingerprints").fetchall()
+        except duckdb.CatalogException:
+            return {}
+        return {name: (input_key, output_key) for name, input_key, output_key in rows}
+
+    def _store_build_fingerprints(self, fingerprints: dict[str, tuple[str | None, str | None]]) -> None:
+        built_at = datetime.now()
+        self.con.execute("DELETE FROM build_fingerprints")
+        self.con.executemany(
+            "INSERT INTO build_fingerprints VALUES (?, ?, ?, ?)",
+            [[name, input_key, output_key, built_at] for name, (input_key, output_key) in fingerprints.items()],
+        )
+
+    @staticmethod
+    def _export_names_for(changed_tables: set[str]) -> set[str]:
+        views = {
+            view
+            for view, dependencies in VIEW_TABLE_DEPENDENCIES.items()
+            if changed_tables.intersection(dependencies)
+        }
+        return set(changed_tables) | views
+
+    def finish_build(
+        self,
+        changed_tables: set[str] | None = None,
+        apply_supplemental_enrichment: bool = True,
+        export: bool = True,
+    ) -> set[str]:
+        """Apply supplemental enrichment and rebuild the scorer-dependent tables after ``build()``.
+
+        ``changed_tables`` is what an incremental ``build()`` returned (None after a
+        full build). Enrichment only rewrites ``games``, so it is skipped when
+        ``games`` did not change; the scorer-dependent tables are rebuilt whenever
+        ``games`` or any of them changed, so an incremental build ends with the
+        same rows as a full one. Returns the tables rewritten here.
+        """
+        if not apply_supplemental_enrichment:
+            return set()
+        full = changed_tables is None
+        if full or "games" in changed_tables:
+            _apply_pitchero_supplemental_enrichment(db_path=self.db_file, project_root=self.project_root)
+        elif not changed_tables.intersection(POST_ENRICHMENT_TABLES):
+            return set()
+        # Rebuild scorer-dependent tables so that try/conversion/penalty data
+        # backfilled by enrichment flows through to season_scorers, players,
+        # player_profiles_canonical and season_summary_enriched.
+        self.rebuild_post_enrichment()
+        rebuilt = set(POST_ENRICHMENT_TABLES)
+        # Re-export so all post-enrichment updates are in the JSON files.
+        if export:
+            if full:
+                self.export_tables()
+            else:
+                self.export_tables(names=self._export_names_for(set(changed_tables) | {"games"} | rebuilt))
+        return rebuilt
+
+    @traced
     def rebuild_post_enrichment(self) -> None:
         """Rebuild scorer-dependent tables after Pitchero supplemental enrichment.
 
         ``_apply_pitchero_supplemental_enrichment`` writes try/conversion/penalty
         scorer JSON back onto the ``games`` table rows *after* the main build() run
         has already populated ``season_scorers``.  This method re-reads the enriched
-        games from the database and rebuilds every table that depends on scorer data.
+        games from the database and rebuilds every table that depends on scorer data,
+        from the same inputs ``build()`` uses, then re-keys their build fingerprints
+        so the next incremental build compares against the rows actually stored.
         """
         scorers_2526_raw = getattr(self, "_last_build_scorers_2526_raw", pd.DataFrame())
+        pitchero_stats_clean = getattr(self, "_last_build_pitchero_stats_clean", pd.DataFrame())
 
-        games = self.con.execute("SELECT * FROM games").df()
-        appearances = self.con.execute("SELECT * FROM player_appearances").df()
-        lineouts = self.con.execute("SELECT * FROM lineouts").df()
-        set_piece = self.con.execute("SELECT * FROM set_piece").df()
+        games = self._read_table("games")
+        appearances = self._read_table("player_appearances")
+        lineouts = self._read_table("lineouts")
+        set_piece = self._read_table("set_piece")
 
-        season_scorers = self._build_season_scorers(scorers_2526_raw, pd.DataFrame(), appearances, games)
+        season_scorers = self._build_season_scorers(scorers_2526_raw, pitchero_stats_clean, appearances, games)
         players = self._build_players(appearances, games, lineouts, season_scorers)
         player_profiles_base = self._build_player_profiles_base(players, appearances, games, season_scorers)
         player_profiles_canonical = self._build_player_profiles_canonical(player_profiles_base)
         season_summary_enriched = self._build_season_summary(games, appearances, season_scorers, set_piece)
+        rebuilt = {
+            "season_scorers": season_scorers,
+            "players": players,
+            "player_profiles_canonical": player_profiles_canonical,
+            "season_summary_enriched": season_summary_enriched,
+        }
 
-        for table in ("season_scorers", "players", "player_profiles_canonical", "season_summary_enriched"):
+        for table, df in rebuilt.items():
             self.con.execute(f"DELETE FROM {table}")
+            self._insert(table, df)
+        self._refresh_output_fingerprints(rebuilt)
 
-        self._insert("season_scorers", season_scorers)
-        self._insert("players", players)
-        self._insert("player_profiles_canonical", player_profiles_canonical)
-        self._insert("season_summary_enriched", season_summary_enriched)
+    def _refresh_output_fingerprints(self, frames: dict[str, pd.DataFrame]) -> None:
+        """Store the fingerprints of tables rewritten after ``build()``, and the input keys of those that read them."""
+        fingerprints = self._load_build_fingerprints()
+        if not fingerprints:
+            return
+        for name, dependencies in BUILD_TABLE_DEPENDENCIES.items():
+            if name not in frames:
+                continue
+            # Same key as build(): extracted inputs and tables both keep their hash as output_key.
+            input_key = _fingerprint_text(
+                "|".join(f"{dependency}={fingerprints.get(dependency, (None, None))[1]}" for dependency in dependencies)
+            )
+            fingerprints[name] = (input_key, _frame_fingerprint(frames[name]))
+        self._store_build_fingerprints(fingerprints)
+
+    def _drop_relation(self, name: str) -> None:
+        """Drop ``name`` whether it is a table or a view (the RFU summaries used to be views)."""
+        row = self.con.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_schema = 'main' AND table_name = ?",
+            [name],
+        ).fetchone()
+        if row is not None:
+            self.con.execute(f"DROP {'VIEW' if row[0] == 'VIEW' else 'TABLE'} {name}")
+
+    def _rfu_season_keys(self) -> dict[str, str]:
+        """Content hash of each season's rows in the RFU source tables."""
+        keys: dict[str, list[str]] = {}
+        for position, name in enumerate(RFU_SUMMARY_SOURCES):
+            rows = self.con.execute(f"SELECT season, COUNT(*), SUM(hash(t)) FROM {name} t GROUP BY season").fetchall()
+            for season, row_count, row_hash in rows:
+                keys.setdefault(season, [""] * len(RFU_SUMMARY_SOURCES))[position] = f"{row_count}:{row_hash}"
+        return {season: _fingerprint_text("|".join(parts)) for season, parts in keys.items()}
+
+    @traced
+    def refresh_rfu_summaries(self, previous_keys: dict[str, str] | None = None) -> dict[str, str]:
+        """Rewrite the materialised RFU summary tables for seasons whose RFU rows changed.
+
+        ``previous_keys`` maps each season to the source hash it was last
+        refreshed at (every season is refreshed without it). Returns the
+        current hashes to pass in next time.
+        """
+        previous_keys = previous_keys or {}
+        current_keys = self._rfu_season_keys()
+        seasons = sorted(
+            season
+            for season in set(current_keys) | set(previous_keys)
+            if current_keys.get(season) != previous_keys.get(season)
+        )
+        if not seasons:
+            return current_keys
+        self.con.execute("CREATE OR REPLACE TEMP TABLE _rfu_refresh_seasons (season TEXT)")
+        self.con.executemany("INSERT INTO _rfu_refresh_seasons VALUES (?)", [[season] for season in seasons])
+        for name, sql in RFU_SUMMARY_TABLES.items():
+            with span("rfu_summary", table=name, seasons=len(seasons)):
+                self.con.execute(f"DELETE FROM {name} WHERE season IN (SELECT season FROM _rfu_refresh_seasons)")
+                self.con.execute(f"INSERT INTO {name} {sql}")
+        self.con.execute("DROP TABLE _rfu_refresh_seasons")
+        return current_keys
 
     def create_views(self) -> None:
         self.con.execute(
@@ -1183,167 +2295,6 @@ class BackendDatabase:
             """
         )
 
-        self.con.execute(
-            """
-            CREATE VIEW v_rfu_team_games AS
-            WITH team_games AS (
-                SELECT
-                    match_id,
-                    season,
-                    league,
-                    tracked_squad AS squad,
-                    date,
-                    home_team AS team,
-                    away_team AS opposition,
-                    'H' AS home_away,
-                    home_score AS score_for,
-                    away_score AS score_against,
-                    home_walkover AS team_walkover,
-                    away_walkover AS opposition_walkover,
-                    lineup_available_home AS lineup_available
-                FROM games_rfu
-
-                UNION ALL
-
-                SELECT
-                    match_id,
-                    season,
-                    league,
-                    tracked_squad AS squad,
-                    date,
-                    away_team AS team,
-                    home_team AS opposition,
-                    'A' AS home_away,
-                    away_score AS score_for,
-                    home_score AS score_against,
-                    away_walkover AS team_walkover,
-                    home_walkover AS opposition_walkover,
-                    lineup_available_away AS lineup_available
-                FROM games_rfu
-            )
-            SELECT
-                *,
-                LAG(match_id) OVER (PARTITION BY season, team ORDER BY date, match_id) AS previous_match_id
-            FROM team_games
-            """
-        )
-
-        self.con.execute(
-            """
-            CREATE VIEW v_rfu_squad_size AS
-            WITH player_units AS (
-                SELECT
-                    season,
-                    league,
-                    tracked_squad AS squad,
-                    team,
-                    player,
-                    CASE
-                        WHEN MAX(CASE WHEN unit = 'Forwards' THEN 1 ELSE 0 END) = 1 THEN 'Forwards'
-                        WHEN MAX(CASE WHEN unit = 'Backs' THEN 1 ELSE 0 END) = 1 THEN 'Backs'
-                        ELSE 'Bench'
-                    END AS unit
-                FROM player_appearances_rfu
-                GROUP BY season, league, tracked_squad, team, player
-            )
-            SELECT season, league, squad, team, unit, COUNT(*) AS players
-            FROM player_units
-            WHERE unit IN ('Forwards', 'Backs')
-            GROUP BY season, league, squad, team, unit
-
-            UNION ALL
-
-            SELECT season, league, squad, team, 'Total' AS unit, COUNT(*) AS players
-            FROM player_units
-            GROUP BY season, league, squad, team
-            """
-        )
-
-        self.con.execute(
-            """
-            CREATE VIEW v_rfu_match_retention AS
-            WITH starters AS (
-                SELECT
-                    match_id,
-                    previous_match_id,
-                    season,
-                    league,
-                    tracked_squad AS squad,
-                    date,
-                    team,
-                    opposition,
-                    player,
-                    unit
-                FROM player_appearances_rfu
-                WHERE is_starter = TRUE
-            ),
-            starter_units AS (
-                SELECT match_id, previous_match_id, season, league, squad, date, team, opposition, player, 'Total' AS unit
-                FROM starters
-
-                UNION ALL
-
-                SELECT match_id, previous_match_id, season, league, squad, date, team, opposition, player, unit
-                FROM starters
-                WHERE unit IN ('Forwards', 'Backs')
-            ),
-            lineup_flags AS (
-                SELECT match_id, team, COUNT(*) > 0 AS lineup_available
-                FROM starters
-                GROUP BY match_id, team
-            )
-            SELECT
-                curr.season,
-                curr.league,
-                curr.squad,
-                curr.team,
-                curr.opposition,
-                curr.date,
-                curr.match_id,
-                curr.previous_match_id,
-                curr.unit,
-                COALESCE(MAX(CASE WHEN prev_lineup.lineup_available THEN 1 ELSE 0 END), 0) AS previous_lineup_available,
-                COUNT(DISTINCT CASE WHEN prev.player IS NOT NULL THEN curr.player END) AS retained
-            FROM starter_units curr
-            LEFT JOIN lineup_flags prev_lineup
-                ON prev_lineup.match_id = curr.previous_match_id
-                AND prev_lineup.team = curr.team
-            LEFT JOIN starter_units prev
-                ON prev.match_id = curr.previous_match_id
-                AND prev.team = curr.team
-                AND prev.unit = curr.unit
-                AND prev.player = curr.player
-            GROUP BY
-                curr.season,
-                curr.league,
-                curr.squad,
-                curr.team,
-                curr.opposition,
-                curr.date,
-                curr.match_id,
-                curr.previous_match_id,
-                curr.unit
-            """
-        )
-
-        self.con.execute(
-            """
-            CREATE VIEW v_rfu_average_retention AS
-            SELECT
-                season,
-                league,
-                squad,
-                team,
-                unit,
-                AVG(retained) AS average_retention,
-                COUNT(*) AS game_pairs
-            FROM v_rfu_match_retention
-            WHERE previous_match_id IS NOT NULL
-              AND previous_lineup_available = 1
-            GROUP BY season, league, squad, team, unit
-            """
-        )
-
         self.con.execute(
             """
             CREATE VIEW v_rfu_lineup_coverage AS
@@ -1362,7 +2313,9 @@ class BackendDatabase:
     def query(self, sql: str, params: list[Any] | None = None) -> pd.DataFrame:
         return self.con.execute(sql, params or []).df()
 
-    def export_tables(self) -> None:
+    @traced
+    def export_tables(self, names: set[str] | None = None) -> None:
+        """Export tables and views to JSON; ``names`` limits the export to a subset."""
         self.export_root.mkdir(parents=True, exist_ok=True)
         
         # Map of table/view names to their JSON columns and default values
@@ -1404,6 +2357,10 @@ class BackendDatabase:
             "games_rfu",
             "player_appearances",
             "player_appearances_rfu",
+            "v_rfu_team_games",
+            "v_rfu_squad_size",
+            "v_rfu_match_retention",
+            "v_rfu_average_retention",
             "lineouts",
             "set_piece",
             "season_scorers",
@@ -1417,34 +2374,54 @@ class BackendDatabase:
         ]
         view_names = [
             "v_season_results",
-            "v_rfu_team_games",
-            "v_rfu_squad_size",
-            "v_rfu_match_retention",
-            "v_rfu_average_retention",
             "v_rfu_lineup_coverage",
             "v_red_zone",
         ]
 
         expected_export_names = {f"{name}.json" for name in (table_names + view_names)}
+        expected_export_names.update(f"{name}.columns.json" for name in (table_names + view_names))
         expected_export_names.update({"scorer_coverage_audit.json", "scorer_coverage_audit.csv"})
+        # Every path written or removed here, so data/manifest.json can be brought up to date.
+        touched: list[Path] = []
         for path in self.export_root.glob("*.*"):
-            if path.name not in expected_export_names:
+            if path.name not in expected_export_names and not is_published_artifact(path):
                 path.unlink()
+                touched.append(path)
 
+        exported_records: dict[str, list[dict[str, Any]]] = {}
         for name in table_names + view_names:
-            df = self.con.execute(f"SELECT * FROM {name}").df()
-            export_df = _normalise_dates_for_json(df)
-            
-            # Deserialize JSON columns if this table has any registered
-            if name in json_columns_map and not export_df.empty:
-                for col, default_type in json_columns_map[name].items():
-                    if col in export_df.columns:
-                        default_value = [] if default_type == "array" else {}
-                        export_df[col] = export_df[col].apply(
-                            lambda value: json.loads(value) if isinstance(value, str) and value.strip() else default_value
-                        )
-            
-            export_df.to_json(self.export_root / f"{name}.json", orient="records")
+            if names is not None and name not in names:
+                continue
+            columns, records_json = self._export_records_json(name, json_columns_map.get(name, {}))
+            (self.export_root / f"{name}.json").write_text(records_json, encoding="utf-8")
+            # Compact column-oriented copy for the frontend; built from the records
+            # JSON so both files decode to identical rows.
+            records = json.loads(records_json)
+            exported_records[name] = records
+            columnar = _columnar_payload(records, columns)
+            (self.export_root / f"{name}.columns.json").write_text(
+                json.dumps(columnar, separators=(",", ":")),
+                encoding="utf-8",
+            )
+            touched += [self.export_root / f"{name}.json", self.export_root / f"{name}.columns.json"]
+
+        shard_exports = (
+            (PLAYER_SHARD_SOURCES, PLAYER_SHARD_DIRNAME, _player_shards),
+            (MATCH_SHARD_SOURCES, MATCH_SHARD_DIRNAME, _match_shards),
+        )
+        for sources, dirname, build_shards in shard_exports:
+            if names is not None and not names & set(sources):
+                continue
+            for name in sources:
+                if name not in exported_records:
+                    _, records_json = self._export_records_json(name, json_columns_map.get(name, {}))
+                    exported_records[name] = json.loads(records_json)
+            index, shards = build_shards({name: exported_records[name] for name in sources})
+            touched += self._write_shards(dirname, index, shards)
+
+        if names is not None and "games" not in names:
+            self._refresh_export_manifest(touched)
+            return
 
         # Scorer coverage audit: identify game_ids still missing all scorer payloads.
         scorer_audit_df = self.con.execute(
@@ -1482,12 +2459,57 @@ class BackendDatabase:
         scorer_audit_df = _normalise_dates_for_json(scorer_audit_df)
         scorer_audit_df.to_json(self.export_root / "scorer_coverage_audit.json", orient="records")
         scorer_audit_df.to_csv(self.export_root / "scorer_coverage_audit.csv", index=False)
+        touched.append(self.export_root / "scorer_coverage_audit.json")
+        self._refresh_export_manifest(touched)
+
+    def _refresh_export_manifest(self, paths: list[Path]) -> None:
+        """Update data/manifest.json for rewritten exports, so pages never fetch an older hashed copy."""
+        refresh_static_artifacts(paths, site_root=self.project_root, roots=(self.export_root,))
+
+    def _export_records_json(self, name: str, json_columns: dict[str, str]) -> tuple[list[str], str]:
+        """Export JSON for one table/view, with registered JSON text columns decoded."""
+        order_by = f" ORDER BY {EXPORT_ORDER_BY[name]}" if name in EXPORT_ORDER_BY else ""
+        df = self.con.execute(f"SELECT * FROM {name}{order_by}").df()
+        export_df = _normalise_dates_for_json(df)
+
+        # Deserialize JSON columns if this table has any registered
+        if json_columns and not export_df.empty:
+            for col, default_type in json_columns.items():
+                if col in export_df.columns:
+                    default_value = [] if default_type == "array" else {}
+                    export_df[col] = export_df[col].apply(
+                        lambda value: json.loads(value) if isinstance(value, str) and value.strip() else default_value
+                    )
+
+        return [str(column) for column in export_df.columns], export_df.to_json(orient="records")
 
+    def _write_shards(self, dirname: str, index: dict[str, Any], shards: dict[str, dict[str, Any]]) -> list[Path]:
+        """Write ``<export_dir>/<dirname>/<slug>.json`` plus index.json, removing stale shards.
+
+        Returns every path written or removed.
+        """
+        shard_dir = self.export_root / dirname
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        expected = {f"{slug}.json" for slug in shards} | {"index.json"}
+        touched = []
+        for path in shard_dir.glob("*.json"):
+            if path.name not in expected and not is_published_artifact(path):
+                path.unlink()
+                touched.append(path)
+        for slug, shard in shards.items():
+            (shard_dir / f"{slug}.json").write_text(json.dumps(shard, separators=(",", ":")), encoding="utf-8")
+            touched.append(shard_dir / f"{slug}.json")
+        (shard_dir / "index.json").write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+        touched.append(shard_dir / "index.json")
+        return touched
+
+    @traced
     def _insert(self, table_name: str, df: pd.DataFrame) -> None:
         if df.empty:
             return
         self.con.execute(f"INSERT INTO {table_name} SELECT * FROM df")
 
+    @traced
     def _build_ref_pitchero_player_name_overrides(self) -> pd.DataFrame:
         rows = [
             {"pitchero_name": pitchero_name, "canonical_name": canonical_name}
@@ -1495,6 +2517,7 @@ class BackendDatabase:
         ]
         return pd.DataFrame(rows, columns=["pitchero_name", "canonical_name"])
 
+    @traced
     def _build_ref_pitchero_opposition_overrides(self) -> pd.DataFrame:
         rows = [
             {"opposition_key": opposition_key, "canonical_opposition": canonical_name}
@@ -1502,6 +2525,7 @@ class BackendDatabase:
         ]
         return pd.DataFrame(rows, columns=["opposition_key", "canonical_opposition"])
 
+    @traced
     def _build_ref_pitchero_match_url_overrides(self) -> pd.DataFrame:
         rows = [
             {"game_id": game_id, "pitchero_match_url": url}
@@ -1509,6 +2533,7 @@ class BackendDatabase:
         ]
         return pd.DataFrame(rows, columns=["game_id", "pitchero_match_url"])
 
+    @traced
     def _build_pitchero_games_raw(self, historic_games_raw: pd.DataFrame) -> pd.DataFrame:
         columns = [
             "game_id",
@@ -1546,6 +2571,7 @@ class BackendDatabase:
         df["margin"] = pd.to_numeric(df["margin"], errors="coerce").astype("Int64")
         return df.drop_duplicates(subset=["game_id"])
 
+    @traced
     def _build_pitchero_games_clean(self, pitchero_games_raw: pd.DataFrame) -> pd.DataFrame:
         if pitchero_games_raw.empty:
             return pitchero_games_raw.copy()
@@ -1553,9 +2579,9 @@ class BackendDatabase:
         df = pitchero_games_raw.copy()
         historic_seasons = set(HISTORIC_PITCHERO_SEASON_IDS.keys())
         historic_mask = df["season"].isin(historic_seasons)
-        df.loc[historic_mask, "opposition"] = df.loc[historic_mask, "opposition"].map(_canonical_pitchero_opposition_name)
+        df.loc[historic_mask, "opposition"] = map_unique(df.loc[historic_mask, "opposition"], _canonical_pitchero_opposition_name)
         for col in ["captain", "motm", "vc1", "vc2"]:
-            df[col] = df[col].map(_canonical_player_name)
+            df[col] = map_unique(df[col], _canonical_player_name)
         
         # Filter out unfulfilled fixtures (0-0 scores or non-numeric score values like "W-L").
         # A fixture is considered unfulfilled if:
@@ -1590,6 +2616,7 @@ class BackendDatabase:
         
         return df
 
+    @traced
     def _build_pitchero_player_appearances_raw(self, historic_appearances_raw: pd.DataFrame) -> pd.DataFrame:
         columns = [
             "appearance_id",
@@ -1613,15 +2640,17 @@ class BackendDatabase:
             df[flag_col] = df[flag_col].fillna(False).astype(bool)
         return df.drop_duplicates(subset=["appearance_id"])
 
+    @traced
     def _build_pitchero_player_appearances_clean(self, pitchero_apps_raw: pd.DataFrame) -> pd.DataFrame:
         if pitchero_apps_raw.empty:
             return pitchero_apps_raw.copy()
 
         df = pitchero_apps_raw.copy()
-        df["player"] = df["player"].map(_canonical_player_name)
-        df["player_join"] = df["player"].map(clean_name)
+        df["player"] = map_unique(df["player"], _canonical_player_name)
+        df["player_join"] = map_unique(df["player"], clean_name)
         return df.drop_duplicates(subset=["appearance_id"])
 
+    @traced
     def _build_pitchero_stats_raw(self, pitchero_stats_source: pd.DataFrame) -> pd.DataFrame:
         expected_columns = ["Season", "Squad", "Player_join", "A", "Event", "Count"]
         if pitchero_stats_source.empty:
@@ -1632,6 +2661,7 @@ class BackendDatabase:
         df["Count"] = pd.to_numeric(df["Count"], errors="coerce").fillna(0).astype(int)
         return df
 
+    @traced
     def _build_pitchero_stats_clean(self, pitchero_stats_raw: pd.DataFrame) -> pd.DataFrame:
         if pitchero_stats_raw.empty:
             return pitchero_stats_raw.copy()
@@ -1644,6 +2674,7 @@ class BackendDatabase:
         df = df[df["Event"].isin(["T", "Con", "PK", "DG", "YC", "RC"])].copy()
         return df
 
+    @traced
     def _load_pitchero(self, extractor: DataExtractor, refresh: bool) -> pd.DataFrame:
         expected_columns = ["Season", "Squad", "Player_join", "A", "Event", "Count"]
 
@@ -1657,47 +2688,14 @@ class BackendDatabase:
         pitchero.to_json(self.pitchero_cache_file, orient="records")
         return pitchero
 
+    @traced
     def _load_historic_pitchero_team_sheets(
         self,
         extractor: DataExtractor,
         refresh_pitchero: bool,
     ) -> tuple[pd.DataFrame, pd.DataFrame]:
-        cache_games_cols = [
-            "game_id",
-            "date",
-            "season",
-            "squad",
-            "competition",
-            "game_type",
-            "opposition",
-            "home_away",
-            "pf",
-            "pa",
-            "result",
-            "margin",
-            "captain",
-            "motm",
-            "vc1",
-            "vc2",
-            "tries_scorers",
-            "conversions_scorers",
-            "penalties_scorers",
-            "drop_goals_scorers",
-            "pitchero_match_url",
-        ]
-        cache_apps_cols = [
-            "appearance_id",
-            "game_id",
-            "player",
-            "shirt_number",
-            "position",
-            "position_group",
-            "unit",
-            "is_starter",
-            "is_captain",
-            "is_vc",
-            "player_join",
-        ]
+        cache_games_cols = list(HISTORIC_PITCHERO_GAME_COLUMNS)
+        cache_apps_cols = list(HISTORIC_PITCHERO_APPEARANCE_COLUMNS)
 
         if refresh_pitchero:
             games_df, apps_df = extractor.extract_pitchero_historic_team_sheets(
@@ -1709,7 +2707,7 @@ class BackendDatabase:
                 self._write_historic_pitchero_cache(games_df, apps_df)
             return games_df.reindex(columns=cache_games_cols), apps_df.reindex(columns=cache_apps_cols)
 
-        if self.historic_pitchero_cache_file.exists():
+        if self.historic_pitchero_cache_file.exists() or self.historic_pitchero_store_dir.is_dir():
             cached_games, cached_apps = self._read_historic_pitchero_cache()
             cached_games, cached_apps = self._filter_to_historic_pitchero_seasons(cached_games, cached_apps)
             return cached_games.reindex(columns=cache_games_cols), cached_apps.reindex(columns=cache_apps_cols)
@@ -1722,14 +2720,19 @@ class BackendDatabase:
 
         raise FileNotFoundError(
             "Historic Pitchero cache not found. Run with --refresh-pitchero once to create "
-            f"{self.historic_pitchero_cache_file.as_posix()}"
+            f"{self.historic_pitchero_store_dir.as_posix()}"
         )
 
+    @property
+    def historic_pitchero_store_dir(self) -> Path:
+        return historic_pitchero_store_dir(self.historic_pitchero_cache_file)
+
     def _read_historic_pitchero_cache(self) -> tuple[pd.DataFrame, pd.DataFrame]:
-        with self.historic_pitchero_cache_file.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-        games = pd.DataFrame(payload.get("games", []))
-        appearances = pd.DataFrame(payload.get("appearances", []))
+        """Read the historic seasons from the Parquet store, migrating a JSON-only cache on first use."""
+        if self.historic_pitchero_store_dir.is_dir():
+            return read_historic_pitchero_store(self.historic_pitchero_store_dir, seasons=HISTORIC_PITCHERO_SEASON_IDS.keys())
+        games, appearances = read_historic_pitchero_cache(self.historic_pitchero_cache_file)
+        write_historic_pitchero_store(self.historic_pitchero_store_dir, games, appearances)
         return games, appearances
 
     def _filter_to_historic_pitchero_seasons(
@@ -1741,25 +2744,23 @@ class BackendDatabase:
         historic_seasons = set(HISTORIC_PITCHERO_SEASON_IDS.keys())
 
         if games_df.empty:
-            return games_df.copy(), apps_df.copy()
-
-        filtered_games = games_df.copy()
-        if "season" in filtered_games.columns:
-            filtered_games["season"] = filtered_games["season"].astype(str).str.strip()
-            filtered_games = filtered_games[filtered_games["season"].isin(historic_seasons)].copy()
+            return games_df, apps_df
 
-        if apps_df.empty:
-            return filtered_games, apps_df.copy()
+        filtered_games = games_df
+        if "season" in games_df.columns:
+            seasons = games_df["season"].astype(str).str.strip()
+            filtered_games = games_df.assign(season=seasons)[seasons.isin(historic_seasons)]
 
-        if "game_id" not in filtered_games.columns or "game_id" not in apps_df.columns:
-            return filtered_games, apps_df.copy()
+        if apps_df.empty or "game_id" not in filtered_games.columns or "game_id" not in apps_df.columns:
+            return filtered_games, apps_df
 
         historic_game_ids = set(filtered_games["game_id"].astype(str))
-        filtered_apps = apps_df.copy()
-        filtered_apps = filtered_apps[filtered_apps["game_id"].astype(str).isin(historic_game_ids)].copy()
-        return filtered_games, filtered_apps
+        return filtered_games, apps_df[apps_df["game_id"].astype(str).isin(historic_game_ids)]
 
     def _write_historic_pitchero_cache(self, games_df: pd.DataFrame, apps_df: pd.DataFrame) -> None:
+        write_historic_pitchero_store(self.historic_pitchero_store_dir, games_df, apps_df)
+        if not self.config.export_historic_pitchero_json:
+            return
         payload = {
             "games": games_df.to_dict(orient="records"),
             "appearances": apps_df.to_dict(orient="records"),
@@ -1828,7 +2829,7 @@ class BackendDatabase:
                         """
                     ).df()
                     if not appearances.empty:
-                        appearances["player_join"] = appearances["player"].map(clean_name)
+                        appearances["player_join"] = map_unique(appearances["player"], clean_name)
                     if not games.empty or not appearances.empty:
                         return games, appearances
             except Exception:
@@ -1836,10 +2837,9 @@ class BackendDatabase:
 
         return pd.DataFrame(), pd.DataFrame()
 
+    @traced
     def _extract_2526_scorers(self, extractor: DataExtractor) -> pd.DataFrame:
-        spreadsheet = extractor.client.open_by_url(extractor.sheet_url)
-        worksheet = spreadsheet.worksheet("25/26 Scorers")
-        values = worksheet.get_all_values()
+        values = extractor.sheet_values("25/26 Scorers")
         if not values:
             return pd.DataFrame(columns=["Squad", "Date", "Opposition", "Score", "Count", "Player", "Points"])
 
@@ -2036,12 +3036,11 @@ class BackendDatabase:
                 games_with_scorers[col] = None
         return _order_game_columns(games_with_scorers)
 
+    @traced
     def _extract_lineouts(self, extractor: DataExtractor) -> pd.DataFrame:
-        spreadsheet = extractor.client.open_by_url(extractor.sheet_url)
         rows: list[dict[str, Any]] = []
         for squad, sheet_name in [("1st", "1st XV Lineouts"), ("2nd", "2nd XV Lineouts")]:
-            worksheet = spreadsheet.worksheet(sheet_name)
-            values = worksheet.get_all_values()
+            values = extractor.sheet_values(sheet_name)
             if len(values) <= 3:
                 continue
 
@@ -2089,6 +3088,7 @@ class BackendDatabase:
 
         return pd.DataFrame(rows)
 
+    @traced
     def _build_games(self, games_raw: pd.DataFrame, appearances_raw: pd.DataFrame | None = None) -> pd.DataFrame:
         df = games_raw.copy()
         # Reset per-build alias map used to remap appearances from duplicate raw game_ids
@@ -2108,7 +3108,7 @@ class BackendDatabase:
         pitchero_primary_source_seasons = PITCHERO_PRIMARY_SOURCE_SEASONS
         # Apply opposition canonicalization to all rows so Google Sheets entries
         # (e.g. "Heathfield II") are normalised the same way as Pitchero entries.
-        df["opposition"] = df["opposition"].map(_canonical_pitchero_opposition_name)
+        df["opposition"] = map_unique(df["opposition"], _canonical_pitchero_opposition_name)
         df["pf"] = pd.to_numeric(df["pf"], errors="coerce").astype("Int64")
         df["pa"] = pd.to_numeric(df["pa"], errors="coerce").astype("Int64")
         df["game_id"] = df["game_id"].astype(str)
@@ -2119,10 +3119,7 @@ class BackendDatabase:
         _opposition_alias_map: dict[str, str] = {}
         if not df.empty:
             _old_ids = df["game_id"].astype(str)
-            _new_ids = df.apply(
-                lambda row: _canonical_game_id(row.get("date"), row.get("squad"), row.get("opposition")),
-                axis=1,
-            )
+            _new_ids = _canonical_game_ids(df)
             _opposition_alias_map = {
                 str(old): str(new)
                 for old, new in zip(_old_ids, _new_ids)
@@ -2147,20 +3144,20 @@ class BackendDatabase:
             lookup_apps["game_id"] = lookup_apps["game_id"].astype(str).map(
                 lambda game_id: self._game_id_alias_map.get(game_id, game_id)
             )
-            lookup_apps["player"] = lookup_apps["player"].map(_canonical_player_name)
-            lookup_apps["player_join"] = lookup_apps["player"].map(clean_name)
+            lookup_apps["player"] = map_unique(lookup_apps["player"], _canonical_player_name)
+            lookup_apps["player_join"] = map_unique(lookup_apps["player"], clean_name)
 
-            for row in lookup_apps.drop_duplicates(subset=["game_id", "player"]).itertuples(index=False):
-                game_lookup = scorer_name_lookup.setdefault(str(row.game_id), {})
-                game_lookup[(str(row.player).strip(), str(row.player_join).strip())] = str(row.player).strip()
-                game_lookup[(str(row.player_join).strip(), str(row.player_join).strip())] = str(row.player).strip()
+            lookup_apps = lookup_apps.drop_duplicates(subset=["game_id", "player"])
+            players = lookup_apps["player"].astype(str).str.strip()
+            player_joins = lookup_apps["player_join"].astype(str).str.strip()
+            for game_id, player, player_join in zip(lookup_apps["game_id"].astype(str), players, player_joins):
+                game_lookup = scorer_name_lookup.setdefault(game_id, {})
+                game_lookup[(player, player_join)] = player
+                game_lookup[(player_join, player_join)] = player
 
         df["has_score"] = (df["pf"].notna() & df["pa"].notna()).astype(int)
         df["has_pitchero_url"] = df["pitchero_match_url"].notna().astype(int)
-        df["has_pitchero_scorers"] = df[scorer_columns].fillna("{}").astype(str).apply(
-            lambda row: any(value.strip() not in {"", "{}", "null", "None"} for value in row),
-            axis=1,
-        ).astype(int)
+        df["has_pitchero_scorers"] = _non_empty_jsonish(df[scorer_columns]).any(axis=1).astype(int)
         df["has_result"] = df["result"].notna().astype(int)
         df["_source_priority"] = (df["_source"].astype(str) == "google").astype(int)
 
@@ -2191,20 +3188,13 @@ class BackendDatabase:
         # Sort by (squad, date, match_key, quality_score DESC, opposition_length DESC, game_id)
         # Prefer score-based identity for duplicates on the same day; fall back to opposition key
         # when scores are unavailable. This keeps true double-headers while merging alias rows.
-        df["_score_match_key"] = df.apply(
-            lambda row: (
-                f"{min(int(row['pf']), int(row['pa']))}:{max(int(row['pf']), int(row['pa']))}"
-                if pd.notna(row.get("pf")) and pd.notna(row.get("pa"))
-                else ""
-            ),
-            axis=1,
+        df["_score_match_key"] = _score_pair_keys(df["pf"], df["pa"])
+        df["_opp_dedupe_key"] = map_unique(
+            df["opposition"],
+            lambda value: _normalise_key(str(_canonical_pitchero_opposition_name(value))),
         )
-        df["_opp_dedupe_key"] = df["opposition"].map(
-            lambda value: _normalise_key(str(_canonical_pitchero_opposition_name(value)))
-        )
-        df["_match_dedupe_key"] = df.apply(
-            lambda row: row["_score_match_key"] if row["_score_match_key"] else row["_opp_dedupe_key"],
-            axis=1,
+        df["_match_dedupe_key"] = df["_score_match_key"].where(
+            df["_score_match_key"] != "", df["_opp_dedupe_key"]
         )
         df["_opposition_length"] = df["opposition"].str.len()
         sorted_df = df.sort_values(
@@ -2235,10 +3225,9 @@ class BackendDatabase:
             alias_map_df["canonical_game_id"].notna() & (alias_map_df["game_id"] != alias_map_df["canonical_game_id"])
         ]
         if not alias_map_df.empty:
-            self._game_id_alias_map = {
-                str(row.game_id): str(row.canonical_game_id)
-                for row in alias_map_df.itertuples(index=False)
-            }
+            self._game_id_alias_map = dict(
+                zip(alias_map_df["game_id"].astype(str), alias_map_df["canonical_game_id"].astype(str))
+            )
         # Fold in opposition-canonicalization aliases. Dedup aliases take priority
         # (they may redirect to a different canonical ID entirely).
         if _opposition_alias_map:
@@ -2267,8 +3256,9 @@ class BackendDatabase:
         _google_squads_dates = set(
             df.loc[df["_source"] == "google", ["squad", "date"]].itertuples(index=False, name=None)
         )
-        _pitchero_overlap = (df["_source"] == "pitchero") & df.apply(
-            lambda row: (str(row["squad"]), row["date"]) in _google_squads_dates, axis=1
+        _squad_dates = pd.MultiIndex.from_arrays([df["squad"].astype(str), df["date"]])
+        _pitchero_overlap = (df["_source"] == "pitchero") & pd.Series(
+            _squad_dates.isin(list(_google_squads_dates)), index=df.index
         )
         if _pitchero_overlap.any():
             print(f"Removing {_pitchero_overlap.sum()} Pitchero-only rows overlapping with Google games.")
@@ -2307,11 +3297,11 @@ class BackendDatabase:
         if not pitchero_lookup.empty:
             pitchero_lookup["pf"] = pd.to_numeric(pitchero_lookup["pf"], errors="coerce")
             pitchero_lookup["pa"] = pd.to_numeric(pitchero_lookup["pa"], errors="coerce")
-            _pitchero_opp_parts = pitchero_lookup["opposition"].map(_split_opposition_club_team)
+            _pitchero_opp_parts = map_unique(pitchero_lookup["opposition"], _split_opposition_club_team)
             pitchero_lookup["opp_club_key"] = _pitchero_opp_parts.map(lambda parts: _normalise_key(parts[0]))
             pitchero_lookup["opp_team_number"] = _pitchero_opp_parts.map(lambda parts: parts[1])
 
-            def _score_match_quality(row: pd.Series, cand: pd.Series) -> float:
+            def _score_match_quality(row: pd.Series, cand: dict[str, Any]) -> float:
                 row_club, row_team = _split_opposition_club_team(row.get("opposition"))
                 row_key = _normalise_key(row_club)
                 cand_key = str(cand.get("opp_club_key") or "")
@@ -2345,31 +3335,32 @@ class BackendDatabase:
                         quality += 1.0
                 return quality
 
-            for idx, row in df.iterrows():
-                needs_url = _is_empty_jsonish(row.get("pitchero_match_url"))
-                needs_scorers = all(_is_empty_jsonish(row.get(col)) for col in scorer_columns)
-                if not needs_url and not needs_scorers:
-                    continue
+            # Group candidates by (squad, date) once instead of filtering per row.
+            candidates_by_key: dict[tuple[str, Any], list[dict[str, Any]]] = {}
+            for cand in pitchero_lookup.to_dict("records"):
+                candidates_by_key.setdefault((str(cand.get("squad")), cand.get("date")), []).append(cand)
 
-                candidates = pitchero_lookup[
-                    (pitchero_lookup["squad"].astype(str) == str(row.get("squad")))
-                    & (pitchero_lookup["date"] == row.get("date"))
-                ]
-                if candidates.empty:
+            needs_url_mask = df["pitchero_match_url"].map(_is_empty_jsonish).astype(bool)
+            needs_scorers_mask = ~_non_empty_jsonish(df[scorer_columns]).any(axis=1)
+            for idx in df.index[needs_url_mask | needs_scorers_mask]:
+                row = df.loc[idx]
+                needs_url = bool(needs_url_mask.loc[idx])
+
+                candidates = candidates_by_key.get((str(row.get("squad")), row.get("date")))
+                if not candidates:
                     continue
 
-                best_idx = None
+                best = None
                 best_quality = -1.0
-                for cand_idx, cand in candidates.iterrows():
+                for cand in candidates:
                     quality = _score_match_quality(row, cand)
                     if quality > best_quality:
                         best_quality = quality
-                        best_idx = cand_idx
+                        best = cand
 
-                if best_idx is None or best_quality < 1.0:
+                if best is None or best_quality < 1.0:
                     continue
 
-                best = candidates.loc[best_idx]
                 if needs_url:
                     df.at[idx, "pitchero_match_url"] = best.get("pitchero_match_url")
                 for col in scorer_columns:
@@ -2379,12 +3370,15 @@ class BackendDatabase:
                     df.at[idx, "motm"] = best.get("motm")
 
         if scorer_name_lookup:
-            for idx, row in df.iterrows():
-                player_lookup = scorer_name_lookup.get(str(row.get("game_id")))
-                if not player_lookup:
-                    continue
+            game_lookups = df["game_id"].astype(str).map(scorer_name_lookup)
+            has_lookup = game_lookups.map(bool, na_action="ignore").fillna(False).astype(bool)
+            if has_lookup.any():
+                lookups = game_lookups[has_lookup]
                 for col in scorer_columns:
-                    df.at[idx, col] = _normalise_scorer_payload_names(row.get(col), player_lookup)
+                    df.loc[has_lookup, col] = [
+                        _normalise_scorer_payload_names(value, player_lookup)
+                        for value, player_lookup in zip(df.loc[has_lookup, col], lookups)
+                    ]
 
         # Replace generic league competition labels with the season/squad-specific
         # league name when one is available in the same group.
@@ -2411,9 +3405,14 @@ class BackendDatabase:
                     (str(row.squad), str(row.season)): str(row.competition)
                     for row in preferred_by_group.itertuples(index=False)
                 }
-                mapped_competitions = df.loc[generic_league_mask, ["squad", "season"]].apply(
-                    lambda row: preferred_lookup.get((str(row["squad"]), str(row["season"]))),
-                    axis=1,
+                generic_rows = df.loc[generic_league_mask]
+                mapped_competitions = pd.Series(
+                    [
+                        preferred_lookup.get((str(squad), str(season)))
+                        for squad, season in zip(generic_rows["squad"], generic_rows["season"])
+                    ],
+                    index=generic_rows.index,
+                    dtype=object,
                 )
                 fill_indexes = mapped_competitions[mapped_competitions.notna()].index
                 if len(fill_indexes) > 0:
@@ -2451,6 +3450,7 @@ class BackendDatabase:
             }
         )
 
+    @traced
     def _build_player_appearances(self, appearances_raw: pd.DataFrame, games: pd.DataFrame) -> pd.DataFrame:
         if appearances_raw.empty:
             return pd.DataFrame(
@@ -2497,7 +3497,7 @@ class BackendDatabase:
 
         df = df.merge(games[["game_id", "squad", "date", "season", "game_type"]], on="game_id", how="left")
         df = df[df["player"].notna()]
-        df["player"] = df["player"].map(_canonical_player_name)
+        df["player"] = map_unique(df["player"], _canonical_player_name)
 
         # Guarded alias cleanup: only remap alias -> canonical when the canonical
         # name is already present for the same game_id.
@@ -2640,6 +3640,7 @@ class BackendDatabase:
         synthetic_df = pd.DataFrame(synthetic_rows)[existing_cols]
         return pd.concat([adjusted, synthetic_df], ignore_index=True)
 
+    @traced
     def _build_lineouts(self, lineouts_raw: pd.DataFrame, games: pd.DataFrame) -> pd.DataFrame:
         if lineouts_raw.empty:
             return pd.DataFrame(
@@ -2712,6 +3713,7 @@ class BackendDatabase:
             ]
         ].rename(columns={"hooker": "thrower"})
 
+    @traced
     def _build_set_piece(self, set_piece_raw: pd.DataFrame, games: pd.DataFrame) -> pd.DataFrame:
         if set_piece_raw.empty:
             return pd.DataFrame(
@@ -2786,6 +3788,7 @@ class BackendDatabase:
             ]
         ].drop_duplicates(subset=["squad", "date", "team"])
 
+    @traced
     def _build_season_scorers(
         self,
         scorers_2526_raw: pd.DataFrame,
@@ -2805,8 +3808,8 @@ class BackendDatabase:
 
         appearance_names = appearances[["player"]].dropna().copy()
         if not appearance_names.empty:
-            appearance_names["player"] = appearance_names["player"].map(_canonical_player_name)
-            appearance_names["player_join"] = appearance_names["player"].map(clean_name)
+            appearance_names["player"] = map_unique(appearance_names["player"], _canonical_player_name)
+            appearance_names["player_join"] = map_unique(appearance_names["player"], clean_name)
             player_lookup = (
                 appearance_names.groupby("player_join", as_index=False)
                 .agg(player=("player", _mode_or_none))
@@ -2909,7 +3912,7 @@ class BackendDatabase:
                     else:
                         keyed_games = games[keyed_cols + scorer_payload_cols].copy()
                     keyed_games["date"] = _safe_date(keyed_games["date"])
-                    keyed_games["opposition"] = keyed_games["opposition"].map(_canonical_pitchero_opposition_name)
+                    keyed_games["opposition"] = map_unique(keyed_games["opposition"], _canonical_pitchero_opposition_name)
                     keyed_games["opposition"] = keyed_games["opposition"].astype(str).str.strip()
                     if scorer_payload_cols:
                         keyed_games["has_scorer_payload"] = keyed_games[scorer_payload_cols].fillna("").astype(str).apply(
@@ -2925,7 +3928,10 @@ class BackendDatabase:
                 game_lookup = games[["squad", "season", "game_type"]].copy() if not games.empty else pd.DataFrame()
                 if not game_lookup.empty:
                     game_lookup["date"] = _safe_date(games.get("date"))
-                    game_lookup["opposition"] = games.get("opposition", pd.Series(index=games.index, dtype="object")).map(_canonical_pitchero_opposition_name)
+                    game_lookup["opposition"] = map_unique(
+                        games.get("opposition", pd.Series(index=games.index, dtype="object")),
+                        _canonical_pitchero_opposition_name,
+                    )
                     game_lookup["opposition"] = game_lookup["opposition"].astype(str).str.strip()
                     game_lookup = game_lookup.drop_duplicates(subset=["squad", "date", "opposition"], keep="first")
 
@@ -2987,6 +3993,7 @@ class BackendDatabase:
             source=("source", lambda s: "+".join(sorted(set(s)))),
         )
 
+    @traced
     def _build_players(
         self,
         appearances: pd.DataFrame,
@@ -3173,167 +4180,218 @@ class BackendDatabase:
             return {"League"}
         return None
 
-    @staticmethod
-    def _resolve_starter_position(shirt_number) -> str | None:
-        try:
-            n = int(float(shirt_number))
-        except (TypeError, ValueError):
-            return None
-        if n in (1, 3): return "Prop"
-        if n == 2: return "Hooker"
-        if n in (4, 5): return "Second Row"
-        if n in (6, 7): return "Flanker"
-        if n == 8: return "Number 8"
-        if n == 9: return "Scrum Half"
-        if n == 10: return "Fly Half"
-        if n in (12, 13): return "Centre"
-        if n in (11, 14): return "Wing"
-        if n == 15: return "Full Back"
-        return None
-
-    def _build_squad_stats(self, appearances: pd.DataFrame, games: pd.DataFrame) -> pd.DataFrame:
-        columns = ["season", "gameTypeMode", "squad", "unit", "playerCounts", "playersUsed"]
-        if appearances.empty:
-            return pd.DataFrame(columns=columns)
-
-        df = appearances[
-            appearances["squad"].isin(["1st", "2nd"]) &
-            appearances["game_id"].notna() &
-            appearances["player"].notna()
-        ].copy()
-        df["player"] = df["player"].astype(str).str.strip()
-        df = df[df["player"] != ""]
-
-        gt = games.set_index("game_id")["game_type"].to_dict()
-        df["game_type"] = df["game_type"].where(
-            df["game_type"].notna(), df["game_id"].map(gt)
-        )
-
+    def _game_type_modes_sql(self) -> str:
+        """``modes`` CTE: one row per game-type mode with its allowed game types (NULL = all)."""
         rows = []
-        for mode in self._GAME_TYPE_MODES:
+        for mode_order, mode in enumerate(self._GAME_TYPE_MODES):
             allowed = self._get_allowed_game_types(mode)
-            filtered = df[df["game_type"].isin(allowed)] if allowed is not None else df
-
-            for squad in ["1st", "2nd"]:
-                squad_df = filtered[filtered["squad"] == squad]
-                for season, grp in squad_df.groupby("season"):
-                    for unit_label, unit_df in [
-                        ("Total", grp),
-                        ("Forwards", grp[grp["unit"] == "Forwards"]),
-                        ("Backs", grp[grp["unit"] == "Backs"]),
-                    ]:
-                        pc = unit_df.groupby("player").size().to_dict()
-                        rows.append({"season": season, "gameTypeMode": mode, "squad": squad, "unit": unit_label, "playerCounts": json.dumps(pc), "playersUsed": len(pc)})
-
-            for season, grp in filtered.groupby("season"):
-                for unit_label, unit_df in [
-                    ("Total", grp),
-                    ("Forwards", grp[grp["unit"] == "Forwards"]),
-                    ("Backs", grp[grp["unit"] == "Backs"]),
-                ]:
-                    pc = unit_df.groupby("player").size().to_dict()
-                    rows.append({"season": season, "gameTypeMode": mode, "squad": "Total", "unit": unit_label, "playerCounts": json.dumps(pc), "playersUsed": len(pc)})
-
-        return pd.DataFrame(rows, columns=columns)
-
-    def _build_squad_position_profiles(self, appearances: pd.DataFrame, games: pd.DataFrame) -> pd.DataFrame:
-        columns = ["season", "gameTypeMode", "squad", "position", "playerCounts", "playersUsed"]
-        if appearances.empty:
-            return pd.DataFrame(columns=columns)
+            allowed_sql = (
+                "NULL::VARCHAR[]"
+                if allowed is None
+                else "[" + ", ".join(f"'{game_type}'" for game_type in sorted(allowed)) + "]"
+            )
+            rows.append(f"({mode_order}, '{mode}', {allowed_sql})")
+        return f"modes(mode_order, mode, allowed) AS (VALUES {', '.join(rows)})"
+
+    def _squad_appearances_sql(self, starters_only: bool = False) -> str:
+        """CTEs ``apps`` (1st/2nd XV appearances with resolved game type) and ``mode_apps``."""
+        starter_filter = "AND a.is_starter = TRUE" if starters_only else ""
+        return f"""
+            {self._game_type_modes_sql()},
+            apps AS (
+                SELECT
+                    a.season,
+                    a.squad,
+                    a.unit,
+                    a.number AS shirt_number,
+                    a.game_id,
+                    TRIM(a.player) AS player,
+                    COALESCE(a.game_type, g.game_type) AS game_type,
+                    COALESCE(a.date, g.date) AS game_date
+                FROM player_appearances a
+                LEFT JOIN games g USING (game_id)
+                WHERE a.squad IN ('1st', '2nd')
+                  AND a.game_id IS NOT NULL
+                  AND a.player IS NOT NULL
+                  {starter_filter}
+            ),
+            mode_apps AS (
+                SELECT m.mode_order, m.mode, apps.*
+                FROM apps
+                CROSS JOIN modes m
+                WHERE apps.player <> ''
+                  AND apps.season IS NOT NULL
+                  AND (m.allowed IS NULL OR list_contains(m.allowed, apps.game_type))
+            )
+        """
 
-        df = appearances[
-            appearances["squad"].isin(["1st", "2nd"]) &
-            appearances["game_id"].notna() &
-            appearances["player"].notna() &
-            (appearances["is_starter"] == True)
-        ].copy()
-        df["player"] = df["player"].astype(str).str.strip()
-        df = df[df["player"] != ""]
-        df["canonical_position"] = df["shirt_number"].apply(self._resolve_starter_position)
-        df = df[df["canonical_position"].notna()]
-
-        gt = games.set_index("game_id")["game_type"].to_dict()
-        df["game_type"] = df["game_type"].where(
-            df["game_type"].notna(), df["game_id"].map(gt)
-        )
+    # Squad rows per mode/season: each XV, then both combined as "Total".
+    _SQUAD_SCOPES_SQL = """
+            scoped AS (
+                SELECT mode_order, mode, season, squad, CASE squad WHEN '1st' THEN 0 ELSE 1 END AS squad_order,
+                       unit, player, game_id
+                FROM mode_apps
+                UNION ALL
+                SELECT mode_order, mode, season, 'Total', 2, unit, player, game_id
+                FROM mode_apps
+            ),
+            units(unit_order, unit) AS (VALUES (0, 'Total'), (1, 'Forwards'), (2, 'Backs')),
+            unit_apps AS (
+                SELECT s.mode_order, s.mode, s.season, s.squad, s.squad_order, u.unit_order, u.unit, s.player, s.game_id
+                FROM scoped s
+                JOIN units u ON u.unit = 'Total' OR s.unit = u.unit
+            ),
+            season_groups AS (
+                SELECT DISTINCT mode_order, mode, season, squad, squad_order FROM scoped
+            ),
+            group_units AS (
+                SELECT g.*, u.unit_order, u.unit FROM season_groups g CROSS JOIN units u
+            ),
+            player_counts AS (
+                SELECT mode, season, squad, unit, player, COUNT(*) AS appearances
+                FROM unit_apps
+                GROUP BY mode, season, squad, unit, player
+            )
+    """
 
-        rows = []
-        for mode in self._GAME_TYPE_MODES:
-            allowed = self._get_allowed_game_types(mode)
-            filtered = df[df["game_type"].isin(allowed)] if allowed is not None else df
+    @traced
+    def _build_squad_stats_sql(self) -> str:
+        """Players used per season/squad/unit with per-player appearance counts as JSON."""
+        return f"""
+            WITH {self._squad_appearances_sql()},
+            {self._SQUAD_SCOPES_SQL}
+            SELECT
+                gu.season,
+                gu.mode AS gameTypeMode,
+                gu.squad,
+                gu.unit,
+                COALESCE(
+                    '{{' || STRING_AGG(to_json(pc.player) || ': ' || pc.appearances, ', ' ORDER BY pc.player) || '}}',
+                    '{{}}'
+                ) AS playerCounts,
+                COUNT(pc.player)::INTEGER AS playersUsed
+            FROM group_units gu
+            LEFT JOIN player_counts pc USING (mode, season, squad, unit)
+            GROUP BY gu.mode_order, gu.mode, gu.squad_order, gu.squad, gu.season, gu.unit_order, gu.unit
+            ORDER BY gu.mode_order, gu.squad_order, gu.season, gu.unit_order
+        """
 
-            for (season, squad, position), grp in filtered.groupby(["season", "squad", "canonical_position"]):
-                pc = grp.groupby("player").size().to_dict()
-                rows.append({"season": season, "gameTypeMode": mode, "squad": squad, "position": position, "playerCounts": json.dumps(pc), "playersUsed": len(pc)})
+    @traced
+    def _build_squad_position_profiles_sql(self) -> str:
+        """Distinct starters per season/squad/position with per-player start counts as JSON."""
+        return f"""
+            WITH {self._squad_appearances_sql(starters_only=True)},
+            positioned AS (
+                SELECT
+                    mode_order,
+                    mode,
+                    season,
+                    squad,
+                    player,
+                    CASE shirt_number
+                        WHEN 1 THEN 'Prop' WHEN 3 THEN 'Prop'
+                        WHEN 2 THEN 'Hooker'
+                        WHEN 4 THEN 'Second Row' WHEN 5 THEN 'Second Row'
+                        WHEN 6 THEN 'Flanker' WHEN 7 THEN 'Flanker'
+                        WHEN 8 THEN 'Number 8'
+                        WHEN 9 THEN 'Scrum Half'
+                        WHEN 10 THEN 'Fly Half'
+                        WHEN 12 THEN 'Centre' WHEN 13 THEN 'Centre'
+                        WHEN 11 THEN 'Wing' WHEN 14 THEN 'Wing'
+                        WHEN 15 THEN 'Full Back'
+                    END AS position
+                FROM mode_apps
+            ),
+            player_counts AS (
+                SELECT mode_order, mode, season, squad, position, player, COUNT(*) AS starts
+                FROM positioned
+                WHERE position IS NOT NULL
+                GROUP BY ALL
+            )
+            SELECT
+                season,
+                mode AS gameTypeMode,
+                squad,
+                position,
+                '{{' || STRING_AGG(to_json(player) || ': ' || starts, ', ' ORDER BY player) || '}}' AS playerCounts,
+                COUNT(*)::INTEGER AS playersUsed
+            FROM player_counts
+            GROUP BY mode_order, mode, season, squad, position
+            ORDER BY mode_order, season, squad, position
+        """
 
-        return pd.DataFrame(rows, columns=columns)
+    @traced
+    def _build_squad_continuity(self, window: int | None = None) -> pd.DataFrame:
+        """Average number of starters retained from the previous ``window`` games.
 
-    def _build_squad_continuity(self, appearances: pd.DataFrame, games: pd.DataFrame) -> pd.DataFrame:
+        Games are ranked by date within each season/squad/mode and every game after
+        the first ``window`` is compared with the union of starters in the ``window``
+        games before it (``window=1`` is plain match-to-match retention). All modes,
+        squads and units are computed in one DuckDB query; only the final
+        ``round`` happens in Python so values match the previous pandas output.
+        """
         columns = ["season", "gameTypeMode", "squad", "unit", "retained", "gamePairs"]
-        if appearances.empty:
+        window = int(window if window is not None else self.config.continuity_window)
+        if window < 1:
+            raise ValueError(f"continuity window must be at least 1, got {window}")
+
+        df = self.con.execute(
+            f"""
+            WITH {self._squad_appearances_sql(starters_only=True)},
+            units(unit_order, unit) AS (VALUES (0, 'Total'), (1, 'Forwards'), (2, 'Backs')),
+            game_order AS (
+                SELECT
+                    mode_order, mode, season, squad, game_id,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY mode, season, squad ORDER BY MIN(game_date) NULLS LAST, game_id
+                    ) AS game_rank
+                FROM mode_apps
+                GROUP BY mode_order, mode, season, squad, game_id
+            ),
+            ranked AS (
+                SELECT DISTINCT o.mode, o.season, o.squad, o.game_rank, u.unit, m.player
+                FROM mode_apps m
+                JOIN game_order o USING (mode, season, squad, game_id)
+                JOIN units u ON u.unit = 'Total' OR m.unit = u.unit
+            ),
+            retained_players AS (
+                SELECT DISTINCT cur.mode, cur.season, cur.squad, cur.unit, cur.game_rank, cur.player
+                FROM ranked cur
+                JOIN ranked prev
+                  ON prev.mode = cur.mode AND prev.season = cur.season AND prev.squad = cur.squad
+                 AND prev.unit = cur.unit AND prev.player = cur.player
+                 AND prev.game_rank BETWEEN cur.game_rank - {window} AND cur.game_rank - 1
+                WHERE cur.game_rank > {window}
+            ),
+            per_game AS (
+                SELECT o.mode_order, o.mode, o.season, o.squad, u.unit_order, u.unit, o.game_rank,
+                       COUNT(r.player) AS retained
+                FROM game_order o
+                CROSS JOIN units u
+                LEFT JOIN retained_players r USING (mode, season, squad, unit, game_rank)
+                WHERE o.game_rank > {window}
+                GROUP BY ALL
+            )
+            SELECT
+                season,
+                mode AS gameTypeMode,
+                squad,
+                unit,
+                SUM(retained)::INTEGER AS retained_total,
+                COUNT(*)::INTEGER AS gamePairs
+            FROM per_game
+            GROUP BY mode_order, mode, season, squad, unit_order, unit
+            ORDER BY mode_order, season, squad, unit_order
+            """
+        ).df()
+        if df.empty:
             return pd.DataFrame(columns=columns)
+        df["retained"] = [
+            round(total / pairs, 4) for total, pairs in zip(df["retained_total"].tolist(), df["gamePairs"].tolist())
+        ]
+        return df[columns]
 
-        df = appearances[
-            appearances["squad"].isin(["1st", "2nd"]) &
-            appearances["game_id"].notna() &
-            appearances["player"].notna() &
-            (appearances["is_starter"] == True)
-        ].copy()
-        df["player"] = df["player"].astype(str).str.strip()
-        df = df[df["player"] != ""]
-
-        games_indexed = games.set_index("game_id")
-        gt = games_indexed["game_type"].to_dict()
-        dates = games_indexed["date"].to_dict()
-        df["game_type"] = df["game_type"].where(
-            df["game_type"].notna(), df["game_id"].map(gt)
-        )
-        df["date_resolved"] = pd.to_datetime(
-            df["date"].where(df["date"].notna(), df["game_id"].map(dates)), errors="coerce"
-        )
-
-        rows = []
-        for mode in self._GAME_TYPE_MODES:
-            allowed = self._get_allowed_game_types(mode)
-            filtered = df[df["game_type"].isin(allowed)] if allowed is not None else df
-
-            for (season, squad), grp in filtered.groupby(["season", "squad"]):
-                game_dates = grp.groupby("game_id")["date_resolved"].first().reset_index()
-                game_dates = game_dates.sort_values("date_resolved")
-                game_ids_sorted = game_dates["game_id"].tolist()
-                if len(game_ids_sorted) < 2:
-                    continue
-
-                by_game: dict[str, dict[str, set]] = {}
-                for _, row in grp.iterrows():
-                    gid = row["game_id"]
-                    player = row["player"]
-                    unit = row.get("unit")
-                    if gid not in by_game:
-                        by_game[gid] = {"Total": set(), "Forwards": set(), "Backs": set()}
-                    by_game[gid]["Total"].add(player)
-                    if unit in ("Forwards", "Backs"):
-                        by_game[gid][unit].add(player)
-
-                retentions: dict[str, list[int]] = {"Total": [], "Forwards": [], "Backs": []}
-                for i in range(1, len(game_ids_sorted)):
-                    prev_id = game_ids_sorted[i - 1]
-                    curr_id = game_ids_sorted[i]
-                    if prev_id not in by_game or curr_id not in by_game:
-                        continue
-                    for unit in ["Total", "Forwards", "Backs"]:
-                        prev_set = by_game[prev_id].get(unit, set())
-                        curr_set = by_game[curr_id].get(unit, set())
-                        retentions[unit].append(len(curr_set & prev_set))
-
-                for unit in ["Total", "Forwards", "Backs"]:
-                    if not retentions[unit]:
-                        continue
-                    avg = sum(retentions[unit]) / len(retentions[unit])
-                    rows.append({"season": season, "gameTypeMode": mode, "squad": squad, "unit": unit, "retained": round(avg, 4), "gamePairs": len(retentions[unit])})
-
-        return pd.DataFrame(rows, columns=columns)
-
+    @traced
     def _build_season_summary(
         self,
         games: pd.DataFrame,
@@ -3500,6 +4558,7 @@ class BackendDatabase:
 
         return pd.DataFrame(rows, columns=columns)
 
+    @traced
     def _build_player_profiles_base(
         self,
         players: pd.DataFrame,
@@ -3723,79 +4782,43 @@ class BackendDatabase:
 
         return pd.DataFrame(rows, columns=columns)
 
-    def _build_squad_stats_with_thresholds(self, appearances: pd.DataFrame, games: pd.DataFrame) -> pd.DataFrame:
+    @traced
+    def _build_squad_stats_with_thresholds_sql(self) -> str:
         """
         Pre-compute player counts at different appearance thresholds (0-20).
         Eliminates need for client-side recalculation of threshold filtering.
         """
-        columns = ["season", "gameTypeMode", "squad", "unit", "minimumAppearances", "playerCount", "totalPlayed"]
-        if appearances.empty:
-            return pd.DataFrame(columns=columns)
-
-        df = appearances[
-            appearances["squad"].isin(["1st", "2nd"]) &
-            appearances["game_id"].notna() &
-            appearances["player"].notna()
-        ].copy()
-        df["player"] = df["player"].astype(str).str.strip()
-        df = df[df["player"] != ""]
-
-        gt = games.set_index("game_id")["game_type"].to_dict()
-        df["game_type"] = df["game_type"].where(
-            df["game_type"].notna(), df["game_id"].map(gt)
-        )
-
-        rows = []
-        for mode in self._GAME_TYPE_MODES:
-            allowed = self._get_allowed_game_types(mode)
-            filtered = df[df["game_type"].isin(allowed)] if allowed is not None else df
-
-            for squad in ["1st", "2nd"]:
-                squad_df = filtered[filtered["squad"] == squad]
-                for season, season_grp in squad_df.groupby("season"):
-                    for unit_label, unit_df in [
-                        ("Total", season_grp),
-                        ("Forwards", season_grp[season_grp["unit"] == "Forwards"]),
-                        ("Backs", season_grp[season_grp["unit"] == "Backs"]),
-                    ]:
-                        # Count appearances per player
-                        player_counts = unit_df.groupby("player").size()
-                        
-                        # For each threshold 0-20, count players with >= that many appearances
-                        for threshold in range(21):
-                            player_count = (player_counts >= threshold).sum() if threshold > 0 else len(player_counts)
-                            rows.append({
-                                "season": season,
-                                "gameTypeMode": mode,
-                                "squad": squad,
-                                "unit": unit_label,
-                                "minimumAppearances": threshold,
-                                "playerCount": int(player_count),
-                                "totalPlayed": int(unit_df["game_id"].nunique()),
-                            })
-
-            # Total squad aggregates
-            for season, season_grp in filtered.groupby("season"):
-                for unit_label, unit_df in [
-                    ("Total", season_grp),
-                    ("Forwards", season_grp[season_grp["unit"] == "Forwards"]),
-                    ("Backs", season_grp[season_grp["unit"] == "Backs"]),
-                ]:
-                    player_counts = unit_df.groupby("player").size()
-                    for threshold in range(21):
-                        player_count = (player_counts >= threshold).sum() if threshold > 0 else len(player_counts)
-                        rows.append({
-                            "season": season,
-                            "gameTypeMode": mode,
-                            "squad": "Total",
-                            "unit": unit_label,
-                            "minimumAppearances": threshold,
-                            "playerCount": int(player_count),
-                            "totalPlayed": int(season_grp["game_id"].nunique()),
-                        })
-
-        return pd.DataFrame(rows, columns=columns)
+        return f"""
+            WITH {self._squad_appearances_sql()},
+            {self._SQUAD_SCOPES_SQL},
+            games_played AS (
+                -- Per-XV rows count games for the unit; the combined "Total" row counts
+                -- every game in the season regardless of unit.
+                SELECT gu.mode, gu.season, gu.squad, gu.unit, COUNT(DISTINCT ua.game_id) AS total_played
+                FROM group_units gu
+                LEFT JOIN unit_apps ua
+                  ON ua.mode = gu.mode AND ua.season = gu.season AND ua.squad = gu.squad
+                 AND (ua.unit = gu.unit OR (gu.squad = 'Total' AND ua.unit = 'Total'))
+                GROUP BY ALL
+            ),
+            thresholds AS (SELECT range::INTEGER AS minimumAppearances FROM range(21))
+            SELECT
+                gu.season,
+                gu.mode AS gameTypeMode,
+                gu.squad,
+                gu.unit,
+                t.minimumAppearances,
+                COUNT(pc.player) FILTER (WHERE pc.appearances >= t.minimumAppearances)::INTEGER AS playerCount,
+                ANY_VALUE(gp.total_played)::INTEGER AS totalPlayed
+            FROM group_units gu
+            CROSS JOIN thresholds t
+            JOIN games_played gp USING (mode, season, squad, unit)
+            LEFT JOIN player_counts pc USING (mode, season, squad, unit)
+            GROUP BY gu.mode_order, gu.mode, gu.squad_order, gu.squad, gu.season, gu.unit_order, gu.unit, t.minimumAppearances
+            ORDER BY gu.mode_order, gu.squad_order, gu.season, gu.unit_order, t.minimumAppearances
+        """
 
+    @traced
     def _build_player_profiles_canonical(self, player_profiles_base: pd.DataFrame) -> pd.DataFrame:
         """
         Deduplicate base player profile rows by selecting the record with most appearances
@@ -3860,6 +4883,7 @@ class BackendDatabase:
 
         return pd.DataFrame(rows, columns=columns)
 
+    @traced
     def _build_pitchero_appearance_reconciliation(
         self,
         pitchero_raw: pd.DataFrame,
@@ -3912,8 +4936,8 @@ class BackendDatabase:
             reconciliation["player"] = reconciliation["player_join"]
             reconciliation["scraped_appearances"] = 0
         else:
-            scraped["player"] = scraped["player"].map(_canonical_player_name)
-            scraped["player_join"] = scraped["player"].map(clean_name)
+            scraped["player"] = map_unique(scraped["player"], _canonical_player_name)
+            scraped["player_join"] = map_unique(scraped["player"], clean_name)
 
             preferred_name_lookup = (
                 scraped.groupby("player_join", as_index=False)
@@ -4068,23 +5092,35 @@ def build_backend(
     export_dir: str | None = None,
     strict_duplicate_audit: bool = False,
     apply_supplemental_enrichment: bool = True,
+    incremental: bool = False,
+    offline: bool = False,
+    continuity_window: int = BackendConfig.continuity_window,
+    export_historic_pitchero_json: bool = False,
 ) -> None:
     config = BackendConfig(
         db_path=db_path or BackendConfig.db_path,
         export_dir=export_dir or BackendConfig.export_dir,
+        continuity_window=continuity_window,
+        export_historic_pitchero_json=export_historic_pitchero_json,
     )
-    backend = BackendDatabase(config=config)
+    # Build into a staged copy so open readers never block the build.
+    backend = BackendDatabase(config=config, staged=True)
     try:
-        backend.build(refresh_pitchero=refresh_pitchero, export=export, strict_duplicate_audit=strict_duplicate_audit)
-        if apply_supplemental_enrichment:
-            _apply_pitchero_supplemental_enrichment(db_path=backend.db_file, project_root=backend.project_root)
-            # Rebuild scorer-dependent tables so that try/conversion/penalty data
-            # backfilled by enrichment flows through to season_scorers, players,
-            # player_profiles_canonical and season_summary_enriched.
-            backend.rebuild_post_enrichment()
-            # Re-export so all post-enrichment updates are in the JSON files.
-            if export:
-                backend.export_tables()
+        changed_tables = backend.build(
+            refresh_pitchero=refresh_pitchero,
+            export=export,
+            strict_duplicate_audit=strict_duplicate_audit,
+            incremental=incremental,
+            offline=offline,
+        )
+        backend.finish_build(
+            changed_tables if incremental else None,
+            apply_supplemental_enrichment=apply_supplemental_enrichment,
+            export=export,
+        )
+        backend.publish()
+        if export:
+            publish_static_artifacts(backend.project_root, roots=(config.export_dir, "data/charts"))
     finally:
         backend.close()
 
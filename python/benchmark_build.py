@@ -0,0 +1,512 @@
+"""
+Benchmark harness for the canonical backend build
+
+Runs ``BackendDatabase.build`` offline against recorded inputs: a frozen
+Sheets snapshot plus the Pitchero and RFU caches. Each run records per-stage
+wall time, peak traced memory and row counts. The results are appended to a
+JSON trend file, so regressions show up as the history grows:
+
+    ./env/bin/python python/benchmark_build.py --scales 1 10 100
+    ./env/bin/python python/benchmark_build.py --freeze-fixture benchmarks/fixture
+
+A scale-up of ``n`` adds ``n - 1`` synthetic copies of the recorded history.
+Each copy is shifted back by the span of the real seasons, so games,
+appearances, lineouts, scorers and RFU matches grow together and game ids stay
+unique. The shifted seasons are registered as historic Pitchero seasons for the
+duration of the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import duckdb
+import pandas as pd
+
+import python.backend as backend_module
+from python.backend import (
+    BUILD_TABLE_DEPENDENCIES,
+    PITCHERO_PRIMARY_SOURCE_SEASONS,
+    BackendConfig,
+    BackendDatabase,
+    historic_pitchero_store_dir,
+    read_historic_pitchero_cache,
+    write_historic_pitchero_store,
+)
+from python.data import HISTORIC_PITCHERO_SEASON_IDS, DataExtractor
+from python.sheets_snapshot import SNAPSHOT_TABS
+
+TREND_FORMAT = "egrfc-build-benchmark/1"
+DEFAULT_TREND_FILE = "data/benchmarks/build_trend.json"
+DEFAULT_SCALES = (1, 10, 100)
+# BackendConfig paths that make up a benchmark fixture.
+FIXTURE_FIELDS = ("sheets_snapshot_path", "historic_pitchero_cache_path", "pitchero_cache_path", "rfu_matches_path")
+# Calls that read the recorded inputs; they are reported together as one stage.
+EXTRACT_STAGE = "extract"
+_BACKEND_EXTRACT_METHODS = ("_load_historic_pitchero_team_sheets", "_extract_lineouts", "_load_pitchero", "_extract_2526_scorers")
+_EXTRACTOR_METHODS = ("extract_games_data", "extract_player_appearances", "extract_set_piece_stats")
+_BACKEND_STAGE_METHODS = ("_attach_match_scorers", "_annotate_appearance_numbers", "_insert", "export_tables")
+_MODULE_STAGE_FUNCTIONS = ("load_consolidated_matches", "build_rfu_games_dataframe", "build_rfu_player_appearances_dataframe")
+# Time in build() outside every timed call: DuckDB-side SQL tables, fingerprints, views.
+OTHER_STAGE = "other"
+# Stage slowdowns smaller than this are treated as noise by the regression check.
+MIN_REGRESSION_SECONDS = 0.1
+
+# ISO dates, dd/mm/yyyy dates and "2024/25" or "2024-2025" season labels,
+# including inside game ids such as "2024-09-07_1st_Hove".
+_DATE_OR_SEASON = re.compile(
+    r"(?<!\d)(\d{4})-(\d{2})-(\d{2})(?!\d)"
+    r"|(?<!\d)(\d{2})/(\d{2})/(\d{4})(?!\d)"
+    r"|(?<!\d)(\d{4})([-/])(\d{4}|\d{2})(?!\d)"
+)
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    seconds: float = 0.0
+    peak_bytes: int = 0
+    rows: int = 0
+
+
+def _shift_date(year: int, month: int, day: int, years: int) -> date:
+    if year - years < 1:
+        raise ValueError(f"Cannot shift {year} back {years} years; use a smaller scale.")
+    try:
+        return date(year - years, month, day)
+    except ValueError:
+        # 29 February in a year that is not a leap year.
+        return date(year - years, month, 28)
+
+
+def _shift_years(text: str, years: int) -> str:
+    """Move every date and season label in ``text`` back by ``years`` years."""
+
+    def replace(match: re.Match[str]) -> str:
+        if match.group(1):
+            return _shift_date(int(match.group(1)), int(match.group(2)), int(match.group(3)), years).isoformat()
+        if match.group(4):
+            shifted = _shift_date(int(match.group(6)), int(match.group(5)), int(match.group(4)), years)
+            return f"{shifted.day:02d}/{shifted.month:02d}/{shifted.year:04d}"
+        start, separator, end = match.group(7), match.group(8), match.group(9)
+        modulus = 10 ** len(end)
+        if (int(start) + 1) % modulus != int(end):
+            return match.group(0)
+        new_start = int(start) - years
+        if new_start < 1:
+            raise ValueError(f"Cannot shift season {match.group(0)} back {years} years; use a smaller scale.")
+        return f"{new_start:04d}{separator}{(new_start + 1) % modulus:0{len(end)}d}"
+
+    return _DATE_OR_SEASON.sub(replace, text)
+
+
+def _shift_payload(value: Any, years: int, replica: int) -> Any:
+    if isinstance(value, str):
+        return _shift_years(value, years)
+    if isinstance(value, list):
+        return [_shift_payload(item, years, replica) for item in value]
+    if isinstance(value, dict):
+        return {
+            # RFU match ids carry no date, so replicas need their own.
+            key: f"{item}-{replica}" if key == "match_id" else _shift_payload(item, years, replica)
+            for key, item in value.items()
+        }
+    return value
+
+
+def scale_rows(rows: list[Any], scale: int, span: int) -> list[Any]:
+    """Return ``rows`` followed by ``scale - 1`` copies shifted back ``span`` years each.
+
+    Rows without a date or season (sheet headers, blank rows) are not copied.
+    """
+    scaled = list(rows)
+    for replica in range(1, scale):
+        for row in rows:
+            shifted = _shift_payload(row, replica * span, replica)
+            if shifted != row:
+                scaled.append(shifted)
+    return scaled
+
+
+def _history_years(payloads: list[Any]) -> set[int]:
+    years: set[int] = set()
+
+    def visit(value: Any) -> None:
+        if isinstance(value, str):
+            for match in _DATE_OR_SEASON.finditer(value):
+                year = match.group(1) or match.group(6) or match.group(7)
+                years.add(int(year))
+        elif isinstance(value, list):
+            for item in value:
+                visit(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                visit(item)
+
+    for payload in payloads:
+        visit(payload)
+    return years
+
+
+def fixture_paths(fixture_dir: str | Path | None = None) -> dict[str, Path]:
+    """Input files per ``FIXTURE_FIELDS`` entry: the live caches, or a frozen copy in ``fixture_dir``."""
+    defaults = BackendConfig()
+    paths = {}
+    for field in FIXTURE_FIELDS:
+        relative = Path(getattr(defaults, field))
+        paths[field] = Path(fixture_dir) / relative.name if fixture_dir else project_root / relative
+    return paths
+
+
+def freeze_fixture(target_dir: str | Path) -> list[Path]:
+    """Copy the current recorded inputs into ``target_dir`` so later benchmarks stay comparable."""
+    target_dir = Path(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    copied = []
+    for field, source in fixture_paths().items():
+        store_dir = historic_pitchero_store_dir(source)
+        if field == "historic_pitchero_cache_path" and store_dir.is_dir():
+            copied.append(Path(shutil.copytree(store_dir, target_dir / store_dir.name, dirs_exist_ok=True)))
+        elif source.exists():
+            copied.append(Path(shutil.copy2(source, target_dir / source.name)))
+    return copied
+
+
+def _load_fixture(paths: dict[str, Path]) -> dict[str, Any]:
+    payloads = {}
+    for field, path in paths.items():
+        if field == "historic_pitchero_cache_path" and (path.exists() or historic_pitchero_store_dir(path).is_dir()):
+            frames = read_historic_pitchero_cache(path)
+            payloads[field] = {
+                key: frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+                for key, frame in zip(("games", "appearances"), frames)
+            }
+        elif path.exists():
+            payloads[field] = json.loads(path.read_text(encoding="utf-8"))
+        elif field == "sheets_snapshot_path":
+            # No snapshot recorded yet (it is written by the first online build):
+            # benchmark the Pitchero and RFU inputs with empty worksheets.
+            print(f"No Sheets snapshot at {path.as_posix()}; benchmarking with empty worksheets.")
+            payloads[field] = None
+        else:
+            raise FileNotFoundError(f"Benchmark input not found: {path.as_posix()}")
+    return payloads
+
+
+def _scaled_inputs(payloads: dict[str, Any], scale: int, span: int) -> dict[str, Any]:
+    scaled = {}
+    for field, payload in payloads.items():
+        if field == "sheets_snapshot_path":
+            if payload is None:
+                payload = {"requested_tabs": list(SNAPSHOT_TABS), "worksheets": {tab: {"values": []} for tab in SNAPSHOT_TABS}}
+            payload = dict(payload)
+            payload["worksheets"] = {
+                tab: {**entry, "values": scale_rows(entry.get("values", []), scale, span)}
+                for tab, entry in payload.get("worksheets", {}).items()
+            }
+        elif field == "historic_pitchero_cache_path":
+            payload = {key: scale_rows(rows, scale, span) for key, rows in payload.items()}
+        else:
+            payload = scale_rows(payload, scale, span)
+        scaled[field] = payload
+    return scaled
+
+
+@contextmanager
+def _synthetic_seasons(scale: int, span: int) -> Iterator[None]:
+    """Treat the shifted copies of historic Pitchero seasons like the originals."""
+    added_ids = {
+        _shift_years(season, replica * span): season_id
+        for season, season_id in HISTORIC_PITCHERO_SEASON_IDS.items()
+        for replica in range(1, scale)
+    }
+    added_ids = {season: season_id for season, season_id in added_ids.items() if season not in HISTORIC_PITCHERO_SEASON_IDS}
+    added_primary = {
+        _shift_years(season, replica * span) for season in PITCHERO_PRIMARY_SOURCE_SEASONS for replica in range(1, scale)
+    } - PITCHERO_PRIMARY_SOURCE_SEASONS
+    HISTORIC_PITCHERO_SEASON_IDS.update(added_ids)
+    PITCHERO_PRIMARY_SOURCE_SEASONS.update(added_primary)
+    try:
+        yield
+    finally:
+        for season in added_ids:
+            HISTORIC_PITCHERO_SEASON_IDS.pop(season, None)
+        PITCHERO_PRIMARY_SOURCE_SEASONS.difference_update(added_primary)
+
+
+def _row_count(result: Any) -> int:
+    if isinstance(result, pd.DataFrame):
+        return len(result)
+    if isinstance(result, tuple):
+        return sum(_row_count(item) for item in result)
+    if isinstance(result, list):
+        return len(result)
+    return 0
+
+
+class _StageRecorder:
+    """Times the outermost instrumented call; nested calls count towards their caller's stage."""
+
+    def __init__(self, trace_memory: bool):
+        self.trace_memory = trace_memory
+        self.stages: dict[str, StageStats] = {}
+        self._active = False
+
+    def wrap(self, stage: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            if self._active:
+                return func(*args, **kwargs)
+            self._active = True
+            if self.trace_memory:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._active = False
+            stats = self.stages.setdefault(stage, StageStats())
+            stats.calls += 1
+            stats.seconds += elapsed
+            if self.trace_memory:
+                stats.peak_bytes = max(stats.peak_bytes, tracemalloc.get_traced_memory()[1] - baseline)
+            stats.rows += _row_count(result)
+            return result
+
+        return timed
+
+    def instrument(self, backend: BackendDatabase, extractor: DataExtractor) -> None:
+        for name in _EXTRACTOR_METHODS:
+            setattr(extractor, name, self.wrap(EXTRACT_STAGE, getattr(extractor, name)))
+        for name in _BACKEND_EXTRACT_METHODS:
+            setattr(backend, name, self.wrap(EXTRACT_STAGE, getattr(backend, name)))
+        # SQL builders only return a query string; DuckDB runs it under "other".
+        builders = [name for name in dir(backend) if name.startswith("_build_") and not name.endswith("_sql")]
+        for name in [*builders, *_BACKEND_STAGE_METHODS]:
+            setattr(backend, name, self.wrap(name, getattr(backend, name)))
+
+    @contextmanager
+    def module_functions(self) -> Iterator[None]:
+        originals = {name: getattr(backend_module, name) for name in _MODULE_STAGE_FUNCTIONS}
+        for name, func in originals.items():
+            setattr(backend_module, name, self.wrap(name, func))
+        try:
+            yield
+        finally:
+            for name, func in originals.items():
+                setattr(backend_module, name, func)
+
+
+def run_benchmark(
+    scale: int,
+    payloads: dict[str, Any],
+    span: int,
+    workdir: Path,
+    export: bool = True,
+    trace_memory: bool = True,
+) -> dict[str, Any]:
+    """Build the backend once from ``payloads`` scaled ``scale`` times and return the measurements."""
+    workdir.mkdir(parents=True, exist_ok=True)
+    overrides = {}
+    for field, payload in _scaled_inputs(payloads, scale, span).items():
+        path = workdir / Path(getattr(BackendConfig(), field)).name
+        if field == "historic_pitchero_cache_path":
+            games, appearances = (pd.DataFrame(payload[key]) for key in ("games", "appearances"))
+            write_historic_pitchero_store(historic_pitchero_store_dir(path), games, appearances)
+        else:
+            path.write_text(json.dumps(payload), encoding="utf-8")
+        overrides[field] = str(path)
+    config = BackendConfig(
+        db_path=str(workdir / "egrfc_backend.duckdb"), export_dir=str(workdir / "backend"), **overrides
+    )
+
+    recorder = _StageRecorder(trace_memory)
+    with _synthetic_seasons(scale, span), recorder.module_functions():
+        backend = BackendDatabase(config)
+        try:
+            extractor = DataExtractor(
+                offline=True, snapshot_cache_path=backend.sheets_snapshot_file, response_cache_path=None
+            )
+            recorder.instrument(backend, extractor)
+            if trace_memory:
+                tracemalloc.start()
+            start = time.perf_counter()
+            try:
+                backend.build(export=export, extractor=extractor, offline=True)
+            finally:
+                wall_seconds = time.perf_counter() - start
+                peak_bytes = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+                if trace_memory:
+                    tracemalloc.stop()
+            tables = {
+                name: backend.con.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+                for name in BUILD_TABLE_DEPENDENCIES
+            }
+            seasons = backend.con.execute("SELECT COUNT(DISTINCT season) FROM games").fetchone()[0]
+        finally:
+            backend.close()
+
+    stages = dict(recorder.stages)
+    stages[OTHER_STAGE] = StageStats(
+        calls=1, seconds=max(wall_seconds - sum(stats.seconds for stats in stages.values()), 0.0)
+    )
+    return {
+        "scale": scale,
+        "seasons": seasons,
+        "wall_seconds": round(wall_seconds, 4),
+        "peak_bytes": peak_bytes,
+        "stages": {name: {**asdict(stats), "seconds": round(stats.seconds, 4)} for name, stats in stages.items()},
+        "tables": tables,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def load_trend(trend_file: Path) -> dict[str, Any]:
+    if trend_file.exists():
+        trend = json.loads(trend_file.read_text(encoding="utf-8"))
+        if trend.get("format") == TREND_FORMAT:
+            return trend
+    return {"format": TREND_FORMAT, "entries": []}
+
+
+def find_regressions(run: dict[str, Any], previous_runs: list[dict[str, Any]], max_slowdown: float) -> list[str]:
+    """Stages of ``run`` more than ``max_slowdown`` times slower than the latest run at the same scale."""
+    baseline = next((item for item in reversed(previous_runs) if item["scale"] == run["scale"]), None)
+    if baseline is None:
+        return []
+    regressions = []
+    timings = {"build": (run["wall_seconds"], baseline["wall_seconds"])}
+    for name, stats in run["stages"].items():
+        if name in baseline["stages"]:
+            timings[name] = (stats["seconds"], baseline["stages"][name]["seconds"])
+    for name, (seconds, previous) in timings.items():
+        if seconds - previous >= MIN_REGRESSION_SECONDS and seconds > previous * max_slowdown:
+            regressions.append(f"x{run['scale']} {name}: {previous:.2f}s -> {seconds:.2f}s")
+    return regressions
+
+
+def _print_run(run: dict[str, Any]) -> None:
+    print(
+        f"\nScale x{run['scale']}: {run['seasons']} seasons, {run['tables']['games']} games, "
+        f"{run['wall_seconds']:.2f}s, peak {run['peak_bytes'] / 1e6:.1f} MB"
+    )
+    ordered = sorted(run["stages"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+    for name, stats in ordered:
+        print(f"  {name:<42} {stats['seconds']:>9.3f}s {stats['peak_bytes'] / 1e6:>9.1f} MB {stats['rows']:>10} rows")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the backend build against recorded inputs")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES), help="History scale-ups to run")
+    parser.add_argument("--fixture-dir", help="Frozen inputs written by --freeze-fixture (default: the live caches)")
+    parser.add_argument("--freeze-fixture", metavar="DIR", help="Copy the current recorded inputs to DIR and exit")
+    parser.add_argument("--trend-file", default=DEFAULT_TREND_FILE, help="JSON file the results are appended to")
+    parser.add_argument("--no-export", action="store_true", help="Skip the export_tables stage")
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc (faster, no peak memory)")
+    parser.add_argument("--workdir", help="Keep the scaled inputs and databases here instead of a temp directory")
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        help="Exit with status 1 if a stage is this many times slower than the previous run at the same scale",
+    )
+    args = parser.parse_args()
+
+    if args.freeze_fixture:
+        for path in freeze_fixture(args.freeze_fixture):
+            print(f"Froze {path.as_posix()}")
+        return
+    if any(scale < 1 for scale in args.scales):
+        parser.error("--scales must be positive")
+
+    paths = fixture_paths(args.fixture_dir)
+    payloads = _load_fixture(paths)
+    years = _history_years([payload for payload in payloads.values() if payload is not None])
+    span = max(years) - min(years) + 1 if years else 1
+
+    trend_file = Path(args.trend_file)
+    if not trend_file.is_absolute():
+        trend_file = project_root / trend_file
+    trend = load_trend(trend_file)
+    # Only compare like with like: tracemalloc and the export stage change timings.
+    previous_runs = [
+        run
+        for entry in trend["entries"]
+        if entry.get("export") == (not args.no_export) and entry.get("trace_memory") == (not args.no_memory)
+        for run in entry["runs"]
+    ]
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="egrfc-benchmark-") as temp_dir:
+        root = Path(args.workdir) if args.workdir else Path(temp_dir)
+        for scale in args.scales:
+            run = run_benchmark(
+                scale,
+                payloads,
+                span,
+                root / f"x{scale}",
+                export=not args.no_export,
+                trace_memory=not args.no_memory,
+            )
+            _print_run(run)
+            runs.append(run)
+
+    trend["entries"].append(
+        {
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "versions": {"python": platform.python_version(), "pandas": pd.__version__, "duckdb": duckdb.__version__},
+            "fixture": {
+                field: path.relative_to(project_root).as_posix() if path.is_relative_to(project_root) else path.as_posix()
+                for field, path in paths.items()
+                if payloads[field] is not None
+            },
+            "export": not args.no_export,
+            "trace_memory": not args.no_memory,
+            "runs": runs,
+        }
+    )
+    trend_file.parent.mkdir(parents=True, exist_ok=True)
+    trend_file.write_text(json.dumps(trend, indent=2) + "\n", encoding="utf-8")
+    print(f"\nAppended {len(runs)} run(s) to {trend_file.as_posix()}")
+
+    if args.max_slowdown:
+        regressions = [
+            message for run in runs for message in find_regressions(run, previous_runs, args.max_slowdown)
+        ]
+        if regressions:
+            print("Slower than the previous benchmark:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
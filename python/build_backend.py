@@ -7,6 +7,7 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from python.backend import build_backend
+from python.tracing import enable_span_log, profiling
 
 
 def main() -> None:
@@ -19,7 +20,7 @@ def main() -> None:
     parser.add_argument(
         "--db-path",
         default="data/egrfc_backend.duckdb",
-        help="DuckDB output path (useful if default DB file is locked)",
+        help="DuckDB output path (built to a staged copy, then swapped in)",
     )
     parser.add_argument(
         "--export-dir",
@@ -35,21 +36,55 @@ def main() -> None:
         ),
     )
     parser.add_argument("--no-export", action="store_true", help="Skip exporting JSON/Parquet artifacts")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only rebuild (and re-export) tables whose fingerprinted inputs changed since the last build",
+    )
     parser.add_argument(
         "--no-supplemental-enrichment",
         action="store_true",
         help="Skip post-build URL/scorer supplementation from reconciliation artifacts",
     )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Build from the on-disk Sheets snapshot and local caches without any network access",
+    )
+    parser.add_argument(
+        "--export-historic-cache-json",
+        action="store_true",
+        help="With --refresh-pitchero, also write the historic team-sheet cache as JSON next to its Parquet store",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Trace each build/extract/insert/export stage: JSON span records on stderr and a summary at the end",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        metavar="PATH",
+        help="Also write the spans as a Chrome trace JSON file (implies --profile)",
+    )
     args = parser.parse_args()
+    if args.offline and args.refresh_pitchero:
+        parser.error("--offline cannot be combined with --refresh-pitchero")
 
-    build_backend(
-        refresh_pitchero=args.refresh_pitchero,
-        export=not args.no_export,
-        db_path=args.db_path,
-        export_dir=args.export_dir,
-        strict_duplicate_audit=args.strict_duplicate_audit,
-        apply_supplemental_enrichment=not args.no_supplemental_enrichment,
-    )
+    profile = args.profile or bool(args.profile_trace)
+    if profile:
+        enable_span_log()
+    with profiling(enabled=profile, chrome_trace_path=args.profile_trace):
+        build_backend(
+            refresh_pitchero=args.refresh_pitchero,
+            export=not args.no_export,
+            db_path=args.db_path,
+            export_dir=args.export_dir,
+            strict_duplicate_audit=args.strict_duplicate_audit,
+            apply_supplemental_enrichment=not args.no_supplemental_enrichment,
+            incremental=args.incremental,
+            offline=args.offline,
+            export_historic_pitchero_json=args.export_historic_cache_json,
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,75 @@
+"""
+Memoised name canonicalisation shared by the extractors and the backend build
+
+Every builder canonicalises player and opposition names, but a build only
+ever sees a few thousand distinct names. ``memoize_name`` keeps a
+canonicaliser's results in a bounded LRU cache keyed on its string arguments,
+and interns the returned strings. ``map_unique`` applies a canonicaliser to a
+whole column: it factorises the column, resolves each distinct value once and
+broadcasts the results back by code, so no per-row Python call is made.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+from typing import Any, Callable, TypeVar
+
+import numpy as np
+import pandas as pd
+
+# Comfortably above the distinct player/opposition names in the full history.
+NAME_CACHE_SIZE = 16384
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_memoized: list[Any] = []
+
+
+def _intern(value: Any) -> Any:
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, tuple):
+        return tuple(_intern(item) for item in value)
+    return value
+
+
+def memoize_name(func: F) -> F:
+    """Cache ``func`` for string/None arguments; other values (NaN, numbers) bypass the cache.
+
+    Only use it on functions that return strings, tuples or other immutable values.
+    """
+    cached = functools.lru_cache(maxsize=NAME_CACHE_SIZE)(lambda *args: _intern(func(*args)))
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if kwargs or not all(arg is None or isinstance(arg, str) for arg in args):
+            return func(*args, **kwargs)
+        return cached(*args)
+
+    wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    _memoized.append(wrapper)
+    return wrapper  # type: ignore[return-value]
+
+
+def clear_name_caches() -> None:
+    """Drop every memoised result, e.g. after editing an alias table at runtime."""
+    for wrapper in _memoized:
+        wrapper.cache_clear()
+
+
+def map_unique(series: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """``series.map(func)`` with ``func`` called once per distinct value.
+
+    Missing values are passed to ``func`` once as well, as ``Series.map`` would.
+    """
+    codes, uniques = pd.factorize(series)
+    values = np.empty(len(uniques) + 1, dtype=object)
+    for position, value in enumerate(uniques):
+        values[position] = func(value)
+    # Code -1 (missing) picks the last slot.
+    missing = codes == -1
+    if missing.any():
+        values[-1] = func(series.iloc[int(np.argmax(missing))])
+    return pd.Series(values[codes], index=series.index, name=series.name)
@@ -0,0 +1,246 @@
+"""
+Shared, content-addressed datasets for the Vega-Lite chart specs
+
+Altair inlines every chart's data into the saved spec under ``datasets``, so
+the same appearance/game rows end up copied into many files under
+data/charts. ``externalize_chart_specs`` moves each sizeable dataset into
+``data/charts/datasets/<sha256>.json`` (written once, however many specs use
+it) and records the reference in the spec's ``usermeta.externalDatasets``.
+``resolveChartSpecDatasets`` in js/shared.js puts the rows back under
+``datasets`` after loading a spec, so page code sees the usual inline shape
+while the browser fetches and caches each shared dataset once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from python.static_artifacts import is_published_artifact, refresh_static_artifacts
+
+DATASETS_DIRNAME = "datasets"
+EXTERNAL_DATASETS_KEY = "externalDatasets"
+# Datasets smaller than this stay inline: a request costs more than the bytes saved.
+MIN_EXTERNAL_BYTES = 1024
+
+PLAYER_CHART_ROWS_FORMAT = "egrfc-player-charts/1"
+PLAYER_CHART_ROWS_DIRNAME = "players"
+DEFAULT_PLAYERS_INDEX = "data/backend/players/index.json"
+# Specs js/player-profile.js filters down to the selected player's rows.
+PLAYER_PROFILE_CHART_SPECS = (
+    "player_full_profile_appearances_per_season_squad.json",
+    "player_full_profile_appearances_per_season_result.json",
+    "player_full_profile_appearances_per_season_position.json",
+    "player_full_profile_position_donut.json",
+    "player_full_profile_career_timeline.json",
+)
+
+
+@dataclass
+class ExternalizeSummary:
+    specs_rewritten: int = 0
+    datasets_written: int = 0
+    datasets_pruned: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+
+@dataclass
+class PlayerChartRowsSummary:
+    players: int = 0
+    files_written: int = 0
+    files_pruned: int = 0
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _is_vega_lite_spec(payload: Any) -> bool:
+    return isinstance(payload, dict) and "vega-lite" in str(payload.get("$schema", ""))
+
+
+def externalize_spec(
+    spec: dict[str, Any],
+    datasets_dir: Path,
+    url_prefix: str,
+    min_bytes: int = MIN_EXTERNAL_BYTES,
+) -> tuple[int, int]:
+    """Move ``spec``'s inline datasets into ``datasets_dir`` in place.
+
+    Returns the number of datasets moved and the number of new files written.
+    """
+    datasets = spec.get("datasets")
+    if not isinstance(datasets, dict):
+        return 0, 0
+
+    moved = written = 0
+    external = dict(spec.get("usermeta", {}).get(EXTERNAL_DATASETS_KEY, {}))
+    for name in list(datasets):
+        content = json.dumps(datasets[name], separators=(",", ":"), ensure_ascii=False)
+        if len(content.encode("utf-8")) < min_bytes:
+            continue
+        filename = f"{hashlib.sha256(content.encode('utf-8')).hexdigest()}.json"
+        target = datasets_dir / filename
+        if not target.exists():
+            _atomic_write(target, content)
+            written += 1
+        external[name] = f"{url_prefix.rstrip('/')}/{filename}"
+        del datasets[name]
+        moved += 1
+
+    if external:
+        spec.setdefault("usermeta", {})[EXTERNAL_DATASETS_KEY] = external
+    if not datasets:
+        del spec["datasets"]
+    return moved, written
+
+
+def _referenced_datasets(charts_dir: Path, datasets_dir: Path) -> set[str]:
+    referenced = set()
+    for path in charts_dir.rglob("*.json"):
+        if datasets_dir in path.parents or is_published_artifact(path):
+            continue
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if _is_vega_lite_spec(payload):
+            for url in payload.get("usermeta", {}).get(EXTERNAL_DATASETS_KEY, {}).values():
+                referenced.add(url.rsplit("/", 1)[-1])
+    return referenced
+
+
+def externalize_chart_specs(
+    charts_dir: str | Path = "data/charts",
+    url_prefix: str | None = None,
+    min_bytes: int = MIN_EXTERNAL_BYTES,
+    prune: bool = True,
+) -> ExternalizeSummary:
+    """Externalize the datasets of every Vega-Lite spec under ``charts_dir``.
+
+    Specs that were already externalized are left untouched, so this is cheap to
+    run after an incremental chart refresh. ``url_prefix`` is the site-relative
+    URL of the datasets directory (default: ``<charts_dir>/datasets``). With
+    ``prune=True`` dataset files no longer referenced by any spec are removed.
+    """
+    charts_dir = Path(charts_dir)
+    datasets_dir = charts_dir / DATASETS_DIRNAME
+    url_prefix = url_prefix or (charts_dir / DATASETS_DIRNAME).as_posix()
+    summary = ExternalizeSummary()
+    touched: list[Path] = []
+
+    for path in sorted(charts_dir.rglob("*.json")):
+        # Hashed copies from static_artifacts are immutable; only stable paths are rewritten.
+        if datasets_dir in path.parents or is_published_artifact(path):
+            continue
+        try:
+            text = path.read_text(encoding="utf-8")
+            spec = json.loads(text)
+        except (OSError, ValueError):
+            continue
+        if not _is_vega_lite_spec(spec) or "datasets" not in spec:
+            continue
+
+        moved, written = externalize_spec(spec, datasets_dir, url_prefix, min_bytes=min_bytes)
+        if not moved:
+            continue
+        indent = 2 if text.startswith("{\n") else None
+        rewritten = json.dumps(spec, indent=indent)
+        _atomic_write(path, rewritten)
+        touched.append(path)
+        touched.extend(datasets_dir / url.rsplit("/", 1)[-1] for url in spec["usermeta"][EXTERNAL_DATASETS_KEY].values())
+        summary.specs_rewritten += 1
+        summary.datasets_written += written
+        summary.bytes_before += len(text.encode("utf-8"))
+        summary.bytes_after += len(rewritten.encode("utf-8"))
+
+    if prune and datasets_dir.exists():
+        referenced = _referenced_datasets(charts_dir, datasets_dir)
+        for dataset in datasets_dir.glob("*.json"):
+            if dataset.name not in referenced:
+                dataset.unlink()
+                touched.append(dataset)
+                summary.datasets_pruned += 1
+    # Rewritten specs must not be served from an older hashed copy.
+    refresh_static_artifacts(touched)
+    return summary
+
+
+def split_player_chart_rows(
+    charts_dir: str | Path = "data/charts",
+    players_index: str | Path = DEFAULT_PLAYERS_INDEX,
+    specs: tuple[str, ...] = PLAYER_PROFILE_CHART_SPECS,
+) -> PlayerChartRowsSummary:
+    """Write each player's rows of the profile chart datasets to ``<charts_dir>/players/<slug>.json``.
+
+    The player page filters these specs down to one player, so it reads this
+    file instead of the shared datasets. Each entry keeps the spec's
+    ``externalDatasets`` it was cut from, and the page only uses it while they
+    still match the spec it loaded. Specs that are not externalized are
+    skipped. Slugs come from the player shard index written by export_tables.
+    """
+    charts_dir = Path(charts_dir)
+    summary = PlayerChartRowsSummary()
+    try:
+        index = json.loads(Path(players_index).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return summary
+    players = {str(row["name"]).strip(): row["slug"] for row in index.get("players", [])}
+
+    payloads = {
+        name: {"format": PLAYER_CHART_ROWS_FORMAT, "name": name, "specs": {}} for name in players
+    }
+    for spec_name in specs:
+        try:
+            spec = json.loads((charts_dir / spec_name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        external = spec.get("usermeta", {}).get(EXTERNAL_DATASETS_KEY)
+        if not _is_vega_lite_spec(spec) or not external:
+            continue
+        rows_by_player: dict[str, dict[str, list[Any]]] = {name: {} for name in players}
+        for dataset_name, url in external.items():
+            dataset_path = charts_dir / DATASETS_DIRNAME / url.rsplit("/", 1)[-1]
+            for name in players:
+                rows_by_player[name][dataset_name] = []
+            for row in json.loads(dataset_path.read_text(encoding="utf-8")):
+                name = str(row.get("player") or "").strip() if isinstance(row, dict) else ""
+                if name in rows_by_player:
+                    rows_by_player[name][dataset_name].append(row)
+        for name, datasets in rows_by_player.items():
+            payloads[name]["specs"][spec_name] = {EXTERNAL_DATASETS_KEY: external, "datasets": datasets}
+
+    rows_dir = charts_dir / PLAYER_CHART_ROWS_DIRNAME
+    rows_dir.mkdir(parents=True, exist_ok=True)
+    expected = {f"{slug}.json" for slug in players.values()}
+    touched: list[Path] = []
+    for path in rows_dir.glob("*.json"):
+        if path.name not in expected and not is_published_artifact(path):
+            path.unlink()
+            touched.append(path)
+            summary.files_pruned += 1
+    for name, slug in players.items():
+        path = rows_dir / f"{slug}.json"
+        content = json.dumps(payloads[name], separators=(",", ":"))
+        summary.players += 1
+        if path.exists() and path.read_text(encoding="utf-8") == content:
+            continue
+        _atomic_write(path, content)
+        touched.append(path)
+        summary.files_written += 1
+    refresh_static_artifacts(touched)
+    return summary
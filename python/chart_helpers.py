@@ -1,6 +1,10 @@
+from pathlib import Path
+
 import altair as alt
 from bs4 import BeautifulSoup
 
+from python.static_artifacts import refresh_static_artifacts
+
 VEGA_ACTIONS = {
     "export": True,
     "source": False,
@@ -106,6 +110,13 @@ def get_embed_options(renderer="svg"):
     }
 
 
+def save_chart(chart, file, **kwargs):
+    """Save ``chart`` and refresh its data/manifest.json entry, so pages never load an older hashed copy."""
+    chart.save(file, **kwargs)
+    if isinstance(file, (str, Path)):
+        refresh_static_artifacts([file])
+
+
 def ensure_actions_menu_inside_chart(file):
   with open(file, 'r', encoding='utf-8') as f:
     soup = BeautifulSoup(f, 'html.parser')
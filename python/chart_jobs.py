@@ -0,0 +1,239 @@
+"""
+Chart generation jobs for update.py
+
+Every chart builder in python/charts.py is registered here as a job along with
+the backend tables and views it reads. Jobs are independent of each other, so
+they run across a process pool where each worker holds its own read-only
+DuckDB connection to the backend database.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from python import charts
+from python.backend import BackendConfig, BackendDatabase
+
+
+@dataclass(frozen=True)
+class ChartJob:
+    name: str
+    builder: Callable[..., Any]
+    tables: tuple[str, ...]
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ChartJobResult:
+    name: str
+    seconds: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# Most builders check for the canonical backend tables before querying.
+_CANONICAL = ("players", "season_scorers")
+
+CHART_JOBS: list[ChartJob] = [
+    ChartJob("captains", charts.captains_chart, ("games", "player_appearances")),
+    ChartJob("player_stats_motm", charts.player_stats_motm_chart, ("games", "players")),
+    ChartJob("player_stats_appearances", charts.player_stats_appearances_chart, ("games", "player_appearances")),
+    ChartJob(
+        "player_stats_starting_combinations",
+        charts.player_stats_starting_combinations_chart,
+        ("games", "player_appearances"),
+    ),
+    ChartJob(
+        "player_full_profile_appearances_per_season",
+        charts.player_full_profile_appearances_per_season_chart,
+        ("games", "player_appearances"),
+    ),
+    ChartJob(
+        "player_full_profile_position_donut",
+        charts.player_full_profile_position_donut_chart,
+        ("player_appearances",),
+    ),
+    ChartJob(
+        "player_full_profile_career_timeline",
+        charts.player_full_profile_career_timeline_chart,
+        ("games", "player_appearances"),
+    ),
+    ChartJob("points_scorers", charts.points_scorers_chart, ("season_scorers",)),
+    ChartJob("team_sheets", charts.team_sheets_chart, ("games", "player_appearances") + _CANONICAL),
+    ChartJob(
+        "opposition_profile_team_sheets",
+        charts.opposition_profile_team_sheets_chart,
+        ("games", "player_appearances") + _CANONICAL,
+    ),
+    ChartJob("results", charts.results_chart, ("games",) + _CANONICAL),
+    ChartJob(
+        "opposition_results",
+        charts.results_chart,
+        ("games",) + _CANONICAL,
+        {"output_file": "data/charts/opposition_results.json", "facet_by_season": True},
+    ),
+    ChartJob("team_stats_results", charts.team_stats_results_chart, ("games",) + _CANONICAL),
+    ChartJob(
+        "set_piece_success_by_season",
+        charts.set_piece_success_by_season_chart,
+        ("games", "set_piece") + _CANONICAL,
+        {"layout": "separate"},
+    ),
+    ChartJob(
+        "set_piece_attacking_volume",
+        charts.set_piece_attacking_volume_chart,
+        ("games", "set_piece"),
+        {"layout": "separate", "bind_params": False},
+    ),
+    ChartJob(
+        "lineout_h2h",
+        charts.set_piece_h2h_chart_backend,
+        ("games", "set_piece"),
+        {"set_piece": "Lineout", "output_file": "data/charts/lineout_h2h.json"},
+    ),
+    ChartJob(
+        "scrum_h2h",
+        charts.set_piece_h2h_chart_backend,
+        ("games", "set_piece"),
+        {"set_piece": "Scrum", "output_file": "data/charts/scrum_h2h.json"},
+    ),
+    ChartJob(
+        "season_match_metric_trends",
+        charts.season_match_metric_trends_chart,
+        ("games", "player_appearances", "set_piece", "v_red_zone"),
+        {"output_file": "data/charts/season_match_metric_trends.json"},
+    ),
+    ChartJob(
+        "red_zone_points",
+        charts.red_zone_performance_chart,
+        ("games", "v_red_zone"),
+        {"metric": "points", "output_file": "data/charts/red_zone_points.json", "bind_params": False},
+    ),
+    ChartJob(
+        "red_zone_entries_efficiency",
+        charts.red_zone_entries_efficiency_chart,
+        ("games", "v_red_zone"),
+        {"output_file": "data/charts/red_zone_entries_efficiency.json", "bind_params": False},
+    ),
+    ChartJob("lineout_success_by_zone", charts.lineout_success_by_zone_chart, ("games", "lineouts") + _CANONICAL),
+    ChartJob("lineout_breakdown", charts.lineout_breakdown_chart_suite, ("games", "lineouts", "players")),
+    ChartJob("lineout_trend", charts.lineout_trend_chart_suite, ("games", "lineouts", "players")),
+    ChartJob("lineout_analysis", charts.lineout_analysis_chart_suite, ("games", "lineouts")),
+    ChartJob("squad_size_trend", charts.squad_size_trend_chart, ("player_appearances", "players")),
+    ChartJob("squad_position_composition", charts.squad_position_composition_chart, ("games", "player_appearances")),
+    ChartJob("squad_overlap", charts.squad_overlap_chart, ("player_appearances", "players")),
+    ChartJob("squad_continuity_average", charts.squad_continuity_average_chart, ("games", "player_appearances")),
+    ChartJob(
+        "league_context",
+        charts.export_league_context_chart_specs,
+        ("v_rfu_average_retention", "v_rfu_squad_size"),
+        {"squads": ("1st",)},
+    ),
+    ChartJob("league_results", charts.export_league_results_chart_specs, ("games_rfu",)),
+]
+
+
+def jobs_for_tables(changed: Iterable[str], jobs: Iterable[ChartJob] | None = None) -> list[ChartJob]:
+    """Jobs reading any of ``changed`` (tables and views, see ``BackendDatabase._export_names_for``)."""
+    changed = set(changed)
+    return [job for job in (CHART_JOBS if jobs is None else jobs) if changed.intersection(job.tables)]
+
+
+# Per-process backend handle, opened once by ``_init_worker``.
+_worker_db: BackendDatabase | None = None
+
+
+def _init_worker(db_path: str) -> None:
+    global _worker_db
+    # Chart builders write to paths relative to the project root.
+    os.chdir(project_root)
+    _worker_db = BackendDatabase(config=BackendConfig(db_path=db_path), read_only=True)
+
+
+def _close_worker() -> None:
+    global _worker_db
+    if _worker_db is not None:
+        _worker_db.close()
+        _worker_db = None
+
+
+def _run_job(job: ChartJob) -> ChartJobResult:
+    started = time.perf_counter()
+    try:
+        job.builder(_worker_db, **job.kwargs)
+    except Exception:
+        return ChartJobResult(job.name, time.perf_counter() - started, traceback.format_exc())
+    return ChartJobResult(job.name, time.perf_counter() - started)
+
+
+def run_chart_jobs(
+    db_path: str,
+    jobs: Iterable[ChartJob] | None = None,
+    max_workers: int | None = None,
+) -> list[ChartJobResult]:
+    """Run chart jobs against the backend at ``db_path`` and return per-chart timings.
+
+    ``max_workers=1`` runs every job in this process; otherwise jobs are spread
+    over a spawned process pool (default: one worker per CPU, capped at the
+    number of jobs). The database must not be held open for writing elsewhere,
+    since DuckDB only allows read-only connections alongside each other.
+    Results come back in job order; failed jobs carry their traceback instead
+    of stopping the remaining charts.
+    """
+    jobs = list(CHART_JOBS if jobs is None else jobs)
+    if not jobs:
+        return []
+    max_workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+
+    if max_workers == 1:
+        _init_worker(db_path)
+        try:
+            return [_run_job(job) for job in jobs]
+        finally:
+            _close_worker()
+
+    results: dict[str, ChartJobResult] = {}
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(db_path,),
+    ) as pool:
+        futures = {pool.submit(_run_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.name] = result
+    return [results[job.name] for job in jobs]
+
+
+def report_chart_results(results: list[ChartJobResult], wall_seconds: float | None = None) -> None:
+    """Print per-chart timings (slowest first) and raise if any chart failed."""
+    for result in sorted(results, key=lambda r: r.seconds, reverse=True):
+        status = "ok" if result.ok else "FAILED"
+        print(f"  {result.name:<45} {result.seconds:7.2f}s  {status}")
+    total = sum(result.seconds for result in results)
+    summary = f"{len(results)} chart job(s), {total:.1f}s of chart time"
+    if wall_seconds is not None:
+        summary += f" in {wall_seconds:.1f}s wall clock"
+    print(summary)
+
+    failed = [result for result in results if not result.ok]
+    if failed:
+        for result in failed:
+            print(f"\n{result.name} failed:\n{result.error}")
+        raise RuntimeError(f"{len(failed)} chart job(s) failed: {', '.join(result.name for result in failed)}")
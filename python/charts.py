@@ -12,8 +12,7 @@ import math
 import altair as alt
 import pandas as pd
 import re
-import duckdb
-from python.chart_helpers import hack_params_css, alt_theme, get_embed_options
+from python.chart_helpers import hack_params_css, alt_theme, get_embed_options, save_chart
 
 pitchero_caveat = f"Using Pitchero data from 2017 to 2019/20. Manually updated records from 2021 onwards"
 
@@ -188,7 +187,7 @@ def lineout_success_by_zone(df=None, squad="1st", min_total=20, file=None):
     )
 
     if file:
-        chart.save(file, embed_options=get_embed_options())
+        save_chart(chart, file, embed_options=get_embed_options())
         if str(file).lower().endswith('.html'):
             hack_params_css(file)
 
@@ -359,7 +358,7 @@ def points_scorers_chart(db, output_file='data/charts/point_scorers.json'):
         )
     )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 def captains_chart(db, output_file='data/charts/player_stats_captains.json'):
@@ -490,7 +489,7 @@ def captains_chart(db, output_file='data/charts/player_stats_captains.json'):
         )
     )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -781,9 +780,9 @@ def player_stats_motm_chart(db, output_file='data/charts/player_stats_motm.json'
         )
     )
 
-    player_panel.save(output_file)
+    save_chart(player_panel, output_file)
 
-    aggregated_panel.save(units_output_file)
+    save_chart(aggregated_panel, units_output_file)
 
     return player_panel, aggregated_panel
 
@@ -909,7 +908,7 @@ def player_stats_appearances_chart(db, output_file='data/charts/player_stats_app
         )
     )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -1076,7 +1075,7 @@ def player_stats_starting_combinations_chart(db, output_file='data/charts/player
         )
     )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -1342,11 +1341,11 @@ def player_full_profile_appearances_per_season_chart(db, output_file='data/chart
     charts = {}
     for mode, config in chart_configs.items():
         chart = build_mode_chart(mode, config['sort'], config['colors'], config.get('allowed'))
-        chart.save(output_dir / f'{output_stem}_{mode.lower()}.json')
+        save_chart(chart, output_dir / f'{output_stem}_{mode.lower()}.json')
         charts[mode] = chart
 
     position_chart = build_position_chart()
-    position_chart.save(output_dir / f'{output_stem}_position.json')
+    save_chart(position_chart, output_dir / f'{output_stem}_position.json')
     charts['Position'] = position_chart
 
     return charts
@@ -1495,7 +1494,7 @@ def player_full_profile_position_donut_chart(db, output_file='data/charts/player
     )
 
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -1874,7 +1873,7 @@ def player_full_profile_career_timeline_chart(db, output_file='data/charts/playe
         .configure(background='transparent')
     )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 seasons = ["2021/22", "2022/23", "2023/24", "2024/25", "2025/26"]
@@ -2103,7 +2102,7 @@ def squad_continuity_average_chart(db, output_file='data/charts/squad_continuity
         )
     )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -2231,7 +2230,7 @@ def squad_size_trend_chart(db, output_file='data/charts/squad_size_trend.json'):
         )
     )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -2399,7 +2398,7 @@ def squad_position_composition_chart(db, output_file='data/charts/squad_position
         )
     )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -2657,7 +2656,7 @@ def squad_overlap_chart(db, output_file='data/charts/squad_overlap.json'):
         )
     ).resolve_scale(x='shared')
 
-    plot_area.save(output_file)
+    save_chart(plot_area, output_file)
     
     return plot_area
 
@@ -2859,7 +2858,7 @@ def team_sheets_chart(db, output_file='data/charts/team_sheets.json'):
         spacing=10
     ).resolve_scale(y='independent', x='independent').configure_view(stroke=None)
 
-    team_sheets.save(output_file)
+    save_chart(team_sheets, output_file)
 
     return team_sheets
 
@@ -3014,7 +3013,7 @@ def opposition_profile_team_sheets_chart(db, output_file='data/charts/opposition
         spacing=10
     ).resolve_scale(y='independent').resolve_axis(x='shared').configure_view(strokeWidth=0)
 
-    opposition_team_sheets.save(output_file)
+    save_chart(opposition_team_sheets, output_file)
 
     return opposition_team_sheets
 
@@ -3189,7 +3188,7 @@ def results_chart(db, output_file='data/charts/results.json', facet_by_season=Fa
             )
         ).configure_view(strokeWidth=0)
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
 
     return chart
 
@@ -3510,8 +3509,8 @@ def team_stats_results_chart(
         strokeWidth=0
     )
 
-    game_chart.save(output_file_game)
-    agg_chart.save(output_file_aggregated)
+    save_chart(game_chart, output_file_game)
+    save_chart(agg_chart, output_file_aggregated)
 
     print("Saved Squad Stats results specs:")
     print(f"  Game-level: {output_file_game}")
@@ -3836,7 +3835,7 @@ def set_piece_success_by_season_chart(
                 subtitle="Percentage of lineouts and scrums won for EGRFC and their opposition.",
             )
         )
-        chart.save(output_file)
+        save_chart(chart, output_file)
         return chart
 
     if layout_value != "separate":
@@ -3873,7 +3872,7 @@ def set_piece_success_by_season_chart(
         )
 
         chart_path = output_root / filename
-        chart.save(str(chart_path))
+        save_chart(chart, str(chart_path))
         charts[set_piece_type.lower()] = chart
 
     return charts
@@ -4297,7 +4296,7 @@ def lineout_breakdown_chart(db=None, df=None, breakdown="numbers", output_file=N
             )
         )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -4702,7 +4701,7 @@ def lineout_trend_chart(db=None, df=None, breakdown="numbers", output_file=None,
                 title=alt.Title(text=f"{field_label} Trend", subtitle=interaction_subtitle),
             )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -4932,7 +4931,7 @@ def lineout_analysis_panel_chart(db, breakdown="numbers", panel="breakdown", out
             title=alt.Title(text=f"{field_label} Trend", subtitle="Relative usage (bars) and success rate (line)"),
         )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -5645,7 +5644,7 @@ def season_match_metric_trends_chart(db, output_file="data/charts/season_match_m
         )
     )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -6026,7 +6025,7 @@ def set_piece_h2h_chart_backend(db, set_piece="Lineout", output_file=None):
 
     chart = alt.vconcat(main_chart, aggregate_chart, spacing=10)
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
     
 
@@ -6332,7 +6331,7 @@ def red_zone_performance_chart(db, metric="points", output_file=None, bind_param
         .resolve_scale(x="shared", y="shared", color="independent")
     )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -6493,7 +6492,7 @@ def set_piece_attacking_volume_chart(
                 height=300,
             )
         )
-        chart.save(output_file)
+        save_chart(chart, output_file)
         return chart
 
     if layout_value != "separate":
@@ -6521,7 +6520,7 @@ def set_piece_attacking_volume_chart(
             subtitle_text=subtitle,
         )
         chart_path = output_root / filename
-        chart.save(str(chart_path))
+        save_chart(chart, str(chart_path))
         charts[set_piece_type.lower()] = chart
 
     return charts if charts else None
@@ -6765,7 +6764,7 @@ def red_zone_entries_efficiency_chart(db, output_file="data/charts/red_zone_entr
         )
     )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -6962,7 +6961,7 @@ def lineout_analysis_chart(db, breakdown="numbers", output_file=None, bind_param
         )
     )
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -7162,72 +7161,6 @@ def _normalize_rfu_season_label(season):
     return text.replace("/", "-")
 
 
-def _league_score_coverage(con):
-    """Return (total_league_rows, rows_with_scores) for games_rfu in a connection."""
-
-    total_rows, with_scores = con.execute(
-        """
-        SELECT
-            COUNT(*) AS total_rows,
-            SUM(CASE WHEN home_score IS NOT NULL AND away_score IS NOT NULL THEN 1 ELSE 0 END) AS with_scores
-        FROM games_rfu
-        WHERE league IS NOT NULL
-        """
-    ).fetchone()
-
-    return int(total_rows or 0), int(with_scores or 0)
-
-
-def _select_league_source_connection(db):
-    """Pick the backend DB connection with the best games_rfu score coverage.
-
-    This prevents league chart specs being generated from a stale primary DB when
-    the fallback backend DB has fresher RFU scores.
-    """
-
-    active_con = db.con
-    best_con = active_con
-    best_label = "active"
-    best_total, best_scores = _league_score_coverage(active_con)
-    opened_connections = []
-
-    root = Path(__file__).resolve().parent.parent
-    candidate_paths = [
-        root / "data" / "egrfc_backend.duckdb",
-        root / "data" / "egrfc_backend_alt.duckdb",
-    ]
-
-    active_db_path = None
-    if hasattr(db, "config") and getattr(db.config, "db_path", None):
-        active_db_path = (root / db.config.db_path).resolve()
-
-    for candidate in candidate_paths:
-        try:
-            resolved_candidate = candidate.resolve()
-        except FileNotFoundError:
-            continue
-
-        if active_db_path is not None and resolved_candidate == active_db_path:
-            continue
-        if not candidate.exists():
-            continue
-
-        try:
-            con = duckdb.connect(str(candidate), read_only=True)
-            opened_connections.append(con)
-            total_rows, with_scores = _league_score_coverage(con)
-        except Exception:
-            continue
-
-        if with_scores > best_scores:
-            best_con = con
-            best_label = candidate.name
-            best_total = total_rows
-            best_scores = with_scores
-
-    return best_con, best_label, best_total, best_scores, opened_connections
-
-
 def league_results_chart(db, season="2024-2025", league="Counties 1 Surrey/Sussex", output_file="data/charts/league_results.json", squad=None):
     """Create league results matrix chart from canonical backend data."""
 
@@ -7451,7 +7384,7 @@ def league_results_chart(db, season="2024-2025", league="Counties 1 Surrey/Susse
         )
     ).configure_view(stroke=None).add_params(highlight)
 
-    chart.save(output_file)
+    save_chart(chart, output_file)
     return chart
 
 
@@ -7761,8 +7694,8 @@ def export_league_context_chart_specs(db, output_dir="data/charts", squads=("1st
 
         size_file = output_root / f"league_squad_size_context_{squad_num}s.json"
         continuity_file = output_root / f"league_continuity_context_{squad_num}s.json"
-        squad_size_context_chart.save(str(size_file))
-        continuity_context_chart.save(str(continuity_file))
+        save_chart(squad_size_context_chart, str(size_file))
+        save_chart(continuity_context_chart, str(continuity_file))
 
         exports[f"{squad_num}s"] = {
             "squad_size_file": size_file.name,
@@ -7775,90 +7708,73 @@ def export_league_context_chart_specs(db, output_dir="data/charts", squads=("1st
 def export_league_results_chart_specs(db, output_dir="data/charts"):
     """Export season/squad league results matrix specs from backend data."""
 
-    source_con, source_label, total_rows, scored_rows, opened_connections = _select_league_source_connection(db)
-    if source_label != "active":
-        print(
-            "League chart export is using "
-            f"{source_label} for games_rfu scores ({scored_rows}/{total_rows} scored fixtures)."
-        )
-
-    try:
-        league_rows = source_con.execute(
+    league_rows = db.con.execute(
         """
         SELECT season, league, home_team, away_team
         FROM games_rfu
         WHERE league IS NOT NULL
         """
-        ).df()
-
-        if league_rows.empty:
-            print("No league fixtures found in games_rfu; skipping league results chart exports.")
-            return {}
+    ).df()
 
-        pairs = []
-        for _, row in league_rows.iterrows():
-            season = row["season"]
-            league = row["league"]
-            squads = {
-                _infer_egr_squad(row["home_team"]),
-                _infer_egr_squad(row["away_team"]),
-            }
-            for squad in squads:
-                if squad in (1, 2):
-                    pairs.append({"season": season, "league": league, "squad": squad})
+    if league_rows.empty:
+        print("No league fixtures found in games_rfu; skipping league results chart exports.")
+        return {}
 
-        if not pairs:
-            print("No East Grinstead league fixtures found; skipping league results chart exports.")
-            return {}
+    pairs = []
+    for _, row in league_rows.iterrows():
+        season = row["season"]
+        league = row["league"]
+        squads = {
+            _infer_egr_squad(row["home_team"]),
+            _infer_egr_squad(row["away_team"]),
+        }
+        for squad in squads:
+            if squad in (1, 2):
+                pairs.append({"season": season, "league": league, "squad": squad})
 
-        pair_df = pd.DataFrame(pairs)
-        pair_df = (
-            pair_df.groupby(["season", "squad", "league"], as_index=False)
-            .size()
-            .rename(columns={"size": "egr_matches"})
-            .sort_values(["season", "squad", "egr_matches"], ascending=[True, True, False])
-        )
-        selected_pairs = pair_df.drop_duplicates(["season", "squad"], keep="first")
+    if not pairs:
+        print("No East Grinstead league fixtures found; skipping league results chart exports.")
+        return {}
 
-        output_root = Path(output_dir)
-        output_root.mkdir(parents=True, exist_ok=True)
-        exports = {}
+    pair_df = pd.DataFrame(pairs)
+    pair_df = (
+        pair_df.groupby(["season", "squad", "league"], as_index=False)
+        .size()
+        .rename(columns={"size": "egr_matches"})
+        .sort_values(["season", "squad", "egr_matches"], ascending=[True, True, False])
+    )
+    selected_pairs = pair_df.drop_duplicates(["season", "squad"], keep="first")
 
-        # Build a thin proxy so league_results_chart can use the selected connection.
-        source_db = db if source_con is db.con else type("_LeagueSourceDB", (), {"con": source_con})()
+    output_root = Path(output_dir)
+    output_root.mkdir(parents=True, exist_ok=True)
+    exports = {}
 
-        for _, row in selected_pairs.iterrows():
-            season = row["season"]
-            season_key = _normalize_rfu_season_label(season)
-            squad = int(row["squad"])
-            league = row["league"]
+    for _, row in selected_pairs.iterrows():
+        season = row["season"]
+        season_key = _normalize_rfu_season_label(season)
+        squad = int(row["squad"])
+        league = row["league"]
 
-            filename = f"league_results_{squad}s_{season_key}.json"
-            output_file = output_root / filename
+        filename = f"league_results_{squad}s_{season_key}.json"
+        output_file = output_root / filename
 
-            chart = league_results_chart(
-                source_db,
-                season=season,
-                league=league,
-                output_file=str(output_file),
-                squad=squad,
-            )
+        chart = league_results_chart(
+            db,
+            season=season,
+            league=league,
+            output_file=str(output_file),
+            squad=squad,
+        )
 
-            if chart is not None:
-                exports.setdefault(season_key, {})[str(squad)] = {
-                    "league": league,
-                    "file": filename,
-                }
+        if chart is not None:
+            exports.setdefault(season_key, {})[str(squad)] = {
+                "league": league,
+                "file": filename,
+            }
 
-        if exports:
-            index_file = output_root / "league_results_index.json"
-            with open(index_file, "w", encoding="utf-8") as f:
-                json.dump(exports, f, indent=2)
+    if exports:
+        index_file = output_root / "league_results_index.json"
+        with open(index_file, "w", encoding="utf-8") as f:
+            json.dump(exports, f, indent=2)
 
-        return exports
-    finally:
-        for con in opened_connections:
-            try:
-                con.close()
-            except Exception:
-                pass
+    return exports
@@ -11,18 +11,26 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
     
 import gspread
+from gspread.exceptions import GSpreadException
+from gspread.utils import numericise_all, to_records
 from google.oauth2.service_account import Credentials
 import pandas as pd
 import duckdb
 from datetime import datetime
 import re
 import requests
-from bs4 import BeautifulSoup
 import logging
 import os
 from urllib.parse import urljoin
 import json
 
+from python.canonical_names import map_unique, memoize_name
+from python.html_parsing import ParsedPage, make_soup
+from python.response_cache import DEFAULT_CACHE_PATH as DEFAULT_RESPONSE_CACHE_PATH
+from python.response_cache import LISTING_TTL, PINNED, ResponseCache
+from python.scraping import ConcurrentFetcher
+from python.sheets_snapshot import SheetsSnapshot
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -151,11 +159,20 @@ PITCHERO_OPPOSITION_CANONICAL_NAMES: dict[str, str] = {
 }
 
 
+_NON_ALPHANUMERIC_RE = re.compile(r"[^a-z0-9]")
+_OPPOSITION_NUMBER_SUFFIX_RE = re.compile(
+    r"^(?P<base>.+?)\s*(?P<num>[2-5])(?:st|nd|rd|th)?(?:xv|s)?\s*$",
+    flags=re.IGNORECASE,
+)
+
+
+@memoize_name
 def _normalise_pitchero_key(name: str) -> str:
     """Lowercase, strip all non-alphanumeric characters – used as dict lookup key."""
-    return re.sub(r"[^a-z0-9]", "", name.lower())
+    return _NON_ALPHANUMERIC_RE.sub("", name.lower())
 
 
+@memoize_name
 def canonical_pitchero_opposition(name: object) -> object:
     """Return the canonical opposition name for a raw Pitchero opposition string.
 
@@ -168,11 +185,7 @@ def canonical_pitchero_opposition(name: object) -> object:
 
     # Fallback for unmapped team-suffix shorthand like "Club 2"/"Club 3s".
     if canonical == cleaned:
-        suffix_match = re.match(
-            r"^(?P<base>.+?)\s*(?P<num>[2-5])(?:st|nd|rd|th)?(?:xv|s)?\s*$",
-            cleaned,
-            flags=re.IGNORECASE,
-        )
+        suffix_match = _OPPOSITION_NUMBER_SUFFIX_RE.match(cleaned)
         if suffix_match:
             roman = {
                 "2": "II",
@@ -196,6 +209,7 @@ _EGRFC_TEAM_ALIASES = (
     "egrfc",
 )
 
+@memoize_name
 def clean_name(name):
     name_dict = {
         "Sam Lindsay": "S Lindsay 2",
@@ -213,9 +227,37 @@ def clean_name(name):
     return name_clean.strip().title()
 
 class DataExtractor:
-    def __init__(self, credentials_path='client_secret.json'):
+    def __init__(
+        self,
+        credentials_path='client_secret.json',
+        offline=False,
+        snapshot_cache_path=None,
+        response_cache_path=DEFAULT_RESPONSE_CACHE_PATH,
+    ):
+        """Sheets/Pitchero extractor.
+
+        ``snapshot_cache_path`` keeps an on-disk copy of the worksheet values that is
+        reused while the spreadsheet's modifiedTime is unchanged. ``offline=True``
+        skips authentication entirely and reads only from that copy.
+        ``response_cache_path`` is the raw HTML cache used by the Pitchero scrapers
+        (``None`` disables it).
+        """
         self.scope = ['https://spreadsheets.google.com/feeds',
                      'https://www.googleapis.com/auth/drive']
+        self.sheet_url = "https://docs.google.com/spreadsheets/d/1pcO8iEpZuds9AWs4AFRmqJtx5pv5QGbP4yg2dEkl8fU/edit"
+        self.offline = offline
+        self.snapshot_cache_path = snapshot_cache_path
+        self._snapshot = None
+        self._games_df = None
+        self.response_cache_path = response_cache_path
+        self._response_cache = None
+        if offline:
+            if snapshot_cache_path is None:
+                raise ValueError("Offline mode needs a snapshot_cache_path to read worksheets from")
+            self.creds = None
+            self.client = None
+            return
+
         # Convert to absolute path if relative
         if not os.path.isabs(credentials_path):
             # Get the directory of this script
@@ -223,7 +265,35 @@ class DataExtractor:
             credentials_path = os.path.join(script_dir, credentials_path)
         self.creds = Credentials.from_service_account_file(credentials_path, scopes=self.scope)
         self.client = gspread.authorize(self.creds)
-        self.sheet_url = "https://docs.google.com/spreadsheets/d/1pcO8iEpZuds9AWs4AFRmqJtx5pv5QGbP4yg2dEkl8fU/edit"
+
+    @property
+    def snapshot(self):
+        """Every needed worksheet, fetched once per extractor with a batched values request."""
+        if getattr(self, "_snapshot", None) is None:
+            cache_path = getattr(self, "snapshot_cache_path", None)
+            if getattr(self, "offline", False):
+                self._snapshot = SheetsSnapshot.from_file(cache_path)
+            else:
+                self._snapshot = SheetsSnapshot.load(self.client, self.sheet_url, cache_path=cache_path)
+        return self._snapshot
+
+    @property
+    def response_cache(self):
+        """On-disk Pitchero response cache, opened on first use (``None`` when disabled)."""
+        cache_path = getattr(self, "response_cache_path", None)
+        if cache_path is None:
+            return None
+        if getattr(self, "_response_cache", None) is None:
+            self._response_cache = ResponseCache(cache_path)
+        return self._response_cache
+
+    def _require_online(self, action):
+        if getattr(self, "offline", False):
+            raise RuntimeError(f"Cannot {action} in offline mode; run without --offline to fetch from the web.")
+
+    def sheet_values(self, sheet_name):
+        """All values of a worksheet from the snapshot (same shape as get_all_values)."""
+        return self.snapshot.values(sheet_name)
 
     @staticmethod
     def _normalise_sheet_header(header_value):
@@ -288,13 +358,13 @@ class DataExtractor:
         
     def extract_games_data(self):
         """Extract games data from team sheets"""
-        ss = self.client.open_by_url(self.sheet_url)
-        
+        if getattr(self, "_games_df", None) is not None:
+            return self._games_df.copy()
+
         games_data = []
         
         for squad_name, sheet_name in [("1st", "1st XV Players"), ("2nd", "2nd XV Players")]:
-            sheet = ss.worksheet(sheet_name)
-            data = sheet.get_all_values()
+            data = self.sheet_values(sheet_name)
             layout = self._build_team_sheet_layout(data[3] if len(data) >= 4 else [], squad_name)
             
             # Skip header rows
@@ -306,7 +376,8 @@ class DataExtractor:
                 if game_data:
                     games_data.append(game_data)
         
-        return pd.DataFrame(games_data)
+        self._games_df = pd.DataFrame(games_data)
+        return self._games_df.copy()
     
     def _parse_game_row(self, row, squad, layout):
         """Parse a single game row from team sheet"""
@@ -367,13 +438,10 @@ class DataExtractor:
     
     def extract_player_appearances(self, include_pitchero_stats=False):
         """Extract player appearances from team sheets"""
-        ss = self.client.open_by_url(self.sheet_url)
-        
         appearances_data = []
 
         for squad_name, sheet_name in [("1st", "1st XV Players"), ("2nd", "2nd XV Players")]:
-            sheet = ss.worksheet(sheet_name)
-            data = sheet.get_all_values()
+            data = self.sheet_values(sheet_name)
             layout = self._build_team_sheet_layout(data[3] if len(data) >= 4 else [], squad_name)
 
             for row in data[4:]:
@@ -414,6 +482,7 @@ class DataExtractor:
         return pd.DataFrame(appearances_data)
     
     def extract_pitchero_stats(self):
+        self._require_online("scrape Pitchero season stats")
 
         season_ids = {
             "2016/17": 42025,
@@ -446,7 +515,7 @@ class DataExtractor:
                     continue
 
                 page = requests.get(url)
-                soup = BeautifulSoup(page.content, 'html.parser')
+                soup = make_soup(page.content)
 
                 table = soup.find_all("div", {"class": "no-grid-hide"})[0]
 
@@ -471,7 +540,7 @@ class DataExtractor:
 
                 df["Squad"] = "1st" if squad == 1 else "2nd"
 
-                df["Player_join"] = df["Player"].apply(clean_name)
+                df["Player_join"] = map_unique(df["Player"], clean_name)
 
                 df.drop(columns=["Player"], inplace=True)
 
@@ -495,12 +564,27 @@ class DataExtractor:
 
         return pitchero_df[["Season", "Squad", "Player_join", "A", "Event", "Count"]]
 
-    def extract_pitchero_historic_team_sheets(self, seasons=None, squads=(1, 2), timeout=20):
+    def extract_pitchero_historic_team_sheets(
+        self,
+        seasons=None,
+        squads=(1, 2),
+        timeout=20,
+        max_workers=8,
+        requests_per_second=4.0,
+        session=None,
+    ):
         """Scrape historic Pitchero fixtures + lineup pages for game and appearance data.
 
         Google Sheets remains canonical for 2021/22 onwards. This scraper is intended
         for historic supplementation (2019/20 and earlier by default).
+
+        Pages are fetched concurrently over one pooled keep-alive session, limited to
+        ``requests_per_second`` per host with retry/backoff on transient errors. All
+        fixtures pages are fetched first, then every lineup and events page; rows are
+        assembled in squad/season/fixture order so the output does not depend on
+        which request finished first.
         """
+        self._require_online("scrape Pitchero team sheets")
 
         season_map = HISTORIC_PITCHERO_SEASON_IDS if seasons is None else {
             season: HISTORIC_PITCHERO_SEASON_IDS[season]
@@ -508,147 +592,173 @@ class DataExtractor:
             if season in HISTORIC_PITCHERO_SEASON_IDS
         }
 
-        games_rows = []
-        appearance_rows = []
-
-        session = requests.Session()
-        session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0 Safari/537.36"
-        })
-
+        fixture_pages = []
         for squad in squads:
             squad_label = "1st" if squad == 1 else "2nd"
             team_id = f"14206{8 if squad == 1 else 9}"
-
             for season, season_id in season_map.items():
                 fixtures_url = f"https://www.egrfc.com/teams/{team_id}/fixtures-results?season={season_id}"
-                logger.info(f"Scraping historic fixtures: {season} {squad_label} XV -> {fixtures_url}")
+                fixture_pages.append((squad_label, season, fixtures_url))
 
-                fixtures_soup = self._fetch_soup(session, fixtures_url, timeout=timeout)
+        with ConcurrentFetcher(
+            max_workers=max_workers,
+            requests_per_second=requests_per_second,
+            session=session,
+        ) as fetcher:
+            def fetch_listing(url):
+                return self._fetch_soup(fetcher, url, timeout=timeout, ttl=LISTING_TTL)
+
+            # Lineup/events pages are only requested for scored fixtures, so they never change.
+            def fetch_match_page(url):
+                return self._fetch_soup(fetcher, url, timeout=timeout, ttl=PINNED)
+
+            logger.info(f"Scraping {len(fixture_pages)} historic fixtures pages")
+            fixtures_soups = fetcher.map(fetch_listing, [url for _, _, url in fixture_pages])
+
+            fixtures = []
+            for (squad_label, season, _), fixtures_soup in zip(fixture_pages, fixtures_soups):
                 if fixtures_soup is None:
                     continue
-
-                fixtures = fixtures_soup.find_all("div", class_="fixture-overview")
-                for fixture in fixtures:
+                for fixture in fixtures_soup.find_all("div", class_="fixture-overview"):
                     fixture_data = self._parse_pitchero_fixture(fixture)
-                    if not fixture_data:
-                        continue
+                    if fixture_data and self._is_scored_egrfc_fixture(fixture_data):
+                        fixtures.append((squad_label, season, fixture_data))
 
-                    home_team = fixture_data["home_team"]
-                    away_team = fixture_data["away_team"]
-                    home_is_egrfc = self._is_egrfc_team_name(home_team)
-                    away_is_egrfc = self._is_egrfc_team_name(away_team)
-                    if not home_is_egrfc and not away_is_egrfc:
-                        continue
+            match_urls = []
+            for _, _, fixture_data in fixtures:
+                for url in (
+                    self._normalise_lineup_url(fixture_data.get("match_url")),
+                    self._normalise_events_url(fixture_data.get("match_url")),
+                ):
+                    if url and url not in match_urls:
+                        match_urls.append(url)
 
-                    if fixture_data["home_score"] is None or fixture_data["away_score"] is None:
-                        continue
+            logger.info(f"Scraping {len(match_urls)} historic lineup/events pages")
+            match_soups = dict(zip(match_urls, fetcher.map(fetch_match_page, match_urls)))
 
-                    home_away = "H" if home_is_egrfc else "A"
-                    opposition = canonical_pitchero_opposition(
-                        away_team if home_away == "H" else home_team
-                    )
-                    pf, pa = (
-                        (fixture_data["home_score"], fixture_data["away_score"])
-                        if home_away == "H"
-                        else (fixture_data["away_score"], fixture_data["home_score"])
-                    )
-
-                    result = "W" if pf > pa else "L" if pf < pa else "D"
-                    lineup_url = self._normalise_lineup_url(fixture_data.get("match_url"))
-
-                    lineup_soup = None
-                    if lineup_url:
-                        lineup_soup = self._fetch_soup(session, lineup_url, timeout=timeout)
-
-                    date_obj = self._parse_pitchero_date(fixture_data["date_text"])
-                    if date_obj is None and lineup_soup is not None:
-                        date_obj = self._extract_pitchero_match_date(lineup_soup)
-                    if date_obj is None:
-                        continue
-                    date_iso = date_obj.strftime("%Y-%m-%d")
+        games_rows = []
+        appearance_rows = []
 
-                    game_id = f"{date_iso}_{squad_label}_{opposition}".replace(" ", "_").replace("/", "")
+        for squad_label, season, fixture_data in fixtures:
+            home_team = fixture_data["home_team"]
+            away_team = fixture_data["away_team"]
+            home_away = "H" if self._is_egrfc_team_name(home_team) else "A"
+            opposition = canonical_pitchero_opposition(
+                away_team if home_away == "H" else home_team
+            )
+            pf, pa = (
+                (fixture_data["home_score"], fixture_data["away_score"])
+                if home_away == "H"
+                else (fixture_data["away_score"], fixture_data["home_score"])
+            )
 
-                    # Extract scorers from /events endpoint
-                    scorers_data = {}
-                    motm = None
-                    events_url = self._normalise_events_url(fixture_data.get("match_url"))
-                    if events_url:
-                        events_soup = self._fetch_soup(session, events_url, timeout=timeout)
-                        if events_soup:
-                            scorers_data = self._parse_pitchero_scorers_from_events_page(events_soup)
-                            motm = self._parse_pitchero_motm_from_events_page(events_soup)
+            result = "W" if pf > pa else "L" if pf < pa else "D"
+            lineup_url = self._normalise_lineup_url(fixture_data.get("match_url"))
 
-                    game_row = {
-                        "game_id": game_id,
-                        "date": date_iso,
-                        "season": season,
-                        "squad": squad_label,
-                        "competition": fixture_data.get("competition") or "League",
-                        "game_type": self._classify_game_type(fixture_data.get("competition") or "League"),
-                        "opposition": opposition,
-                        "home_away": home_away,
-                        "pf": pf,
-                        "pa": pa,
-                        "result": result,
-                        "margin": abs(pf - pa),
-                        "captain": None,
-                        "motm": motm,
-                        "vc1": None,
-                        "vc2": None,
-                        "tries_scorers": json.dumps(scorers_data.get("tries_scorers", {})),
-                        "conversions_scorers": json.dumps(scorers_data.get("conversions_scorers", {})),
-                        "penalties_scorers": json.dumps(scorers_data.get("penalties_scorers", {})),
-                        "drop_goals_scorers": json.dumps(scorers_data.get("drop_goals_scorers", {})),
-                        "pitchero_match_url": events_url or None,
-                    }
-                    games_rows.append(game_row)
+            lineup_soup = match_soups.get(lineup_url) if lineup_url else None
 
-                    if lineup_soup is None:
-                        continue
+            date_obj = self._parse_pitchero_date(fixture_data["date_text"])
+            if date_obj is None and lineup_soup is not None:
+                date_obj = self._extract_pitchero_match_date(lineup_soup)
+            if date_obj is None:
+                continue
+            date_iso = date_obj.strftime("%Y-%m-%d")
+
+            game_id = f"{date_iso}_{squad_label}_{opposition}".replace(" ", "_").replace("/", "")
+
+            # Extract scorers from /events endpoint
+            scorers_data = {}
+            motm = None
+            events_url = self._normalise_events_url(fixture_data.get("match_url"))
+            if events_url:
+                events_soup = match_soups.get(events_url)
+                if events_soup:
+                    scorers_data = self._parse_pitchero_scorers_from_events_page(events_soup)
+                    motm = self._parse_pitchero_motm_from_events_page(events_soup)
+
+            game_row = {
+                "game_id": game_id,
+                "date": date_iso,
+                "season": season,
+                "squad": squad_label,
+                "competition": fixture_data.get("competition") or "League",
+                "game_type": self._classify_game_type(fixture_data.get("competition") or "League"),
+                "opposition": opposition,
+                "home_away": home_away,
+                "pf": pf,
+                "pa": pa,
+                "result": result,
+                "margin": abs(pf - pa),
+                "captain": None,
+                "motm": motm,
+                "vc1": None,
+                "vc2": None,
+                "tries_scorers": json.dumps(scorers_data.get("tries_scorers", {})),
+                "conversions_scorers": json.dumps(scorers_data.get("conversions_scorers", {})),
+                "penalties_scorers": json.dumps(scorers_data.get("penalties_scorers", {})),
+                "drop_goals_scorers": json.dumps(scorers_data.get("drop_goals_scorers", {})),
+                "pitchero_match_url": events_url or None,
+            }
+            games_rows.append(game_row)
 
-                    lineup_players = self._parse_pitchero_lineup(lineup_soup)
-                    if not lineup_players:
-                        continue
+            if lineup_soup is None:
+                continue
 
-                    captain_name = None
-                    for player_info in lineup_players:
-                        shirt_number = player_info["number"]
-                        player_name = player_info["player"]
-                        is_captain = player_info["is_captain"]
-                        if is_captain and not captain_name:
-                            captain_name = player_name
+            lineup_players = self._parse_pitchero_lineup(lineup_soup)
+            if not lineup_players:
+                continue
 
-                        appearance_rows.append(
-                            {
-                                "appearance_id": f"{game_id}_{shirt_number}",
-                                "game_id": game_id,
-                                "player": player_name,
-                                "shirt_number": shirt_number,
-                                "position": self._get_position(shirt_number),
-                                "position_group": self._get_position_group(shirt_number),
-                                "unit": self._get_unit(shirt_number),
-                                "is_starter": shirt_number <= 15,
-                                "is_captain": is_captain,
-                                "is_vc": False,
-                                "player_join": clean_name(player_name),
-                            }
-                        )
+            captain_name = None
+            for player_info in lineup_players:
+                shirt_number = player_info["number"]
+                player_name = player_info["player"]
+                is_captain = player_info["is_captain"]
+                if is_captain and not captain_name:
+                    captain_name = player_name
+
+                appearance_rows.append(
+                    {
+                        "appearance_id": f"{game_id}_{shirt_number}",
+                        "game_id": game_id,
+                        "player": player_name,
+                        "shirt_number": shirt_number,
+                        "position": self._get_position(shirt_number),
+                        "position_group": self._get_position_group(shirt_number),
+                        "unit": self._get_unit(shirt_number),
+                        "is_starter": shirt_number <= 15,
+                        "is_captain": is_captain,
+                        "is_vc": False,
+                        "player_join": clean_name(player_name),
+                    }
+                )
 
-                    if captain_name:
-                        games_rows[-1]["captain"] = captain_name
+            if captain_name:
+                games_rows[-1]["captain"] = captain_name
 
         games_df = pd.DataFrame(games_rows).drop_duplicates(subset=["game_id"])
         appearances_df = pd.DataFrame(appearance_rows).drop_duplicates(subset=["appearance_id"])
 
         return games_df, appearances_df
 
-    def _fetch_soup(self, session, url, timeout=20):
-        try:
+    def _is_scored_egrfc_fixture(self, fixture_data):
+        if not (
+            self._is_egrfc_team_name(fixture_data["home_team"])
+            or self._is_egrfc_team_name(fixture_data["away_team"])
+        ):
+            return False
+        return fixture_data["home_score"] is not None and fixture_data["away_score"] is not None
+
+    def _fetch_soup(self, session, url, timeout=20, ttl=LISTING_TTL):
+        """Parse ``url``, served from the response cache when a fresh copy exists."""
+        def download():
             response = session.get(url, timeout=timeout)
             response.raise_for_status()
-            return BeautifulSoup(response.content, "html.parser")
+            return response.content
+
+        try:
+            cache = self.response_cache
+            content = cache.fetch(url, download, ttl=ttl).content if cache is not None else download()
+            return ParsedPage(content)
         except Exception as exc:
             logger.warning(f"Failed to fetch {url}: {exc}")
             return None
@@ -772,6 +882,11 @@ class DataExtractor:
         return None
 
     def _extract_next_data_payload(self, soup):
+        if isinstance(soup, ParsedPage):
+            # Fast path: read the JSON straight from the raw HTML without building a DOM.
+            payload = soup.next_data
+            if payload is not None:
+                return payload
         script_node = soup.find("script", id="__NEXT_DATA__")
         if not script_node:
             return None
@@ -866,8 +981,6 @@ class DataExtractor:
 
     def extract_lineouts_data(self):
         """Extract lineout data"""
-        ss = self.client.open_by_url(self.sheet_url)
-        
         headers = [
             '#', 'Half', 'Season', 'Date', 'Opposition', 
             'Numbers', 'Call', 'Dummy', 'Front', 'Middle', 'Back',
@@ -879,8 +992,7 @@ class DataExtractor:
         
         for squad_name, sheet_name in [("1st", "1st XV Lineouts"), ("2nd", "2nd XV Lineouts")]:
             try:
-                sheet = ss.worksheet(sheet_name)
-                data = sheet.get_all_records(expected_headers=headers, head=3)
+                data = self._sheet_records(sheet_name, expected_headers=headers, head=3)
                 
                 for idx, row in enumerate(data):
                     if not row.get('Opposition'):
@@ -915,15 +1027,24 @@ class DataExtractor:
         
         return pd.DataFrame(lineouts_data)
 
+    def _sheet_records(self, sheet_name, expected_headers, head=1):
+        """Snapshot equivalent of Worksheet.get_all_records(expected_headers=..., head=...)."""
+        values = self.sheet_values(sheet_name)
+        if not values:
+            return []
+        keys = values[head - 1]
+        unknown = set(expected_headers) - set(keys)
+        if unknown:
+            raise GSpreadException(f"the given 'expected_headers' contains unknown headers: {unknown}")
+        return to_records(keys, [numericise_all(row) for row in values[head:]])
+
     def extract_set_piece_stats(self):
-        ss = self.client.open_by_url(self.sheet_url)
         set_piece_data = []
 
         for squad_name, sheet_name in [("1st", "1st XV Set piece"), ("2nd", "2nd XV Set piece")]:
             try:
-                sheet = ss.worksheet(sheet_name)
                 # Extract one wide range so set piece and red zone are handled together.
-                data = sheet.get("A5:AH")
+                data = self.snapshot.range(sheet_name, first_row=5, last_column="AH")
                 
                 for row in data:
                     if len(row) <= 2 or not row[1]:
@@ -989,7 +1110,7 @@ class DataExtractor:
                 "tries_per_entry",
             ])
 
-        # Join to games to get game_id
+        # Join to games to get game_id (parsed once per extractor and reused here)
         df_set_piece = pd.DataFrame(set_piece_data)
         df_games = self.extract_games_data()[['game_id', 'date', 'squad']]
         df_set_piece['date'] = pd.to_datetime(df_set_piece['date'])
@@ -0,0 +1,83 @@
+"""
+Shared HTML parsing for the Pitchero and RFU scrapers
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from importlib.util import find_spec
+from typing import Any
+
+from bs4 import BeautifulSoup
+
+# The scrapers use the faster, C-backed lxml when it is installed (the optional
+# "lxml" extra) and fall back to the stdlib html.parser otherwise;
+# EGRFC_HTML_PARSER overrides the choice. The two can build different trees for
+# malformed markup, so tests/test_html_parsing.py checks that both give the
+# same scraped records.
+HTML_PARSER = os.getenv("EGRFC_HTML_PARSER", "").strip() or ("lxml" if find_spec("lxml") else "html.parser")
+
+_NEXT_DATA_PATTERN = re.compile(
+    rb"<script\b[^>]*\bid=[\"']__NEXT_DATA__[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _as_bytes(markup: str | bytes) -> bytes:
+    return markup.encode("utf-8") if isinstance(markup, str) else markup
+
+
+def make_soup(markup: str | bytes, parser: str | None = None) -> BeautifulSoup:
+    """Parse ``markup`` with ``parser``, or the configured ``HTML_PARSER``."""
+    return BeautifulSoup(markup, parser or HTML_PARSER)
+
+
+def extract_next_data(markup: str | bytes) -> dict[str, Any] | None:
+    """Return the Next.js ``__NEXT_DATA__`` payload straight from the raw HTML, if present."""
+    match = _NEXT_DATA_PATTERN.search(_as_bytes(markup))
+    if not match:
+        return None
+    raw = match.group(1).strip()
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+class ParsedPage:
+    """Raw page whose soup is only built when DOM access is actually needed.
+
+    Pitchero pages embed their data as ``__NEXT_DATA__`` JSON, which ``next_data``
+    reads with a regex; callers that only need that payload never pay for a full
+    parse. Any other attribute (``find``, ``select``, ``get_text`` ...) is
+    delegated to the lazily built ``BeautifulSoup``.
+    """
+
+    def __init__(self, content: str | bytes, parser: str | None = None):
+        self.content = _as_bytes(content)
+        self.parser = parser
+        self._soup = None
+        self._next_data = None
+        self._next_data_loaded = False
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = make_soup(self.content, self.parser)
+        return self._soup
+
+    @property
+    def next_data(self) -> dict[str, Any] | None:
+        if not self._next_data_loaded:
+            self._next_data = extract_next_data(self.content)
+            self._next_data_loaded = True
+        return self._next_data
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.soup, name)
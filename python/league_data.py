@@ -1,19 +1,31 @@
 import csv
+import sys
 import requests
 import os
 import json
+import numpy as np
 import pandas as pd
 import argparse
 import logging
-from bs4 import BeautifulSoup
-import time
-import random
 import re
-import glob
 from datetime import datetime
 from urllib.parse import parse_qs, urlparse
 from pathlib import Path
 
+# Add project root to Python path so this also runs as a script
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from python.canonical_names import map_unique
+from python.html_parsing import make_soup
+from python.match_cache import MatchCacheManifest, iter_match_cache
+from python.match_store import MatchStore, match_store_path
+from python.response_cache import INCOMPLETE_MATCH_TTL, LISTING_TTL, ResponseCache
+from python.scraping import ConcurrentFetcher
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -89,6 +101,64 @@ RFU_LEAGUE_PREFIXES = (
 
 base_url = 'https://www.englandrugby.com/fixtures-and-results/'
 
+_response_cache = None
+_response_cache_replay = False
+
+
+def configure_response_cache(path=None, replay=False):
+    """Point the RFU scrapers at a response cache; ``replay`` also serves expired entries."""
+    global _response_cache, _response_cache_replay
+    if _response_cache is not None:
+        _response_cache.close()
+    _response_cache = ResponseCache(path, replay=replay) if path is not None else None
+    _response_cache_replay = replay
+
+
+def get_response_cache():
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(_DATA_DIR / "http_cache.sqlite", replay=_response_cache_replay)
+    return _response_cache
+
+
+# One polite limit shared by every englandrugby.com request, however many workers are running.
+RFU_REQUESTS_PER_SECOND = 1.0
+RFU_MAX_WORKERS = 4
+
+_rfu_fetcher = None
+_rfu_fetcher_lock = threading.Lock()
+
+
+def get_rfu_fetcher():
+    """Pooled keep-alive session with the global RFU rate limit and retry/backoff."""
+    global _rfu_fetcher
+    with _rfu_fetcher_lock:
+        if _rfu_fetcher is None:
+            _rfu_fetcher = ConcurrentFetcher(
+                max_workers=RFU_MAX_WORKERS,
+                requests_per_second=RFU_REQUESTS_PER_SECOND,
+                burst=1,
+            )
+        return _rfu_fetcher
+
+
+def _cached_get(url, request_headers, timeout, ttl=LISTING_TTL):
+    """Return the page body for ``url`` from the response cache, fetching on a miss.
+
+    Network requests wait for the global RFU rate limit; cache hits do not.
+    Raises ``requests.RequestException`` if the fetch fails; failures are not cached.
+    """
+    def download():
+        response = get_rfu_fetcher().get(url, headers=request_headers, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+
+    return get_response_cache().fetch(url, download, ttl=ttl)
+
+
+def _match_centre_url(match_id):
+    return f'{base_url}match-centre-community?matchId={match_id}#lineup'
+
 def get_url(squad=1, season="2025/26"):
     """Generate URL for fetching match data."""
     
@@ -145,23 +215,11 @@ def season_to_short_label(season):
     return f"{start_year}/{end_year[-2:]}"
 
 
-def _parse_lineup_shirt_number(raw_number):
-    """Convert RFU lineup keys like 15 or S1 into shirt numbers."""
-    if raw_number is None:
-        return None
-
-    value = str(raw_number).strip().upper()
-    if not value:
-        return None
-
-    if value.isdigit():
-        return int(value)
-
-    sub_match = re.match(r"^S(\d+)$", value)
-    if sub_match:
-        return 15 + int(sub_match.group(1))
-
-    return None
+def _parse_lineup_shirt_numbers(raw_numbers):
+    """Convert RFU lineup keys like 15 or S1 into shirt numbers (NaN when unrecognised)."""
+    values = raw_numbers.map(lambda value: "" if value is None else str(value)).str.strip().str.upper()
+    substitutes = pd.to_numeric(values.str.extract(r"^S(\d+)$", expand=False), errors="coerce") + 15
+    return pd.to_numeric(values.where(values.str.isdigit()), errors="coerce").fillna(substitutes)
 
 
 def _rfu_position_from_shirt_number(shirt_number):
@@ -197,22 +255,79 @@ def _rfu_unit_from_shirt_number(shirt_number):
     return "Bench"
 
 
-def _coerce_rfu_score_value(value):
-    """Return numeric score and walkover flag from consolidated RFU score values."""
-    if value is None:
-        return pd.NA, False
+_RFU_GAME_COLUMNS = [
+    "match_id",
+    "season",
+    "league",
+    "tracked_squad",
+    "date",
+    "home_team",
+    "away_team",
+    "home_score",
+    "away_score",
+    "home_walkover",
+    "away_walkover",
+    "lineup_available_home",
+    "lineup_available_away",
+]
+
+_RFU_APPEARANCE_COLUMNS = [
+    "match_id",
+    "season",
+    "league",
+    "tracked_squad",
+    "date",
+    "team",
+    "opposition",
+    "home_away",
+    "player",
+    "shirt_number",
+    "position",
+    "unit",
+    "is_starter",
+    "previous_match_id",
+    "played_previous_game",
+]
+
+
+def _normalized_matches(matches):
+    """One row per consolidated match, with the fields the RFU builders read as columns."""
+    return pd.DataFrame(
+        {
+            "match_id": pd.Series([str(match.get("match_id", "")) for match in matches], dtype=str).str.strip(),
+            "season": pd.Series([match.get("season") for match in matches], dtype=object),
+            "league": pd.Series([match.get("league") for match in matches], dtype=object),
+            "date": pd.Series([match.get("date") for match in matches], dtype=object),
+            "teams": pd.Series([match.get("teams", []) or [] for match in matches], dtype=object),
+            "score": pd.Series([match.get("score", []) or [] for match in matches], dtype=object),
+            "players": pd.Series([match.get("players", []) or [] for match in matches], dtype=object),
+        }
+    )
+
+
+def _non_empty_dict(value):
+    return isinstance(value, dict) and bool(value)
+
 
-    text = str(value).strip().upper()
-    if not text:
-        return pd.NA, False
-    if text == "WO":
-        return pd.NA, True
+def _coerce_rfu_scores(values):
+    """Return numeric scores and walkover flags from consolidated RFU score values."""
+    text = values.map(lambda value: "" if value is None or (isinstance(value, float) and pd.isna(value)) else str(value))
+    walkover = text.str.strip().str.upper().eq("WO")
+    scores = pd.to_numeric(values.where(~walkover), errors="coerce")
+    return np.trunc(scores.astype("float64")).astype("Int64"), walkover.astype(bool)
 
-    numeric_value = pd.to_numeric(value, errors="coerce")
-    if pd.notna(numeric_value):
-        return int(numeric_value), False
 
-    return pd.NA, False
+def _tracked_squad_labels(seasons, leagues):
+    """Map normalized seasons and leagues to tracked squad labels ("1st"/"2nd"), None without a league."""
+    squad_by_key = {}
+    for div, div_seasons in divisions.items():
+        for season, league in div_seasons.items():
+            # The first division listing a league wins, as in squad_lookup().
+            squad_by_key.setdefault((season, league), int(div))
+    keys = pd.Series(list(zip(seasons, leagues)), index=seasons.index, dtype=object)
+    squads = keys.map(squad_by_key).fillna(1).astype(int)
+    labels = squads.map({1: "1st"}).fillna(squads.astype(str) + "nd")
+    return labels.where(leagues.ne(""), None)
 
 
 def build_rfu_games_dataframe(matches=None, consolidated_file=None):
@@ -222,70 +337,67 @@ def build_rfu_games_dataframe(matches=None, consolidated_file=None):
     if matches is None:
         matches = load_consolidated_matches(consolidated_file)
 
-    rows = []
-    for match in matches:
-        match_id = str(match.get("match_id", "")).strip()
-        teams = match.get("teams", []) or []
-        if not match_id or len(teams) < 2:
-            continue
-
-        season = season_to_short_label(match.get("season"))
-        league = normalize_league_name(match.get("league"))
-        date_value = pd.to_datetime(match.get("date"), errors="coerce")
-        if not season or pd.isna(date_value):
-            continue
-
-        score = match.get("score", []) or []
-        home_score, home_walkover = _coerce_rfu_score_value(score[0] if len(score) > 0 else None)
-        away_score, away_walkover = _coerce_rfu_score_value(score[1] if len(score) > 1 else None)
-
-        players = match.get("players", []) or []
-        home_players = players[0] if len(players) > 0 and isinstance(players[0], dict) else {}
-        away_players = players[1] if len(players) > 1 and isinstance(players[1], dict) else {}
-
-        tracked_squad = squad_lookup(season, league) if league else None
-        tracked_squad_label = f"{tracked_squad}st" if tracked_squad == 1 else f"{tracked_squad}nd" if tracked_squad else None
-
-        rows.append(
-            {
-                "match_id": match_id,
-                "season": season,
-                "league": league,
-                "tracked_squad": tracked_squad_label,
-                "date": date_value.date(),
-                "home_team": str(teams[0]).strip(),
-                "away_team": str(teams[1]).strip(),
-                "home_score": home_score,
-                "away_score": away_score,
-                "home_walkover": bool(home_walkover),
-                "away_walkover": bool(away_walkover),
-                "lineup_available_home": bool(home_players),
-                "lineup_available_away": bool(away_players),
-            }
+    frame = _normalized_matches(matches)
+    frame["season"] = map_unique(frame["season"], season_to_short_label)
+    frame["league"] = map_unique(frame["league"], normalize_league_name)
+    frame["date"] = pd.to_datetime(frame["date"], errors="coerce", format="mixed")
+    keep = (
+        frame["match_id"].ne("")
+        & frame["teams"].str.len().ge(2)
+        & frame["season"].map(bool, na_action="ignore").fillna(False).astype(bool)
+        & frame["date"].notna()
+    )
+    frame = frame[keep].drop_duplicates(subset=["match_id"]).reset_index(drop=True)
+    if frame.empty:
+        return pd.DataFrame(columns=_RFU_GAME_COLUMNS)
+
+    home_score, home_walkover = _coerce_rfu_scores(frame["score"].str[0])
+    away_score, away_walkover = _coerce_rfu_scores(frame["score"].str[1])
+    df = pd.DataFrame(
+        {
+            "match_id": frame["match_id"],
+            "season": frame["season"],
+            "league": frame["league"],
+            "tracked_squad": _tracked_squad_labels(frame["season"], frame["league"]),
+            "date": frame["date"].dt.date,
+            "home_team": frame["teams"].str[0].astype(str).str.strip(),
+            "away_team": frame["teams"].str[1].astype(str).str.strip(),
+            "home_score": home_score,
+            "away_score": away_score,
+            "home_walkover": home_walkover,
+            "away_walkover": away_walkover,
+            "lineup_available_home": frame["players"].str[0].map(_non_empty_dict).astype(bool),
+            "lineup_available_away": frame["players"].str[1].map(_non_empty_dict).astype(bool),
+        },
+        columns=_RFU_GAME_COLUMNS,
+    )
+    return df.sort_values(["season", "date", "match_id"])
+
+
+def _rfu_lineup_rows(frame):
+    """One row per (match, side, lineup entry), in the order the lineups list them."""
+    sides = []
+    for team_index, home_away in enumerate(["H", "A"]):
+        lineups = frame["players"].str[team_index]
+        has_lineup = lineups.map(_non_empty_dict).astype(bool)
+        side = frame.loc[has_lineup, ["match_id", "position"]].assign(
+            team=frame.loc[has_lineup, "teams"].str[team_index].astype(str).str.strip(),
+            opposition=frame.loc[has_lineup, "teams"].str[1 - team_index].astype(str).str.strip(),
+            home_away=home_away,
+            side=team_index,
+            lineup=lineups[has_lineup],
         )
+        sides.append(side)
+    sides = pd.concat(sides, ignore_index=True)
+    if sides.empty:
+        return sides.assign(raw_number=[], raw_player=[])
 
-    columns = [
-        "match_id",
-        "season",
-        "league",
-        "tracked_squad",
-        "date",
-        "home_team",
-        "away_team",
-        "home_score",
-        "away_score",
-        "home_walkover",
-        "away_walkover",
-        "lineup_available_home",
-        "lineup_available_away",
-    ]
-    if not rows:
-        return pd.DataFrame(columns=columns)
-
-    df = pd.DataFrame(rows, columns=columns).drop_duplicates(subset=["match_id"]).sort_values(["season", "date", "match_id"])
-    df["home_score"] = pd.to_numeric(df["home_score"], errors="coerce").astype("Int64")
-    df["away_score"] = pd.to_numeric(df["away_score"], errors="coerce").astype("Int64")
-    return df
+    entries = [list(lineup.items()) for lineup in sides["lineup"]]
+    rows = sides.drop(columns="lineup").loc[sides.index.repeat([len(items) for items in entries])].reset_index(drop=True)
+    flat = [item for items in entries for item in items]
+    rows["raw_number"] = [number for number, _ in flat]
+    rows["raw_player"] = [player for _, player in flat]
+    return rows
 
 
 def build_rfu_player_appearances_dataframe(matches=None, consolidated_file=None, games_df=None):
@@ -297,76 +409,50 @@ def build_rfu_player_appearances_dataframe(matches=None, consolidated_file=None,
     if games_df is None:
         games_df = build_rfu_games_dataframe(matches=matches, consolidated_file=consolidated_file)
 
-    game_lookup = {}
-    for game in games_df.to_dict("records"):
-        game_lookup[str(game["match_id"])] = game
-
-    rows = []
-    for match in matches:
-        match_id = str(match.get("match_id", "")).strip()
-        game = game_lookup.get(match_id)
-        teams = match.get("teams", []) or []
-        players = match.get("players", []) or []
-        if game is None or len(teams) < 2 or len(players) < 2:
-            continue
-
-        for team_index, home_away in enumerate(["H", "A"]):
-            lineup = players[team_index] if isinstance(players[team_index], dict) else {}
-            if not lineup:
-                continue
-
-            team = str(teams[team_index]).strip()
-            opposition = str(teams[1 - team_index]).strip()
-            sorted_lineup = sorted(
-                lineup.items(),
-                key=lambda item: (_parse_lineup_shirt_number(item[0]) is None, _parse_lineup_shirt_number(item[0]) or 999, str(item[0])),
-            )
-
-            for raw_number, raw_player in sorted_lineup:
-                player = " ".join(str(raw_player).split()).strip()
-                shirt_number = _parse_lineup_shirt_number(raw_number)
-                if not player or shirt_number is None:
-                    continue
-
-                rows.append(
-                    {
-                        "match_id": match_id,
-                        "season": game["season"],
-                        "league": game["league"],
-                        "tracked_squad": game["tracked_squad"],
-                        "date": game["date"],
-                        "team": team,
-                        "opposition": opposition,
-                        "home_away": home_away,
-                        "player": player,
-                        "shirt_number": shirt_number,
-                        "position": _rfu_position_from_shirt_number(shirt_number),
-                        "unit": _rfu_unit_from_shirt_number(shirt_number),
-                        "is_starter": shirt_number <= 15,
-                    }
-                )
-
-    columns = [
-        "match_id",
-        "season",
-        "league",
-        "tracked_squad",
-        "date",
-        "team",
-        "opposition",
-        "home_away",
-        "player",
-        "shirt_number",
-        "position",
-        "unit",
-        "is_starter",
-        "previous_match_id",
-        "played_previous_game",
+    columns = _RFU_APPEARANCE_COLUMNS
+    frame = _normalized_matches(matches)
+    frame["position"] = range(len(frame))
+    game_ids = set(games_df["match_id"].astype(str))
+    frame = frame[
+        frame["match_id"].isin(game_ids) & frame["teams"].str.len().ge(2) & frame["players"].str.len().ge(2)
     ]
-    if not rows:
+    rows = _rfu_lineup_rows(frame)
+    if rows.empty:
         return pd.DataFrame(columns=columns)
 
-    appearances_df = pd.DataFrame(rows)
+    rows["shirt_number"] = _parse_lineup_shirt_numbers(rows["raw_number"])
+    rows["player"] = rows["raw_player"].astype(str).str.replace(r"\s+", " ", regex=True).str.strip()
+    rows = rows[rows["player"].ne("") & rows["shirt_number"].notna()]
+    if rows.empty:
+        return pd.DataFrame(columns=columns)
+
+    # Lineup order (shirt number, then key) decides which duplicate entry is kept below.
+    rows = rows.assign(shirt_number=rows["shirt_number"].astype(int), raw_key=rows["raw_number"].astype(str))
+    rows = rows.sort_values(["position", "side", "shirt_number", "raw_key"], kind="stable")
+    game_fields = games_df[["match_id", "season", "league", "tracked_squad", "date"]].assign(
+        match_id=games_df["match_id"].astype(str)
+    )
+    appearances_df = rows.merge(game_fields.drop_duplicates(subset=["match_id"], keep="last"), on="match_id", how="left")
+    appearances_df["position"] = map_unique(appearances_df["shirt_number"], _rfu_position_from_shirt_number)
+    appearances_df["unit"] = map_unique(appearances_df["shirt_number"], _rfu_unit_from_shirt_number)
+    appearances_df["is_starter"] = appearances_df["shirt_number"].le(15)
+    appearances_df = appearances_df[
+        [
+            "match_id",
+            "season",
+            "league",
+            "tracked_squad",
+            "date",
+            "team",
+            "opposition",
+            "home_away",
+            "player",
+            "shirt_number",
+            "position",
+            "unit",
+            "is_starter",
+        ]
+    ]
 
     team_games = pd.concat(
         [
@@ -403,20 +489,17 @@ def build_rfu_player_appearances_dataframe(matches=None, consolidated_file=None,
         how="left",
     )
 
-    previous_player_keys = {
-        (row.match_id, row.team, row.player)
-        for row in appearances_df[["match_id", "team", "player"]].itertuples(index=False)
-    }
-
-    def _played_previous_game(row):
-        previous_match_id = row["previous_match_id"]
-        if pd.isna(previous_match_id):
-            return pd.NA
-        if not bool(row.get("previous_lineup_available")):
-            return pd.NA
-        return (previous_match_id, row["team"], row["player"]) in previous_player_keys
-
-    appearances_df["played_previous_game"] = appearances_df.apply(_played_previous_game, axis=1)
+    player_keys = pd.MultiIndex.from_frame(appearances_df[["match_id", "team", "player"]])
+    previous_keys = pd.MultiIndex.from_arrays(
+        [appearances_df["previous_match_id"], appearances_df["team"], appearances_df["player"]]
+    )
+    # Unknown when there is no previous game or it has no recorded lineup (a missing flag counts as recorded).
+    has_previous = appearances_df["previous_match_id"].notna() & appearances_df["previous_lineup_available"].map(
+        lambda value: bool(value) if value is not pd.NA else True
+    ).astype(bool)
+    played_previous_game = pd.Series(pd.NA, index=appearances_df.index, dtype=object)
+    played_previous_game[has_previous] = previous_keys[has_previous.to_numpy()].isin(player_keys)
+    appearances_df["played_previous_game"] = played_previous_game
     appearances_df["shirt_number"] = pd.to_numeric(appearances_df["shirt_number"], errors="coerce").astype("Int64")
 
     return appearances_df[columns].drop_duplicates(subset=["match_id", "team", "player"]).sort_values(
@@ -585,39 +668,45 @@ def is_match_complete(match_data):
 def get_existing_match_ids_from_consolidated(consolidated_file=None):
     if consolidated_file is None:
         consolidated_file = str(_DATA_DIR / "matches.json")
-    """Get set of match IDs from the consolidated matches.json file."""
-    existing_ids = set()
-    
-    if not os.path.exists(consolidated_file):
-        logging.info(f"Consolidated file {consolidated_file} doesn't exist yet")
-        return existing_ids
-    
+    """Get set of match IDs from the match store behind the consolidated matches.json file."""
     try:
-        with open(consolidated_file, 'r') as f:
-            matches = json.load(f)
-        
-        for match in matches:
-            if 'match_id' in match:
-                existing_ids.add(match['match_id'])
-        
+        with open_match_store(consolidated_file) as store:
+            existing_ids = store.match_ids()
         logging.info(f"Found {len(existing_ids)} existing matches in consolidated file")
         return existing_ids
-        
     except Exception as e:
         logging.error(f"Error reading consolidated file: {e}")
-        return existing_ids
+        return set()
+
+def open_match_store(consolidated_file=None):
+    """Open the indexed match store kept beside ``consolidated_file`` (data/matches.sqlite).
+
+    The store is loaded from the JSON file the first time, and again whenever the
+    JSON changed since it was last exported.
+    """
+    if consolidated_file is None:
+        consolidated_file = str(_DATA_DIR / "matches.json")
+    return MatchStore(match_store_path(consolidated_file), export_path=consolidated_file, is_complete=is_match_complete)
+
+def iter_consolidated_matches(consolidated_file=None, season=None, league=None):
+    """Stream matches (sorted by date) from the match store, optionally for one season and/or league."""
+    with open_match_store(consolidated_file) as store:
+        yield from store.iter_matches(season=season, league=league)
 
 def load_consolidated_matches(consolidated_file=None):
     if consolidated_file is None:
         consolidated_file = str(_DATA_DIR / "matches.json")
-    """Load all matches from consolidated file."""
-    if not os.path.exists(consolidated_file):
+    """Load all matches from the match store, or from the consolidated file when there is no store."""
+    if not os.path.exists(consolidated_file) and not match_store_path(consolidated_file).exists():
         logging.info(f"Consolidated file {consolidated_file} doesn't exist yet")
         return []
     
     try:
-        with open(consolidated_file, 'r') as f:
-            matches = json.load(f)
+        if match_store_path(consolidated_file).exists():
+            matches = list(iter_consolidated_matches(consolidated_file))
+        else:
+            with open(consolidated_file, 'r') as f:
+                matches = json.load(f)
         logging.info(f"Loaded {len(matches)} matches from consolidated file")
         return matches
     except Exception as e:
@@ -628,12 +717,8 @@ def get_incomplete_match_ids(consolidated_file=None):
     if consolidated_file is None:
         consolidated_file = str(_DATA_DIR / "matches.json")
     """Get match IDs that exist but have incomplete data."""
-    incomplete_ids = []
-    
-    matches = load_consolidated_matches(consolidated_file)
-    for match in matches:
-        if not is_match_complete(match):
-            incomplete_ids.append(match['match_id'])
+    with open_match_store(consolidated_file) as store:
+        incomplete_ids = store.incomplete_match_ids()
     
     logging.info(f"Found {len(incomplete_ids)} matches with incomplete data")
     return incomplete_ids
@@ -646,8 +731,11 @@ def save_consolidated_matches(matches, consolidated_file=None):
         # Sort by date for consistency
         matches.sort(key=lambda x: x.get('date', ''))
         
-        with open(consolidated_file, 'w') as f:
+        # Write to a temp file and swap it in so an interrupted run never leaves a partial file
+        temp_file = f"{consolidated_file}.tmp"
+        with open(temp_file, 'w') as f:
             json.dump(matches, f, indent=4)
+        os.replace(temp_file, consolidated_file)
         
         logging.info(f"Saved {len(matches)} matches to consolidated file: {consolidated_file}")
         return True
@@ -716,14 +804,10 @@ def fetch_league_table(squad=1, season="2025/26"):
 
     url = f"{get_url(squad=squad, season=season)}#tables"
     
-    # Add a random delay to avoid being detected as a bot
-    time.sleep(random.uniform(1, 3))
-    
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        page = _cached_get(url, headers, timeout=10)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(page.content)
         table = soup.find_all('table')[0]
         df = pd.read_html(str(table))[0]
         df.rename(columns={"+/-": "PD"}, inplace=True)
@@ -740,18 +824,14 @@ def fetch_match_ids(squad=1, season="2025/26"):
     """Fetch match IDs from the England Rugby website."""
 
     url = f"{get_url(squad=squad, season=season)}#results"
-    
-    # Add a random delay to avoid being detected as a bot
-    time.sleep(random.uniform(1, 3))
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        page = _cached_get(url, headers, timeout=30)
     except requests.RequestException as e:
         logging.error(f"Error fetching match list: {e}")
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = make_soup(page.content)
     links = {
         match_id
         for a in soup.find_all('a', href=True)
@@ -770,13 +850,12 @@ def fetch_matches_from_results_page(squad=2, season="2025/26"):
     url = f"{get_url(squad=squad, season=season)}#results"
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        page = _cached_get(url, headers, timeout=30)
     except requests.RequestException as e:
         logging.error(f"Error fetching results page for squad {squad}, season {season}: {e}")
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = make_soup(page.content)
     cards = soup.find_all('div', class_=lambda class_list: class_list and 'dataContainer' in class_list)
 
     league = divisions.get(squad, {}).get(season, f"Squad {squad}")
@@ -838,7 +917,7 @@ def get_players(soup):
 
 def fetch_match_data(match_id):
     """Fetch and process match details."""
-    url = f'{base_url}match-centre-community?matchId={match_id}#lineup'
+    url = _match_centre_url(match_id)
     
     logging.info(f"Fetching match data for ID {match_id}")
 
@@ -860,17 +939,14 @@ def fetch_match_data(match_id):
         'Sec-Ch-Ua-Platform': '"macOS"'
     }
     
-    # Add a random delay to avoid being detected as a bot
-    time.sleep(random.uniform(2, 5))
-
     try:
-        response = requests.get(url, headers=match_headers, timeout=30)
-        response.raise_for_status()
+        # Pages stay cached briefly until the match is complete, then are pinned.
+        page = _cached_get(url, match_headers, timeout=30, ttl=INCOMPLETE_MATCH_TTL)
     except requests.RequestException as e:
         logging.error(f"Error fetching match {match_id}: {e}")
         return None
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = make_soup(page.content)
 
     # Extract score — normal matches use c042-match-score; walkovers use c042-score
     score_tag = soup.find(class_='c042-match-score') or soup.find(class_='c042-score')
@@ -932,6 +1008,9 @@ def fetch_match_data(match_id):
         "players": players
     }
 
+    if is_match_complete(match_data):
+        get_response_cache().pin(url)
+
     # Save individual match file as backup
     match_file = str(_DATA_DIR / "match_data" / f"{match_id}.json")
     try:
@@ -967,21 +1046,38 @@ def _fetch_match_for_squad(match_id, squad, results_by_id):
         return fetch_match_data(match_id)
     return fetch_match_data(match_id)
 
-def fetch_new_matches_only(squad=1, season="2025/26", consolidated_file=None):
+def fetch_new_matches_only(
+    squad=1, season="2025/26", consolidated_file=None, max_workers=None, checkpoint=True, export_json=True
+):
     if consolidated_file is None:
         consolidated_file = str(_DATA_DIR / "matches.json")
-    """Fetch new matches AND re-fetch incomplete ones."""
+    """Fetch new matches AND re-fetch incomplete ones.
+
+    Matches are fetched by a bounded worker pool under the global RFU rate limit.
+    With ``checkpoint`` each complete match is upserted into the match store as
+    soon as it arrives, so an interrupted run resumes from where it stopped.
+    ``consolidated_file`` is re-exported once at the end unless ``export_json``
+    is false.
+    """
     all_match_ids, results_by_id = _get_match_sources(squad=squad, season=season)
     
     if not all_match_ids:
         logging.warning("No match IDs found for the season.")
         return []
-    
-    # Get existing match IDs from consolidated file
-    existing_match_ids = get_existing_match_ids_from_consolidated(consolidated_file)
+
+    with open_match_store(consolidated_file) as store:
+        fetched_matches = _fetch_into_store(store, squad, season, all_match_ids, results_by_id, max_workers, checkpoint)
+        if checkpoint and export_json:
+            store.export_json()
+    return fetched_matches
+
+def _fetch_into_store(store, squad, season, all_match_ids, results_by_id, max_workers, checkpoint):
+    # Get existing match IDs from the store
+    existing_match_ids = store.match_ids()
     
     # Get incomplete match IDs (in file but missing data)
-    incomplete_match_ids = get_incomplete_match_ids(consolidated_file)
+    incomplete_match_ids = store.incomplete_match_ids()
+    logging.info(f"Found {len(incomplete_match_ids)} matches with incomplete data")
     
     # New matches: not in consolidated file at all
     new_match_ids = [mid for mid in all_match_ids if mid not in existing_match_ids]
@@ -989,8 +1085,8 @@ def fetch_new_matches_only(squad=1, season="2025/26", consolidated_file=None):
     # Incomplete matches: in file but missing data, and still on website
     retry_match_ids = [mid for mid in incomplete_match_ids if mid in all_match_ids]
     
-    # Combine both sets (remove duplicates)
-    to_fetch = list(set(new_match_ids + retry_match_ids))
+    # Combine both sets (remove duplicates, keep a stable order)
+    to_fetch = list(dict.fromkeys(new_match_ids + retry_match_ids))
 
     logging.info(f"Season {season} squad {squad}: {len(all_match_ids)} total matches on website")
     logging.info(f"Found {len(existing_match_ids)} existing matches in consolidated file")
@@ -1001,90 +1097,100 @@ def fetch_new_matches_only(squad=1, season="2025/26", consolidated_file=None):
         return []
     
     # Fetch matches
-    fetched_matches = []
-    for i, match_id in enumerate(to_fetch, 1):
-        match_type = "new" if match_id in new_match_ids else "retry"
-        logging.info(f"Fetching ({match_type}) {i}/{len(to_fetch)}: {match_id}")
+    fetched_by_id = {}
+    checkpoint_lock = threading.Lock()
 
-        match_data = _fetch_match_for_squad(match_id, squad, results_by_id)
+    def fetch(match_id):
+        match_type = "new" if match_id in new_match_ids else "retry"
+        logging.info(f"Fetching ({match_type}): {match_id}")
+        return _fetch_match_for_squad(match_id, squad, results_by_id)
+
+    workers = max_workers or get_rfu_fetcher().max_workers
+    with ThreadPoolExecutor(max_workers=min(workers, len(to_fetch))) as pool:
+        futures = {pool.submit(fetch, match_id): match_id for match_id in to_fetch}
+        for done, future in enumerate(as_completed(futures), 1):
+            match_id = futures[future]
+            try:
+                match_data = future.result()
+            except Exception as e:
+                logging.error(f"Error fetching match {match_id}: {e}")
+                continue
 
-        if match_data and is_match_complete(match_data):
-            fetched_matches.append(match_data)
+            if match_data and is_match_complete(match_data):
+                fetched_by_id[match_id] = match_data
+                if checkpoint:
+                    with checkpoint_lock:
+                        store.upsert([match_data])
+            logging.info(f"Fetched {done}/{len(to_fetch)} matches")
 
-        if squad != 2 and i < len(to_fetch):
-            time.sleep(random.uniform(3, 7))
-    
+    fetched_matches = [fetched_by_id[mid] for mid in to_fetch if mid in fetched_by_id]
     logging.info(f"Successfully fetched {len(fetched_matches)} matches ({len(fetched_matches)} complete)")
     return fetched_matches
 
-def update_consolidated_file(new_matches, consolidated_file=None):
+def update_consolidated_file(new_matches, consolidated_file=None, export_json=True):
     if consolidated_file is None:
         consolidated_file = str(_DATA_DIR / "matches.json")
-    """Add new matches or update existing ones in the consolidated file."""
-    
-    # Load existing matches
-    existing_matches = load_consolidated_matches(consolidated_file)
-    
-    # Create dict for quick lookup and updating
-    matches_dict = {match['match_id']: match for match in existing_matches if 'match_id' in match}
-    
-    # Update or add matches
-    added_count = 0
-    updated_count = 0
-    
-    for match in new_matches:
-        match_id = match['match_id']
-        if match_id in matches_dict:
-            # Update existing match (in case we re-fetched incomplete data)
-            matches_dict[match_id] = match
-            updated_count += 1
+    """Add new matches or update existing ones (e.g. re-fetched incomplete data) in the match store."""
+    with open_match_store(consolidated_file) as store:
+        added_count, updated_count = store.upsert(new_matches)
+
+        if added_count == 0 and updated_count == 0:
+            logging.info("No changes to consolidated file")
         else:
-            # Add new match
-            matches_dict[match_id] = match
-            added_count += 1
-    
-    # Convert back to list
-    all_matches = list(matches_dict.values())
-    
-    if added_count == 0 and updated_count == 0:
-        logging.info("No changes to consolidated file")
-        return all_matches
-    
-    # Save
-    if save_consolidated_matches(all_matches, consolidated_file):
-        logging.info(f"Updated consolidated file: {added_count} added, {updated_count} updated")
-    else:
-        logging.error("Failed to update consolidated file")
-    
-    return all_matches
+            logging.info(f"Updated consolidated file: {added_count} added, {updated_count} updated")
+            if export_json:
+                store.export_json()
 
+        return list(store.iter_matches())
 
-def reconcile_consolidated_from_match_cache(consolidated_file=None, cache_dir=None):
+
+def reconcile_consolidated_from_match_cache(consolidated_file=None, cache_dir=None, export_json=True, workers=None):
     if consolidated_file is None:
         consolidated_file = str(_DATA_DIR / "matches.json")
     if cache_dir is None:
         cache_dir = str(_DATA_DIR / "match_data")
-    """Reconcile consolidated matches using authoritative cached match-centre files."""
-    existing_matches = load_consolidated_matches(consolidated_file)
-    if not existing_matches:
-        return 0
+    """Reconcile consolidated matches using authoritative cached match-centre files.
+
+    Only files changed since the last reconciliation are parsed (``workers``
+    parses them across a process pool); the fields used here are kept in the
+    match-cache manifest for the rest.
+    """
+    with open_match_store(consolidated_file) as store:
+        if not len(store):
+            return 0
+        updates = _reconcile_store_from_match_cache(store, cache_dir, workers)
+        if updates > 0 and export_json:
+            store.export_json()
+    if updates > 0:
+        logging.info(f"Reconciled {updates} consolidated matches from cached match-centre files")
+    return updates
 
-    matches_by_id = {str(match.get("match_id")): match for match in existing_matches if match.get("match_id")}
-    cache_files = glob.glob(os.path.join(cache_dir, "*.json"))
+_RECONCILE_FIELDS = ("match_id", "teams", "score", "league", "date", "logos")
 
-    updates = 0
-    for cache_file in cache_files:
-        try:
-            with open(cache_file, "r") as f:
-                cached_match = json.load(f)
-        except Exception:
+def _reconcile_fields(cached_match):
+    if not isinstance(cached_match, dict):
+        return None
+    return {field: cached_match[field] for field in _RECONCILE_FIELDS if field in cached_match}
+
+def _reconcile_store_from_match_cache(store, cache_dir, workers=None):
+    manifest = MatchCacheManifest(cache_dir, "reconcile")
+    changed_files, cached_matches = manifest.scan()
+    for cached_file in iter_match_cache(changed_files, workers=workers):
+        fields = _reconcile_fields(cached_file.data)
+        manifest.record(cached_file.path, fields)
+        cached_matches[cached_file.path] = fields
+    manifest.save()
+
+    known_ids = store.match_ids()
+    reconciled = []
+    for cached_match in cached_matches.values():
+        if not cached_match:
             continue
 
         match_id = str(cached_match.get("match_id", ""))
-        if not match_id or match_id not in matches_by_id:
+        if match_id not in known_ids:
             continue
-
-        target = matches_by_id[match_id]
+        target = store.get(match_id)
 
         if cached_match.get("teams") and target.get("teams") and cached_match.get("teams") != target.get("teams"):
             continue
@@ -1101,27 +1207,34 @@ def reconcile_consolidated_from_match_cache(consolidated_file=None, cache_dir=No
                 target["date"] = cached_match["date"]
             if cached_match.get("logos"):
                 target["logos"] = cached_match["logos"]
-            updates += 1
+            reconciled.append(target)
 
-    if updates > 0:
-        save_consolidated_matches(list(matches_by_id.values()), consolidated_file)
-        logging.info(f"Reconciled {updates} consolidated matches from cached match-centre files")
+    store.upsert(reconciled)
+    return len(reconciled)
 
-    return updates
-
-def update_league_data(squad=1, season="2025/26", consolidated_file=None):
+def update_league_data(squad=1, season="2025/26", consolidated_file=None, export_json=True):
     if consolidated_file is None:
         consolidated_file = str(_DATA_DIR / "matches.json")
-    """Complete workflow: fetch new matches and update consolidated file."""
+    """Complete workflow: fetch new matches and update consolidated file.
+
+    Matches go into the match store; ``consolidated_file`` is re-exported once
+    at the end unless ``export_json`` is false.
+    """
     
     # Step 1: Fetch only new matches
-    new_matches = fetch_new_matches_only(squad=squad, season=season, consolidated_file=consolidated_file)
+    new_matches = fetch_new_matches_only(
+        squad=squad, season=season, consolidated_file=consolidated_file, export_json=False
+    )
     
     # Step 2: Update consolidated file with new matches
-    all_matches = update_consolidated_file(new_matches, consolidated_file)
+    all_matches = update_consolidated_file(new_matches, consolidated_file, export_json=False)
 
     # Step 2b: Reconcile cached match-centre files into consolidated scores
-    reconcile_consolidated_from_match_cache(consolidated_file=consolidated_file)
+    reconcile_consolidated_from_match_cache(consolidated_file=consolidated_file, export_json=False)
+
+    if export_json:
+        with open_match_store(consolidated_file) as store:
+            store.export_json()
     
     # Step 3: Also fetch/update league table
     try:
@@ -1161,13 +1274,18 @@ def update_multiple_seasons_and_squads(seasons=None, squads=None, consolidated_f
                 all_matches, new_matches = update_league_data(
                     squad=squad, 
                     season=season, 
-                    consolidated_file=consolidated_file
+                    consolidated_file=consolidated_file,
+                    export_json=False,
                 )
                 total_new_matches += len(new_matches)
                 
             except Exception as e:
                 logging.error(f"Error updating {season} squad {squad}: {e}")
     
+    # Write matches.json once, after every season and squad is in the store
+    with open_match_store(consolidated_file) as store:
+        store.export_json()
+
     # Generate frontend-ready league tables JSON after all updates
     build_league_tables_json(output_file=str(_DATA_DIR / "league_tables.json"))
     
@@ -1441,9 +1559,17 @@ def main():
     parser.add_argument("--season", required=False, help="Season (e.g., 2025/26)", default=None)
     parser.add_argument("--file", required=False, help="Consolidated match data file", default=str(_DATA_DIR / "matches.json"))
     parser.add_argument("--all", action="store_true", help="Full refresh for all configured seasons and squads")
+    parser.add_argument(
+        "--replay-cache",
+        action="store_true",
+        help="Serve every page already in the HTTP response cache, even if expired (e.g. after a parser fix)",
+    )
 
     args = parser.parse_args()
 
+    if args.replay_cache:
+        configure_response_cache(_DATA_DIR / "http_cache.sqlite", replay=True)
+
     if args.squad is not None and args.squad not in divisions:
         parser.error(f"Invalid --squad value '{args.squad}'. Valid options: {sorted(divisions.keys())}")
 
@@ -0,0 +1,129 @@
+"""
+Streaming reader for the per-match RFU files in data/match_data
+
+``iter_match_cache`` parses match files lazily, one at a time or across a
+process pool. ``MatchCacheManifest`` records each file's size and mtime for a
+maintenance command, together with what the command took from the file, so
+the next run only parses files that changed since that command last saw them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+MANIFEST_FORMAT = "egrfc-match-cache/1"
+
+
+def default_manifest_path(cache_dir: str | Path) -> Path:
+    """Manifest kept beside the cache directory, e.g. data/.match_data_manifest.json."""
+    cache_dir = Path(cache_dir)
+    return cache_dir.parent / f".{cache_dir.name}_manifest.json"
+
+
+def match_cache_files(cache_dir: str | Path) -> list[Path]:
+    """The ``*.json`` match files in ``cache_dir``, sorted by name (hidden files are skipped)."""
+    with os.scandir(cache_dir) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+        )
+
+
+def _signature(path: Path) -> list[int]:
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+@dataclass(frozen=True)
+class CachedMatchFile:
+    path: Path
+    data: Any = None
+    error: str | None = None
+
+    @property
+    def match_id(self) -> str:
+        return self.path.stem
+
+
+def _load(path: str) -> tuple[str, Any, str | None]:
+    try:
+        with open(path, "r") as handle:
+            return path, json.load(handle), None
+    except Exception as exc:
+        return path, None, str(exc)
+
+
+def iter_match_cache(paths: Iterable[str | Path], workers: int | None = None) -> Iterator[CachedMatchFile]:
+    """Yield each file parsed, in order; unreadable files come back with ``error`` set.
+
+    With ``workers`` above 1 the files are parsed across a process pool.
+    """
+    paths = [str(path) for path in paths]
+    if not workers or workers <= 1 or len(paths) < 2:
+        for path in paths:
+            _, data, error = _load(path)
+            yield CachedMatchFile(Path(path), data, error)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path, data, error in pool.map(_load, paths, chunksize=max(1, len(paths) // (workers * 4))):
+            yield CachedMatchFile(Path(path), data, error)
+
+
+class MatchCacheManifest:
+    """Which match files one command has processed, at what size/mtime, and the result it kept for each.
+
+    ``scan()`` splits the cache into changed files, to be parsed again, and the
+    saved results of unchanged ones. ``record()`` results as files are processed
+    and ``save()`` at the end; a file that is never recorded is re-read next run.
+    """
+
+    def __init__(self, cache_dir: str | Path, command: str, manifest_path: str | Path | None = None):
+        self.cache_dir = Path(cache_dir)
+        self.command = command
+        self.path = Path(manifest_path) if manifest_path is not None else default_manifest_path(self.cache_dir)
+        self._entries: dict[str, dict[str, Any]] = dict(self._load().get(command, {}))
+        self._present: set[str] | None = None
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("format") != MANIFEST_FORMAT:
+            return {}
+        return payload.get("commands", {})
+
+    def scan(self, full: bool = False) -> tuple[list[Path], dict[Path, Any]]:
+        """Return ``(changed files, {unchanged file: saved result})``; ``full`` treats every file as changed."""
+        changed: list[Path] = []
+        unchanged: dict[Path, Any] = {}
+        files = match_cache_files(self.cache_dir)
+        self._present = {path.name for path in files}
+        for path in files:
+            entry = self._entries.get(path.name)
+            if not full and entry is not None and entry.get("signature") == _signature(path):
+                unchanged[path] = entry.get("result")
+            else:
+                changed.append(path)
+        return changed, unchanged
+
+    def record(self, path: str | Path, result: Any = None) -> None:
+        path = Path(path)
+        self._entries[path.name] = {"signature": _signature(path), "result": result}
+
+    def save(self) -> None:
+        if self._present is not None:
+            # Forget files that have been deleted from the cache.
+            self._entries = {name: entry for name, entry in self._entries.items() if name in self._present}
+        commands = self._load()
+        commands[self.command] = self._entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.path.with_name(f"{self.path.name}.tmp")
+        temp_file.write_text(json.dumps({"format": MANIFEST_FORMAT, "commands": commands}), encoding="utf-8")
+        os.replace(temp_file, self.path)
@@ -0,0 +1,231 @@
+"""
+Indexed SQLite store of consolidated RFU matches, exported to data/matches.json
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    match_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    season TEXT,
+    league TEXT,
+    sort_date TEXT NOT NULL,
+    complete INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS matches_season_league ON matches (season, league);
+CREATE INDEX IF NOT EXISTS matches_complete ON matches (complete);
+CREATE INDEX IF NOT EXISTS matches_export_order ON matches (sort_date, position);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def match_store_path(consolidated_file: str | Path) -> Path:
+    """SQLite file kept beside a consolidated JSON file, e.g. data/matches.sqlite for data/matches.json."""
+    return Path(consolidated_file).with_suffix(".sqlite")
+
+
+def _file_signature(path: Path) -> str | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class MatchStore:
+    """Consolidated matches keyed by ``match_id``, with season/league and completeness indexes.
+
+    Matches are upserted one batch at a time instead of rewriting the whole JSON
+    file. ``export_path`` is the JSON file other tools read: ``export_json()``
+    rewrites it in the old format (sorted by date, ``indent=4``), and when that
+    file has changed since the last export (e.g. after a ``git pull``) the store
+    is reloaded from it on open. ``complete`` is worked out with ``is_complete``
+    when a match is written.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        export_path: str | Path | None = None,
+        is_complete: Callable[[dict[str, Any]], bool] = bool,
+    ):
+        self.path = Path(path)
+        self.export_path = Path(export_path) if export_path is not None else None
+        self.is_complete = is_complete
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        if self.export_path is not None:
+            self._sync_from_export()
+
+    def __enter__(self) -> "MatchStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _meta(self, key: str) -> str | None:
+        row = self._conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _row(self, match: dict[str, Any], position: int) -> tuple[Any, ...]:
+        return (
+            str(match["match_id"]),
+            position,
+            match.get("season"),
+            match.get("league"),
+            str(match.get("date") or ""),
+            int(bool(self.is_complete(match))),
+            json.dumps(match),
+        )
+
+    def _sync_from_export(self) -> None:
+        signature = _file_signature(self.export_path)
+        with self._lock:
+            if signature is None or signature == self._meta("export_signature"):
+                return
+            if self._meta("dirty") == "1":
+                logger.warning(
+                    "%s changed outside the match store; reloading it and dropping unexported matches",
+                    self.export_path.as_posix(),
+                )
+            with self.export_path.open("r") as handle:
+                matches = json.load(handle)
+            self._conn.execute("DELETE FROM matches")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [self._row(match, position) for position, match in enumerate(matches) if "match_id" in match],
+            )
+            self._set_meta("export_signature", signature)
+            self._set_meta("dirty", "0")
+            self._conn.commit()
+        logger.info("Loaded %d matches into %s", len(matches), self.path.as_posix())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+
+    def __contains__(self, match_id: object) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM matches WHERE match_id = ?", (str(match_id),)).fetchone() is not None
+
+    def get(self, match_id: Any) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM matches WHERE match_id = ?", (str(match_id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def match_ids(self) -> set[str]:
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT match_id FROM matches")}
+
+    def incomplete_match_ids(self) -> list[str]:
+        """IDs of matches missing a score, lineups or date, in export order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT match_id FROM matches WHERE complete = 0 ORDER BY sort_date, position"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def iter_matches(self, season: str | None = None, league: str | None = None) -> Iterator[dict[str, Any]]:
+        """Yield matches in export order, optionally for one season and/or league, without loading them all."""
+        clauses, params = [], []
+        if season is not None:
+            clauses.append("season = ?")
+            params.append(season)
+        if league is not None:
+            clauses.append("league = ?")
+            params.append(league)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            cursor = self._conn.execute(f"SELECT payload FROM matches {where} ORDER BY sort_date, position", params)
+        # A separate cursor, so other reads and writes can run while this is consumed.
+        for (payload,) in cursor:
+            yield json.loads(payload)
+
+    def upsert(self, matches: Iterable[dict[str, Any]]) -> tuple[int, int]:
+        """Add new matches and replace changed ones in one transaction; returns ``(added, updated)``."""
+        added = updated = 0
+        with self._lock:
+            next_position = self._conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM matches").fetchone()[0]
+            for match in matches:
+                match_id = str(match["match_id"])
+                existing = self._conn.execute(
+                    "SELECT position, payload FROM matches WHERE match_id = ?", (match_id,)
+                ).fetchone()
+                if existing is not None and json.loads(existing[1]) == match:
+                    # Already written (e.g. checkpointed during the fetch)
+                    continue
+                if existing is None:
+                    position = next_position
+                    next_position += 1
+                    added += 1
+                else:
+                    # Updated matches keep their place, as they did in the JSON file.
+                    position = existing[0]
+                    updated += 1
+                self._conn.execute("INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?, ?, ?)", self._row(match, position))
+            if added or updated:
+                self._set_meta("dirty", "1")
+            self._conn.commit()
+        return added, updated
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the store holds changes that are not in the JSON export yet."""
+        with self._lock:
+            return self._meta("dirty") == "1"
+
+    def export_json(self, path: str | Path | None = None, force: bool = False) -> bool:
+        """Write the matches as a JSON list sorted by date; skipped when the export is already current.
+
+        The file is streamed one match at a time and swapped in atomically.
+        Returns whether it was written.
+        """
+        target = Path(path) if path is not None else self.export_path
+        if target is None:
+            raise ValueError("No JSON export path configured for the match store.")
+        is_export_path = self.export_path is not None and target == self.export_path
+        if is_export_path and not force and target.exists() and not self.dirty:
+            return False
+
+        temp_file = target.with_name(f"{target.name}.tmp")
+        count = 0
+        with temp_file.open("w") as handle:
+            # Same bytes as json.dump(matches, handle, indent=4).
+            for match in self.iter_matches():
+                handle.write("[\n    " if count == 0 else ",\n    ")
+                handle.write(json.dumps(match, indent=4).replace("\n", "\n    "))
+                count += 1
+            handle.write("\n]" if count else "[]")
+        os.replace(temp_file, target)
+        if is_export_path:
+            with self._lock:
+                self._set_meta("export_signature", _file_signature(target) or "")
+                self._set_meta("dirty", "0")
+                self._conn.commit()
+        logger.info("Exported %d matches to %s", count, target.as_posix())
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,240 @@
+"""
+Long-lived, read-only query service over the published backend database
+
+Builds write to a staged copy of data/egrfc_backend.duckdb and swap it in with
+an atomic rename (``BackendDatabase(staged=True)`` / ``publish()``), so readers
+never hold the lock a build needs. ``ReadConnectionPool`` serves single SELECT
+statements from read-only cursors: each query runs against one complete build,
+and the first query after a swap opens the new file while in-flight queries
+finish on the old one.
+
+Run it once and point notebooks at it instead of opening the DuckDB file:
+
+    ./env/bin/python python/query_service.py --port 8765
+
+    POST /query  {"sql": "SELECT ...", "params": [...]}  -> {"columns": [...], "rows": [[...]]}
+    GET  /health                                         -> current snapshot details
+
+``query_dataframe`` is a small client for notebooks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import urllib.request
+from contextlib import contextmanager
+from datetime import date, datetime, time
+from decimal import Decimal
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterator
+
+import duckdb
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent
+DEFAULT_DB_PATH = project_root / "data" / "egrfc_backend.duckdb"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+# Attached catalog name; each cursor ``USE``s it so queries need no prefix.
+_CATALOG = "backend"
+
+
+def _file_identity(path: Path) -> tuple[int, int, int, int]:
+    stat = path.stat()
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class _Snapshot:
+    """One build of the database file, attached read-only.
+
+    DuckDB caches database instances by path, so reconnecting to a swapped file
+    would return the old build while any connection to it is open. Attaching
+    into a fresh in-memory instance always opens the file currently at the path.
+    """
+
+    def __init__(self, db_path: Path):
+        self.identity = _file_identity(db_path)
+        self.con = duckdb.connect(":memory:")
+        self.con.execute(f"ATTACH '{str(db_path).replace(chr(39), chr(39) * 2)}' AS {_CATALOG} (READ_ONLY)")
+        # Queries may only read the attached build: no COPY ... TO, no further ATTACH.
+        self.con.execute("SET enable_external_access = false")
+        self.con.execute("SET lock_configuration = true")
+        self.active = 0
+        self.retired = False
+
+    def checkout(self) -> duckdb.DuckDBPyConnection:
+        # A fresh cursor per checkout, so a USE or open transaction left on one
+        # never leaks into the next query.
+        cursor = self.con.cursor()
+        cursor.execute(f"USE {_CATALOG}")
+        self.active += 1
+        return cursor
+
+    def checkin(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        self.active -= 1
+        cursor.close()
+
+    def close(self) -> None:
+        self.con.close()
+
+
+class ReadConnectionPool:
+    """Bounded pool of read-only cursors that follows atomic swaps of ``db_path``."""
+
+    def __init__(self, db_path: str | Path = DEFAULT_DB_PATH, max_connections: int = 4):
+        if max_connections < 1:
+            raise ValueError("max_connections must be >= 1")
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._snapshot: _Snapshot | None = None
+
+    def _current_snapshot(self) -> _Snapshot:
+        identity = _file_identity(self.db_path)
+        if self._snapshot is None or self._snapshot.identity != identity:
+            previous = self._snapshot
+            self._snapshot = _Snapshot(self.db_path)
+            if previous is not None:
+                previous.retired = True
+                if previous.active == 0:
+                    previous.close()
+        return self._snapshot
+
+    @contextmanager
+    def connection(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Yield a cursor on the newest published build; it stays on that build until returned."""
+        with self._slots:
+            with self._lock:
+                snapshot = self._current_snapshot()
+                cursor = snapshot.checkout()
+            try:
+                yield cursor
+            finally:
+                with self._lock:
+                    snapshot.checkin(cursor)
+                    if snapshot.retired and snapshot.active == 0:
+                        snapshot.close()
+
+    def query(self, sql: str, params: list[Any] | None = None) -> tuple[list[str], list[tuple[Any, ...]]]:
+        """Run one SELECT statement; anything else raises ``ValueError``.
+
+        Cursors share one DuckDB instance, so statements such as ``USE`` or
+        ``DETACH`` would change what every other query sees.
+        """
+        statements = duckdb.extract_statements(sql)
+        if len(statements) != 1:
+            raise ValueError(f"expected exactly one SQL statement, got {len(statements)}")
+        if statements[0].type != duckdb.StatementType.SELECT:
+            raise ValueError(f"only SELECT statements are allowed, got {statements[0].type.name}")
+        with self.connection() as cursor:
+            result = cursor.execute(sql, params or [])
+            columns = [column[0] for column in result.description or []]
+            return columns, result.fetchall()
+
+    def snapshot_info(self) -> dict[str, Any]:
+        with self._lock:
+            snapshot = self._current_snapshot()
+            _, inode, mtime_ns, size = snapshot.identity
+            return {"db_path": self.db_path.as_posix(), "inode": inode, "mtime_ns": mtime_ns, "size": size}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._snapshot is not None:
+                self._snapshot.retired = True
+                if self._snapshot.active == 0:
+                    self._snapshot.close()
+                self._snapshot = None
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+class _QueryHandler(BaseHTTPRequestHandler):
+    pool: ReadConnectionPool
+
+    def _send_json(self, status: HTTPStatus, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload, default=_json_default).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") != "/health":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "unknown path"})
+            return
+        self._send_json(HTTPStatus.OK, self.pool.snapshot_info())
+
+    def do_POST(self) -> None:
+        if self.path.rstrip("/") != "/query":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "unknown path"})
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            columns, rows = self.pool.query(str(request["sql"]), request.get("params"))
+        except (KeyError, ValueError, duckdb.Error) as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+        self._send_json(HTTPStatus.OK, {"columns": columns, "rows": rows})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def make_server(
+    pool: ReadConnectionPool, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+) -> ThreadingHTTPServer:
+    handler = type("QueryHandler", (_QueryHandler,), {"pool": pool})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def query_dataframe(sql: str, params: list[Any] | None = None, url: str = DEFAULT_URL) -> pd.DataFrame:
+    """Run ``sql`` on a running query service and return the rows as a DataFrame."""
+    request = urllib.request.Request(
+        f"{url.rstrip('/')}/query",
+        data=json.dumps({"sql": sql, "params": params or []}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request) as response:
+        payload = json.loads(response.read())
+    return pd.DataFrame(payload["rows"], columns=payload["columns"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve read-only queries over the published backend DuckDB file")
+    parser.add_argument("--db-path", default=str(DEFAULT_DB_PATH), help="Published DuckDB file to serve")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-connections", type=int, default=4, help="Concurrent read cursors")
+    args = parser.parse_args()
+
+    db_path = Path(args.db_path)
+    if not db_path.is_absolute():
+        db_path = project_root / db_path
+    pool = ReadConnectionPool(db_path, max_connections=args.max_connections)
+    server = make_server(pool, args.host, args.port)
+    print(f"Serving {db_path} on http://{args.host}:{args.port} (POST /query, GET /health)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Content-addressed on-disk cache of raw HTTP responses for the Pitchero and RFU scrapers
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DEFAULT_CACHE_PATH = _DATA_DIR / "http_cache.sqlite"
+
+# TTLs in seconds. ``None`` pins an entry: it is never refetched.
+LISTING_TTL = 6 * 60 * 60
+INCOMPLETE_MATCH_TTL = 60 * 60
+PINNED = None
+
+
+def _sha256(value: bytes) -> str:
+    return hashlib.sha256(value).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    content: bytes
+    fetched_at: float
+    expires_at: float | None
+    from_cache: bool = True
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+
+class ResponseCache:
+    """SQLite store of response bodies, deduplicated by content hash and indexed by URL.
+
+    Each URL row records when it was fetched and when it expires (``NULL`` for
+    pinned entries such as completed matches). With ``replay=True`` expired
+    entries are served too, so a scrape can be re-run after a parser fix without
+    touching the network for anything already on disk.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH, replay: bool = False):
+        self.path = Path(path)
+        self.replay = replay
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS bodies (
+                content_hash TEXT PRIMARY KEY,
+                content BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS responses (
+                url_hash TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                content_hash TEXT NOT NULL REFERENCES bodies(content_hash),
+                fetched_at REAL NOT NULL,
+                expires_at REAL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Return the cached response for ``url`` if present and fresh (or replaying)."""
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT r.fetched_at, r.expires_at, b.content
+                FROM responses r JOIN bodies b USING (content_hash)
+                WHERE r.url_hash = ?
+                """,
+                (_sha256(url.encode("utf-8")),),
+            ).fetchone()
+        if row is None:
+            return None
+        fetched_at, expires_at, content = row
+        if not self.replay and expires_at is not None and expires_at <= time.time():
+            return None
+        return CachedResponse(url, bytes(content), fetched_at, expires_at)
+
+    def put(self, url: str, content: bytes, ttl: float | None = LISTING_TTL) -> CachedResponse:
+        """Store ``content`` for ``url``; ``ttl=None`` pins it."""
+        fetched_at = time.time()
+        expires_at = None if ttl is None else fetched_at + ttl
+        content_hash = _sha256(content)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO bodies (content_hash, content) VALUES (?, ?)",
+                (content_hash, sqlite3.Binary(content)),
+            )
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses (url_hash, url, content_hash, fetched_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (_sha256(url.encode("utf-8")), url, content_hash, fetched_at, expires_at),
+            )
+            self._conn.commit()
+        return CachedResponse(url, content, fetched_at, expires_at, from_cache=False)
+
+    def pin(self, url: str) -> None:
+        """Mark an existing entry as permanent (e.g. once its match is complete)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET expires_at = NULL WHERE url_hash = ?",
+                (_sha256(url.encode("utf-8")),),
+            )
+            self._conn.commit()
+
+    def fetch(self, url: str, fetch_content: Callable[[], bytes], ttl: float | None = LISTING_TTL) -> CachedResponse:
+        """Return the cached body for ``url`` or call ``fetch_content`` and store the result.
+
+        ``fetch_content`` should raise on failure; failed fetches are never cached.
+        """
+        cached = self.get(url)
+        if cached is not None:
+            return cached
+        return self.put(url, fetch_content(), ttl)
+
+    def prune(self) -> int:
+        """Delete expired entries and unreferenced bodies; returns the number of URLs removed."""
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            ).rowcount
+            self._conn.execute(
+                "DELETE FROM bodies WHERE content_hash NOT IN (SELECT content_hash FROM responses)"
+            )
+            self._conn.commit()
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
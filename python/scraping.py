@@ -0,0 +1,145 @@
+"""
+Concurrent, rate-limited HTTP fetching for the Pitchero scrapers
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, TypeVar
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/123.0 Safari/537.36"
+)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` requests per second with bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """One ``TokenBucket`` per host, created on first use."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> None:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.capacity)
+        bucket.acquire()
+
+
+def make_session(
+    pool_size: int = 8,
+    retries: int = 3,
+    backoff_factor: float = 1.0,
+    user_agent: str = DEFAULT_USER_AGENT,
+) -> requests.Session:
+    """Keep-alive session with a connection pool sized for ``pool_size`` workers.
+
+    Transient failures (connection errors, 429 and 5xx) are retried with
+    exponential backoff, honouring any ``Retry-After`` header.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": user_agent})
+    return session
+
+
+class ConcurrentFetcher:
+    """Shared pooled session plus per-host rate limit, with a bounded worker pool.
+
+    ``get`` has the ``requests.Session.get`` signature, so a fetcher can be
+    passed anywhere a session is expected.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        requests_per_second: float = 4.0,
+        burst: float | None = None,
+        retries: int = 3,
+        backoff_factor: float = 1.0,
+        session: requests.Session | None = None,
+    ):
+        self.max_workers = max(1, int(max_workers))
+        self.session = session or make_session(
+            pool_size=self.max_workers,
+            retries=retries,
+            backoff_factor=backoff_factor,
+        )
+        self.limiter = HostRateLimiter(requests_per_second, burst)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        self.limiter.acquire(url)
+        return self.session.get(url, **kwargs)
+
+    def map(self, func: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Apply ``func`` to ``items`` concurrently; results keep the input order."""
+        items = list(items)
+        if not items:
+            return []
+        if self.max_workers == 1 or len(items) == 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            return list(pool.map(func, items))
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "ConcurrentFetcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
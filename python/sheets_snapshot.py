@@ -0,0 +1,192 @@
+"""
+Snapshot of the EGRFC team-sheet spreadsheet tabs fetched in one batched request
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from gspread.exceptions import WorksheetNotFound
+from gspread.utils import extract_id_from_url, fill_gaps
+
+logger = logging.getLogger(__name__)
+
+
+# Every tab read by DataExtractor and the backend extractors.
+SNAPSHOT_TABS = (
+    "1st XV Players",
+    "2nd XV Players",
+    "1st XV Lineouts",
+    "2nd XV Lineouts",
+    "1st XV Set piece",
+    "2nd XV Set piece",
+    "25/26 Scorers",
+)
+
+
+def _quote_tab(title: str) -> str:
+    return "'" + title.replace("'", "''") + "'"
+
+
+def _column_index(column: str) -> int:
+    """Convert an A1 column label (e.g. "AH") to a 1-based index."""
+    index = 0
+    for char in column.upper():
+        index = index * 26 + (ord(char) - ord("A") + 1)
+    return index
+
+
+class SheetsSnapshot:
+    """Raw cell values for a set of worksheets, held in memory.
+
+    ``values`` mirrors ``Worksheet.get_all_values()`` (rows padded to the same
+    width) and ``range`` mirrors ``Worksheet.get("A5:AH")``-style reads, so the
+    existing row parsers work unchanged on top of a single API round trip.
+    """
+
+    def __init__(
+        self,
+        tabs: dict[str, list[list[str]]],
+        spreadsheet_id: str | None = None,
+        modified_time: str | None = None,
+        requested_tabs: tuple[str, ...] = (),
+    ):
+        self.tabs = tabs
+        self.spreadsheet_id = spreadsheet_id
+        self.modified_time = modified_time
+        self.requested_tabs = tuple(requested_tabs) or tuple(tabs)
+
+    @classmethod
+    def fetch(cls, spreadsheet: Any, tabs: tuple[str, ...] = SNAPSHOT_TABS) -> "SheetsSnapshot":
+        """Download ``tabs`` from ``spreadsheet`` with one metadata and one batchGet call."""
+        available = {worksheet.title for worksheet in spreadsheet.worksheets()}
+        requested = [tab for tab in tabs if tab in available]
+        missing = [tab for tab in tabs if tab not in available]
+        if missing:
+            logger.warning(f"Worksheets not found in spreadsheet: {', '.join(missing)}")
+        if not requested:
+            return cls({}, requested_tabs=tabs)
+
+        response = spreadsheet.values_batch_get([_quote_tab(tab) for tab in requested])
+        value_ranges = response.get("valueRanges", [])
+        snapshot = {
+            tab: value_range.get("values", [])
+            for tab, value_range in zip(requested, value_ranges)
+        }
+        logger.info(f"Fetched {len(snapshot)} worksheets in one batched request")
+        return cls(snapshot, requested_tabs=tabs)
+
+    @classmethod
+    def load(
+        cls,
+        client: Any,
+        sheet_url: str,
+        cache_path: Path | None = None,
+        tabs: tuple[str, ...] = SNAPSHOT_TABS,
+    ) -> "SheetsSnapshot":
+        """Return a snapshot, reusing ``cache_path`` while the spreadsheet is unmodified.
+
+        The Drive ``modifiedTime`` of the spreadsheet is a single cheap metadata
+        request; the worksheet values are only downloaded (and the cache rewritten)
+        when it differs from the time stored with the cached copy.
+        """
+        if cache_path is None:
+            return cls.fetch(client.open_by_url(sheet_url), tabs)
+
+        spreadsheet_id = extract_id_from_url(sheet_url)
+        modified_time = None
+        try:
+            modified_time = client.get_file_drive_metadata(spreadsheet_id).get("modifiedTime")
+        except Exception as exc:
+            logger.warning(f"Could not read spreadsheet modifiedTime, refetching worksheets: {exc}")
+
+        cached = cls.from_file(cache_path) if Path(cache_path).exists() else None
+        if (
+            modified_time
+            and cached is not None
+            and cached.spreadsheet_id == spreadsheet_id
+            and cached.modified_time == modified_time
+            and set(tabs).issubset(cached.requested_tabs)
+        ):
+            logger.info(f"Sheets snapshot cache is current (modified {modified_time})")
+            return cached
+
+        snapshot = cls.fetch(client.open_by_url(sheet_url), tabs)
+        snapshot.spreadsheet_id = spreadsheet_id
+        snapshot.modified_time = modified_time
+        if modified_time:
+            snapshot.save(cache_path)
+        return snapshot
+
+    @classmethod
+    def from_file(cls, cache_path: Path) -> "SheetsSnapshot":
+        """Load a snapshot previously written by ``save`` (no network access)."""
+        cache_path = Path(cache_path)
+        if not cache_path.exists():
+            raise FileNotFoundError(
+                f"Sheets snapshot not found at {cache_path.as_posix()}. Run one online build to create it."
+            )
+        with cache_path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        return cls(
+            {title: entry.get("values", []) for title, entry in payload.get("worksheets", {}).items()},
+            spreadsheet_id=payload.get("spreadsheet_id"),
+            modified_time=payload.get("modified_time"),
+            requested_tabs=tuple(payload.get("requested_tabs", [])),
+        )
+
+    def save(self, cache_path: Path) -> None:
+        """Write raw worksheet values, keyed by worksheet and spreadsheet modifiedTime."""
+        cache_path = Path(cache_path)
+        payload = {
+            "spreadsheet_id": self.spreadsheet_id,
+            "modified_time": self.modified_time,
+            "fetched_at": datetime.now().isoformat(timespec="seconds"),
+            "requested_tabs": list(self.requested_tabs),
+            "worksheets": {
+                title: {"modified_time": self.modified_time, "values": values}
+                for title, values in self.tabs.items()
+            },
+        }
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        with temp_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(temp_path, cache_path)
+
+    def has_tab(self, tab: str) -> bool:
+        return tab in self.tabs
+
+    def _raw(self, tab: str) -> list[list[str]]:
+        if tab not in self.tabs:
+            raise WorksheetNotFound(tab)
+        return self.tabs[tab]
+
+    def values(self, tab: str) -> list[list[str]]:
+        """All cell values for ``tab`` with rows right-padded to the widest row."""
+        raw = self._raw(tab)
+        if not raw:
+            return []
+        return fill_gaps([list(row) for row in raw])
+
+    def range(self, tab: str, first_row: int = 1, last_column: str | None = None) -> list[list[str]]:
+        """Rows from ``first_row`` (1-based) onward, cut at ``last_column``.
+
+        Trailing blank cells and rows are dropped, matching what the Sheets API
+        returns for an open-ended range such as ``A5:AH``.
+        """
+        width = _column_index(last_column) if last_column else None
+        rows = []
+        for row in self._raw(tab)[max(first_row - 1, 0):]:
+            cells = list(row[:width]) if width else list(row)
+            while cells and cells[-1] == "":
+                cells.pop()
+            rows.append(cells)
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
@@ -0,0 +1,251 @@
+"""
+Precompressed, content-hashed copies of the published JSON artifacts
+
+The site is served as static files, so every export under data/backend and
+data/charts gets:
+
+- an immutable copy named ``<stem>.<hash>.json`` that can be cached forever,
+- ``.gz`` (and ``.br`` when the optional ``brotli`` package is installed)
+  siblings of that copy for hosts that serve precompressed files,
+- an entry in ``data/manifest.json`` mapping the stable path to the hashed copy
+  with its size, compressed sizes and sha256.
+
+``resolveAssetPath`` / ``fetchStaticAsset`` in js/shared.js read the manifest
+and fetch the hashed copy, falling back to the stable path when it is absent.
+
+``publish_static_artifacts`` rebuilds the whole manifest and prunes superseded
+copies. ``refresh_static_artifacts`` updates just the entries for files that
+were rewritten or removed; ``BackendDatabase.export_tables`` and
+``python.chart_helpers.save_chart`` call it so the manifest never points at an
+older copy of a file they wrote.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import importlib.util
+import json
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+# brotli is optional (the "brotli" extra): without it only gzip siblings are written.
+if importlib.util.find_spec("brotli") is not None:
+    import brotli
+else:
+    brotli = None
+
+# Chart jobs save specs from several processes at once, so manifest updates
+# take an exclusive lock on a sidecar file.
+if importlib.util.find_spec("fcntl") is not None:
+    import fcntl
+
+    msvcrt = None
+else:
+    fcntl = None
+    import msvcrt
+
+MANIFEST_VERSION = 1
+DEFAULT_ROOTS = ("data/backend", "data/charts")
+DEFAULT_MANIFEST = "data/manifest.json"
+HASH_LENGTH = 12
+# Files whose names are already their content hash (chart datasets).
+_CONTENT_ADDRESSED = re.compile(r"^[0-9a-f]{64}\.json$")
+_HASHED_COPY = re.compile(rf"\.[0-9a-f]{{{HASH_LENGTH}}}\.json$")
+
+
+@dataclass
+class PublishSummary:
+    files: int = 0
+    hashed_copies_written: int = 0
+    compressed_written: int = 0
+    pruned: int = 0
+    bytes_raw: int = 0
+    bytes_gzip: int = 0
+
+
+def is_published_artifact(path: str | Path) -> bool:
+    """True for hashed copies and compressed siblings written by ``publish_static_artifacts``."""
+    name = Path(path).name
+    return name.endswith((".gz", ".br")) or bool(_HASHED_COPY.search(name))
+
+
+def _write_bytes_if_missing(path: Path, content: bytes) -> bool:
+    if path.exists():
+        return False
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(content)
+    tmp_path.replace(path)
+    return True
+
+
+def _source_files(site_root: Path, roots: Iterable[str], manifest_path: Path) -> list[Path]:
+    sources = []
+    for root in roots:
+        root_dir = site_root / root
+        if not root_dir.exists():
+            continue
+        for path in sorted(root_dir.rglob("*.json")):
+            if path == manifest_path or path.name.startswith(".") or is_published_artifact(path):
+                continue
+            sources.append(path)
+    return sources
+
+
+def _publish_source(site_root: Path, source: Path, summary: PublishSummary) -> tuple[Path, dict[str, Any]]:
+    """Write the hashed copy and compressed siblings of ``source``; return the copy and its manifest entry."""
+    content = source.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+    if _CONTENT_ADDRESSED.match(source.name):
+        target = source
+    else:
+        target = source.with_name(f"{source.stem}.{digest[:HASH_LENGTH]}{source.suffix}")
+        summary.hashed_copies_written += _write_bytes_if_missing(target, content)
+
+    gzip_path = target.with_name(f"{target.name}.gz")
+    if gzip_path.exists():
+        gzip_size = gzip_path.stat().st_size
+    else:
+        gzip_content = gzip.compress(content, compresslevel=9, mtime=0)
+        summary.compressed_written += _write_bytes_if_missing(gzip_path, gzip_content)
+        gzip_size = len(gzip_content)
+    entry = {
+        "path": target.relative_to(site_root).as_posix(),
+        "sha256": digest,
+        "size": len(content),
+        "gzip": gzip_size,
+    }
+    if brotli is not None:
+        br_path = target.with_name(f"{target.name}.br")
+        if br_path.exists():
+            entry["br"] = br_path.stat().st_size
+        else:
+            br_content = brotli.compress(content)
+            summary.compressed_written += _write_bytes_if_missing(br_path, br_content)
+            entry["br"] = len(br_content)
+
+    summary.files += 1
+    summary.bytes_raw += len(content)
+    summary.bytes_gzip += gzip_size
+    return target, entry
+
+
+@contextmanager
+def _manifest_lock(manifest_path: Path) -> Iterator[None]:
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path.with_name(f".{manifest_path.name}.lock"), "a+b") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _write_manifest(manifest_path: Path, entries: dict[str, dict[str, Any]]) -> None:
+    tmp_manifest = manifest_path.with_name(f".{manifest_path.name}.tmp")
+    tmp_manifest.write_text(
+        json.dumps({"version": MANIFEST_VERSION, "files": entries}, indent=1, sort_keys=True),
+        encoding="utf-8",
+    )
+    tmp_manifest.replace(manifest_path)
+
+
+def publish_static_artifacts(
+    site_root: str | Path = ".",
+    roots: Iterable[str] = DEFAULT_ROOTS,
+    manifest: str = DEFAULT_MANIFEST,
+) -> PublishSummary:
+    """Write hashed copies, compressed siblings and the manifest for ``roots``.
+
+    Paths are relative to ``site_root`` (the directory the site is served from).
+    Hashed copies and siblings are immutable, so unchanged files cost one hash
+    each on later runs; copies and siblings no longer in the manifest are removed.
+    """
+    site_root = Path(site_root)
+    roots = tuple(roots)
+    manifest_path = site_root / manifest
+    summary = PublishSummary()
+    entries: dict[str, dict[str, Any]] = {}
+    served: set[Path] = set()
+
+    with _manifest_lock(manifest_path):
+        for source in _source_files(site_root, roots, manifest_path):
+            target, entry = _publish_source(site_root, source, summary)
+            served.add(target)
+            entries[source.relative_to(site_root).as_posix()] = entry
+
+        for root in roots:
+            root_dir = site_root / root
+            if not root_dir.exists():
+                continue
+            for path in root_dir.rglob("*"):
+                if not path.is_file():
+                    continue
+                if path.suffix in {".gz", ".br"}:
+                    base = path.with_suffix("")
+                    stale = base not in served
+                else:
+                    stale = bool(_HASHED_COPY.search(path.name)) and path not in served
+                if stale:
+                    path.unlink()
+                    summary.pruned += 1
+
+        _write_manifest(manifest_path, entries)
+    return summary
+
+
+def refresh_static_artifacts(
+    paths: Iterable[str | Path],
+    site_root: str | Path = ".",
+    roots: Iterable[str | Path] = DEFAULT_ROOTS,
+    manifest: str = DEFAULT_MANIFEST,
+) -> PublishSummary:
+    """Bring the manifest entries for ``paths`` in line with the files on disk.
+
+    Rewritten files get a hashed copy, siblings and a fresh entry; removed files
+    lose theirs. Paths outside ``roots`` (or outside ``site_root``) are ignored.
+    Superseded copies are left for the next ``publish_static_artifacts`` to prune.
+    """
+    site_root = Path(site_root).resolve()
+    root_dirs = [site_root / root for root in roots]
+    manifest_path = site_root / manifest
+    summary = PublishSummary()
+    sources: dict[str, Path] = {}
+    for path in paths:
+        source = Path(path).resolve()
+        if (
+            source.suffix != ".json"
+            or source.name.startswith(".")
+            or is_published_artifact(source)
+            or source == manifest_path
+            or site_root not in source.parents
+            or not any(root_dir in source.parents for root_dir in root_dirs)
+        ):
+            continue
+        sources[source.relative_to(site_root).as_posix()] = source
+    if not sources:
+        return summary
+
+    with _manifest_lock(manifest_path):
+        try:
+            entries = json.loads(manifest_path.read_text(encoding="utf-8"))["files"]
+        except (OSError, ValueError, KeyError):
+            entries = {}
+        for key, source in sources.items():
+            if source.exists():
+                entries[key] = _publish_source(site_root, source, summary)[1]
+            else:
+                entries.pop(key, None)
+        _write_manifest(manifest_path, entries)
+    return summary
@@ -0,0 +1,246 @@
+"""
+Stage-level tracing for the backend build and chart update
+
+``@traced`` wraps a function in a span and ``span(name)`` wraps a block. Both
+do nothing unless a ``profiling()`` block is active: a traced call then costs
+one global lookup. While profiling, each finished span records its duration,
+the rows of the DataFrames passed in and returned, and the traced memory delta
+and peak. Spans are logged as one JSON object per line on the ``python.tracing``
+logger, summarised slowest first at the end, and can be written as a Chrome
+trace (open it in chrome://tracing or https://ui.perfetto.dev):
+
+    ./env/bin/python python/build_backend.py --profile --profile-trace build-trace.json
+
+Spans are recorded for the calling thread only; chart workers in other
+processes are not traced.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_NO_SPAN = nullcontext()
+_active_tracer: "Tracer | None" = None
+
+
+def _rows(value: Any) -> int | None:
+    if isinstance(value, pd.DataFrame):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        counts = [_rows(item) for item in value if isinstance(item, pd.DataFrame)]
+        return sum(counts) if counts else None
+    return None
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    depth: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+    duration: float = 0.0
+    child_duration: float = 0.0
+    rows_in: int | None = None
+    rows_out: int | None = None
+    memory_start: int = 0
+    memory_delta: int | None = None
+    memory_peak: int | None = None
+
+    def record(self) -> dict[str, Any]:
+        record = {
+            "name": self.name,
+            "start_s": round(self.start, 6),
+            "duration_s": round(self.duration, 6),
+            "self_s": round(self.duration - self.child_duration, 6),
+            "depth": self.depth,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "memory_delta_bytes": self.memory_delta,
+            "memory_peak_bytes": self.memory_peak,
+        }
+        record.update(self.attributes)
+        return record
+
+
+class Tracer:
+    """Collects nested spans for one profiled run."""
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.spans: list[Span] = []
+        self._stack: list[Span] = []
+        self._origin = time.perf_counter()
+        self._thread = threading.get_ident()
+
+    @contextmanager
+    def span(self, name: str, rows_in: int | None = None, **attributes: Any) -> Iterator[Span]:
+        if threading.get_ident() != self._thread:
+            yield Span(name, 0.0, 0)
+            return
+        current = Span(name, time.perf_counter() - self._origin, len(self._stack), attributes, rows_in=rows_in)
+        if self.trace_memory:
+            if self._stack:
+                # Keep the parent's peak before resetting the counter for this span.
+                parent = self._stack[-1]
+                parent.memory_peak = max(parent.memory_peak or 0, tracemalloc.get_traced_memory()[1] - parent.memory_start)
+            tracemalloc.reset_peak()
+            current.memory_start = tracemalloc.get_traced_memory()[0]
+        self._stack.append(current)
+        try:
+            yield current
+        finally:
+            current.duration = time.perf_counter() - self._origin - current.start
+            self._stack.pop()
+            if self.trace_memory:
+                memory, peak = tracemalloc.get_traced_memory()
+                current.memory_delta = memory - current.memory_start
+                current.memory_peak = max(current.memory_peak or 0, peak - current.memory_start)
+                if self._stack:
+                    parent = self._stack[-1]
+                    parent.memory_peak = max(
+                        parent.memory_peak or 0, current.memory_start + current.memory_peak - parent.memory_start
+                    )
+            if self._stack:
+                self._stack[-1].child_duration += current.duration
+            self.spans.append(current)
+            logger.info(json.dumps(current.record(), default=str))
+
+    def call(self, func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        inputs = [_rows(value) for value in (*args, *kwargs.values())]
+        counts = [count for count in inputs if count is not None]
+        # The first string argument names what the call acts on, e.g. the table for ``_insert``.
+        target = next((value for value in args if isinstance(value, str)), None)
+        attributes = {"target": target} if target is not None else {}
+        with self.span(func.__name__, rows_in=sum(counts) if counts else None, **attributes) as current:
+            result = func(*args, **kwargs)
+            current.rows_out = _rows(result)
+            return result
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Spans aggregated by name, slowest total first."""
+        totals: dict[str, dict[str, Any]] = defaultdict(lambda: {"calls": 0, "total_s": 0.0, "self_s": 0.0, "peak_bytes": 0})
+        for item in self.spans:
+            entry = totals[item.name]
+            entry["calls"] += 1
+            entry["total_s"] += item.duration
+            entry["self_s"] += item.duration - item.child_duration
+            entry["peak_bytes"] = max(entry["peak_bytes"], item.memory_peak or 0)
+        return sorted(({"name": name, **entry} for name, entry in totals.items()), key=lambda entry: -entry["total_s"])
+
+    def chrome_trace(self) -> dict[str, Any]:
+        events = []
+        for item in self.spans:
+            arguments = {key: value for key, value in item.record().items() if key not in {"name", "start_s", "duration_s"}}
+            events.append(
+                {
+                    "name": item.name,
+                    "cat": "build",
+                    "ph": "X",
+                    "ts": round(item.start * 1e6, 1),
+                    "dur": round(item.duration * 1e6, 1),
+                    "pid": os.getpid(),
+                    "tid": 1,
+                    "args": {key: value for key, value in arguments.items() if value is not None},
+                }
+            )
+        events.sort(key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def traced(func: F) -> F:
+    """Record a span for each call of ``func`` while profiling is enabled."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        tracer = _active_tracer
+        if tracer is None:
+            return func(*args, **kwargs)
+        return tracer.call(func, args, kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def span(name: str, **attributes: Any):
+    """Context manager for a span around a block; a shared no-op when profiling is off."""
+    tracer = _active_tracer
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.span(name, **attributes)
+
+
+def print_summary(tracer: Tracer, limit: int = 25) -> None:
+    print(f"\nProfile ({len(tracer.spans)} spans, slowest first):")
+    for entry in tracer.summary()[:limit]:
+        print(
+            f"  {entry['name']:<44} {entry['calls']:>4}x {entry['total_s']:>9.3f}s total "
+            f"{entry['self_s']:>9.3f}s self {entry['peak_bytes'] / 1e6:>9.1f} MB peak"
+        )
+
+
+@contextmanager
+def profiling(
+    enabled: bool = True,
+    chrome_trace_path: str | Path | None = None,
+    trace_memory: bool = True,
+    show_summary: bool = True,
+) -> Iterator[Tracer | None]:
+    """Trace ``@traced`` calls and ``span`` blocks run inside this block.
+
+    Yields ``None`` (and changes nothing) when ``enabled`` is false, so callers
+    can wrap their work unconditionally behind a ``--profile`` flag.
+    """
+    global _active_tracer
+    if not enabled:
+        yield None
+        return
+    if _active_tracer is not None:
+        # Nested: the outer block already collects everything.
+        yield _active_tracer
+        return
+
+    started_tracemalloc = trace_memory and not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    tracer = Tracer(trace_memory=trace_memory and tracemalloc.is_tracing())
+    _active_tracer = tracer
+    try:
+        yield tracer
+    finally:
+        _active_tracer = None
+        if started_tracemalloc:
+            tracemalloc.stop()
+        if chrome_trace_path:
+            path = Path(chrome_trace_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(tracer.chrome_trace(), default=str), encoding="utf-8")
+        if show_summary:
+            print_summary(tracer)
+            if chrome_trace_path:
+                print(f"Chrome trace written to {Path(chrome_trace_path).as_posix()}")
+
+
+def enable_span_log(level: int = logging.INFO) -> None:
+    """Send the JSON span records to stderr (used by the ``--profile`` command-line flags)."""
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
@@ -4,6 +4,7 @@ import argparse
 import os
 from collections import defaultdict
 import json
+import time
 
 # Add project root to Python path
 project_root = Path(__file__).resolve().parent.parent
@@ -15,36 +16,10 @@ os.chdir(project_root)
 
 from python.backend import BackendConfig, BackendDatabase
 from python.data import *
-from python.charts import (
-    squad_position_composition_chart,
-    squad_size_trend_chart,
-    squad_continuity_average_chart,
-    squad_overlap_chart,
-    captains_chart,
-    player_stats_motm_chart,
-    player_stats_appearances_chart,
-    player_stats_starting_combinations_chart,
-    player_full_profile_appearances_per_season_chart,
-    player_full_profile_position_donut_chart,
-    player_full_profile_career_timeline_chart,
-    points_scorers_chart,
-    team_sheets_chart,
-    opposition_profile_team_sheets_chart,
-    results_chart,
-    team_stats_results_chart,
-    set_piece_success_by_season_chart,
-    lineout_success_by_zone_chart,
-    lineout_breakdown_chart_suite,
-    lineout_trend_chart_suite,
-    set_piece_h2h_chart_backend,
-    season_match_metric_trends_chart,
-    red_zone_performance_chart,
-    set_piece_attacking_volume_chart,
-    red_zone_entries_efficiency_chart,
-    lineout_analysis_chart_suite,
-    export_league_context_chart_specs,
-    export_league_results_chart_specs,
-)
+from python.chart_jobs import CHART_JOBS, jobs_for_tables, report_chart_results, run_chart_jobs
+from python.chart_datasets import externalize_chart_specs, split_player_chart_rows
+from python.static_artifacts import publish_static_artifacts
+from python.tracing import enable_span_log, profiling, span
 
 from python.sync_headshots import run_sync, HEADSHOTS_DIR, TARGET_FILES
 from python.logos import export_logos_manifest
@@ -57,33 +32,36 @@ import pandas as pd
 # Player Appearances Chart #
 ############################
 
-def main(refresh_pitchero=False, backend_mode="canonical", backend_db_path="data/egrfc_backend.duckdb"):
+def main(refresh_pitchero=False, backend_mode="canonical", backend_db_path="data/egrfc_backend.duckdb", incremental=False, offline=False, jobs=None):
     """Main update function using optimized data"""
 
     # Generate logos manifest for frontend
-    export_logos_manifest(Path("data") / "logos.json", Path("img") / "logos")
+    with span("logos_manifest"):
+        export_logos_manifest(Path("data") / "logos.json", Path("img") / "logos")
 
     if backend_mode != "canonical":
         raise ValueError("Only canonical backend mode is supported.")
 
+    # Build into a staged copy and swap it in, so readers of the published
+    # file (notebooks, the query service) never block the build.
+    db = BackendDatabase(config=BackendConfig(db_path=backend_db_path), staged=True)
     try:
-        db = BackendDatabase(config=BackendConfig(db_path=backend_db_path))
-    except RuntimeError as exc:
-        default_path = "data/egrfc_backend.duckdb"
-        fallback_path = "data/egrfc_backend_alt.duckdb"
-        if backend_db_path == default_path and "locked by another process" in str(exc):
-            print(f"Default backend DB is locked. Falling back to {fallback_path}...")
-            db = BackendDatabase(config=BackendConfig(db_path=fallback_path))
-        else:
-            raise
-    db.build(refresh_pitchero=refresh_pitchero, export=True)
+        changed_tables = db.build(refresh_pitchero=refresh_pitchero, export=True, incremental=incremental, offline=offline)
+        changed_names = db._export_names_for(changed_tables)
+        # Chart workers open their own read-only connections to the published file.
+        with span("publish_database"):
+            db.publish()
+    finally:
+        db.close()
+    chart_db_path = db.config.db_path
 
     # Keep backend player exports aligned with current headshot files and crop rules.
-    recrop_result, sync_results, sync_total_updates = run_sync(
-        write=True,
-        headshots_dir=HEADSHOTS_DIR,
-        targets=TARGET_FILES,
-    )
+    with span("headshot_sync"):
+        recrop_result, sync_results, sync_total_updates = run_sync(
+            write=True,
+            headshots_dir=HEADSHOTS_DIR,
+            targets=TARGET_FILES,
+        )
     print(
         "Headshot sync: "
         f"checked={recrop_result.checked}, "
@@ -99,39 +77,45 @@ def main(refresh_pitchero=False, backend_mode="canonical", backend_db_path="data
     # db.load_league_data(season="2024-2025", league="Counties 1 Surrey/Sussex")
     
     print("Generating charts and data...")
-    
-    # Existing charts
-    captains_chart(db)
-    player_stats_motm_chart(db)
-    player_stats_appearances_chart(db)
-    player_stats_starting_combinations_chart(db)
-    player_full_profile_appearances_per_season_chart(db)
-    player_full_profile_position_donut_chart(db)
-    player_full_profile_career_timeline_chart(db)
-    points_scorers_chart(db)
-    team_sheets_chart(db)
-    opposition_profile_team_sheets_chart(db)
-    results_chart(db)
-    results_chart(db, output_file='data/charts/opposition_results.json', facet_by_season=True)
-    team_stats_results_chart(db)
-
-    set_piece_success_by_season_chart(db, layout="separate")
-    set_piece_attacking_volume_chart(db, layout="separate", bind_params=False)
-    set_piece_h2h_chart_backend(db, set_piece="Lineout", output_file="data/charts/lineout_h2h.json")
-    set_piece_h2h_chart_backend(db, set_piece="Scrum", output_file="data/charts/scrum_h2h.json")
-    season_match_metric_trends_chart(db, output_file="data/charts/season_match_metric_trends.json")
-    red_zone_performance_chart(db, metric="points", output_file="data/charts/red_zone_points.json", bind_params=False)
-    red_zone_entries_efficiency_chart(db, output_file="data/charts/red_zone_entries_efficiency.json", bind_params=False)
-    lineout_success_by_zone_chart(db)
-    lineout_breakdown_chart_suite(db)
-    lineout_trend_chart_suite(db)
-    lineout_analysis_chart_suite(db)
-    squad_size_trend_chart(db)
-    squad_position_composition_chart(db)
-    squad_overlap_chart(db)
-    squad_continuity_average_chart(db)
-    export_league_context_chart_specs(db, squads=("1st",))
-    export_league_results_chart_specs(db)
+    chart_jobs = jobs_for_tables(changed_names) if incremental else CHART_JOBS
+    if incremental:
+        print(f"Incremental build: regenerating {len(chart_jobs)} of {len(CHART_JOBS)} chart job(s).")
+    started = time.perf_counter()
+    with span("chart_jobs", jobs=len(chart_jobs)):
+        results = run_chart_jobs(chart_db_path, chart_jobs, max_workers=jobs)
+    wall_seconds = time.perf_counter() - started
+
+    # Move inline chart data into shared content-hashed files under data/charts/datasets.
+    with span("externalize_chart_specs"):
+        datasets = externalize_chart_specs(Path("data") / "charts")
+    print(
+        "Chart datasets: "
+        f"specs={datasets.specs_rewritten}, "
+        f"new={datasets.datasets_written}, "
+        f"pruned={datasets.datasets_pruned}, "
+        f"spec bytes {datasets.bytes_before:,} -> {datasets.bytes_after:,}"
+    )
+    # Per-player slices of the profile chart datasets, read by player-profile.html.
+    with span("split_player_chart_rows"):
+        player_charts = split_player_chart_rows(Path("data") / "charts")
+    print(
+        "Player chart rows: "
+        f"players={player_charts.players}, "
+        f"written={player_charts.files_written}, "
+        f"pruned={player_charts.files_pruned}"
+    )
+    # Hashed, precompressed copies of data/backend and data/charts plus data/manifest.json.
+    with span("publish_static_artifacts"):
+        published = publish_static_artifacts(project_root)
+    print(
+        "Static artifacts: "
+        f"files={published.files}, "
+        f"new copies={published.hashed_copies_written}, "
+        f"new compressed={published.compressed_written}, "
+        f"pruned={published.pruned}, "
+        f"bytes {published.bytes_raw:,} -> {published.bytes_gzip:,} gzip"
+    )
+    report_chart_results(results, wall_seconds=wall_seconds)
 
     print("All charts and data generated.")
 
@@ -151,12 +135,47 @@ if __name__ == "__main__":
     parser.add_argument(
         "--db-path",
         default="data/egrfc_backend.duckdb",
-        help="DuckDB path for canonical backend mode (falls back to data/egrfc_backend_alt.duckdb if default is locked)",
+        help="DuckDB path for canonical backend mode (built to a staged copy, then swapped in)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only rebuild backend tables whose inputs changed since the last build",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Build from the on-disk Sheets snapshot without network access",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of chart worker processes (default: one per CPU; 1 runs charts in this process)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Trace backend build stages and update steps: JSON span records on stderr and a summary at the end",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        metavar="PATH",
+        help="Also write the spans as a Chrome trace JSON file (implies --profile)",
     )
 
     args = parser.parse_args()
-    main(
-        refresh_pitchero=args.refresh_pitchero,
-        backend_mode=args.backend_mode,
-        backend_db_path=args.db_path,
-    )
\ No newline at end of file
+    profile = args.profile or bool(args.profile_trace)
+    if profile:
+        enable_span_log()
+    with profiling(enabled=profile, chrome_trace_path=args.profile_trace):
+        main(
+            refresh_pitchero=args.refresh_pitchero,
+            backend_mode=args.backend_mode,
+            backend_db_path=args.db_path,
+            incremental=args.incremental,
+            offline=args.offline,
+            jobs=args.jobs,
+        )
\ No newline at end of file
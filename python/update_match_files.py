@@ -1,7 +1,17 @@
 import os
+import sys
 import json
+import shutil
 import logging
 from datetime import datetime
+from pathlib import Path
+
+# Add project root to Python path so this also runs as a script
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from python.match_cache import MatchCacheManifest, iter_match_cache, match_cache_files
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -40,32 +50,38 @@ def determine_league_from_teams_and_date(teams, date_str):
     
     return league_mappings.get(season, "Unknown League")
 
-def update_match_files(match_data_dir="data/match_data", dry_run=False):
-    """Update all match JSON files with missing fields."""
+def update_match_files(match_data_dir="data/match_data", dry_run=False, workers=None, full=False):
+    """Update match JSON files with missing fields.
+
+    Files already checked (or fixed) by an earlier run and unchanged since are
+    skipped; ``full`` checks every file again.
+    """
     
     if not os.path.exists(match_data_dir):
         logging.error(f"Directory {match_data_dir} does not exist")
         return
     
-    json_files = [f for f in os.listdir(match_data_dir) if f.endswith('.json')]
+    manifest = MatchCacheManifest(match_data_dir, "update")
+    changed_files, unchanged = manifest.scan(full=full)
     
-    if not json_files:
+    if not changed_files and not unchanged:
         logging.warning("No JSON files found")
         return
     
-    logging.info(f"Found {len(json_files)} JSON files to process")
+    logging.info(f"Found {len(changed_files)} new or changed JSON files to process ({len(unchanged)} unchanged)")
     
     updated_count = 0
     error_count = 0
     
-    for filename in json_files:
-        filepath = os.path.join(match_data_dir, filename)
-        match_id = filename.replace('.json', '')
+    for cached_file in iter_match_cache(changed_files, workers=workers):
+        filepath = str(cached_file.path)
+        filename = cached_file.path.name
+        match_id = cached_file.match_id
         
         try:
-            # Load existing data
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            if cached_file.error is not None:
+                raise ValueError(cached_file.error)
+            data = cached_file.data
             
             # Track what we're updating
             updates = []
@@ -104,13 +120,12 @@ def update_match_files(match_data_dir="data/match_data", dry_run=False):
             if updates:
                 if not dry_run:
                     # Create backup
-                    backup_path = filepath + '.backup'
-                    with open(backup_path, 'w') as f:
-                        json.dump(json.load(open(filepath, 'r')), f, indent=4)
+                    shutil.copyfile(filepath, filepath + '.backup')
                     
                     # Save updated data
                     with open(filepath, 'w') as f:
                         json.dump(data, f, indent=4)
+                    manifest.record(filepath)
                     
                     logging.info(f"✅ Updated {filename}: {', '.join(updates)}")
                 else:
@@ -118,51 +133,61 @@ def update_match_files(match_data_dir="data/match_data", dry_run=False):
                 
                 updated_count += 1
             else:
+                manifest.record(filepath)
                 logging.debug(f"No updates needed for {filename}")
                 
         except Exception as e:
             logging.error(f"❌ Error processing {filename}: {e}")
             error_count += 1
     
+    manifest.save()
     logging.info(f"Processing complete: {updated_count} files updated, {error_count} errors")
     
     if dry_run:
         logging.info("This was a dry run. Use dry_run=False to make actual changes.")
 
-def validate_updated_files(match_data_dir="data/match_data"):
-    """Validate that all files have the required fields."""
+def _missing_required_fields(cached_file, required_fields):
+    """Validation result kept in the manifest: the missing fields, or the read error."""
+    if cached_file.error is not None:
+        return {"error": cached_file.error}
+    try:
+        return {"missing": [field for field in required_fields if field not in cached_file.data]}
+    except Exception as e:
+        return {"error": str(e)}
+
+def validate_updated_files(match_data_dir="data/match_data", workers=None, full=False):
+    """Validate that all files have the required fields.
+
+    Only files changed since the last validation are read; the others reuse
+    their saved result. ``full`` reads every file again.
+    """
     
     if not os.path.exists(match_data_dir):
         logging.error(f"Directory {match_data_dir} does not exist")
         return
     
-    json_files = [f for f in os.listdir(match_data_dir) if f.endswith('.json')]
     required_fields = ['match_id', 'season', 'league']
+    manifest = MatchCacheManifest(match_data_dir, "validate")
+    changed_files, results = manifest.scan(full=full)
+    for cached_file in iter_match_cache(changed_files, workers=workers):
+        result = _missing_required_fields(cached_file, required_fields)
+        manifest.record(cached_file.path, result)
+        results[cached_file.path] = result
+    manifest.save()
     
     missing_fields = {}
     valid_count = 0
     
-    for filename in json_files:
-        filepath = os.path.join(match_data_dir, filename)
-        
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            
-            missing = []
-            for field in required_fields:
-                if field not in data:
-                    missing.append(field)
-            
-            if missing:
-                missing_fields[filename] = missing
-            else:
-                valid_count += 1
-                
-        except Exception as e:
-            logging.error(f"Error validating {filename}: {e}")
+    for path, result in sorted(results.items()):
+        filename = path.name
+        if "error" in result:
+            logging.error(f"Error validating {filename}: {result['error']}")
+        elif result["missing"]:
+            missing_fields[filename] = result["missing"]
+        else:
+            valid_count += 1
     
-    logging.info(f"Validation complete: {valid_count}/{len(json_files)} files have all required fields")
+    logging.info(f"Validation complete: {valid_count}/{len(results)} files have all required fields")
     
     if missing_fields:
         logging.warning("Files with missing fields:")
@@ -199,15 +224,16 @@ def fix_specific_leagues(match_data_dir="data/match_data", dry_run=False):
         logging.error(f"Directory {match_data_dir} does not exist")
         return
     
-    json_files = [f for f in os.listdir(match_data_dir) if f.endswith('.json')]
     corrections_made = 0
     
-    for filename in json_files:
-        filepath = os.path.join(match_data_dir, filename)
+    for cached_file in iter_match_cache(match_cache_files(match_data_dir)):
+        filepath = str(cached_file.path)
+        filename = cached_file.path.name
         
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            if cached_file.error is not None:
+                raise ValueError(cached_file.error)
+            data = cached_file.data
             
             if 'season' in data and 'teams' in data:
                 season = data['season']
@@ -250,21 +276,23 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Show what would be updated without making changes")
     parser.add_argument("--validate", action="store_true", help="Only validate files (don't update)")
     parser.add_argument("--fix-leagues", action="store_true", help="Apply specific league corrections")
+    parser.add_argument("--workers", type=int, default=None, help="Parse changed files across N processes")
+    parser.add_argument("--full", action="store_true", help="Re-read every file, not just those changed since the last run")
     
     args = parser.parse_args()
     
     if args.validate:
-        validate_updated_files(args.dir)
+        validate_updated_files(args.dir, workers=args.workers, full=args.full)
     elif args.fix_leagues:
         fix_specific_leagues(args.dir, dry_run=args.dry_run)
     else:
         # Run the main update
-        update_match_files(args.dir, dry_run=args.dry_run)
+        update_match_files(args.dir, dry_run=args.dry_run, workers=args.workers, full=args.full)
         
         # Validate after updating
         if not args.dry_run:
             logging.info("\nValidating updated files...")
-            validate_updated_files(args.dir)
+            validate_updated_files(args.dir, workers=args.workers, full=args.full)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
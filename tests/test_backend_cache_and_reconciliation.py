@@ -5,7 +5,13 @@ from pathlib import Path
 
 import pandas as pd
 
-from python.backend import BackendConfig, BackendDatabase
+from python.backend import (
+    BackendConfig,
+    BackendDatabase,
+    historic_pitchero_store_dir,
+    read_historic_pitchero_store,
+    write_historic_pitchero_store,
+)
 from python.data import DataExtractor
 
 
@@ -157,6 +163,62 @@ class BackendCacheAndReconciliationTests(unittest.TestCase):
         self.assertEqual(len(appearances), 1)
         self.assertEqual(appearances.iloc[0]["game_id"], "2018-09-01_1st_Hove")
 
+    def test_historic_loader_migrates_json_cache_to_parquet_store(self):
+        cache_file = self.temp_path / "historic_cache.json"
+        payload = {
+            "games": [
+                {"game_id": "2018-09-01_1st_Hove", "date": "2018-09-01", "season": "2018/19", "squad": "1st", "pf": 20},
+            ],
+            "appearances": [
+                {"appearance_id": "a1", "game_id": "2018-09-01_1st_Hove", "player": "T Mitchell", "shirt_number": 9},
+            ],
+        }
+        cache_file.write_text(json.dumps(payload), encoding="utf-8")
+        self.backend.historic_pitchero_cache_file = cache_file
+
+        self.backend._load_historic_pitchero_team_sheets(extractor=_ExtractorShouldNotBeCalled(), refresh_pitchero=False)
+        cache_file.unlink()
+        games, appearances = self.backend._load_historic_pitchero_team_sheets(
+            extractor=_ExtractorShouldNotBeCalled(),
+            refresh_pitchero=False,
+        )
+
+        self.assertTrue((self.temp_path / "historic_cache" / "season=2018-19" / "games.parquet").exists())
+        self.assertEqual(games.iloc[0]["date"], "2018-09-01")
+        self.assertEqual(games.iloc[0]["pf"], 20)
+        self.assertEqual(appearances.iloc[0]["player"], "T Mitchell")
+
+    def test_historic_store_reads_only_requested_seasons_in_cache_order(self):
+        store_dir = historic_pitchero_store_dir(self.temp_path / "historic_cache.json")
+        games = pd.DataFrame(
+            [
+                {"game_id": "g2", "date": "2019-09-07", "season": "2019/20", "pf": 10, "pa": 3},
+                {"game_id": "g1", "date": "2018-09-01", "season": "2018/19", "pf": 20, "pa": None},
+                {"game_id": "g3", "date": "2018-09-08", "season": "2018/19", "pf": 5, "pa": 7},
+            ]
+        )
+        appearances = pd.DataFrame(
+            [
+                {"appearance_id": "a3", "game_id": "g3", "is_starter": True},
+                {"appearance_id": "a2", "game_id": "g2", "is_starter": False},
+                {"appearance_id": "a1", "game_id": "g1", "is_starter": True},
+                {"appearance_id": "orphan", "game_id": "g9", "is_starter": True},
+            ]
+        )
+
+        write_historic_pitchero_store(store_dir, games, appearances)
+        all_games, all_apps = read_historic_pitchero_store(store_dir)
+        season_games, season_apps = read_historic_pitchero_store(store_dir, seasons=["2018/19"])
+
+        self.assertEqual(sorted(path.name for path in store_dir.iterdir()), ["season=2018-19", "season=2019-20"])
+        self.assertEqual(all_games["game_id"].tolist(), ["g2", "g1", "g3"])
+        self.assertEqual(all_apps["appearance_id"].tolist(), ["a3", "a2", "a1"])
+        self.assertEqual(season_games["game_id"].tolist(), ["g1", "g3"])
+        self.assertEqual(season_games["season"].tolist(), ["2018/19", "2018/19"])
+        self.assertTrue(pd.isna(season_games.iloc[0]["pa"]))
+        self.assertEqual(season_apps["appearance_id"].tolist(), ["a3", "a1"])
+        self.assertEqual(season_apps["is_starter"].tolist(), [True, True])
+
     def test_build_games_blocks_pitchero_only_rows_in_google_covered_season(self):
         games_raw = pd.DataFrame(
             [
@@ -0,0 +1,69 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from python.backend import COLUMNAR_EXPORT_FORMAT, BackendConfig, BackendDatabase, _columnar_payload
+
+
+def _decode(payload):
+    # Mirrors decodeColumnarTable in js/shared.js.
+    columns = payload["columns"]
+    return [
+        {
+            column["name"]: column["dict"][column["codes"][index]] if "dict" in column else column["values"][index]
+            for column in columns
+        }
+        for index in range(payload["length"])
+    ]
+
+
+class ColumnarExportTests(unittest.TestCase):
+    def test_repeated_strings_are_dictionary_encoded(self):
+        records = [
+            {"squad": "1st", "player": f"Player {index}", "number": index, "is_starter": True, "unit": None if index == 3 else "Backs"}
+            for index in range(4)
+        ]
+
+        payload = _columnar_payload(records, ["squad", "player", "number", "is_starter", "unit"])
+        columns = {column["name"]: column for column in payload["columns"]}
+
+        self.assertEqual(payload["format"], COLUMNAR_EXPORT_FORMAT)
+        self.assertEqual(columns["squad"], {"name": "squad", "dict": ["1st"], "codes": [0, 0, 0, 0]})
+        self.assertEqual(columns["unit"]["dict"], ["Backs", None])
+        self.assertEqual(columns["player"]["values"], ["Player 0", "Player 1", "Player 2", "Player 3"])
+        self.assertEqual(columns["number"]["values"], [0, 1, 2, 3])
+        self.assertEqual(_decode(payload), records)
+        self.assertEqual(_columnar_payload([], ["squad"]), {"format": COLUMNAR_EXPORT_FORMAT, "length": 0, "columns": [{"name": "squad", "values": []}]})
+
+    def test_export_writes_matching_records_and_columnar_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            backend = BackendDatabase(
+                BackendConfig(db_path=str(temp_path / "backend.duckdb"), export_dir=str(temp_path / "export"))
+            )
+            try:
+                backend.reset_schema()
+                backend.create_views()
+                backend.con.execute(
+                    """
+                    INSERT INTO games (game_id, date, season, squad, opposition, home_away, tries_scorers)
+                    VALUES
+                        ('2025-09-13_1st_Hove', '2025-09-13', '2025/26', '1st', 'Hove', 'H', '{"Sam Lindsay": 2}'),
+                        ('2025-09-20_1st_Crawley', '2025-09-20', '2025/26', '1st', 'Crawley', 'A', NULL)
+                    """
+                )
+                backend.export_tables(names={"games"})
+            finally:
+                backend.close()
+
+            records = json.loads((temp_path / "export" / "games.json").read_text(encoding="utf-8"))
+            columnar = json.loads((temp_path / "export" / "games.columns.json").read_text(encoding="utf-8"))
+
+        self.assertEqual(_decode(columnar), records)
+        self.assertEqual(records[0]["tries_scorers"], {"Sam Lindsay": 2})
+        self.assertEqual(records[0]["date"], "2025-09-13")
+
+
+if __name__ == "__main__":
+    unittest.main()
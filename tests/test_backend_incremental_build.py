@@ -0,0 +1,247 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from python.backend import POST_ENRICHMENT_TABLES, BackendConfig, BackendDatabase
+from python.data import DataExtractor
+
+
+def _team_sheet(rows):
+    header = ["Date", "Season", "Competition", "Opposition", "Score", "Captain", "VC", "VC", "", "MOTM"]
+    header += [str(number) for number in range(1, 16)]
+    return [[""], [""], [""], header] + rows
+
+
+def _team_sheet_row(date, opposition, score, players):
+    return [date, "2025/26", "Counties 1", opposition, score, players[0], players[1], "", "", players[2]] + players
+
+
+def _lineout_row(date, opposition, call, won, jumper="Player D"):
+    row = ["1", "1st", "2025/26", date, opposition, "7", call, "", "x", "", "", "", "", "", "", "Player B", jumper, won]
+    return row + [""]
+
+
+def _rfu_match(match_id, season, date, home_players, away_players):
+    return {
+        "match_id": match_id,
+        "season": season,
+        "league": "Counties 2 Sussex",
+        "date": date,
+        "teams": ["East Grinstead", "Hove"],
+        "score": [20, 10],
+        "players": [
+            {str(number): player for number, player in enumerate(home_players, start=1)},
+            {str(number): player for number, player in enumerate(away_players, start=1)},
+        ],
+    }
+
+
+def _set_piece_row(date, lineouts_won, lineouts_total):
+    row = [""] * 34
+    row[1] = "Hove"
+    row[2] = date
+    row[8] = str(lineouts_won)
+    row[9] = str(lineouts_total)
+    return row
+
+
+class _FakeWorksheet:
+    def __init__(self, title):
+        self.title = title
+
+
+class _FakeSpreadsheet:
+    def __init__(self, tabs):
+        self.tabs = tabs
+
+    def worksheets(self):
+        return [_FakeWorksheet(title) for title in self.tabs]
+
+    def values_batch_get(self, ranges):
+        return {"valueRanges": [{"values": self.tabs[name.strip("'")]} for name in ranges]}
+
+
+class _FakeClient:
+    def __init__(self, tabs):
+        self.tabs = tabs
+
+    def open_by_url(self, url):
+        return _FakeSpreadsheet(self.tabs)
+
+
+class BackendIncrementalBuildTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        (self.temp_path / "historic_cache.json").write_text(
+            json.dumps({"games": [], "appearances": []}),
+            encoding="utf-8",
+        )
+        (self.temp_path / "pitchero_stats_cache.json").write_text(
+            json.dumps([{"Season": "2025/26", "Squad": "1st", "Player_join": "A Player", "A": 1, "Event": "T", "Count": 1}]),
+            encoding="utf-8",
+        )
+        (self.temp_path / "matches.json").write_text("[]", encoding="utf-8")
+        self.backend = self._backend("test_backend.duckdb")
+
+        players = [f"Player {letter}" for letter in "ABCDEFGHIJKLMNO"]
+        self.tabs = {
+            "1st XV Players": _team_sheet([_team_sheet_row("2025-09-13", "Hove (H)", "20-10", players)]),
+            "2nd XV Players": _team_sheet([]),
+            "1st XV Lineouts": [[""], [""], [""], _lineout_row("2025-09-13", "Hove", "C1", "Y")],
+            "2nd XV Lineouts": [],
+            "1st XV Set piece": [[""]] * 4 + [_set_piece_row("2025-09-13", 8, 10)],
+            "2nd XV Set piece": [],
+            "25/26 Scorers": [["", "Squad", "Date", "Opposition", "Score", "Count", "Player", "Points"]],
+        }
+
+    def tearDown(self):
+        self.backend.close()
+        self.temp_dir.cleanup()
+
+    def _backend(self, db_name):
+        backend = BackendDatabase(BackendConfig(db_path=str(self.temp_path / db_name)))
+        # Keep supplemental enrichment away from the repository's reconciliation files.
+        backend.project_root = self.temp_path
+        backend.historic_pitchero_cache_file = self.temp_path / "historic_cache.json"
+        backend.pitchero_cache_file = self.temp_path / "pitchero_stats_cache.json"
+        backend.rfu_matches_file = self.temp_path / "matches.json"
+        return backend
+
+    def _extractor(self):
+        extractor = DataExtractor.__new__(DataExtractor)
+        extractor.client = _FakeClient(self.tabs)
+        extractor.sheet_url = "https://example.invalid/sheet"
+        return extractor
+
+    def _build(self):
+        return self.backend.build(export=False, incremental=True, extractor=self._extractor())
+
+    def test_first_incremental_build_populates_every_table(self):
+        changed = self._build()
+
+        self.assertIn("games", changed)
+        self.assertIn("player_appearances", changed)
+        self.assertEqual(self.backend.query("SELECT COUNT(*) AS n FROM games").iloc[0]["n"], 1)
+        self.assertEqual(self.backend.query("SELECT COUNT(*) AS n FROM player_appearances").iloc[0]["n"], 15)
+
+    def test_unchanged_inputs_rebuild_nothing(self):
+        self._build()
+
+        self.assertEqual(self._build(), set())
+        self.assertEqual(self.backend.query("SELECT COUNT(*) AS n FROM players").iloc[0]["n"], 15)
+
+    def test_lineout_change_only_rebuilds_lineout_dependants(self):
+        self._build()
+        self.tabs["1st XV Lineouts"].append(_lineout_row("2025-09-13", "Hove", "A2", "N"))
+
+        changed = self._build()
+
+        self.assertIn("lineouts", changed)
+        self.assertIn("players", changed)
+        self.assertNotIn("games", changed)
+        self.assertNotIn("player_appearances", changed)
+        self.assertNotIn("squad_stats_enriched", changed)
+        self.assertNotIn("games_rfu", changed)
+        self.assertEqual(self.backend.query("SELECT COUNT(*) AS n FROM lineouts").iloc[0]["n"], 2)
+
+    def test_recomputed_table_with_identical_rows_is_not_rewritten(self):
+        self._build()
+        self.tabs["1st XV Lineouts"].append(_lineout_row("2025-09-13", "Hove", "A2", "N", jumper="Guest Jumper"))
+
+        changed = self._build()
+
+        # players is recomputed for the new lineout but none of its rows change.
+        self.assertEqual(changed, {"lineouts"})
+
+    def test_new_fixture_rebuilds_game_tables(self):
+        self._build()
+        players = [f"Player {letter}" for letter in "ABCDEFGHIJKLMNP"]
+        self.tabs["1st XV Players"].append(_team_sheet_row("2025-09-20", "Crawley", "15-22", players))
+
+        changed = self._build()
+
+        self.assertTrue({"games", "player_appearances", "squad_stats_enriched", "season_summary_enriched"} <= changed)
+        self.assertNotIn("player_appearances_rfu", changed)
+        self.assertEqual(self.backend.query("SELECT COUNT(*) AS n FROM games").iloc[0]["n"], 2)
+        self.assertEqual(self.backend.query("SELECT COUNT(*) AS n FROM players").iloc[0]["n"], 16)
+
+    def _write_enrichment_artifacts(self):
+        # Supplemental enrichment links the fixture to a Pitchero URL and backfills its try scorers.
+        data_dir = self.temp_path / "data"
+        data_dir.mkdir(exist_ok=True)
+        (data_dir / "full_scrape_reconcile_candidates.csv").write_text(
+            "game_id,pitchero_url,candidate_score,score_match,opp_similarity\n"
+            "2025-09-13_1st_Hove,https://example.invalid/1/events,1.0,True,1.0\n",
+            encoding="utf-8",
+        )
+        (data_dir / "full_scrape_pitchero_games.csv").write_text(
+            'pitchero_match_url,tries_scorers\nhttps://example.invalid/1/events,"{""Player B"": 2}"\n',
+            encoding="utf-8",
+        )
+
+    def test_incremental_build_matches_full_build_after_pitchero_input_change(self):
+        self._write_enrichment_artifacts()
+        self.backend.finish_build(self._build(), export=False)
+        (self.temp_path / "pitchero_stats_cache.json").write_text(
+            json.dumps([{"Season": "2025/26", "Squad": "1st", "Player_join": "A Player", "A": 1, "Event": "T", "Count": 2}]),
+            encoding="utf-8",
+        )
+
+        changed = self._build()
+        rebuilt = self.backend.finish_build(changed, export=False)
+
+        # The stored fingerprints describe the enriched rows, so the recomputed
+        # scorer tables match them and nothing is rewritten.
+        self.assertEqual(changed | rebuilt, set())
+        full = self._backend("full_backend.duckdb")
+        try:
+            full.build(export=False, extractor=self._extractor())
+            full.finish_build(export=False)
+            for table in ("games",) + POST_ENRICHMENT_TABLES:
+                with self.subTest(table=table):
+                    pd.testing.assert_frame_equal(
+                        self.backend.query(f"SELECT * FROM {table} ORDER BY ALL"),
+                        full.query(f"SELECT * FROM {table} ORDER BY ALL"),
+                    )
+            self.assertEqual(
+                self.backend.query("SELECT player, tries FROM season_scorers").values.tolist(), [["Player B", 2]]
+            )
+        finally:
+            full.close()
+
+    def test_rfu_summaries_are_only_refreshed_for_changed_seasons(self):
+        matches = [
+            _rfu_match("1", "2024-2025", "2024-09-14", ["A", "B"], ["X", "Y"]),
+            _rfu_match("2", "2025-2026", "2025-09-13", ["A", "B"], ["X", "Y"]),
+            _rfu_match("3", "2025-2026", "2025-09-20", ["A", "C"], ["X", "Y"]),
+        ]
+        self.backend.rfu_matches_file.write_text(json.dumps(matches), encoding="utf-8")
+        self._build()
+        # Stand-in for stale content: rows of untouched seasons must not be rewritten.
+        self.backend.con.execute("UPDATE v_rfu_squad_size SET players = -1 WHERE season = '2024/25'")
+
+        matches.append(_rfu_match("4", "2025-2026", "2025-09-27", ["A", "D"], ["X", "Y"]))
+        self.backend.rfu_matches_file.write_text(json.dumps(matches), encoding="utf-8")
+        changed = self._build()
+
+        self.assertTrue({"games_rfu", "player_appearances_rfu"} <= changed)
+        squad_size = self.backend.query(
+            "SELECT season, players FROM v_rfu_squad_size WHERE team = 'East Grinstead' AND unit = 'Total' ORDER BY season"
+        )
+        self.assertEqual(squad_size.values.tolist(), [["2024/25", -1], ["2025/26", 4]])
+        retention = self.backend.query(
+            """
+            SELECT average_retention, game_pairs FROM v_rfu_average_retention
+            WHERE season = '2025/26' AND team = 'East Grinstead' AND unit = 'Total'
+            """
+        )
+        self.assertEqual(retention.values.tolist(), [[1.0, 2]])
+        self.assertEqual(self.backend.query("SELECT COUNT(*) AS n FROM v_rfu_team_games").iloc[0]["n"], 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from python.backend import MATCH_SHARD_FORMAT, BackendConfig, BackendDatabase, _match_shards
+
+
+class MatchShardTests(unittest.TestCase):
+    def test_shards_bundle_one_game_and_index_groups_games_by_season(self):
+        records = {
+            "games": [
+                {"game_id": "2024-09-07_1st_Hove", "date": "2024-09-07", "season": "2024/25", "squad": "1st", "captain": "Sam Lindsay", "motm": "Jo Bloggs", "tries_scorers": {"Al Smith": 1}},
+                {"game_id": "2025-09-13_1st_Hove", "date": "2025-09-13", "season": "2025/26", "squad": "1st", "captain": None, "motm": None, "tries_scorers": {}},
+            ],
+            "player_appearances": [
+                {"game_id": "2024-09-07_1st_Hove", "player": "Sam Lindsay", "number": 9},
+                {"game_id": "2025-09-13_1st_Hove", "player": "Sam Lindsay", "number": 10},
+            ],
+            "player_profiles_canonical": [
+                {"name": "Sam Lindsay", "short_name": "Sam L", "photo_url": None, "totalAppearances": 2, "squad": "1st"},
+                {"name": "Jo Bloggs", "short_name": "Jo B", "photo_url": "img/jo.png", "totalAppearances": 5, "squad": "1st"},
+                {"name": "Al Smith", "short_name": "Al S", "photo_url": None, "totalAppearances": 1, "squad": "2nd"},
+                {"name": "Not Involved", "short_name": "Not I", "photo_url": None, "totalAppearances": 9, "squad": "1st"},
+            ],
+            "set_piece": [{"game_id": "2024-09-07_1st_Hove", "team": "EGRFC", "lineouts_won": 8, "lineouts_total": 10}],
+            "lineouts": [{"game_id": "2024-09-07_1st_Hove", "numbers": "5", "won": True}],
+        }
+
+        index, shards = _match_shards(records)
+
+        self.assertEqual(index["format"], MATCH_SHARD_FORMAT)
+        self.assertEqual([season["season"] for season in index["seasons"]], ["2025/26", "2024/25"])
+        listed = index["seasons"][1]["games"][0]
+        self.assertEqual((listed["slug"], listed["captain"]), ("2024-09-07-1st-hove", "Sam Lindsay"))
+        self.assertNotIn("tries_scorers", listed)
+
+        shard = shards["2024-09-07-1st-hove"]
+        self.assertEqual(shard["game"], records["games"][0])
+        self.assertEqual(shard["appearances"], [records["player_appearances"][0]])
+        self.assertEqual(shard["set_piece"], records["set_piece"])
+        self.assertEqual(shard["lineouts"], records["lineouts"])
+        # Lineup, leadership and scorers only, trimmed to the fields the page reads.
+        self.assertEqual([profile["name"] for profile in shard["profiles"]], ["Al Smith", "Jo Bloggs", "Sam Lindsay"])
+        self.assertNotIn("squad", shard["profiles"][0])
+        self.assertEqual(shards["2025-09-13-1st-hove"]["set_piece"], [])
+
+    def test_export_writes_a_shard_per_game(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            backend = BackendDatabase(
+                BackendConfig(db_path=str(temp_path / "backend.duckdb"), export_dir=str(temp_path / "export"))
+            )
+            try:
+                backend.reset_schema()
+                backend.create_views()
+                backend.con.execute(
+                    """
+                    INSERT INTO games (game_id, date, season, squad, opposition, home_away, tries_scorers)
+                    VALUES
+                        ('2025-09-13_1st_Hove', '2025-09-13', '2025/26', '1st', 'Hove', 'H', '{"Sam Lindsay": 2}'),
+                        ('2025-09-20_2nd_Heathfield_&_Waldron', '2025-09-20', '2025/26', '2nd', 'Heathfield & Waldron', 'A', NULL)
+                    """
+                )
+                backend.export_tables(names={"games"})
+            finally:
+                backend.close()
+
+            shard_dir = temp_path / "export" / "matches"
+            index = json.loads((shard_dir / "index.json").read_text(encoding="utf-8"))
+            shard = json.loads((shard_dir / "2025-09-13-1st-hove.json").read_text(encoding="utf-8"))
+            shard_names = sorted(path.name for path in shard_dir.iterdir())
+
+        self.assertEqual(shard_names, ["2025-09-13-1st-hove.json", "2025-09-20-2nd-heathfield-waldron.json", "index.json"])
+        self.assertEqual([game["game_id"] for game in index["seasons"][0]["games"]], ["2025-09-20_2nd_Heathfield_&_Waldron", "2025-09-13_1st_Hove"])
+        self.assertEqual(shard["game"]["tries_scorers"], {"Sam Lindsay": 2})
+        self.assertEqual(shard["game"]["date"], "2025-09-13")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+import duckdb
+
+import python.charts as charts
+
+from python.backend import (
+    PLAYER_SHARD_FORMAT,
+    BackendConfig,
+    BackendDatabase,
+    _export_slug,
+    _player_shards,
+    _point_scorer_total_rows,
+)
+from python.static_artifacts import is_published_artifact
+
+
+class PlayerShardTests(unittest.TestCase):
+    def test_shards_join_appearances_to_games_and_index_lists_captains(self):
+        records = {
+            "games": [
+                {"game_id": "g1", "date": "2024-09-07", "season": "2024/25", "squad": "1st", "captain": "Sam Lindsay", "result": "W"},
+                {"game_id": "g2", "date": "2025-09-13", "season": "2025/26", "squad": "1st", "captain": None, "result": "L"},
+            ],
+            "player_appearances": [
+                {"game_id": "g2", "player": "Sam Lindsay", "squad": "1st", "is_captain": False},
+                {"game_id": "g2", "player": "Zoë O'Neill", "squad": "1st", "is_captain": True},
+                {"game_id": "g1", "player": "Sam Lindsay", "squad": "1st", "is_captain": True},
+            ],
+            "player_profiles_canonical": [
+                {"name": "Sam Lindsay", "totalAppearances": 2},
+                {"name": "Zoë O'Neill", "totalAppearances": 1},
+            ],
+            "players": [
+                {"name": "Zoë O'Neill", "total_appearances": 1},
+                {"name": "Sam Lindsay", "total_appearances": 2},
+            ],
+            "season_scorers": [
+                {"squad": "1st", "season": "2024/25", "player": "sam  lindsay", "game_type": None,
+                 "tries": 1, "conversions": 2, "penalties": None, "drop_goals": 0, "points": 9},
+            ],
+        }
+
+        index, shards = _player_shards(records)
+
+        self.assertEqual(_export_slug("Zoë O'Neill", "player"), "zoe-o-neill")
+        self.assertEqual(index["currentSeason"], "2025/26")
+        self.assertEqual(index["captains"]["1st"]["name"], "Zoë O'Neill")
+        self.assertIsNone(index["captains"]["2nd"])
+        self.assertEqual(
+            index["players"],
+            [
+                {"name": "Sam Lindsay", "slug": "sam-lindsay", "totalAppearances": 2},
+                {"name": "Zoë O'Neill", "slug": "zoe-o-neill", "totalAppearances": 1},
+            ],
+        )
+
+        shard = shards["sam-lindsay"]
+        self.assertEqual(shard["format"], PLAYER_SHARD_FORMAT)
+        self.assertEqual(shard["profile"], {"name": "Sam Lindsay", "totalAppearances": 2})
+        self.assertEqual([row["game"]["game_id"] for row in shard["appearances"]], ["g1", "g2"])
+        self.assertEqual(shard["appearances"][0]["game"]["result"], "W")
+        self.assertNotIn("captain", shard["appearances"][0]["game"])
+        # One "Total" row per scoring component, matched the way the page matches names.
+        self.assertEqual([row["component"] for row in shard["scoring"]], ["Tries", "Conversions"])
+        self.assertEqual(shard["scoring"][0]["game_type"], "Unknown")
+        self.assertEqual(shards["zoe-o-neill"]["scoring"], [])
+
+    def test_shard_scoring_rows_match_the_point_scorers_chart_totals(self):
+        con = duckdb.connect()
+        try:
+            con.execute(
+                """
+                CREATE TABLE season_scorers AS SELECT * FROM (VALUES
+                    ('1st', '2024/25', 'Sam Lindsay', 'League', 2, 3, 1, 0, 19),
+                    ('2nd', '2025/26', 'Sam Lindsay', NULL, 0, 0, 0, 1, 3),
+                    ('1st', '2025/26', 'Zoë O''Neill', 'Cup', 1, NULL, 0, 0, 5)
+                ) AS t(squad, season, player, game_type, tries, conversions, penalties, drop_goals, points)
+                """
+            )
+            records = json.loads(con.execute("SELECT * FROM season_scorers").df().to_json(orient="records"))
+            with tempfile.TemporaryDirectory() as temp_dir:
+                output_file = Path(temp_dir) / "point_scorers.json"
+                charts.points_scorers_chart(SimpleNamespace(con=con), output_file=str(output_file))
+                spec = json.loads(output_file.read_text(encoding="utf-8"))
+        finally:
+            con.close()
+
+        chart_rows = [
+            row for rows in spec["datasets"].values() for row in rows if row["score_type"] == "Total"
+        ]
+        key = lambda row: (row["player"], row["season"], row["component_order"])
+        self.assertEqual(sorted(_point_scorer_total_rows(records), key=key), sorted(chart_rows, key=key))
+
+    def test_export_writes_shards_and_removes_stale_ones(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            shard_dir = temp_path / "export" / "players"
+            shard_dir.mkdir(parents=True)
+            (shard_dir / "former-player.json").write_text("{}", encoding="utf-8")
+            backend = BackendDatabase(
+                BackendConfig(db_path=str(temp_path / "backend.duckdb"), export_dir=str(temp_path / "export"))
+            )
+            # Serve the site from the temp directory, so data/manifest.json is written there.
+            backend.project_root = temp_path
+            try:
+                backend.reset_schema()
+                backend.create_views()
+                backend.con.execute(
+                    """
+                    INSERT INTO games (game_id, date, season, squad, opposition, home_away, result)
+                    VALUES ('2025-09-13_1st_Hove', '2025-09-13', '2025/26', '1st', 'Hove', 'H', 'W')
+                    """
+                )
+                backend.con.execute(
+                    """
+                    INSERT INTO player_appearances (game_id, date, season, squad, player, number, is_captain)
+                    VALUES ('2025-09-13_1st_Hove', '2025-09-13', '2025/26', '1st', 'Sam Lindsay', 9, TRUE)
+                    """
+                )
+                backend.con.execute("INSERT INTO players (name, total_appearances) VALUES ('Sam Lindsay', 1)")
+                # Only the players table changed, but shards still read the other sources.
+                backend.export_tables(names={"players"})
+            finally:
+                backend.close()
+
+            index = json.loads((shard_dir / "index.json").read_text(encoding="utf-8"))
+            shard = json.loads((shard_dir / "sam-lindsay.json").read_text(encoding="utf-8"))
+            manifest = json.loads((temp_path / "data" / "manifest.json").read_text(encoding="utf-8"))["files"]
+            remaining = sorted(path.name for path in shard_dir.iterdir() if not is_published_artifact(path))
+
+        self.assertEqual(remaining, ["index.json", "sam-lindsay.json"])
+        self.assertEqual(index["players"], [{"name": "Sam Lindsay", "slug": "sam-lindsay", "totalAppearances": 1}])
+        self.assertIsNone(shard["profile"])
+        self.assertEqual(shard["appearances"][0]["number"], 9)
+        self.assertEqual(shard["appearances"][0]["game"]["date"], "2025-09-13")
+        # The export refreshes the manifest entries for everything it wrote.
+        self.assertIn("export/players/sam-lindsay.json", manifest)
+        self.assertIn("export/players.json", manifest)
+        self.assertNotIn("export/players/former-player.json", manifest)
+
+
+if __name__ == "__main__":
+    unittest.main()
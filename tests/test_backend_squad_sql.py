@@ -0,0 +1,132 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from python.backend import BackendConfig, BackendDatabase
+
+
+def _appearance(game_id, player, number, squad="1st", unit=None, game_type=None, is_starter=True, season="2025/26"):
+    if unit is None:
+        unit = "Forwards" if number <= 8 else "Backs"
+    return (squad, game_id[:10], player, number, None, unit, False, False, game_id, season, game_type, is_starter)
+
+
+class SquadAggregateSqlTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.backend = BackendDatabase(BackendConfig(db_path=str(Path(self.temp_dir.name) / "test_backend.duckdb")))
+        self.backend.reset_schema()
+        con = self.backend.con
+        con.executemany(
+            "INSERT INTO games (game_id, date, season, squad, game_type, opposition) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                ["2025-09-13_1st_Hove", "2025-09-13", "2025/26", "1st", "League", "Hove"],
+                ["2025-09-20_1st_Crawley", "2025-09-20", "2025/26", "1st", "Friendly", "Crawley"],
+                ["2025-09-13_2nd_Hove", "2025-09-13", "2025/26", "2nd", "League", "Hove II"],
+            ],
+        )
+        con.executemany(
+            """
+            INSERT INTO player_appearances
+                (squad, date, player, number, position, unit, is_captain, is_vice_captain, game_id, season, game_type, is_starter)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                _appearance("2025-09-13_1st_Hove", "Sam Lindsay", 1),
+                _appearance("2025-09-13_1st_Hove", 'Freddie "Kiwi" Mitchell', 10),
+                _appearance("2025-09-20_1st_Crawley", "Sam Lindsay", 3),
+                _appearance("2025-09-20_1st_Crawley", " Jack Smith ", 16, unit="Forwards", is_starter=False),
+                # Row-level game type wins over the games table.
+                _appearance("2025-09-13_2nd_Hove", "Jack Smith", 15, squad="2nd", game_type="Cup"),
+            ],
+        )
+
+    def tearDown(self):
+        self.backend.close()
+        self.temp_dir.cleanup()
+
+    def _rows(self, sql, key_columns):
+        df = self.backend.con.execute(sql).df()
+        return {tuple(row[column] for column in key_columns): row for _, row in df.iterrows()}
+
+    def test_squad_stats_counts_players_per_unit_and_mode(self):
+        rows = self._rows(self.backend._build_squad_stats_sql(), ["gameTypeMode", "squad", "unit"])
+
+        self.assertEqual(len(rows), 24)
+        first_total = rows[("All", "1st", "Total")]
+        self.assertEqual(
+            json.loads(first_total["playerCounts"]),
+            {'Freddie "Kiwi" Mitchell': 1, "Jack Smith": 1, "Sam Lindsay": 2},
+        )
+        self.assertEqual(first_total["playersUsed"], 3)
+        self.assertEqual(json.loads(rows[("League only", "1st", "Forwards")]["playerCounts"]), {"Sam Lindsay": 1})
+        self.assertNotIn(("League only", "2nd", "Total"), rows)
+        # Units with nobody in them still get a row.
+        self.assertEqual(rows[("League + Cup", "2nd", "Forwards")]["playerCounts"], "{}")
+        self.assertEqual(rows[("League + Cup", "2nd", "Forwards")]["playersUsed"], 0)
+        self.assertEqual(json.loads(rows[("All", "Total", "Backs")]["playerCounts"]), {'Freddie "Kiwi" Mitchell': 1, "Jack Smith": 1})
+
+    def test_position_profiles_only_count_starters(self):
+        rows = self._rows(self.backend._build_squad_position_profiles_sql(), ["gameTypeMode", "squad", "position"])
+
+        self.assertEqual(json.loads(rows[("All", "1st", "Prop")]["playerCounts"]), {"Sam Lindsay": 2})
+        self.assertEqual(rows[("League only", "1st", "Prop")]["playersUsed"], 1)
+        self.assertIn(("League + Cup", "2nd", "Full Back"), rows)
+        self.assertNotIn(("League only", "2nd", "Full Back"), rows)
+        self.assertFalse(any(position == "Bench" for _, _, position in rows))
+
+    def test_thresholds_use_season_wide_games_for_combined_squad(self):
+        rows = self._rows(
+            self.backend._build_squad_stats_with_thresholds_sql(),
+            ["gameTypeMode", "squad", "unit", "minimumAppearances"],
+        )
+
+        self.assertEqual(len(rows), 24 * 21)
+        self.assertEqual(rows[("All", "1st", "Total", 0)]["playerCount"], 3)
+        self.assertEqual(rows[("All", "1st", "Total", 2)]["playerCount"], 1)
+        self.assertEqual(rows[("All", "1st", "Backs", 0)]["totalPlayed"], 1)
+        self.assertEqual(rows[("All", "Total", "Backs", 0)]["totalPlayed"], 3)
+        self.assertEqual(rows[("All", "Total", "Total", 20)]["playerCount"], 0)
+
+    def test_continuity_compares_each_game_with_the_preceding_window(self):
+        con = self.backend.con
+        con.execute(
+            "INSERT INTO games (game_id, date, season, squad, game_type, opposition) "
+            "VALUES ('2025-09-27_1st_Uckfield', '2025-09-27', '2025/26', '1st', 'League', 'Uckfield')"
+        )
+        con.executemany(
+            """
+            INSERT INTO player_appearances
+                (squad, date, player, number, position, unit, is_captain, is_vice_captain, game_id, season, game_type, is_starter)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                _appearance("2025-09-27_1st_Uckfield", "Sam Lindsay", 1),
+                _appearance("2025-09-27_1st_Uckfield", 'Freddie "Kiwi" Mitchell', 10),
+            ],
+        )
+
+        def retained(window):
+            df = self.backend._build_squad_continuity(window=window)
+            return {
+                (row["gameTypeMode"], row["squad"], row["unit"]): (row["retained"], row["gamePairs"])
+                for _, row in df.iterrows()
+            }
+
+        match_to_match = retained(1)
+        # Crawley keeps Sam (1 of 2), Uckfield keeps Sam again (1 of 1 from Crawley).
+        self.assertEqual(match_to_match[("All", "1st", "Total")], (1.0, 2))
+        self.assertEqual(match_to_match[("All", "1st", "Backs")], (0.0, 2))
+        self.assertEqual(match_to_match[("League only", "1st", "Total")], (2.0, 1))
+        self.assertNotIn(("All", "2nd", "Total"), match_to_match)
+
+        # Over two games Uckfield's Freddie is also found in the Hove line-up.
+        self.assertEqual(retained(2)[("All", "1st", "Total")], (2.0, 1))
+        self.assertEqual(self.backend.config.continuity_window, 1)
+        with self.assertRaises(ValueError):
+            self.backend._build_squad_continuity(window=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from python.benchmark_build import find_regressions, scale_rows
+
+
+def _run(scale, wall_seconds, stages):
+    return {
+        "scale": scale,
+        "wall_seconds": wall_seconds,
+        "stages": {name: {"seconds": seconds} for name, seconds in stages.items()},
+    }
+
+
+class BenchmarkBuildTests(unittest.TestCase):
+    def test_scaled_copies_shift_dates_seasons_and_ids_back_by_the_span(self):
+        header = ["", "Date", "Season", "Opposition"]
+        game = {"game_id": "2024-02-29_1st_Hove", "date": "2024-02-29", "season": "2023/24", "pf": 20}
+        sheet_row = ["", "07/09/2024", "2024/25", "Hove"]
+        rfu_match = {"match_id": "861249", "season": "2019-2020", "date": "2020-03-07"}
+
+        self.assertEqual(scale_rows([header, sheet_row], 3, 10)[1:], [sheet_row, ["", "07/09/2014", "2014/15", "Hove"], ["", "07/09/2004", "2004/05", "Hove"]])
+        # The header carries no date, so it is not copied.
+        self.assertEqual(scale_rows([header, sheet_row], 3, 10).count(header), 1)
+        self.assertEqual(
+            scale_rows([game], 2, 10)[1],
+            {"game_id": "2014-02-28_1st_Hove", "date": "2014-02-28", "season": "2013/14", "pf": 20},
+        )
+        self.assertEqual(
+            scale_rows([rfu_match], 2, 12)[1],
+            {"match_id": "861249-1", "season": "2007-2008", "date": "2008-03-07"},
+        )
+
+    def test_regressions_compare_against_the_latest_run_at_the_same_scale(self):
+        previous = [
+            _run(1, 10.0, {"_build_games": 1.0, "export_tables": 2.0}),
+            _run(10, 50.0, {"_build_games": 5.0}),
+            _run(1, 10.0, {"_build_games": 0.5, "export_tables": 2.0}),
+        ]
+
+        regressions = find_regressions(_run(1, 10.5, {"_build_games": 1.2, "export_tables": 2.05}), previous, 1.5)
+
+        self.assertEqual(regressions, ["x1 _build_games: 0.50s -> 1.20s"])
+        self.assertEqual(find_regressions(_run(100, 999.0, {}), previous, 1.5), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import json
+import unittest
+
+import pandas as pd
+
+from python.backend import (
+    BackendDatabase,
+    _canonical_game_id,
+    _canonical_game_ids,
+    _non_empty_jsonish,
+    _score_pair_keys,
+)
+
+SCORER_COLUMNS = ["tries_scorers", "conversions_scorers", "penalties_scorers", "drop_goals_scorers"]
+
+
+def _game(game_id, date, squad, opposition, pf, pa, source, url=None, tries=None, season="2023/24"):
+    return {
+        "game_id": game_id,
+        "date": date,
+        "season": season,
+        "squad": squad,
+        "competition": "League",
+        "game_type": "League",
+        "opposition": opposition,
+        "home_away": "H",
+        "pf": pf,
+        "pa": pa,
+        "result": None if pf is None else ("W" if pf > pa else "L"),
+        "captain": None,
+        "motm": None,
+        "vc1": None,
+        "vc2": None,
+        "tries_scorers": json.dumps(tries) if tries is not None else None,
+        "conversions_scorers": "{}",
+        "penalties_scorers": None,
+        "drop_goals_scorers": "null",
+        "pitchero_match_url": url,
+        "_source": source,
+    }
+
+
+def _games_raw():
+    return pd.DataFrame(
+        [
+            _game("g1", "2023-09-09", "1st", "Haywards Heath II", 20, 10, "google"),
+            # Pitchero alias of g1 with the score reversed and richer metadata.
+            _game("p1", "2023-09-09", "1st", "Haywards Heath", 10, 20, "pitchero", url="https://x/1/events", tries={"J Smith": 2}),
+            _game("g2", "2023-09-16", "1st", "Crawley", None, None, "google"),
+            _game("p2", "2023-09-16", "2nd", "Crawley 2nd XV", None, None, "pitchero"),
+            _game("p3", "2018-10-06", "1st", "Hove", 33, 7, "pitchero", url="https://x/3/events", tries={"S Lindsay": 1}, season="2018/19"),
+            _game("p4", "2018-10-06", "1st", "Hove RFC", 33, 7, "pitchero", season="2018/19"),
+            _game("g5", "2023-09-23", "2nd", "Uckfield", 5, 12, "google", tries={}),
+        ]
+    )
+
+
+class BuildGamesVectorisedTests(unittest.TestCase):
+    def setUp(self):
+        self.raw = _games_raw()
+
+    def test_vectorised_keys_match_row_wise_reference(self):
+        df = self.raw.copy()
+        df["pf"] = pd.to_numeric(df["pf"], errors="coerce").astype("Int64")
+        df["pa"] = pd.to_numeric(df["pa"], errors="coerce").astype("Int64")
+
+        expected_ids = df.apply(
+            lambda row: _canonical_game_id(row.get("date"), row.get("squad"), row.get("opposition")),
+            axis=1,
+        )
+        expected_scorers = df[SCORER_COLUMNS].fillna("{}").astype(str).apply(
+            lambda row: any(value.strip() not in {"", "{}", "null", "None"} for value in row),
+            axis=1,
+        )
+        expected_score_keys = df.apply(
+            lambda row: (
+                f"{min(int(row['pf']), int(row['pa']))}:{max(int(row['pf']), int(row['pa']))}"
+                if pd.notna(row.get("pf")) and pd.notna(row.get("pa"))
+                else ""
+            ),
+            axis=1,
+        )
+
+        self.assertEqual(_canonical_game_ids(df).tolist(), expected_ids.tolist())
+        self.assertEqual(_non_empty_jsonish(df[SCORER_COLUMNS]).any(axis=1).tolist(), expected_scorers.tolist())
+        self.assertEqual(_score_pair_keys(df["pf"], df["pa"]).tolist(), expected_score_keys.tolist())
+        self.assertEqual(
+            _score_pair_keys(df["pf"], df["pa"]).tolist(),
+            ["10:20", "10:20", "", "", "7:33", "7:33", "5:12"],
+        )
+
+    def test_build_games_dedupes_and_backfills_from_pitchero(self):
+        appearances = pd.DataFrame(
+            [
+                {"game_id": "2023-09-09_1st_Haywards_Heath", "player": "Jack Smith"},
+                {"game_id": "2018-10-06_1st_Hove", "player": "Sam Lindsay"},
+            ]
+        )
+        backend = BackendDatabase.__new__(BackendDatabase)
+
+        games = backend._build_games(self.raw, appearances).sort_values(["date", "squad"]).reset_index(drop=True)
+
+        self.assertEqual(
+            games["game_id"].tolist(),
+            [
+                "2018-10-06_1st_Hove",
+                "2023-09-09_1st_Haywards_Heath",
+                "2023-09-16_1st_Crawley",
+                "2023-09-23_2nd_Uckfield",
+            ],
+        )
+        haywards = games.iloc[1]
+        self.assertEqual(haywards["opposition"], "Haywards Heath II")
+        self.assertEqual(haywards["pitchero_match_url"], "https://x/1/events")
+        # Backfilled scorer names are resolved against the game's appearances.
+        self.assertEqual(json.loads(haywards["tries_scorers"]), {"Jack Smith": 2})
+        self.assertEqual(games.iloc[0]["pitchero_match_url"], "https://x/3/events")
+        self.assertEqual(backend._game_id_alias_map.get("p1"), "2023-09-09_1st_Haywards_Heath")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+import pandas as pd
+
+from python.backend import _canonical_player_name_for_season, _split_opposition_club_team
+from python.canonical_names import clear_name_caches, map_unique, memoize_name
+from python.data import clean_name
+
+
+class CanonicalNameTests(unittest.TestCase):
+    def test_map_unique_matches_series_map_and_calls_once_per_value(self):
+        calls = []
+
+        def shout(value):
+            calls.append(value)
+            return value.upper() if isinstance(value, str) else value
+
+        series = pd.Series(["ab", "cd", None, "ab", "cd", None], index=[5, 4, 3, 2, 1, 0], name="player")
+
+        mapped = map_unique(series, shout)
+
+        pd.testing.assert_series_equal(mapped, series.map(lambda value: value.upper() if isinstance(value, str) else value))
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(map_unique(pd.Series(["Hove II", "Hove II"]), _split_opposition_club_team).tolist(), [("Hove", 2), ("Hove", 2)])
+
+    def test_memoized_names_cache_strings_and_bypass_missing_values(self):
+        calls = []
+
+        @memoize_name
+        def canonical(name, season=None):
+            calls.append(name)
+            return f"{name}!"
+
+        self.assertEqual([canonical("Al"), canonical("Al"), canonical("Al", "2024/25")], ["Al!", "Al!", "Al!"])
+        self.assertEqual(len(calls), 2)
+        # NaN never equals itself, so it is not cached.
+        canonical(float("nan"))
+        canonical(float("nan"))
+        self.assertEqual(len(calls), 4)
+
+        clear_name_caches()
+        canonical("Al")
+        self.assertEqual(len(calls), 5)
+
+    def test_shared_canonicalisers_keep_their_results(self):
+        self.assertEqual(clean_name("Sam Lindsay"), "S Lindsay 2")
+        self.assertEqual(clean_name("james o'neill"), "J O'Neill")
+        self.assertEqual(_canonical_player_name_for_season("S Lindsay", "2019/20"), "Sam Lindsay")
+        self.assertEqual(_canonical_player_name_for_season("S Lindsay", "2022/23"), "Sam Lindsay-McCall")
+        self.assertTrue(pd.isna(_canonical_player_name_for_season(float("nan"), None)))
+
+
+if __name__ == "__main__":
+    unittest.main()
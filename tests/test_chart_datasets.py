@@ -0,0 +1,109 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from python.chart_datasets import externalize_chart_specs, split_player_chart_rows
+
+SCHEMA = "https://vega.github.io/schema/vega-lite/v5.20.1.json"
+
+
+def _spec(datasets, **extra):
+    return {"$schema": SCHEMA, "data": {"name": next(iter(datasets))}, "mark": "bar", "datasets": datasets, **extra}
+
+
+class ChartDatasetTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.charts_dir = Path(self.temp_dir.name) / "charts"
+        self.charts_dir.mkdir()
+        self.rows = [{"player": f"Player {index}", "appearances": index} for index in range(100)]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, name, payload):
+        path = self.charts_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        return path
+
+    def _read(self, path):
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def _resolve(self, spec):
+        # Mirrors resolveChartSpecDatasets in js/shared.js.
+        external = spec["usermeta"].pop("externalDatasets")
+        for name, url in external.items():
+            spec.setdefault("datasets", {})[name] = json.loads(
+                (self.charts_dir / "datasets" / url.rsplit("/", 1)[-1]).read_text(encoding="utf-8")
+            )
+        if not spec["usermeta"]:
+            del spec["usermeta"]
+        return spec
+
+    def test_shared_datasets_are_written_once_and_resolve_to_the_original(self):
+        first = _spec({"data-a": self.rows, "data-tiny": [{"x": 1}]}, usermeta={"embedOptions": {"actions": False}})
+        second = _spec({"data-a": self.rows})
+        first_path = self._write("first.json", first)
+        second_path = self._write("league_results/second.json", second)
+        self._write("index.json", {"2025-2026": {"1": "second.json"}})
+
+        summary = externalize_chart_specs(self.charts_dir, url_prefix="data/charts/datasets")
+
+        self.assertEqual(summary.specs_rewritten, 2)
+        self.assertEqual(summary.datasets_written, 1)
+        self.assertLess(summary.bytes_after, summary.bytes_before)
+        self.assertEqual(len(list((self.charts_dir / "datasets").glob("*.json"))), 1)
+
+        rewritten = self._read(first_path)
+        self.assertEqual(rewritten["datasets"], {"data-tiny": [{"x": 1}]})
+        self.assertTrue(rewritten["usermeta"]["externalDatasets"]["data-a"].startswith("data/charts/datasets/"))
+        self.assertEqual(self._resolve(rewritten), first)
+        self.assertEqual(self._resolve(self._read(second_path)), second)
+
+    def test_rerun_is_a_no_op_and_orphaned_datasets_are_pruned(self):
+        path = self._write("chart.json", _spec({"data-a": self.rows}))
+        externalize_chart_specs(self.charts_dir)
+
+        self.assertEqual(externalize_chart_specs(self.charts_dir).specs_rewritten, 0)
+
+        self._write("chart.json", _spec({"data-b": self.rows[:50]}))
+        summary = externalize_chart_specs(self.charts_dir)
+
+        self.assertEqual((summary.datasets_written, summary.datasets_pruned), (1, 1))
+        (dataset,) = (self.charts_dir / "datasets").glob("*.json")
+        self.assertEqual(json.loads(dataset.read_text(encoding="utf-8")), self.rows[:50])
+        self.assertIn(dataset.name, self._read(path)["usermeta"]["externalDatasets"]["data-b"])
+
+    def test_player_chart_rows_follow_the_externalized_spec(self):
+        self._write("profile.json", _spec({"data-a": self.rows + [{"season": "2024/25"}]}))
+        index = self.charts_dir.parent / "index.json"
+        index.write_text(
+            json.dumps({"players": [{"name": "Player 3", "slug": "player-3"}, {"name": "Nobody", "slug": "nobody"}]}),
+            encoding="utf-8",
+        )
+        (self.charts_dir / "players").mkdir()
+        (self.charts_dir / "players" / "former.json").write_text("{}", encoding="utf-8")
+
+        # Inline specs are left to the page's full-dataset fallback.
+        self.assertEqual(split_player_chart_rows(self.charts_dir, index, specs=("profile.json",)).files_written, 2)
+        self.assertEqual(self._read(self.charts_dir / "players" / "player-3.json")["specs"], {})
+
+        externalize_chart_specs(self.charts_dir)
+        summary = split_player_chart_rows(self.charts_dir, index, specs=("profile.json",))
+        spec = self._read(self.charts_dir / "profile.json")
+        entry = self._read(self.charts_dir / "players" / "player-3.json")["specs"]["profile.json"]
+
+        self.assertEqual((summary.players, summary.files_written), (2, 2))
+        self.assertEqual(entry["externalDatasets"], spec["usermeta"]["externalDatasets"])
+        self.assertEqual(entry["datasets"], {"data-a": [{"player": "Player 3", "appearances": 3}]})
+        self.assertEqual(
+            self._read(self.charts_dir / "players" / "nobody.json")["specs"]["profile.json"]["datasets"], {"data-a": []}
+        )
+        self.assertEqual(sorted(path.name for path in (self.charts_dir / "players").iterdir()), ["nobody.json", "player-3.json"])
+        self.assertEqual(split_player_chart_rows(self.charts_dir, index, specs=("profile.json",)).files_written, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import duckdb
+
+from python.chart_jobs import CHART_JOBS, ChartJob, jobs_for_tables, report_chart_results, run_chart_jobs
+
+
+def _count_games(db, output_file):
+    (count,) = db.con.execute("SELECT COUNT(*) FROM games").fetchone()
+    Path(output_file).write_text(str(count), encoding="utf-8")
+
+
+def _write_to_backend(db):
+    db.con.execute("INSERT INTO games VALUES ('g3')")
+
+
+class ChartJobTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.db_path = str(self.temp_path / "backend.duckdb")
+        con = duckdb.connect(self.db_path)
+        con.execute("CREATE TABLE games (game_id TEXT)")
+        con.execute("INSERT INTO games VALUES ('g1'), ('g2')")
+        con.close()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _job(self, name, builder=_count_games):
+        kwargs = {"output_file": str(self.temp_path / f"{name}.txt")} if builder is _count_games else {}
+        return ChartJob(name, builder, ("games",), kwargs)
+
+    def test_registered_jobs_have_unique_names_and_declared_tables(self):
+        names = [job.name for job in CHART_JOBS]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertTrue(all(job.tables for job in CHART_JOBS))
+
+        selected = {job.name for job in jobs_for_tables({"lineouts"})}
+        self.assertIn("lineout_analysis", selected)
+        self.assertNotIn("results", selected)
+        self.assertEqual({job.name for job in jobs_for_tables({"games_rfu"})}, {"league_results"})
+
+    def test_jobs_run_in_worker_processes_and_report_in_job_order(self):
+        jobs = [self._job(f"chart_{index}") for index in range(3)]
+
+        results = run_chart_jobs(self.db_path, jobs, max_workers=2)
+
+        self.assertEqual([result.name for result in results], ["chart_0", "chart_1", "chart_2"])
+        self.assertTrue(all(result.ok for result in results))
+        for index in range(3):
+            self.assertEqual((self.temp_path / f"chart_{index}.txt").read_text(encoding="utf-8"), "2")
+
+    def test_failed_job_does_not_stop_the_others(self):
+        jobs = [self._job("writer", builder=_write_to_backend), self._job("reader")]
+
+        results = run_chart_jobs(self.db_path, jobs, max_workers=1)
+
+        # Workers only hold read-only connections.
+        self.assertFalse(results[0].ok)
+        self.assertIn("read-only", results[0].error)
+        self.assertTrue(results[1].ok)
+        with self.assertRaises(RuntimeError):
+            report_chart_results(results)
+
+
+if __name__ == "__main__":
+    unittest.main()
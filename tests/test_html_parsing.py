@@ -0,0 +1,264 @@
+import json
+import tempfile
+import unittest
+from contextlib import contextmanager
+from importlib.util import find_spec
+from pathlib import Path
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+import python.html_parsing as html_parsing
+import python.league_data as league_data
+from python.data import DataExtractor
+from python.html_parsing import ParsedPage, extract_next_data, make_soup
+
+
+def _page_with_next_data(payload, body=""):
+    return (
+        "<html><head>"
+        f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(payload)}</script>'
+        f"</head><body>{body}</body></html>"
+    )
+
+
+LINEUP_PAYLOAD = {
+    "props": {
+        "initialReduxState": {
+            "teams": {
+                "matchCentre": {
+                    "pageData": {
+                        "1": {
+                            "overview": {"date": "2019-09-14"},
+                            "lineup": {
+                                "players": [
+                                    {"number": 2, "name": "Player B", "captain": True},
+                                    {"number": 1, "name": "Player A"},
+                                ],
+                                "substitutes": [{"number": 16, "name": "Player P"}],
+                            },
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+
+class HtmlParsingTests(unittest.TestCase):
+    def test_next_data_fast_path_matches_soup_lookup(self):
+        html = _page_with_next_data(LINEUP_PAYLOAD, body="<p>R&amp;D</p>")
+        soup_payload = json.loads(
+            BeautifulSoup(html, "html.parser").find("script", id="__NEXT_DATA__").get_text(strip=True)
+        )
+
+        self.assertEqual(extract_next_data(html), soup_payload)
+        self.assertIsNone(extract_next_data("<html><body>No payload</body></html>"))
+
+    def test_lineup_from_next_data_never_builds_a_soup(self):
+        extractor = DataExtractor.__new__(DataExtractor)
+        html = _page_with_next_data(LINEUP_PAYLOAD)
+        page = ParsedPage(html)
+
+        lineup = extractor._parse_pitchero_lineup(page)
+
+        self.assertEqual(lineup, extractor._parse_pitchero_lineup(BeautifulSoup(html, "html.parser")))
+        self.assertEqual([player["number"] for player in lineup], [1, 2, 16])
+        self.assertIsNone(page._soup)
+        self.assertEqual(extractor._extract_pitchero_match_date(page).strftime("%Y-%m-%d"), "2019-09-14")
+
+    def test_parsed_page_delegates_dom_access_to_soup(self):
+        html = (
+            '<div class="c085-lineup-table-player-number">15</div>'
+            '<div class="c085-lineup-table-player-name-text">Player O</div>'
+        )
+        page = ParsedPage(html.encode("utf-8"))
+
+        self.assertIsNone(page.next_data)
+        self.assertEqual(
+            [node.get_text() for node in page.find_all(class_="c085-lineup-table-player-name-text")],
+            [node.get_text() for node in make_soup(html).find_all(class_="c085-lineup-table-player-name-text")],
+        )
+        self.assertIsNotNone(page._soup)
+
+
+PITCHERO_FIXTURES_URL = "https://www.egrfc.com/teams/142068/fixtures-results?season=68499"
+
+# Markup in the shape of the live pages, with the sloppiness they have in the
+# wild: unclosed <li>/<p>, unquoted attributes, entities, stray closing tags
+# and whitespace inside names.
+PITCHERO_FIXTURES_PAGE = """<!DOCTYPE html><html><head><title>Fixtures &amp; Results</title></head><body>
+<ul class=fixtures>
+<li><div class="fixture-overview"><a href="/teams/142068/match-centre/1-100">
+  <time datetime="2019-09-14">Sat 14 Sep</time>
+  <span class="fixture-overview__teamname">East&nbsp;Grinstead</span>
+  <span class="fixture-overview__teamname"> Hove </span>
+  <span class="statusbox__scores">20 - 10</span></a>
+  <div class="fixture-competition">Sussex 1</div></div>
+<li><div class="fixture-overview"><a href="/teams/142068/match-centre/1-102">
+  <time datetime="2019-09-21"></time>
+  <span class="fixture-overview__teamname">Crawley</span>
+  <span class="fixture-overview__teamname">East Grinstead</span>
+  <span class="statusbox__scores">22 - 15</span></a></div></span>
+</ul>
+</body></html>"""
+
+
+def _pitchero_dom_lineup(names, captain):
+    rows = "".join(
+        f'<div class=row><div class="sc-EHOje eNiGwT">{number}</div>'
+        f'<div class="sc-bwzfXH iamjnI"> {name}'
+        + (' <img alt=C src="/captain.svg">' if name == captain else "")
+        + "</div></div>"
+        for number, name in enumerate(names, start=1)
+    )
+    return f"<html><body><p>Team sheet<div class=lineup>{rows}</div></p></body></html>"
+
+
+def _rfu_match_page(lineups):
+    numbers_and_names = "".join(
+        f'<tr><td><div class="c085-lineup-table-player-number">{number}</div>'
+        f'<td><div class="c085-lineup-table-player-name-text">  {name}\n</div>'
+        for lineup in lineups
+        for number, name in lineup
+    )
+    return f"""<!DOCTYPE html><html><body>
+<div class=c042-header>
+  <span class="c042-team-name">East Grinstead</span><img class="c042-team-logo" src="/eg.png">
+  <div class="c042-match-score"> 24 - 17 </div>
+  <span class="c042-team-name">Hove &amp; District</span><img class="c042-team-logo" src="/hove.png">
+</div>
+<p id="c042-event-date">Saturday 13 September 2025
+<p id="c042-event-champion">Counties 2 Sussex</p>
+<table class=lineups><tbody>{numbers_and_names}</tbody></table>
+</body></html>"""
+
+
+def _rfu_results_page():
+    cards = "".join(
+        f'<div class="dataContainer cardContainer_{date}">'
+        f'<a href="/fixtures-and-results/match-centre-community?matchId={match_id}">Match centre</a>'
+        f'<div class="coh-style-hometeam"><a href="#">{home}</a></div>'
+        f'<div class="coh-style-away-team"><a href="#"> {away} </a></div>'
+        f'<div class="fnr-scores"><a class="coh-style-numeric-score">{home_score}</a>'
+        f'<a class="coh-style-numeric-right">{away_score}</a></div>'
+        "</div>"
+        for match_id, date, home, away, home_score, away_score in [
+            ("501", "Saturday,13Sep2025", "East Grinstead II", "Hove II", "12", "7"),
+            ("502", "Saturday,20Sep2025", "Crawley II", "East Grinstead II", "HWO", ""),
+            ("503", "Saturday,27Sep2025", "East Grinstead II", "Uckfield II", "", ""),
+        ]
+    )
+    return f"<html><body><section class=results>{cards}</section></div></body></html>"
+
+
+class _FakeResponse:
+    def __init__(self, text):
+        self.content = text.encode("utf-8")
+
+    def raise_for_status(self):
+        return None
+
+
+class _FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url, timeout=None):
+        return _FakeResponse(self.pages.get(url, "<html></html>"))
+
+    def close(self):
+        return None
+
+
+@contextmanager
+def _html_parser(parser):
+    previous = html_parsing.HTML_PARSER
+    html_parsing.HTML_PARSER = parser
+    try:
+        yield
+    finally:
+        html_parsing.HTML_PARSER = previous
+
+
+@unittest.skipUnless(find_spec("lxml"), "lxml is not installed")
+class HtmlParserParityTests(unittest.TestCase):
+    """lxml is used whenever it is installed, so it must scrape exactly what html.parser does."""
+
+    def _scrape_with_each_parser(self, scrape):
+        with _html_parser("html.parser"):
+            expected = scrape()
+        with _html_parser("lxml"):
+            actual = scrape()
+        return expected, actual
+
+    def test_pitchero_scraper_records_match(self):
+        pages = {
+            PITCHERO_FIXTURES_URL: PITCHERO_FIXTURES_PAGE,
+            "https://www.egrfc.com/teams/142068/match-centre/1-100/lineup": _pitchero_dom_lineup(
+                ["Player A", "Player B", "Player C"], "Player B"
+            ),
+            "https://www.egrfc.com/teams/142068/match-centre/1-102/lineup": _pitchero_dom_lineup(
+                ["Player C", "Player A"], None
+            ),
+        }
+
+        def scrape():
+            extractor = DataExtractor.__new__(DataExtractor)
+            return extractor.extract_pitchero_historic_team_sheets(
+                seasons=["2019/20"], squads=(1,), max_workers=1, requests_per_second=1000, session=_FakeSession(pages)
+            )
+
+        (expected_games, expected_apps), (games, apps) = self._scrape_with_each_parser(scrape)
+
+        self.assertEqual(len(expected_games), 2)
+        self.assertEqual(expected_games["captain"].iloc[0], "Player B")
+        self.assertEqual(expected_apps["player"].tolist()[:3], ["Player A", "Player B", "Player C"])
+        pd.testing.assert_frame_equal(games, expected_games)
+        pd.testing.assert_frame_equal(apps, expected_apps)
+
+    def test_rfu_scraper_records_match(self):
+        home = [(str(number), f"Home Player {number}") for number in range(1, 16)] + [("S1", "Home Sub")]
+        away = [(str(number), f"Away  Player {number}") for number in range(1, 16)]
+        results_url = f"{league_data.get_url(squad=2, season='2025/26')}#results"
+        pages = {
+            league_data._match_centre_url("401"): _rfu_match_page([home, away]),
+            results_url: _rfu_results_page(),
+        }
+        original_cached_get = league_data._cached_get
+        original_data_dir = league_data._DATA_DIR
+        original_cache = (league_data._response_cache, league_data._response_cache_replay)
+        # fetch_match_data saves data/match_data/<id>.json and pins the URL in the
+        # response cache, so keep both out of the repo's data directory.
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir)
+            (data_dir / "match_data").mkdir()
+            league_data._cached_get = lambda url, request_headers, timeout, ttl=None: _FakeResponse(pages[url])
+            league_data._DATA_DIR = data_dir
+            league_data._response_cache = None
+            league_data.configure_response_cache(data_dir / "http_cache.sqlite")
+            try:
+                expected, actual = self._scrape_with_each_parser(
+                    lambda: (
+                        league_data.fetch_match_data("401"),
+                        league_data.fetch_matches_from_results_page(squad=2, season="2025/26"),
+                        sorted(league_data.fetch_match_ids(squad=2, season="2025/26")),
+                    )
+                )
+            finally:
+                league_data.configure_response_cache(None)
+                league_data._cached_get = original_cached_get
+                league_data._DATA_DIR = original_data_dir
+                league_data._response_cache, league_data._response_cache_replay = original_cache
+
+        match, results, match_ids = expected
+        self.assertEqual(match["players"][0]["S1"], "Home Sub")
+        self.assertEqual(match["players"][1]["15"], "Away Player 15")
+        self.assertEqual([row["score"] for row in results], [[12, 7], ["WO", ""], [None, None]])
+        self.assertEqual(match_ids, ["501", "502", "503"])
+        self.assertEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
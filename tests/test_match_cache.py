@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import python.league_data as league_data
+from python.match_cache import MatchCacheManifest, iter_match_cache, match_cache_files
+
+
+def _write(path, payload, mtime_ns):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class MatchCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name) / "match_data"
+        self.cache_dir.mkdir()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_manifest_only_returns_files_changed_since_they_were_recorded(self):
+        _write(self.cache_dir / "1.json", {"match_id": "1"}, 10)
+        _write(self.cache_dir / "2.json", {"match_id": "2"}, 10)
+        (self.cache_dir / "3.json").write_text("{not json", encoding="utf-8")
+
+        manifest = MatchCacheManifest(self.cache_dir, "test")
+        changed, unchanged = manifest.scan()
+        parsed = list(iter_match_cache(changed))
+        for cached_file in parsed:
+            manifest.record(cached_file.path, cached_file.match_id)
+        manifest.save()
+
+        self.assertEqual([cached_file.match_id for cached_file in parsed], ["1", "2", "3"])
+        self.assertIsNotNone(parsed[2].error)
+        self.assertEqual(unchanged, {})
+        self.assertEqual(
+            [(item.match_id, item.data, item.error) for item in iter_match_cache(changed, workers=2)],
+            [(item.match_id, item.data, item.error) for item in parsed],
+        )
+
+        _write(self.cache_dir / "2.json", {"match_id": "2", "score": [1, 0]}, 20)
+        (self.cache_dir / "3.json").unlink()
+        changed, unchanged = MatchCacheManifest(self.cache_dir, "test").scan()
+
+        self.assertEqual(changed, [self.cache_dir / "2.json"])
+        self.assertEqual(unchanged, {self.cache_dir / "1.json": "1"})
+        self.assertEqual(match_cache_files(self.cache_dir), [self.cache_dir / "1.json", self.cache_dir / "2.json"])
+
+    def test_reconcile_reuses_saved_fields_for_unchanged_cache_files(self):
+        consolidated_file = str(Path(self.temp_dir.name) / "matches.json")
+        match = {"match_id": "7", "date": "2025-09-13", "teams": ["A", "B"], "score": [0, 0]}
+        _write(self.cache_dir / "7.json", {**match, "score": [24, 17]}, 10)
+        league_data.update_consolidated_file([match], consolidated_file)
+
+        self.assertEqual(league_data.reconcile_consolidated_from_match_cache(consolidated_file, str(self.cache_dir)), 1)
+        self.assertEqual(league_data.load_consolidated_matches(consolidated_file)[0]["score"], [24, 17])
+
+        # The cache file is unchanged, so this run reconciles from the manifest without reading it.
+        league_data.update_consolidated_file([match], consolidated_file)
+        self.assertEqual(league_data.reconcile_consolidated_from_match_cache(consolidated_file, str(self.cache_dir)), 1)
+        with open(consolidated_file) as f:
+            self.assertEqual(json.load(f)[0]["score"], [24, 17])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from python.match_store import MatchStore
+
+
+def _match(match_id, date, season="2025-2026", score=(20, 10)):
+    return {"match_id": match_id, "season": season, "league": "Counties 3 Sussex", "date": date, "score": list(score)}
+
+
+def _complete(match):
+    return None not in match["score"]
+
+
+class MatchStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.json_file = Path(self.temp_dir.name) / "matches.json"
+        self.store_file = Path(self.temp_dir.name) / "matches.sqlite"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_upserts_are_indexed_and_exported_like_the_json_file(self):
+        matches = [
+            _match("2", "2025-09-20"),
+            _match("1", "2025-09-13", score=(None, None)),
+            _match("3", "2024-10-05", season="2024-2025"),
+        ]
+        with MatchStore(self.store_file, self.json_file, _complete) as store:
+            self.assertEqual(store.upsert(matches), (3, 0))
+            self.assertEqual(store.upsert([_match("1", "2025-09-13", score=(5, 7)), matches[0]]), (0, 1))
+
+            self.assertIn("1", store)
+            self.assertEqual(store.get("1")["score"], [5, 7])
+            self.assertEqual(store.incomplete_match_ids(), [])
+            self.assertEqual([match["match_id"] for match in store.iter_matches(season="2025-2026")], ["1", "2"])
+            self.assertTrue(store.export_json())
+            self.assertFalse(store.export_json())
+
+        expected = sorted([_match("1", "2025-09-13", score=(5, 7)), matches[0], matches[2]], key=lambda match: match["date"])
+        self.assertEqual(self.json_file.read_text(), json.dumps(expected, indent=4))
+
+    def test_store_reloads_when_the_json_export_changes_outside_it(self):
+        with MatchStore(self.store_file, self.json_file, _complete) as store:
+            store.upsert([_match("1", "2025-09-13")])
+            store.export_json()
+
+        self.json_file.write_text(json.dumps([_match("9", "2025-10-04", score=(None, 3))]))
+        os.utime(self.json_file, ns=(1, 1))
+
+        with MatchStore(self.store_file, self.json_file, _complete) as store:
+            self.assertEqual(store.match_ids(), {"9"})
+            self.assertEqual(store.incomplete_match_ids(), ["9"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+import unittest
+
+from python.data import DataExtractor
+from python.scraping import ConcurrentFetcher, TokenBucket
+
+FIXTURES_URL = "https://www.egrfc.com/teams/142068/fixtures-results?season=68499"
+
+
+def _fixture_html(home, away, score, match_id, date):
+    return (
+        '<div class="fixture-overview">'
+        f'<a href="/teams/142068/match-centre/{match_id}"><time datetime="{date}"></time>'
+        f'<span class="fixture-overview__teamname">{home}</span>'
+        f'<span class="fixture-overview__teamname">{away}</span>'
+        f'<span class="statusbox__scores">{score}</span></a>'
+        "</div>"
+    )
+
+
+def _lineup_html(names, captain):
+    players = [
+        {"number": number, "name": name, "captain": name == captain}
+        for number, name in enumerate(names, start=1)
+    ]
+    payload = {
+        "props": {
+            "initialReduxState": {
+                "teams": {"matchCentre": {"pageData": {"1": {"lineup": {"players": players}}}}}
+            }
+        }
+    }
+    return f'<html><script id="__NEXT_DATA__">{json.dumps(payload)}</script></html>'
+
+
+class _FakeResponse:
+    def __init__(self, text):
+        self.content = text.encode("utf-8")
+
+    def raise_for_status(self):
+        return None
+
+
+class _FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout=None):
+        with self._lock:
+            self.requested.append(url)
+        return _FakeResponse(self.pages.get(url, "<html></html>"))
+
+    def close(self):
+        return None
+
+
+class ScrapingPrimitivesTests(unittest.TestCase):
+    def test_bucket_spaces_requests_beyond_the_burst(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+
+        started = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+    def test_map_preserves_input_order(self):
+        fetcher = ConcurrentFetcher(max_workers=4, requests_per_second=1000, session=_FakeSession({}))
+
+        def slow_identity(value):
+            time.sleep(0.01 * (5 - value))
+            return value
+
+        self.assertEqual(fetcher.map(slow_identity, range(5)), [0, 1, 2, 3, 4])
+
+
+class HistoricPitcheroScraperTests(unittest.TestCase):
+    def test_concurrent_scrape_assembles_rows_in_fixture_order(self):
+        first_xv = [f"Player {letter}" for letter in "ABC"]
+        pages = {
+            FIXTURES_URL: "<html>"
+            + _fixture_html("East Grinstead", "Hove", "20 - 10", "1-100", "2019-09-14")
+            + _fixture_html("Other Club", "Hove", "5 - 5", "1-101", "2019-09-14")
+            + _fixture_html("Crawley", "East Grinstead", "22 - 15", "1-102", "2019-09-21")
+            + "</html>",
+            "https://www.egrfc.com/teams/142068/match-centre/1-100/lineup": _lineup_html(first_xv, "Player B"),
+            "https://www.egrfc.com/teams/142068/match-centre/1-102/lineup": _lineup_html(first_xv[::-1], None),
+        }
+        session = _FakeSession(pages)
+        extractor = DataExtractor.__new__(DataExtractor)
+
+        games_df, appearances_df = extractor.extract_pitchero_historic_team_sheets(
+            seasons=["2019/20"],
+            squads=(1,),
+            max_workers=4,
+            requests_per_second=1000,
+            session=session,
+        )
+
+        self.assertEqual(
+            games_df["game_id"].tolist(),
+            ["2019-09-14_1st_Hove", "2019-09-21_1st_Crawley"],
+        )
+        self.assertEqual(games_df["result"].tolist(), ["W", "L"])
+        self.assertEqual(games_df["captain"].iloc[0], "Player B")
+        self.assertTrue(games_df["captain"].isna().iloc[1])
+        self.assertEqual(
+            appearances_df["appearance_id"].tolist()[:3],
+            ["2019-09-14_1st_Hove_1", "2019-09-14_1st_Hove_2", "2019-09-14_1st_Hove_3"],
+        )
+        crawley = appearances_df[appearances_df["game_id"] == "2019-09-21_1st_Crawley"]
+        self.assertEqual(crawley["player"].tolist(), ["Player C", "Player B", "Player A"])
+        self.assertFalse(any("1-101" in url for url in session.requested))
+        self.assertEqual(len(session.requested), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
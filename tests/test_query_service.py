@@ -0,0 +1,94 @@
+import json
+import tempfile
+import threading
+import unittest
+import urllib.request
+from pathlib import Path
+
+import duckdb
+
+from python.backend import BackendConfig, BackendDatabase
+from python.query_service import ReadConnectionPool, make_server, query_dataframe
+
+
+class StagedBuildAndQueryServiceTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "backend.duckdb"
+        con = duckdb.connect(str(self.db_path))
+        con.execute("CREATE TABLE games AS SELECT 'g1' AS game_id")
+        con.close()
+        self.config = BackendConfig(db_path=str(self.db_path))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _stage_games(self, *game_ids):
+        staged = BackendDatabase(self.config, staged=True)
+        self.assertNotEqual(staged.db_file, self.db_path)
+        values = ", ".join(f"('{game_id}')" for game_id in game_ids)
+        staged.con.execute(f"CREATE OR REPLACE TABLE games AS SELECT * FROM (VALUES {values}) AS t(game_id)")
+        return staged
+
+    def test_readers_keep_their_snapshot_across_a_published_build(self):
+        pool = ReadConnectionPool(self.db_path, max_connections=2)
+        try:
+            with pool.connection() as cursor:
+                staged = self._stage_games("g1", "g2")
+                staged.publish()
+                staged.close()
+                # The in-flight reader still sees the build it started on.
+                self.assertEqual(cursor.execute("SELECT COUNT(*) FROM games").fetchone(), (1,))
+                self.assertEqual(pool.query("SELECT COUNT(*) FROM games")[1], [(2,)])
+            self.assertEqual(pool.query("SELECT COUNT(*) FROM games")[1], [(2,)])
+        finally:
+            pool.close()
+        self.assertEqual(sorted(path.name for path in self.db_path.parent.iterdir()), ["backend.duckdb"])
+
+    def test_pool_rejects_anything_but_a_single_select(self):
+        pool = ReadConnectionPool(self.db_path, max_connections=1)
+        try:
+            for sql in ("USE memory; DETACH backend; SELECT 1", "DETACH backend", "BEGIN", "SELECT 1; SELECT 2"):
+                with self.assertRaises(ValueError):
+                    pool.query(sql)
+            # A USE left on a checked-out cursor does not leak into the next checkout.
+            with pool.connection() as cursor:
+                cursor.execute("USE memory")
+            self.assertEqual(pool.query("SELECT game_id FROM games")[1], [("g1",)])
+        finally:
+            pool.close()
+
+    def test_unpublished_build_is_discarded(self):
+        staged = self._stage_games("g9")
+        staged.close()
+
+        self.assertFalse(staged.db_file.exists())
+        con = duckdb.connect(str(self.db_path), read_only=True)
+        self.assertEqual(con.execute("SELECT game_id FROM games").fetchall(), [("g1",)])
+        con.close()
+
+    def test_http_service_runs_read_only_queries(self):
+        pool = ReadConnectionPool(self.db_path)
+        server = make_server(pool, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            frame = query_dataframe("SELECT game_id, ? AS squad FROM games", ["1st"], url=url)
+            self.assertEqual(frame.to_dict(orient="records"), [{"game_id": "g1", "squad": "1st"}])
+
+            for sql in ("DELETE FROM games", f"COPY games TO '{self.db_path.parent / 'games.csv'}'"):
+                request = urllib.request.Request(
+                    f"{url}/query", data=json.dumps({"sql": sql}).encode("utf-8"), method="POST"
+                )
+                with self.assertRaises(urllib.error.HTTPError) as error:
+                    urllib.request.urlopen(request)
+                self.assertEqual(error.exception.code, 400)
+        finally:
+            server.shutdown()
+            server.server_close()
+            pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from python.data import DataExtractor
+from python.response_cache import PINNED, ResponseCache
+
+
+class _FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        return None
+
+
+class _CountingSession:
+    def __init__(self, content):
+        self.content = content
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        return _FakeResponse(self.content)
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.temp_dir.name) / "http_cache.sqlite"
+        self.cache = ResponseCache(self.cache_path)
+
+    def tearDown(self):
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_fresh_entry_is_served_without_refetching(self):
+        calls = []
+
+        def download():
+            calls.append(1)
+            return b"<html>match</html>"
+
+        first = self.cache.fetch("https://example.invalid/a", download, ttl=60)
+        second = self.cache.fetch("https://example.invalid/a", download, ttl=60)
+
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(second.content, b"<html>match</html>")
+        self.assertEqual(len(calls), 1)
+
+    def test_expired_entries_refetch_unless_pinned_or_replaying(self):
+        self.cache.put("https://example.invalid/listing", b"old", ttl=-1)
+        self.cache.put("https://example.invalid/match", b"final", ttl=-1)
+        self.cache.pin("https://example.invalid/match")
+
+        self.assertIsNone(self.cache.get("https://example.invalid/listing"))
+        self.assertEqual(self.cache.get("https://example.invalid/match").content, b"final")
+
+        replay = ResponseCache(self.cache_path, replay=True)
+        try:
+            self.assertEqual(replay.get("https://example.invalid/listing").content, b"old")
+        finally:
+            replay.close()
+
+    def test_identical_bodies_are_stored_once(self):
+        self.cache.put("https://example.invalid/a", b"same", ttl=PINNED)
+        self.cache.put("https://example.invalid/b", b"same", ttl=PINNED)
+        self.cache.put("https://example.invalid/c", b"gone", ttl=-1)
+
+        self.assertEqual(self.cache.prune(), 1)
+        bodies = self.cache._conn.execute("SELECT COUNT(*) FROM bodies").fetchone()[0]
+        self.assertEqual(bodies, 1)
+
+    def test_failed_fetch_is_not_cached(self):
+        def download():
+            raise OSError("network down")
+
+        with self.assertRaises(OSError):
+            self.cache.fetch("https://example.invalid/a", download)
+        self.assertIsNone(self.cache.get("https://example.invalid/a"))
+
+    def test_pitchero_fetch_soup_replays_from_disk(self):
+        extractor = DataExtractor.__new__(DataExtractor)
+        extractor.response_cache_path = self.cache_path
+        session = _CountingSession(b"<html><p>Lineup</p></html>")
+
+        extractor._fetch_soup(session, "https://www.egrfc.com/match-centre/1/lineup", ttl=PINNED)
+        started = time.monotonic()
+        soup = extractor._fetch_soup(session, "https://www.egrfc.com/match-centre/1/lineup", ttl=PINNED)
+
+        self.assertEqual(session.calls, 1)
+        self.assertEqual(soup.p.get_text(), "Lineup")
+        self.assertLess(time.monotonic() - started, 1.0)
+        extractor.response_cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
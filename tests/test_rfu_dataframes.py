@@ -0,0 +1,61 @@
+import unittest
+
+import pandas as pd
+
+import python.league_data as league_data
+
+
+def _match(match_id, date, home_lineup, away_lineup, score=(20, 10), league="Counties 3 Sussex"):
+    return {
+        "match_id": match_id,
+        "season": "2025-2026",
+        "league": league,
+        "date": date,
+        "teams": ["East Grinstead II", "Hove II"],
+        "score": list(score),
+        "players": [home_lineup, away_lineup],
+    }
+
+
+class RfuDataframeTests(unittest.TestCase):
+    def setUp(self):
+        self.matches = [
+            _match("2", "2025-09-20", {"1": "A  Prop", "S1": "B Bench", "X": "Ignored"}, {}, score=("WO", "")),
+            _match("1", "2025-09-13", {"2": "A Prop", "1": "A  Prop"}, {"9": "C Half"}, league=""),
+            _match("3", "2025-09-27", {"1": "A Prop"}, {"9": "C Half"}, score=("12", 7)),
+            _match("1", "2025-09-13", {}, {}),
+            {"match_id": "4", "season": "2025-2026", "date": "not a date", "teams": ["A", "B"]},
+        ]
+
+    def test_games_coerce_scores_walkovers_and_tracked_squads(self):
+        games = league_data.build_rfu_games_dataframe(matches=self.matches)
+
+        self.assertEqual(games["match_id"].tolist(), ["1", "2", "3"])
+        self.assertEqual(games["season"].unique().tolist(), ["2025/26"])
+        self.assertTrue(pd.isna(games["tracked_squad"].iloc[0]))
+        self.assertEqual(games["tracked_squad"].iloc[1:].tolist(), ["2nd", "2nd"])
+        self.assertEqual(games["home_score"].tolist(), [20, pd.NA, 12])
+        self.assertEqual(games["home_walkover"].tolist(), [False, True, False])
+        self.assertEqual(games["lineup_available_away"].tolist(), [True, False, True])
+
+    def test_appearances_keep_first_lineup_entry_and_flag_previous_game(self):
+        appearances = league_data.build_rfu_player_appearances_dataframe(matches=self.matches)
+        home = appearances[appearances["team"] == "East Grinstead II"]
+
+        self.assertEqual(
+            home[["match_id", "player", "shirt_number", "position", "unit"]].values.tolist(),
+            [
+                ["1", "A Prop", 1, "Prop", "Forwards"],
+                ["2", "A Prop", 1, "Prop", "Forwards"],
+                ["2", "B Bench", 16, "Bench", "Bench"],
+                ["3", "A Prop", 1, "Prop", "Forwards"],
+            ],
+        )
+        self.assertEqual(home["played_previous_game"].tolist(), [pd.NA, True, False, True])
+        # Hove II's lineup is missing for match 2, so whether C Half played in it is unknown.
+        away = appearances[appearances["team"] == "Hove II"]
+        self.assertEqual(away["played_previous_game"].tolist(), [pd.NA, pd.NA])
+
+
+if __name__ == "__main__":
+    unittest.main()
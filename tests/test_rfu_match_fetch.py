@@ -0,0 +1,87 @@
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import python.league_data as league_data
+
+
+def _match(match_id, date):
+    return {
+        "match_id": match_id,
+        "season": "2025-2026",
+        "league": "Counties 3 Sussex",
+        "date": date,
+        "teams": ["East Grinstead II", "Hove II"],
+        "score": [20, 10],
+        "logos": [],
+        "players": [{}, {}],
+    }
+
+
+class RfuMatchFetchTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.consolidated_file = str(Path(self.temp_dir.name) / "matches.json")
+        self.matches = {
+            "101": _match("101", "2025-09-13"),
+            "102": _match("102", "2025-09-20"),
+            "103": _match("103", "2025-09-27"),
+        }
+        self.failing = {"102"}
+        self.fetched = []
+        self._lock = threading.Lock()
+
+        self._original_sources = league_data._get_match_sources
+        self._original_fetch = league_data._fetch_match_for_squad
+        league_data._get_match_sources = lambda squad, season: (list(self.matches), {})
+        league_data._fetch_match_for_squad = self._fake_fetch
+
+    def tearDown(self):
+        league_data._get_match_sources = self._original_sources
+        league_data._fetch_match_for_squad = self._original_fetch
+        self.temp_dir.cleanup()
+
+    def _fake_fetch(self, match_id, squad, results_by_id):
+        with self._lock:
+            self.fetched.append(match_id)
+        if match_id in self.failing:
+            raise RuntimeError("connection reset")
+        return self.matches[match_id]
+
+    def _saved_ids(self):
+        with open(self.consolidated_file) as f:
+            return [match["match_id"] for match in json.load(f)]
+
+    def test_completed_matches_are_checkpointed_and_run_resumes(self):
+        fetched = league_data.fetch_new_matches_only(
+            squad=2, season="2025/26", consolidated_file=self.consolidated_file, max_workers=3
+        )
+
+        self.assertEqual([match["match_id"] for match in fetched], ["101", "103"])
+        self.assertEqual(self._saved_ids(), ["101", "103"])
+
+        self.failing.clear()
+        self.fetched.clear()
+        resumed = league_data.fetch_new_matches_only(
+            squad=2, season="2025/26", consolidated_file=self.consolidated_file, max_workers=3
+        )
+
+        self.assertEqual(self.fetched, ["102"])
+        self.assertEqual([match["match_id"] for match in resumed], ["102"])
+        self.assertEqual(self._saved_ids(), ["101", "102", "103"])
+
+    def test_checkpointed_matches_are_not_rewritten(self):
+        fetched = league_data.fetch_new_matches_only(
+            squad=2, season="2025/26", consolidated_file=self.consolidated_file, max_workers=2
+        )
+        modified = Path(self.consolidated_file).stat().st_mtime_ns
+
+        league_data.update_consolidated_file(fetched, self.consolidated_file)
+
+        self.assertEqual(Path(self.consolidated_file).stat().st_mtime_ns, modified)
+
+
+if __name__ == "__main__":
+    unittest.main()
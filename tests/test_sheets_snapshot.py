@@ -0,0 +1,144 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from gspread.exceptions import WorksheetNotFound
+
+from python.data import DataExtractor
+from python.sheets_snapshot import SheetsSnapshot
+
+
+class _FakeWorksheet:
+    def __init__(self, title):
+        self.title = title
+
+
+class _FakeSpreadsheet:
+    def __init__(self, tabs):
+        self.tabs = tabs
+        self.batch_requests = []
+
+    def worksheets(self):
+        return [_FakeWorksheet(title) for title in self.tabs]
+
+    def values_batch_get(self, ranges):
+        self.batch_requests.append(list(ranges))
+        return {"valueRanges": [{"range": name, "values": self.tabs[name.strip("'")]} for name in ranges]}
+
+
+class _FakeClient:
+    def __init__(self, spreadsheet, modified_time="2025-09-13T18:00:00.000Z"):
+        self.spreadsheet = spreadsheet
+        self.modified_time = modified_time
+        self.opened = 0
+
+    def open_by_url(self, url):
+        self.opened += 1
+        return self.spreadsheet
+
+    def get_file_drive_metadata(self, spreadsheet_id):
+        return {"id": spreadsheet_id, "modifiedTime": self.modified_time}
+
+
+SHEET_URL = "https://docs.google.com/spreadsheets/d/test-sheet-id/edit"
+
+
+def _team_sheet_tab():
+    header = ["Date", "Season", "Competition", "Opposition", "Score", "Captain", "VC", "VC", "", "MOTM"]
+    header += [str(number) for number in range(1, 16)]
+    players = [f"Player {letter}" for letter in "ABCDEFGHIJKLMNO"]
+    row = ["2025-09-13", "2025/26", "Counties 1", "Hove (H)", "20-10", "Player A", "Player B", "", "", "Player C"]
+    return [[""], [""], [""], header, row + players]
+
+
+class SheetsSnapshotTests(unittest.TestCase):
+    def test_values_are_padded_like_get_all_values(self):
+        snapshot = SheetsSnapshot({"Tab": [["a", "b", "c"], ["d"]]})
+
+        self.assertEqual(snapshot.values("Tab"), [["a", "b", "c"], ["d", "", ""]])
+
+    def test_range_cuts_rows_and_columns_like_an_a1_range(self):
+        rows = [["header"]] * 4 + [["x"] * 40, ["y", "", ""], [], [""]]
+        snapshot = SheetsSnapshot({"Tab": rows})
+
+        sliced = snapshot.range("Tab", first_row=5, last_column="AH")
+
+        self.assertEqual(len(sliced), 2)
+        self.assertEqual(len(sliced[0]), 34)
+        self.assertEqual(sliced[1], ["y"])
+
+    def test_missing_tab_raises_worksheet_not_found(self):
+        spreadsheet = _FakeSpreadsheet({"1st XV Players": [["a"]]})
+        snapshot = SheetsSnapshot.fetch(spreadsheet)
+
+        with self.assertRaises(WorksheetNotFound):
+            snapshot.values("25/26 Scorers")
+        self.assertEqual(spreadsheet.batch_requests, [["'1st XV Players'"]])
+
+    def test_extractors_share_one_batched_fetch(self):
+        set_piece_row = [""] * 34
+        set_piece_row[1], set_piece_row[2], set_piece_row[8], set_piece_row[9] = "Hove", "2025-09-13", "8", "10"
+        spreadsheet = _FakeSpreadsheet(
+            {
+                "1st XV Players": _team_sheet_tab(),
+                "2nd XV Players": [],
+                "1st XV Set piece": [[""]] * 4 + [set_piece_row],
+                "2nd XV Set piece": [],
+            }
+        )
+        extractor = DataExtractor.__new__(DataExtractor)
+        extractor.client = _FakeClient(spreadsheet)
+        extractor.sheet_url = "https://example.invalid/sheet"
+
+        games = extractor.extract_games_data()
+        appearances = extractor.extract_player_appearances()
+        set_piece = extractor.extract_set_piece_stats()
+
+        self.assertEqual(extractor.client.opened, 1)
+        self.assertEqual(len(spreadsheet.batch_requests), 1)
+        self.assertEqual(games.iloc[0]["game_id"], "2025-09-13_1st_Hove")
+        self.assertEqual(len(appearances), 15)
+        self.assertEqual(set(set_piece["game_id"]), {"2025-09-13_1st_Hove"})
+        self.assertEqual(set_piece.loc[set_piece["team"] == "EG", "lineouts_total"].iloc[0], 10)
+
+
+    def test_disk_cache_is_reused_until_modified_time_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / "sheets_snapshot_cache.json"
+            spreadsheet = _FakeSpreadsheet({"1st XV Players": _team_sheet_tab()})
+            client = _FakeClient(spreadsheet)
+
+            first = SheetsSnapshot.load(client, SHEET_URL, cache_path=cache_path)
+            second = SheetsSnapshot.load(client, SHEET_URL, cache_path=cache_path)
+            self.assertEqual(len(spreadsheet.batch_requests), 1)
+            self.assertEqual(second.values("1st XV Players"), first.values("1st XV Players"))
+            self.assertEqual(second.modified_time, "2025-09-13T18:00:00.000Z")
+
+            spreadsheet.tabs["1st XV Players"][4][4] = "21-10"
+            client.modified_time = "2025-09-14T09:00:00.000Z"
+            third = SheetsSnapshot.load(client, SHEET_URL, cache_path=cache_path)
+            self.assertEqual(len(spreadsheet.batch_requests), 2)
+            self.assertEqual(third.values("1st XV Players")[4][4], "21-10")
+
+    def test_offline_extractor_reads_snapshot_without_credentials(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / "sheets_snapshot_cache.json"
+            SheetsSnapshot({"1st XV Players": _team_sheet_tab(), "2nd XV Players": []}).save(cache_path)
+
+            extractor = DataExtractor(offline=True, snapshot_cache_path=cache_path)
+
+            self.assertIsNone(extractor.client)
+            self.assertEqual(len(extractor.extract_games_data()), 1)
+            with self.assertRaises(RuntimeError):
+                extractor.extract_pitchero_stats()
+
+    def test_offline_extractor_without_snapshot_fails_clearly(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            extractor = DataExtractor(offline=True, snapshot_cache_path=Path(temp_dir) / "missing.json")
+
+            with self.assertRaises(FileNotFoundError):
+                extractor.extract_games_data()
+
+
+if __name__ == "__main__":
+    unittest.main()
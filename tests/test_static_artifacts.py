@@ -0,0 +1,92 @@
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from python.static_artifacts import is_published_artifact, publish_static_artifacts, refresh_static_artifacts
+
+DATASET_NAME = "ab" * 32 + ".json"
+
+
+class StaticArtifactTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.backend_dir = self.root / "data" / "backend"
+        self.datasets_dir = self.root / "data" / "charts" / "datasets"
+        self.backend_dir.mkdir(parents=True)
+        self.datasets_dir.mkdir(parents=True)
+        self.games = self.backend_dir / "games.json"
+        self.games.write_text(json.dumps([{"game_id": "g1"}] * 50), encoding="utf-8")
+        (self.datasets_dir / DATASET_NAME).write_text("[1, 2, 3]", encoding="utf-8")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _manifest(self):
+        return json.loads((self.root / "data" / "manifest.json").read_text(encoding="utf-8"))["files"]
+
+    def test_hashed_copies_and_gzip_siblings_are_listed_in_the_manifest(self):
+        summary = publish_static_artifacts(self.root)
+        entries = self._manifest()
+
+        self.assertEqual(summary.files, 2)
+        self.assertEqual(summary.hashed_copies_written, 1)
+        games = entries["data/backend/games.json"]
+        hashed = self.root / games["path"]
+        self.assertRegex(hashed.name, r"^games\.[0-9a-f]{12}\.json$")
+        self.assertTrue(is_published_artifact(hashed))
+        self.assertEqual(hashed.read_bytes(), self.games.read_bytes())
+        self.assertEqual(gzip.decompress(hashed.with_name(f"{hashed.name}.gz").read_bytes()), self.games.read_bytes())
+        self.assertEqual(games["size"], self.games.stat().st_size)
+        self.assertLess(games["gzip"], games["size"])
+
+        # Content-addressed chart datasets are served as they are.
+        dataset = entries[f"data/charts/datasets/{DATASET_NAME}"]
+        self.assertEqual(dataset["path"], f"data/charts/datasets/{DATASET_NAME}")
+        self.assertTrue((self.datasets_dir / f"{DATASET_NAME}.gz").exists())
+
+    def test_rerun_writes_nothing_and_changed_files_prune_old_copies(self):
+        publish_static_artifacts(self.root)
+        old_path = self.root / self._manifest()["data/backend/games.json"]["path"]
+
+        rerun = publish_static_artifacts(self.root)
+        self.assertEqual((rerun.hashed_copies_written, rerun.compressed_written, rerun.pruned), (0, 0, 0))
+
+        self.games.write_text("[]", encoding="utf-8")
+        changed = publish_static_artifacts(self.root)
+        new_path = self.root / self._manifest()["data/backend/games.json"]["path"]
+
+        self.assertNotEqual(new_path, old_path)
+        self.assertEqual(changed.hashed_copies_written, 1)
+        self.assertEqual(changed.pruned, 2)
+        self.assertFalse(old_path.exists())
+        self.assertFalse(old_path.with_name(f"{old_path.name}.gz").exists())
+        self.assertEqual(
+            sorted(path.name for path in self.backend_dir.iterdir()),
+            sorted(["games.json", new_path.name, f"{new_path.name}.gz"]),
+        )
+
+    def test_refresh_updates_only_the_entries_for_rewritten_or_removed_files(self):
+        publish_static_artifacts(self.root)
+        self.games.write_text("[]", encoding="utf-8")
+        (self.datasets_dir / DATASET_NAME).unlink()
+        outside = self.root / "data" / "other.json"
+        outside.write_text("{}", encoding="utf-8")
+
+        summary = refresh_static_artifacts(
+            [self.games, self.datasets_dir / DATASET_NAME, outside], site_root=self.root
+        )
+        entries = self._manifest()
+
+        self.assertEqual(summary.files, 1)
+        games = entries["data/backend/games.json"]
+        self.assertEqual((self.root / games["path"]).read_text(encoding="utf-8"), "[]")
+        self.assertTrue((self.root / f"{games['path']}.gz").exists())
+        self.assertNotIn(f"data/charts/datasets/{DATASET_NAME}", entries)
+        self.assertNotIn("data/other.json", entries)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from python import tracing
+from python.tracing import profiling, span, traced
+
+
+class _Builder:
+    @traced
+    def _build_rows(self, frame):
+        with span("inner_step", step="double"):
+            return pd.concat([frame, frame], ignore_index=True)
+
+    @traced
+    def _insert(self, table_name, frame):
+        return None
+
+
+class TracingTests(unittest.TestCase):
+    def test_disabled_tracing_records_nothing(self):
+        builder = _Builder()
+
+        result = builder._build_rows(pd.DataFrame({"a": [1, 2]}))
+
+        self.assertEqual(len(result), 4)
+        self.assertIsNone(tracing._active_tracer)
+        self.assertIs(span("unused"), span("also_unused"))
+
+    def test_spans_record_rows_nesting_and_chrome_trace(self):
+        builder = _Builder()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_path = Path(temp_dir) / "trace.json"
+            with profiling(chrome_trace_path=trace_path, show_summary=False) as tracer:
+                builder._build_rows(pd.DataFrame({"a": [1, 2, 3]}))
+                builder._insert("games", pd.DataFrame({"a": [1]}))
+            events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+
+        records = {item.name: item.record() for item in tracer.spans}
+        self.assertEqual((records["_build_rows"]["rows_in"], records["_build_rows"]["rows_out"]), (3, 6))
+        self.assertEqual((records["inner_step"]["depth"], records["inner_step"]["step"]), (1, "double"))
+        self.assertEqual(records["_insert"]["target"], "games")
+        self.assertGreater(records["_build_rows"]["memory_peak_bytes"], 0)
+        self.assertEqual([event["name"] for event in events], ["_build_rows", "inner_step", "_insert"])
+        self.assertEqual({event["ph"] for event in events}, {"X"})
+        self.assertIsNone(tracing._active_tracer)
+
+
+if __name__ == "__main__":
+    unittest.main()